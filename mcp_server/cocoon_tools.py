@@ -95,11 +95,12 @@ def handle_cocoon_tool(tool_name: str, arguments: dict, brand_id: int) -> dict:
     try:
         from seo_analyzer.models import SemanticCocoon, CocoonKeyword, CocoonCategory
         from business.models import Brand
+        from request_scope import get_brand
         from django.db.models import Count, Q, Sum, Avg, Prefetch
         
         # Vérifier l'accès à la brand
         try:
-            brand = Brand.objects.get(id=brand_id)
+            brand = get_brand(brand_id)
         except Brand.DoesNotExist:
             return {'success': False, 'error': f'Brand {brand_id} not found'}
         
@@ -23,6 +23,19 @@ class MCPConfig:
     environment: str = os.getenv('MCP_ENV', 'development')
     default_brand_id: int = int(os.getenv('MCP_DEFAULT_BRAND_ID', '9'))
     
+    # Cache des outils en lecture seule
+    tool_cache_enabled: bool = os.getenv('MCP_TOOL_CACHE_ENABLED', 'true').lower() == 'true'
+    tool_cache_max_entries: int = int(os.getenv('MCP_TOOL_CACHE_MAX_ENTRIES', '500'))
+    
+    # Exécution des outils : 'concurrent' (pool de workers) ou 'serial' (thread unique)
+    tool_execution_mode: str = os.getenv('MCP_TOOL_EXECUTION_MODE', 'concurrent')
+    tool_workers: int = int(os.getenv('MCP_TOOL_WORKERS', '8'))
+    tool_brand_concurrency: int = int(os.getenv('MCP_TOOL_BRAND_CONCURRENCY', '4'))
+    tool_timeout_seconds: float = float(os.getenv('MCP_TOOL_TIMEOUT', '30'))
+    
+    # Métriques : appels plus lents loggés avec leurs arguments
+    slow_call_seconds: float = float(os.getenv('MCP_SLOW_CALL_SECONDS', '1.0'))
+    
     # Logging
     log_level: str = os.getenv('MCP_LOG_LEVEL', 'INFO')
 
@@ -39,7 +39,10 @@ DATABASES = {
         'PORT': os.getenv('POSTGRES_PORT', '5432'),
         'OPTIONS': {
             'connect_timeout': 10,
-        }
+        },
+        # Une connexion par thread worker (tool_executor), gardée entre appels
+        'CONN_MAX_AGE': int(os.getenv('MCP_DB_CONN_MAX_AGE', '60')),
+        'CONN_HEALTH_CHECKS': True,
     }
 }
 
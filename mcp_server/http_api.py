@@ -1,10 +1,20 @@
 # mcp_server/http_api.py
 from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
-from typing import Dict, Any, Optional
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from pydantic import BaseModel, Field
+from typing import Dict, Any, List, Optional
+import asyncio
+import json
 import logging
+import time
+
+from asgiref.sync import sync_to_async
 
 from tools_registry import ToolRegistry
+from tool_cache import tool_cache
+from tool_executor import tool_executor
+from tool_metrics import tool_metrics
+from request_scope import request_scope, get_brand
 from authentication import authenticate_request
 
 logger = logging.getLogger(__name__)
@@ -21,6 +31,17 @@ class ToolResponse(BaseModel):
     result: Optional[Any] = None
     error: Optional[str] = None
 
+class BatchToolCall(BaseModel):
+    tool_name: str
+    arguments: Dict[str, Any] = Field(default_factory=dict)
+    id: Optional[str] = None  # Référence libre renvoyée telle quelle
+
+class BatchRequest(BaseModel):
+    calls: List[BatchToolCall]
+    brand_id: Optional[int] = None
+
+MAX_BATCH_CALLS = 50
+
 # Instance globale
 tool_registry = ToolRegistry()
 
@@ -30,9 +51,32 @@ async def health_check():
     return {
         "status": "healthy",
         "tools_loaded": len(tool_registry.get_all_tools_metadata()),
-        "categories": tool_registry.get_tools_by_category()
+        "categories": tool_registry.get_tools_by_category(),
+        "cache": tool_cache.get_stats(),
+        "executor": tool_executor.get_stats()
     }
 
+@app.on_event("shutdown")
+async def shutdown_executor():
+    """Attend la fin des handlers en cours avant l'arrêt"""
+    tool_executor.shutdown(wait=True)
+
+@app.get("/cache/stats")
+async def cache_stats():
+    """Hits/misses du cache des outils en lecture seule"""
+    return {
+        "success": True,
+        "cache": tool_cache.get_stats()
+    }
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Métriques par outil au format Prometheus"""
+    return PlainTextResponse(
+        tool_metrics.render_prometheus(),
+        media_type="text/plain; version=0.0.4"
+    )
+
 @app.get("/tools")
 async def list_tools():
     """Liste tous les tools disponibles"""
@@ -42,7 +86,8 @@ async def list_tools():
             "success": True,
             "tools": tools,
             "count": len(tools),
-            "categories": tool_registry.get_tools_by_category()
+            "categories": tool_registry.get_tools_by_category(),
+            "streaming_tools": tool_registry.get_streaming_tools()
         }
     except Exception as e:
         logger.error(f"Error listing tools: {e}")
@@ -74,6 +119,130 @@ async def execute_tool(request: ToolRequest):
             error=str(e)
         )
 
+STREAM_FORMATS = {
+    'ndjson': 'application/x-ndjson',
+    'sse': 'text/event-stream',
+}
+
+def _encode_event(event: Dict[str, Any], stream_format: str) -> str:
+    payload = json.dumps(event, ensure_ascii=False, default=str)
+    if stream_format == 'sse':
+        return f"event: {event.get('type', 'message')}\ndata: {payload}\n\n"
+    return payload + "\n"
+
+@app.post("/execute/stream")
+async def execute_tool_stream(request: ToolRequest, format: str = 'ndjson'):
+    """
+    Execute un tool MCP en streaming (NDJSON par défaut, SSE avec ?format=sse)
+    
+    Un événement par ligne : meta, puis item par résultat, puis summary
+    (ou error). Les outils sans support streaming renvoient un seul
+    événement 'result'.
+    """
+    if format not in STREAM_FORMATS:
+        raise HTTPException(status_code=400, detail=f"Unknown stream format: {format}")
+    if not tool_registry.tool_exists(request.tool_name):
+        raise HTTPException(status_code=404, detail=f"Tool '{request.tool_name}' not found")
+    
+    try:
+        if request.brand_id:
+            brand_id = await authenticate_request(request.arguments)
+        else:
+            brand_id = request.brand_id
+    except Exception as e:
+        raise HTTPException(status_code=401, detail=str(e))
+    
+    async def events():
+        try:
+            async for event in tool_registry.stream_tool(request.tool_name, request.arguments, brand_id):
+                yield _encode_event(event, format)
+        except Exception as e:
+            logger.error(f"Tool streaming error: {e}")
+            yield _encode_event({'type': 'error', 'error': str(e)}, format)
+    
+    return StreamingResponse(
+        events(),
+        media_type=STREAM_FORMATS[format],
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+async def _run_batch_call(index: int, call: BatchToolCall, brand_id: Optional[int]) -> Dict[str, Any]:
+    """Un appel du batch : jamais d'exception, erreur et durée dans le résultat"""
+    started = time.perf_counter()
+    try:
+        result = await tool_registry.execute_tool(call.tool_name, call.arguments, brand_id)
+    except Exception as e:
+        result = {
+            'success': False,
+            'error': str(e),
+            'error_type': getattr(e, 'error_code', 'INTERNAL_ERROR')
+        }
+    
+    return {
+        'index': index,
+        'id': call.id,
+        'tool_name': call.tool_name,
+        'success': bool(result.get('success')),
+        'result': result.get('result'),
+        'error': result.get('error'),
+        'error_type': result.get('error_type'),
+        'duration_ms': round((time.perf_counter() - started) * 1000, 2)
+    }
+
+@app.post("/execute/batch")
+async def execute_batch(request: BatchRequest):
+    """
+    Execute plusieurs tools MCP en une requête
+    
+    - brand authentifiée une seule fois pour tout le batch
+    - appels exécutés en parallèle (pool de tool_executor)
+    - lookups Brand/Website partagés entre les appels (request_scope)
+    - résultats dans l'ordre des appels, avec erreur et durée par appel
+    """
+    if not request.calls:
+        raise HTTPException(status_code=400, detail="calls must not be empty")
+    if len(request.calls) > MAX_BATCH_CALLS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Too many calls in batch ({len(request.calls)} > {MAX_BATCH_CALLS})"
+        )
+    
+    try:
+        auth_arguments = {'brand_id': request.brand_id} if request.brand_id else {}
+        brand_id = await authenticate_request(auth_arguments)
+    except Exception as e:
+        logger.warning(f"Batch authentication failed: {e}")
+        raise HTTPException(status_code=401, detail=str(e))
+    
+    started = time.perf_counter()
+    with request_scope() as scope:
+        # Brand chargée une fois, réutilisée par tous les handlers du batch
+        try:
+            await sync_to_async(get_brand)(brand_id)
+        except Exception as e:
+            logger.warning(f"Batch brand preload failed: {e}")
+        
+        for call in request.calls:
+            # La brand du batch prime sur celle des arguments
+            if 'brand_id' in call.arguments:
+                call.arguments['brand_id'] = brand_id
+        
+        results = await asyncio.gather(*[
+            _run_batch_call(index, call, brand_id)
+            for index, call in enumerate(request.calls)
+        ])
+        scope_stats = scope.get_stats()
+    
+    return {
+        "success": True,
+        "brand_id": brand_id,
+        "count": len(results),
+        "failed": sum(1 for result in results if not result['success']),
+        "duration_ms": round((time.perf_counter() - started) * 1000, 2),
+        "lookups": scope_stats,
+        "results": results
+    }
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8001)
\ No newline at end of file
@@ -49,9 +49,18 @@ KEYWORD_TOOLS = [
                 "exclude_page": {"type": "integer", "description": "Exclude keywords from page"},
                 
                 # Mode vérification d'existence (comme view)
-                "keyword_list": {"type": "array", "items": {"type": "string"}, "description": "Check existence of keywords"},
+                "keyword_list": {"type": "array", "items": {"type": "string"}, "description": "Check existence of keywords (case/whitespace-insensitive, returns text -> id mapping and missing list)"},
                 
-                "limit": {"type": "integer", "default": 20, "description": "Max results"}
+                # Pagination par curseur (keyset)
+                "order_by": {"type": "string", "enum": ["-volume", "volume", "keyword", "id"], "default": "-volume"},
+                "cursor": {"type": "string", "description": "Opaque cursor from next_cursor of the previous page"},
+                "total_mode": {
+                    "type": "string",
+                    "enum": ["capped", "approximate", "exact", "none"],
+                    "description": "Total count strategy (default: capped on first page, none on next pages)"
+                },
+                
+                "limit": {"type": "integer", "default": 20, "description": "Max results (page size, max 500)"}
             },
             "required": ["brand_id"]
         }
@@ -111,17 +120,123 @@ KEYWORD_TOOLS = [
     }
 ]
 
+# ===== PAGINATION search_keywords =====
+#
+# Pagination keyset : ORDER BY (clé de tri, id) puis WHERE (clé, id) > dernier
+# élément vu. Le coût d'une page ne dépend pas de sa position, contrairement
+# à OFFSET. Le curseur est opaque (base64 JSON) et lié au tri et aux filtres.
+
+SEARCH_ORDERINGS = {
+    # nom -> (expression de tri, décroissant)
+    '-volume': ('volume', True),
+    'volume': ('volume', False),
+    'keyword': ('keyword', False),
+    'id': ('id', False),
+}
+
+SEARCH_MAX_LIMIT = 500
+TOTAL_COUNT_CAP = 10000
+
+# Arguments qui ne changent pas l'ensemble de résultats
+_PAGINATION_ARGUMENTS = {'brand_id', 'cursor', 'limit', 'total_mode'}
+
+
+def _filters_fingerprint(arguments):
+    import hashlib
+    import json
+    
+    filters = {k: v for k, v in arguments.items() if k not in _PAGINATION_ARGUMENTS}
+    payload = json.dumps(filters, sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode('utf-8'), digest_size=6).hexdigest()
+
+
+def encode_cursor(ordering, last_value, last_id, fingerprint):
+    import base64
+    import json
+    
+    payload = json.dumps({'o': ordering, 'v': last_value, 'id': last_id, 'f': fingerprint})
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor):
+    """Retourne le dict du curseur, ValueError si illisible"""
+    import base64
+    import json
+    
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        if not isinstance(data, dict) or 'id' not in data:
+            raise ValueError
+        return data
+    except Exception:
+        raise ValueError('Invalid cursor')
+
+
+def related_count(model, relation):
+    """
+    COUNT d'une relation inverse en sous-requête corrélée : pas de JOIN ni
+    de GROUP BY sur la requête principale, donc pas d'explosion de lignes
+    """
+    from django.db.models import Count, IntegerField, OuterRef, Subquery
+    from django.db.models.functions import Coalesce
+    
+    field = model._meta.get_field(relation)
+    related_model = field.related_model
+    fk_name = field.field.name
+    counts = (
+        related_model.objects.filter(**{fk_name: OuterRef('pk')})
+        .order_by()
+        .values(fk_name)
+        .annotate(count=Count('pk'))
+        .values('count')
+    )
+    return Coalesce(Subquery(counts, output_field=IntegerField()), 0)
+
+
+def count_total(queryset, mode):
+    """
+    Total des résultats selon le mode :
+    - exact : COUNT(*) complet
+    - capped : COUNT borné à TOTAL_COUNT_CAP (+1 pour savoir si on dépasse)
+    - approximate : estimation du planner PostgreSQL (capped ailleurs)
+    Retourne (total, is_exact) ou (None, None) pour 'none'.
+    """
+    if mode == 'none':
+        return None, None
+    
+    if mode == 'exact':
+        return queryset.count(), True
+    
+    if mode == 'approximate':
+        from django.db import connections
+        
+        if connections[queryset.db].vendor == 'postgresql':
+            import json
+            
+            try:
+                plan = json.loads(queryset.order_by().explain(format='json'))
+                return int(plan[0]['Plan']['Plan Rows']), False
+            except Exception:
+                pass  # Repli sur le comptage borné
+    
+    total = queryset.order_by().values('pk')[:TOTAL_COUNT_CAP + 1].count()
+    if total > TOTAL_COUNT_CAP:
+        return TOTAL_COUNT_CAP, False
+    return total, True
+
 def handle_keyword_tool(tool_name: str, arguments: dict, brand_id: int) -> dict:
     """Handler pour les outils keyword - ALIGNÉ SUR VIEWS DJANGO"""
     try:
         from seo_analyzer.models import Keyword, PPA, ContentType, KeywordContentType
         from business.models import Brand
-        from django.db.models import Count, Sum, Avg, Q, F, Cast, FloatField, Value
-        from django.db.models.functions import Replace
+        from request_scope import get_brand
+        from django.db.models import Count, Sum, Avg, Q, F, FloatField, Value
+        from django.db.models.functions import Cast, Coalesce, Replace
         
         # Vérifier l'accès à la brand
         try:
-            brand = Brand.objects.get(id=brand_id)
+            brand = get_brand(brand_id)
         except Brand.DoesNotExist:
             return {'success': False, 'error': f'Brand {brand_id} not found'}
         
@@ -132,20 +247,20 @@ def handle_keyword_tool(tool_name: str, arguments: dict, brand_id: int) -> dict:
             # ✅ MODE VÉRIFICATION D'EXISTENCE (comme KeywordViewSet.list)
             keyword_list = arguments.get('keyword_list', [])
             if keyword_list:
-                existing = queryset.filter(keyword__in=keyword_list).values(
-                    'id', 'keyword', 'volume', 'kdifficulty'
+                # Résolution ensembliste (casse/espaces normalisés, IN par tranches ou table temporaire)
+                from seo_keywords_base.services.keyword_resolution_service import KeywordResolutionService
+                resolution = KeywordResolutionService.resolve(
+                    keyword_list, queryset, fields=['volume', 'kdifficulty']
                 )
-                existing_keywords = list(existing)
-                existing_texts = [k['keyword'] for k in existing_keywords]
-                missing = [k for k in keyword_list if k not in existing_texts]
                 
                 return {
                     'success': True,
                     'result': {
                         'mode': 'existence_check',
-                        'count': len(existing_keywords),
-                        'results': existing_keywords,
-                        'missing': missing,
+                        'count': len(resolution['results']),
+                        'results': resolution['results'],
+                        'mapping': resolution['mapping'],
+                        'missing': resolution['missing'],
                         'checked': len(keyword_list)
                     }
                 }
@@ -222,35 +337,87 @@ def handle_keyword_tool(tool_name: str, arguments: dict, brand_id: int) -> dict:
             if youtube_videos:
                 queryset = queryset.filter(youtube_videos=youtube_videos)
             
+            # Filtres sur relations en sous-requêtes : pas de lignes dupliquées
+            # (nécessaire pour la pagination keyset), pas de DISTINCT
             has_ppas = arguments.get('has_ppas')
             if has_ppas is not None:
+                with_ppas = Keyword.objects.filter(ppa_associations__isnull=False).values('pk')
                 if has_ppas:
-                    queryset = queryset.filter(ppa_associations__isnull=False).distinct()
+                    queryset = queryset.filter(pk__in=with_ppas)
                 else:
-                    queryset = queryset.filter(ppa_associations__isnull=True)
+                    queryset = queryset.exclude(pk__in=with_ppas)
             
             # ✅ RELATIONS
             content_type = arguments.get('content_type')
             if content_type:
-                queryset = queryset.filter(content_type_objects__name__icontains=content_type)
+                queryset = queryset.filter(pk__in=Keyword.objects.filter(
+                    content_type_objects__name__icontains=content_type
+                ).values('pk'))
             
             in_cocoon = arguments.get('in_cocoon')
             if in_cocoon:
-                queryset = queryset.filter(cocoon_associations__cocoon_id=in_cocoon)
+                queryset = queryset.filter(pk__in=Keyword.objects.filter(
+                    cocoon_associations__cocoon_id=in_cocoon
+                ).values('pk'))
             
             exclude_page = arguments.get('exclude_page')
             if exclude_page:
                 queryset = queryset.exclude(keyword_pages__page_id=exclude_page)
             
-            # ✅ ANNOTATIONS comme KeywordViewSet
+            # ✅ PAGINATION KEYSET
+            ordering = arguments.get('order_by') or '-volume'
+            if ordering not in SEARCH_ORDERINGS:
+                return {'success': False, 'error': f'Unknown order_by: {ordering}'}
+            sort_field, descending = SEARCH_ORDERINGS[ordering]
+            fingerprint = _filters_fingerprint(arguments)
+            
+            # Volume NULL trié comme 0 : clé de tri toujours comparable
+            filtered = queryset
             queryset = queryset.annotate(
-                cocoons_count=Count('cocoon_associations', distinct=True),
-                pages_count=Count('keyword_pages', distinct=True),
-                has_ppas_count=Count('ppa_associations', distinct=True)
+                sort_key=Coalesce(sort_field, 0) if sort_field == 'volume' else F(sort_field)
             )
             
-            limit = arguments.get('limit', 20)
-            keywords = queryset[:limit]
+            cursor = arguments.get('cursor')
+            if cursor:
+                try:
+                    position = decode_cursor(cursor)
+                except ValueError as e:
+                    return {'success': False, 'error': str(e)}
+                if position.get('o') != ordering or position.get('f') != fingerprint:
+                    return {'success': False, 'error': 'Cursor does not match order_by/filters of this search'}
+                
+                if descending:
+                    queryset = queryset.filter(
+                        Q(sort_key__lt=position['v']) | Q(sort_key=position['v'], id__lt=position['id'])
+                    )
+                else:
+                    queryset = queryset.filter(
+                        Q(sort_key__gt=position['v']) | Q(sort_key=position['v'], id__gt=position['id'])
+                    )
+            
+            prefix = '-' if descending else ''
+            queryset = queryset.order_by(f'{prefix}sort_key', f'{prefix}id')
+            
+            # ✅ COMPTEURS en sous-requêtes corrélées (calculés pour la page seulement)
+            queryset = queryset.annotate(
+                cocoons_count=related_count(Keyword, 'cocoon_associations'),
+                pages_count=related_count(Keyword, 'keyword_pages'),
+                has_ppas_count=related_count(Keyword, 'ppa_associations')
+            )
+            
+            limit = max(1, min(int(arguments.get('limit') or 20), SEARCH_MAX_LIMIT))
+            keywords = list(queryset[:limit + 1])
+            has_more = len(keywords) > limit
+            keywords = keywords[:limit]
+            
+            next_cursor = None
+            if has_more and keywords:
+                last = keywords[-1]
+                next_cursor = encode_cursor(ordering, last.sort_key, last.id, fingerprint)
+            
+            # Total sur la requête filtrée, sans tri ni compteurs
+            total_mode = arguments.get('total_mode') or ('none' if cursor else 'capped')
+            total_matching, total_is_exact = count_total(filtered, total_mode)
             
             return {
                 'success': True,
@@ -274,8 +441,12 @@ def handle_keyword_tool(tool_name: str, arguments: dict, brand_id: int) -> dict:
                         }
                         for kw in keywords
                     ],
-                    'total_matching': queryset.count(),
+                    'total_matching': total_matching,
+                    'total_is_exact': total_is_exact,
                     'returned_count': len(keywords),
+                    'has_more': has_more,
+                    'next_cursor': next_cursor,
+                    'order_by': ordering,
                     'filters_applied': {
                         'search_term': search_term,
                         'search_intent': search_intent,
@@ -0,0 +1,94 @@
+# mcp_server/request_scope.py
+"""
+Cache de lookups limité à une requête HTTP (batch d'appels d'outils)
+
+Les handlers commencent tous par Brand.objects.get puis, souvent,
+Website.objects.get : dans un batch, ces lectures sont faites une seule
+fois et partagées entre les appels concurrents.
+
+Le scope est porté par une ContextVar : il suit les tâches asyncio et les
+threads workers (le contexte est copié à la soumission, voir tool_executor).
+Hors scope, les helpers font simplement la requête.
+"""
+import contextvars
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Optional
+
+_current_scope: contextvars.ContextVar[Optional['RequestScope']] = contextvars.ContextVar(
+    'mcp_request_scope', default=None
+)
+
+
+class RequestScope:
+    """Instances Brand / Website déjà chargées pendant la requête"""
+
+    def __init__(self):
+        self._brands: Dict[int, Any] = {}
+        self._websites: Dict[tuple, Any] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, store: Dict, key):
+        with self._lock:
+            instance = store.get(key)
+            if instance is not None:
+                self.hits += 1
+            else:
+                self.misses += 1
+            return instance
+
+    def put(self, store: Dict, key, instance):
+        with self._lock:
+            store.setdefault(key, instance)
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses}
+
+
+@contextmanager
+def request_scope():
+    """Active un scope pour la durée du bloc"""
+    scope = RequestScope()
+    token = _current_scope.set(scope)
+    try:
+        yield scope
+    finally:
+        _current_scope.reset(token)
+
+
+def get_brand(brand_id):
+    """Brand.objects.get(id=brand_id), partagé dans le scope courant"""
+    from business.models import Brand
+
+    scope = _current_scope.get()
+    key = brand_id
+    if scope is not None:
+        brand = scope.get(scope._brands, key)
+        if brand is not None:
+            return brand
+
+    # Brand.DoesNotExist remonte tel quel (jamais mis en cache)
+    brand = Brand.objects.get(id=key)
+    if scope is not None:
+        scope.put(scope._brands, key, brand)
+    return brand
+
+
+def get_website(website_id, brand):
+    """Website.objects.get(id=website_id, brand=brand), partagé dans le scope courant"""
+    from seo_analyzer.models import Website
+
+    scope = _current_scope.get()
+    key = (str(website_id), brand.id)
+    if scope is not None:
+        website = scope.get(scope._websites, key)
+        if website is not None:
+            return website
+
+    website = Website.objects.get(id=website_id, brand=brand)
+    if scope is not None:
+        scope.put(scope._websites, key, website)
+    return website
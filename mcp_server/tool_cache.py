@@ -0,0 +1,212 @@
+# mcp_server/tool_cache.py
+"""
+Cache des résultats des outils MCP en lecture seule
+
+- Une partition par brand : clé = nom de l'outil + arguments normalisés
+- TTL par outil (CACHEABLE_TOOLS), seuls les résultats en succès sont cachés
+- Invalidation par signaux Django post_save/post_delete sur Keyword, Page,
+  PageKeyword et SemanticCocoon : la brand concernée est vidée quand on
+  peut la déterminer, tout le cache sinon (Keyword et cocons sont partagés)
+
+Les signaux ne voient que les écritures faites dans ce process : le TTL
+borne l'obsolescence des écritures faites par le backend.
+"""
+import json
+import logging
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from config import config
+
+logger = logging.getLogger(__name__)
+
+# Outils en lecture seule -> TTL (secondes)
+CACHEABLE_TOOLS = {
+    # keyword_tools
+    'search_keywords': 300,
+    'get_keyword_details': 600,
+    'analyze_keyword_performance': 600,
+    'get_ppa_analytics': 600,
+    'get_content_types': 3600,
+    # website_tools
+    'list_websites': 600,
+    'get_website_structure': 300,
+    'list_pages': 300,
+    'get_page_by_slug': 300,
+    'get_navigation': 300,
+    'get_sitemap_stats': 300,
+    'analyze_page_keywords': 300,
+    'list_page_keywords': 300,
+    'get_used_keywords': 300,
+    'get_website_stats': 300,
+    'get_page_details': 300,
+    'get_sibling_keywords': 300,
+    # cocoon_tools
+    'list_cocoons': 600,
+    'get_cocoon_details': 600,
+    'search_cocoons': 600,
+    'list_cocoon_keywords': 600,
+    'get_cocoon_categories': 3600,
+}
+
+# Modèles dont l'écriture invalide le cache
+INVALIDATING_MODELS = ('Keyword', 'Page', 'PageKeyword', 'SemanticCocoon')
+
+# Arguments qui n'influent pas sur le résultat (la brand est déjà la partition)
+IGNORED_ARGUMENTS = {'brand_id'}
+
+
+def normalize_arguments(arguments: Dict[str, Any]) -> str:
+    """Forme canonique : clés triées, valeurs vides retirées, chaînes nettoyées"""
+    normalized = {}
+    for key, value in (arguments or {}).items():
+        if key in IGNORED_ARGUMENTS or value is None or value == '' or value == []:
+            continue
+        if isinstance(value, str):
+            value = value.strip()
+        normalized[key] = value
+    return json.dumps(normalized, sort_keys=True, ensure_ascii=False, default=str)
+
+
+class ToolResultCache:
+    """Cache mémoire par brand, thread-safe"""
+
+    def __init__(self, max_entries_per_brand: int = 500, enabled: bool = True):
+        self.max_entries_per_brand = max_entries_per_brand
+        self.enabled = enabled
+        # brand_id -> {clé: (deadline, résultat)}
+        self._entries: Dict[Any, Dict[str, tuple]] = {}
+        self._lock = threading.Lock()
+        self.stats = {
+            'hits': 0,
+            'misses': 0,
+            'stores': 0,
+            'invalidations': 0,
+        }
+        self._tool_stats: Dict[str, Dict[str, int]] = {}
+
+    @staticmethod
+    def is_cacheable(tool_name: str) -> bool:
+        return tool_name in CACHEABLE_TOOLS
+
+    @staticmethod
+    def make_key(tool_name: str, arguments: Dict[str, Any]) -> str:
+        return f"{tool_name}:{normalize_arguments(arguments)}"
+
+    def _count(self, tool_name: str, event: str):
+        self.stats[event] += 1
+        tool_stats = self._tool_stats.setdefault(tool_name, {'hits': 0, 'misses': 0})
+        tool_stats[event] += 1
+
+    def get(self, tool_name: str, arguments: Dict[str, Any], brand_id: Optional[int]) -> Optional[Dict[str, Any]]:
+        """Résultat en cache ou None"""
+        if not self.enabled or not self.is_cacheable(tool_name):
+            return None
+
+        key = self.make_key(tool_name, arguments)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(brand_id, {}).get(key)
+            if entry is not None and entry[0] > now:
+                self._count(tool_name, 'hits')
+                return entry[1]
+            if entry is not None:
+                del self._entries[brand_id][key]
+            self._count(tool_name, 'misses')
+        return None
+
+    def set(self, tool_name: str, arguments: Dict[str, Any], brand_id: Optional[int], result: Dict[str, Any]):
+        """Met en cache un résultat en succès"""
+        if not self.enabled or not self.is_cacheable(tool_name):
+            return
+        if not isinstance(result, dict) or not result.get('success'):
+            return
+
+        key = self.make_key(tool_name, arguments)
+        deadline = time.monotonic() + CACHEABLE_TOOLS[tool_name]
+        with self._lock:
+            brand_entries = self._entries.setdefault(brand_id, {})
+            brand_entries[key] = (deadline, result)
+            if len(brand_entries) > self.max_entries_per_brand:
+                # Évince l'entrée la plus proche de l'expiration
+                oldest = min(brand_entries, key=lambda k: brand_entries[k][0])
+                del brand_entries[oldest]
+            self.stats['stores'] += 1
+
+    def invalidate_brand(self, brand_id: Optional[int]):
+        with self._lock:
+            if self._entries.pop(brand_id, None) is not None:
+                self.stats['invalidations'] += 1
+
+    def invalidate_all(self):
+        with self._lock:
+            if self._entries:
+                self.stats['invalidations'] += 1
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.stats['hits'] + self.stats['misses']
+            return {
+                **self.stats,
+                'enabled': self.enabled,
+                'hit_rate': round(self.stats['hits'] / lookups, 4) if lookups else None,
+                'brands': len(self._entries),
+                'entries': sum(len(entries) for entries in self._entries.values()),
+                'by_tool': {name: dict(counts) for name, counts in self._tool_stats.items()},
+            }
+
+
+def _brand_for_instance(instance) -> Optional[int]:
+    """Brand d'une instance modifiée, None si non déterminable"""
+    try:
+        if hasattr(instance, 'website_id'):
+            return instance.website.brand_id
+        if hasattr(instance, 'page_id'):
+            return instance.page.website.brand_id
+    except Exception:
+        return None
+    return None
+
+
+def _on_model_change(sender, instance, **kwargs):
+    brand_id = _brand_for_instance(instance)
+    if brand_id is None:
+        tool_cache.invalidate_all()
+    else:
+        tool_cache.invalidate_brand(brand_id)
+
+
+_signals_connected = False
+
+
+def connect_invalidation_signals():
+    """Branche l'invalidation sur les modèles (idempotent, nécessite Django initialisé)"""
+    global _signals_connected
+    if _signals_connected:
+        return
+    from django.db.models.signals import post_save, post_delete
+    from seo_analyzer import models as seo_models
+
+    for model_name in INVALIDATING_MODELS:
+        model = getattr(seo_models, model_name, None)
+        if model is None:
+            logger.warning(f"Tool cache: model {model_name} not found, no invalidation")
+            continue
+        for signal_name, signal in (('save', post_save), ('delete', post_delete)):
+            signal.connect(
+                _on_model_change,
+                sender=model,
+                weak=False,
+                dispatch_uid=f"mcp_tool_cache_{signal_name}_{model_name}",
+            )
+    _signals_connected = True
+    logger.info("Tool cache: invalidation signals connected")
+
+
+# Instance globale (partagée par les ToolRegistry du process)
+tool_cache = ToolResultCache(
+    max_entries_per_brand=config.tool_cache_max_entries,
+    enabled=config.tool_cache_enabled,
+)
@@ -0,0 +1,272 @@
+# mcp_server/tool_executor.py
+"""
+Exécution concurrente des handlers d'outils (synchrones, Django ORM)
+
+Par défaut sync_to_async(thread_sensitive=True) exécute tous les handlers
+sur un seul thread : un appel lent bloque tous les clients. Ici :
+- pool de threads borné (MCP_TOOL_WORKERS) : au plus N requêtes SQL en parallèle
+- une connexion Django par thread worker, réutilisée entre appels
+  (CONN_MAX_AGE) et vérifiée/recyclée avant et après chaque appel
+- plafond d'appels simultanés par brand : une brand ne peut pas occuper
+  tout le pool
+- timeout par outil : l'appelant reçoit une erreur, le slot de la brand
+  n'est libéré qu'à la fin réelle du handler (un thread ne s'interrompt pas)
+"""
+import asyncio
+import contextvars
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, Dict, Optional
+
+from config import config
+
+logger = logging.getLogger(__name__)
+
+# Timeouts spécifiques (secondes), MCP_TOOL_TIMEOUT sinon
+TOOL_TIMEOUTS = {
+    'get_website_structure': 60,
+    'get_website_stats': 60,
+    'analyze_keyword_performance': 60,
+    'get_ppa_analytics': 60,
+    'get_content_types': 10,
+    'get_cocoon_categories': 10,
+}
+
+
+class ToolTimeoutError(Exception):
+    """Handler non terminé dans le délai imparti"""
+
+    def __init__(self, tool_name: str, timeout: float):
+        self.tool_name = tool_name
+        self.timeout = timeout
+        super().__init__(f"Tool '{tool_name}' timed out after {timeout:g}s")
+
+
+def _run_with_db_connection(handler: Callable, *args):
+    """Exécute un handler dans un thread worker en gérant sa connexion Django"""
+    try:
+        from django.db import close_old_connections
+    except ImportError:
+        return handler(*args)
+
+    # Connexion expirée ou cassée par l'appel précédent : recyclée ici
+    close_old_connections()
+    try:
+        return handler(*args)
+    finally:
+        close_old_connections()
+
+
+class ToolExecutor:
+    """Pool de workers partagé par les ToolRegistry du process"""
+
+    def __init__(self, max_workers: int = 8, per_brand_limit: int = 4, default_timeout: float = 30):
+        self.max_workers = max_workers
+        self.per_brand_limit = max(1, min(per_brand_limit, max_workers))
+        self.default_timeout = default_timeout
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+        # (loop, brand_id) -> Semaphore : un sémaphore asyncio est lié à sa boucle
+        self._brand_slots: Dict[tuple, asyncio.Semaphore] = {}
+        self._lock = threading.Lock()
+        self.stats = {
+            'executed': 0,
+            'timeouts': 0,
+            'errors': 0,
+            'running': 0,
+            'waiting': 0,
+        }
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    self._pool = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix='mcp-tool',
+                    )
+        return self._pool
+
+    def _brand_semaphore(self, brand_id: Optional[int]) -> asyncio.Semaphore:
+        key = (id(asyncio.get_running_loop()), brand_id)
+        with self._lock:
+            semaphore = self._brand_slots.get(key)
+            if semaphore is None:
+                semaphore = asyncio.Semaphore(self.per_brand_limit)
+                self._brand_slots[key] = semaphore
+            return semaphore
+
+    def timeout_for(self, tool_name: str) -> float:
+        return TOOL_TIMEOUTS.get(tool_name, self.default_timeout)
+
+    def _count(self, event: str, delta: int = 1):
+        with self._lock:
+            self.stats[event] += delta
+
+    async def run(self, tool_name: str, handler: Callable, arguments: Dict[str, Any], brand_id: Optional[int]) -> Any:
+        """
+        Exécute handler(tool_name, arguments, brand_id) dans le pool.
+        Lève ToolTimeoutError si le délai de l'outil est dépassé.
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = self._brand_semaphore(brand_id)
+        timeout = self.timeout_for(tool_name)
+        deadline = loop.time() + timeout
+
+        # Attente d'un slot de la brand : compte dans le délai de l'outil
+        self._count('waiting')
+        try:
+            await asyncio.wait_for(semaphore.acquire(), timeout)
+        except asyncio.TimeoutError:
+            self._count('timeouts')
+            raise ToolTimeoutError(tool_name, timeout)
+        finally:
+            self._count('waiting', -1)
+
+        self._count('running')
+        try:
+            # Contexte copié : le request_scope d'un batch suit l'appel dans le worker
+            context = contextvars.copy_context()
+            future = self._get_pool().submit(
+                context.run, _run_with_db_connection, handler, tool_name, arguments, brand_id
+            )
+        except Exception:
+            self._count('running', -1)
+            semaphore.release()
+            raise
+
+        def on_done(_future):
+            # Libéré à la fin réelle du handler, même après un timeout
+            self._count('running', -1)
+            try:
+                loop.call_soon_threadsafe(semaphore.release)
+            except RuntimeError:
+                pass  # Boucle fermée entre-temps
+
+        future.add_done_callback(on_done)
+
+        started = time.monotonic()
+        try:
+            result = await asyncio.wait_for(
+                asyncio.shield(asyncio.wrap_future(future)),
+                max(deadline - loop.time(), 0),
+            )
+        except asyncio.TimeoutError:
+            self._count('timeouts')
+            logger.warning(
+                f"Tool {tool_name} (brand {brand_id}) timed out after {timeout:g}s, "
+                f"worker still busy"
+            )
+            raise ToolTimeoutError(tool_name, timeout)
+        except Exception:
+            self._count('errors')
+            raise
+
+        self._count('executed')
+        logger.debug(f"Tool {tool_name} (brand {brand_id}) executed in {time.monotonic() - started:.3f}s")
+        return result
+
+    async def stream(self, tool_name: str, generator_fn: Callable, arguments: Dict[str, Any],
+                     brand_id: Optional[int], max_buffered: int = 100) -> AsyncIterator[Any]:
+        """
+        Consomme generator_fn(tool_name, arguments, brand_id) dans un worker.
+
+        Le générateur tourne entièrement sur un seul thread (curseur et
+        connexion Django restent sur leur thread) et pousse ses événements
+        dans une file bornée : s'il va plus vite que le client, il attend.
+        Le timeout de l'outil s'applique entre deux événements. Si le client
+        s'arrête, le générateur est fermé au prochain événement.
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = self._brand_semaphore(brand_id)
+        timeout = self.timeout_for(tool_name)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=max_buffered)
+        cancelled = threading.Event()
+        end = object()
+
+        def put(event) -> bool:
+            try:
+                asyncio.run_coroutine_threadsafe(queue.put(event), loop).result()
+                return True
+            except RuntimeError:
+                return False  # Boucle fermée
+
+        def produce():
+            generator = generator_fn(tool_name, arguments, brand_id)
+            try:
+                for event in generator:
+                    if cancelled.is_set() or not put(event):
+                        break
+            except Exception as e:
+                logger.error(f"Streaming tool {tool_name} failed: {e}", exc_info=True)
+                put({'type': 'error', 'error': f"Internal error in {tool_name}: {e}"})
+            finally:
+                generator.close()
+                put(end)
+
+        try:
+            await asyncio.wait_for(semaphore.acquire(), timeout)
+        except asyncio.TimeoutError:
+            self._count('timeouts')
+            raise ToolTimeoutError(tool_name, timeout)
+
+        self._count('running')
+        context = contextvars.copy_context()
+        try:
+            future = self._get_pool().submit(context.run, _run_with_db_connection, produce)
+        except Exception:
+            self._count('running', -1)
+            semaphore.release()
+            raise
+
+        def on_done(_future):
+            self._count('running', -1)
+            try:
+                loop.call_soon_threadsafe(semaphore.release)
+            except RuntimeError:
+                pass
+
+        future.add_done_callback(on_done)
+
+        try:
+            while True:
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    self._count('timeouts')
+                    raise ToolTimeoutError(tool_name, timeout)
+                if event is end:
+                    break
+                yield event
+            self._count('executed')
+        finally:
+            # Client parti ou timeout : on débloque le worker et on l'arrête
+            cancelled.set()
+            while not queue.empty():
+                queue.get_nowait()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                **self.stats,
+                'mode': config.tool_execution_mode,
+                'max_workers': self.max_workers,
+                'per_brand_limit': self.per_brand_limit,
+                'default_timeout': self.default_timeout,
+            }
+
+    def shutdown(self, wait: bool = True):
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=wait)
+                self._pool = None
+
+
+# Instance globale
+tool_executor = ToolExecutor(
+    max_workers=config.tool_workers,
+    per_brand_limit=config.tool_brand_concurrency,
+    default_timeout=config.tool_timeout_seconds,
+)
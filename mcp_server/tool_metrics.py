@@ -0,0 +1,289 @@
+# mcp_server/tool_metrics.py
+"""
+Instrumentation des outils MCP
+
+Par outil : histogrammes du temps total, du temps SQL, du nombre de
+requêtes et de la taille du résultat (JSON), plus un compteur d'appels
+par statut (ok, error, timeout, cache_hit).
+
+- Le SQL est mesuré par un execute_wrapper Django posé sur les connexions
+  du thread qui exécute le handler (voir run_with_sql_stats)
+- Les appels plus lents que MCP_SLOW_CALL_SECONDS sont loggés avec leurs
+  arguments et gardés dans un historique court
+- Export texte Prometheus (/metrics) et résumé JSON (outil get_tool_metrics)
+"""
+import json
+import logging
+import threading
+import time
+from collections import deque
+from contextlib import ExitStack
+from typing import Any, Dict, List, Optional, Tuple
+
+from config import config
+
+logger = logging.getLogger(__name__)
+
+SECONDS_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+QUERY_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000)
+BYTES_BUCKETS = (1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+
+# Nom -> (description, buckets)
+HISTOGRAMS = {
+    'mcp_tool_duration_seconds': ("Wall time of MCP tool calls", SECONDS_BUCKETS),
+    'mcp_tool_db_seconds': ("Time spent in SQL per MCP tool call", SECONDS_BUCKETS),
+    'mcp_tool_queries': ("SQL queries per MCP tool call", QUERY_BUCKETS),
+    'mcp_tool_result_bytes': ("JSON size of MCP tool results", BYTES_BUCKETS),
+}
+
+MAX_LOGGED_ARGUMENTS = 500
+
+
+class SqlStats:
+    """Compteurs SQL d'un appel (remplis par le thread worker)"""
+
+    __slots__ = ('queries', 'seconds')
+
+    def __init__(self):
+        self.queries = 0
+        self.seconds = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        # Signature des execute_wrapper Django
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries += 1
+            self.seconds += time.perf_counter() - started
+
+
+def run_with_sql_stats(sql_stats: SqlStats, handler, *args):
+    """Exécute un handler en comptant les requêtes de toutes les connexions du thread"""
+    try:
+        from django.db import connections
+    except ImportError:
+        return handler(*args)
+
+    with ExitStack() as stack:
+        for alias in connections:
+            stack.enter_context(connections[alias].execute_wrapper(sql_stats))
+        return handler(*args)
+
+
+def iter_with_sql_stats(sql_stats: SqlStats, generator_fn, *args):
+    """Variante de run_with_sql_stats pour les handlers streaming (même thread de bout en bout)"""
+    try:
+        from django.db import connections
+    except ImportError:
+        yield from generator_fn(*args)
+        return
+
+    with ExitStack() as stack:
+        for alias in connections:
+            stack.enter_context(connections[alias].execute_wrapper(sql_stats))
+        yield from generator_fn(*args)
+
+
+def result_size(result: Any) -> int:
+    try:
+        return len(json.dumps(result, ensure_ascii=False, default=str).encode('utf-8'))
+    except (TypeError, ValueError):
+        return 0
+
+
+class Histogram:
+    """Histogramme cumulatif à la Prometheus, une série par outil"""
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        # outil -> [compteurs par bucket (+Inf en dernier), somme, nombre]
+        self.series: Dict[str, list] = {}
+
+    def observe(self, tool_name: str, value: float):
+        series = self.series.get(tool_name)
+        if series is None:
+            series = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            self.series[tool_name] = series
+        counts = series[0]
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                counts[index] += 1
+                break
+        else:
+            counts[-1] += 1
+        series[1] += value
+        series[2] += 1
+
+    def quantile(self, tool_name: str, q: float) -> Optional[float]:
+        """Estimation par la borne haute du bucket atteint"""
+        series = self.series.get(tool_name)
+        if not series or not series[2]:
+            return None
+        target = q * series[2]
+        cumulative = 0
+        for index, count in enumerate(series[0]):
+            cumulative += count
+            if cumulative >= target:
+                return self.buckets[index] if index < len(self.buckets) else float('inf')
+        return None
+
+    def mean(self, tool_name: str) -> Optional[float]:
+        series = self.series.get(tool_name)
+        if not series or not series[2]:
+            return None
+        return series[1] / series[2]
+
+
+class ToolMetrics:
+    """Registre des métriques des outils, thread-safe"""
+
+    def __init__(self, slow_call_seconds: float = 1.0, slow_calls_kept: int = 50):
+        self.slow_call_seconds = slow_call_seconds
+        self._lock = threading.Lock()
+        self._histograms = {name: Histogram(buckets) for name, (_, buckets) in HISTOGRAMS.items()}
+        self._calls: Dict[Tuple[str, str], int] = {}
+        self._categories: Dict[str, str] = {}
+        self._slow_calls = deque(maxlen=slow_calls_kept)
+
+    def record(self, tool_name: str, category: str, status: str, duration: float,
+               sql_stats: Optional[SqlStats] = None, size: Optional[int] = None,
+               arguments: Optional[Dict[str, Any]] = None, brand_id: Optional[int] = None):
+        with self._lock:
+            self._categories[tool_name] = category
+            self._calls[(tool_name, status)] = self._calls.get((tool_name, status), 0) + 1
+            if status == 'cache_hit':
+                return
+
+            self._histograms['mcp_tool_duration_seconds'].observe(tool_name, duration)
+            if sql_stats is not None:
+                self._histograms['mcp_tool_db_seconds'].observe(tool_name, sql_stats.seconds)
+                self._histograms['mcp_tool_queries'].observe(tool_name, sql_stats.queries)
+            if size is not None:
+                self._histograms['mcp_tool_result_bytes'].observe(tool_name, size)
+
+            if duration < self.slow_call_seconds:
+                return
+            slow_call = {
+                'tool': tool_name,
+                'brand_id': brand_id,
+                'status': status,
+                'duration_ms': round(duration * 1000, 1),
+                'db_ms': round(sql_stats.seconds * 1000, 1) if sql_stats else None,
+                'queries': sql_stats.queries if sql_stats else None,
+                'result_bytes': size,
+                'arguments': arguments,
+                'at': time.time(),
+            }
+            self._slow_calls.append(slow_call)
+
+        arguments_text = json.dumps(arguments, ensure_ascii=False, default=str)[:MAX_LOGGED_ARGUMENTS]
+        logger.warning(
+            f"Slow MCP tool call: {tool_name} {slow_call['duration_ms']}ms "
+            f"(db {slow_call['db_ms']}ms, {slow_call['queries']} queries, "
+            f"{size} bytes, brand {brand_id}) arguments={arguments_text}"
+        )
+
+    # ===== EXPORTS =====
+
+    def render_prometheus(self) -> str:
+        """Format texte d'exposition Prometheus"""
+        lines = [
+            '# HELP mcp_tool_calls_total MCP tool calls by status',
+            '# TYPE mcp_tool_calls_total counter',
+        ]
+        with self._lock:
+            for (tool_name, status), count in sorted(self._calls.items()):
+                lines.append(f'mcp_tool_calls_total{{tool="{tool_name}",status="{status}"}} {count}')
+
+            for name, (description, _) in HISTOGRAMS.items():
+                histogram = self._histograms[name]
+                lines.append(f'# HELP {name} {description}')
+                lines.append(f'# TYPE {name} histogram')
+                for tool_name, (counts, total, count) in sorted(histogram.series.items()):
+                    cumulative = 0
+                    for bound, bucket_count in zip(histogram.buckets, counts):
+                        cumulative += bucket_count
+                        lines.append(f'{name}_bucket{{tool="{tool_name}",le="{bound:g}"}} {cumulative}')
+                    lines.append(f'{name}_bucket{{tool="{tool_name}",le="+Inf"}} {count}')
+                    lines.append(f'{name}_sum{{tool="{tool_name}"}} {total:g}')
+                    lines.append(f'{name}_count{{tool="{tool_name}"}} {count}')
+        return '\n'.join(lines) + '\n'
+
+    def summary(self, sort_by: str = 'p95_ms', limit: Optional[int] = None) -> Dict[str, Any]:
+        """Vue par outil (latences estimées, SQL moyen, taille) + derniers appels lents"""
+        with self._lock:
+            duration = self._histograms['mcp_tool_duration_seconds']
+            db = self._histograms['mcp_tool_db_seconds']
+            queries = self._histograms['mcp_tool_queries']
+            sizes = self._histograms['mcp_tool_result_bytes']
+
+            def ms(value):
+                return round(value * 1000, 1) if value is not None and value != float('inf') else value
+
+            tools: List[Dict[str, Any]] = []
+            for tool_name, category in self._categories.items():
+                calls = {
+                    status: count for (name, status), count in self._calls.items()
+                    if name == tool_name
+                }
+                mean_queries = queries.mean(tool_name)
+                mean_size = sizes.mean(tool_name)
+                tools.append({
+                    'tool': tool_name,
+                    'category': category,
+                    'calls': calls,
+                    'mean_ms': ms(duration.mean(tool_name)),
+                    'p50_ms': ms(duration.quantile(tool_name, 0.5)),
+                    'p95_ms': ms(duration.quantile(tool_name, 0.95)),
+                    'p99_ms': ms(duration.quantile(tool_name, 0.99)),
+                    'mean_db_ms': ms(db.mean(tool_name)),
+                    'mean_queries': round(mean_queries, 1) if mean_queries is not None else None,
+                    'mean_result_bytes': int(mean_size) if mean_size is not None else None,
+                })
+            slow_calls = list(self._slow_calls)
+
+        tools.sort(key=lambda item: item.get(sort_by) or 0, reverse=True)
+        return {
+            'tools': tools[:limit] if limit else tools,
+            'slow_call_threshold_ms': self.slow_call_seconds * 1000,
+            'recent_slow_calls': list(reversed(slow_calls)),
+            'note': 'Percentiles estimated from histogram bucket upper bounds',
+        }
+
+
+# Outil de consultation (catégorie 'system', pas de DB)
+METRICS_TOOLS = [
+    {
+        "name": "get_tool_metrics",
+        "description": "Latency, SQL and result-size summary of MCP tools, with recent slow calls",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "sort_by": {
+                    "type": "string",
+                    "enum": ["p95_ms", "p99_ms", "mean_ms", "mean_db_ms", "mean_queries", "mean_result_bytes"],
+                    "default": "p95_ms"
+                },
+                "limit": {"type": "integer", "description": "Max tools returned"}
+            },
+            "required": []
+        }
+    }
+]
+
+
+def handle_metrics_tool(tool_name: str, arguments: Dict[str, Any], brand_id: int) -> Dict[str, Any]:
+    if tool_name == "get_tool_metrics":
+        return {
+            'success': True,
+            'result': tool_metrics.summary(
+                sort_by=arguments.get('sort_by') or 'p95_ms',
+                limit=arguments.get('limit')
+            )
+        }
+    return {'success': False, 'error': f'Unknown metrics tool: {tool_name}'}
+
+
+# Instance globale
+tool_metrics = ToolMetrics(slow_call_seconds=config.slow_call_seconds)
@@ -1,9 +1,18 @@
 # mcp_server/tools_registry.py
 import asyncio
-from typing import Dict, Any, List, Callable
+import functools
+import time
+from typing import Dict, Any, AsyncIterator, List, Callable
 from asgiref.sync import sync_to_async
 
+from config import config
 from exceptions import ToolNotFoundError, handle_django_error
+from tool_cache import tool_cache, connect_invalidation_signals
+from tool_executor import tool_executor, ToolTimeoutError
+from tool_metrics import (
+    tool_metrics, SqlStats, run_with_sql_stats, iter_with_sql_stats, result_size,
+    METRICS_TOOLS, handle_metrics_tool
+)
 
 class ToolRegistry:
     """Registry centralisé pour tous les outils MCP"""
@@ -11,6 +20,7 @@ class ToolRegistry:
     def __init__(self):
         self._tools = {}
         self._handlers = {}
+        self._stream_handlers = {}
         self._load_tools()
     
     def _load_tools(self):
@@ -20,12 +30,23 @@ class ToolRegistry:
             from cocoon_tools import COCOON_TOOLS, handle_cocoon_tool
             from keyword_tools import KEYWORD_TOOLS, handle_keyword_tool  
             from website_tools import WEBSITE_TOOLS, handle_website_tool
+            from website_tools import WEBSITE_STREAMING_TOOLS, stream_website_tool
             
             # Enregistrer les outils
             self._register_tools('cocoon', COCOON_TOOLS, handle_cocoon_tool)
             self._register_tools('keyword', KEYWORD_TOOLS, handle_keyword_tool)
             self._register_tools('website', WEBSITE_TOOLS, handle_website_tool)
             
+            # Handlers générateurs pour /execute/stream
+            for tool_name in WEBSITE_STREAMING_TOOLS:
+                self._stream_handlers[tool_name] = stream_website_tool
+            
+            # Invalidation du cache sur écriture des modèles SEO
+            try:
+                connect_invalidation_signals()
+            except Exception as e:
+                print(f"⚠️ Tool cache invalidation disabled: {e}")
+            
             print(f"✅ Loaded {len(self._tools)} MCP tools:")
             for category in ['cocoon', 'keyword', 'website']:
                 tools_in_cat = [name for name, info in self._tools.items() if info['category'] == category]
@@ -34,6 +55,9 @@ class ToolRegistry:
         except ImportError as e:
             print(f"⚠️ Could not load Django tools: {e}")
             self._load_fallback_tools()
+        
+        # Métriques des outils : disponibles même sans Django
+        self._register_tools('system', METRICS_TOOLS, handle_metrics_tool)
     
     def _load_fallback_tools(self):
         """Tools de base si Django indisponible"""
@@ -135,23 +159,96 @@ class ToolRegistry:
         handler = self._handlers[tool_name]
         category = self._tools[tool_name]['category']
         
+        # Cache par brand des outils en lecture seule
+        started = time.perf_counter()
+        cached = tool_cache.get(tool_name, arguments, brand_id)
+        if cached is not None:
+            tool_metrics.record(tool_name, category, 'cache_hit', time.perf_counter() - started)
+            return cached
+        
+        # Temps SQL et nombre de requêtes, mesurés dans le thread du handler
+        sql_stats = SqlStats()
+        measured_handler = functools.partial(run_with_sql_stats, sql_stats, handler)
+        
         try:
             # Vérifier si c'est un tool système (déjà prêt pour async)
             if category == 'system':
                 result = handler(tool_name, arguments, brand_id)
+            elif config.tool_execution_mode == 'concurrent':
+                # Pool borné, plafond par brand et timeout par outil
+                result = await tool_executor.run(tool_name, measured_handler, arguments, brand_id)
             else:
                 # Wrapper asynchrone pour les handlers Django
-                sync_handler = sync_to_async(handler)
+                sync_handler = sync_to_async(measured_handler)
                 result = await sync_handler(tool_name, arguments, brand_id)
             
             # Standardisation
-            if isinstance(result, dict) and 'success' in result:
-                return result
-            else:
-                return {'success': True, 'result': result}
-                
+            if not (isinstance(result, dict) and 'success' in result):
+                result = {'success': True, 'result': result}
+            
+            tool_cache.set(tool_name, arguments, brand_id, result)
+        
+        except ToolTimeoutError as e:
+            result = {
+                'success': False,
+                'error': str(e),
+                'error_type': 'TIMEOUT'
+            }
         except Exception as e:
-            return handle_django_error(f"{category}.{tool_name}", e)
+            result = handle_django_error(f"{category}.{tool_name}", e)
+        
+        if result.get('success'):
+            status = 'ok'
+        else:
+            status = 'timeout' if result.get('error_type') == 'TIMEOUT' else 'error'
+        tool_metrics.record(
+            tool_name, category, status, time.perf_counter() - started,
+            sql_stats=sql_stats if category != 'system' else None,
+            size=result_size(result),
+            arguments=arguments,
+            brand_id=brand_id
+        )
+        return result
+    
+    def supports_streaming(self, tool_name: str) -> bool:
+        return tool_name in self._stream_handlers
+    
+    def get_streaming_tools(self) -> List[str]:
+        return sorted(self._stream_handlers)
+    
+    async def stream_tool(self, tool_name: str, arguments: Dict[str, Any], brand_id: int) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Execute un outil en produisant des événements meta/item/summary/error.
+        Les outils sans handler streaming renvoient un unique événement 'result'.
+        """
+        if tool_name not in self._tools:
+            raise ToolNotFoundError(tool_name)
+        
+        if tool_name not in self._stream_handlers:
+            result = await self.execute_tool(tool_name, arguments, brand_id)
+            yield {'type': 'result', **result}
+            return
+        
+        started = time.perf_counter()
+        sql_stats = SqlStats()
+        measured_handler = functools.partial(iter_with_sql_stats, sql_stats, self._stream_handlers[tool_name])
+        status = 'ok'
+        size = 0
+        try:
+            async for event in tool_executor.stream(tool_name, measured_handler, arguments, brand_id):
+                if event.get('type') == 'error':
+                    status = 'error'
+                size += result_size(event)
+                yield event
+        except ToolTimeoutError as e:
+            status = 'timeout'
+            yield {'type': 'error', 'error': str(e), 'error_type': 'TIMEOUT'}
+        finally:
+            category = self._tools[tool_name]['category']
+            tool_metrics.record(
+                f"{tool_name}:stream", category, status, time.perf_counter() - started,
+                sql_stats=sql_stats, size=size, arguments=arguments, brand_id=brand_id
+            )
     
     def tool_exists(self, tool_name: str) -> bool:
         return tool_name in self._tools
@@ -168,17 +168,259 @@ WEBSITE_TOOLS = [
     }
 ]
 
+def load_page_tree(website, Page, PageKeyword):
+    """
+    Arbre des pages d'un website en 2 requêtes (au lieu d'une par page) :
+    - toutes les pages + nombre de cocons (une requête annotée)
+    - nombre de mots-clés par page (une requête groupée)
+    L'arbre est ensuite assemblé en mémoire via parent_id.
+    Retourne (racines, total_pages, profondeur max).
+    """
+    from django.db.models import Count
+    
+    pages = list(
+        Page.objects.filter(website=website)
+        .annotate(cocoons_count=Count('cocoons', distinct=True))
+        .values(
+            'id', 'parent_id', 'title', 'url_path', 'page_type',
+            'search_intent', 'exclude_from_sitemap', 'cocoons_count'
+        )
+        .order_by('title', 'id')
+    )
+    
+    keyword_counts = dict(
+        PageKeyword.objects.filter(page__website=website)
+        .values('page_id')
+        .annotate(count=Count('id'))
+        .values_list('page_id', 'count')
+    )
+    
+    nodes = {}
+    children_by_parent = {}
+    for page in pages:
+        nodes[page['id']] = {
+            'id': page['id'],
+            'title': page['title'],
+            'url_path': page['url_path'],
+            'page_type': page['page_type'],
+            'search_intent': page['search_intent'],
+            'keywords_count': keyword_counts.get(page['id'], 0),
+            'cocoons_count': page['cocoons_count'],
+            'exclude_from_sitemap': page['exclude_from_sitemap'],
+            'children': []
+        }
+        # Pages triées par titre : l'ordre des enfants est conservé
+        children_by_parent.setdefault(page['parent_id'], []).append(page['id'])
+    
+    # Assemblage itératif (pas de récursion, protégé contre les cycles)
+    roots = [nodes[page_id] for page_id in children_by_parent.get(None, [])]
+    max_depth = 1 if roots else 0
+    stack = [(node, 1) for node in roots]
+    visited = set()
+    while stack:
+        node, depth = stack.pop()
+        if node['id'] in visited:
+            continue
+        visited.add(node['id'])
+        max_depth = max(max_depth, depth)
+        for child_id in children_by_parent.get(node['id'], []):
+            child = nodes[child_id]
+            node['children'].append(child)
+            stack.append((child, depth + 1))
+    
+    return roots, len(pages), max_depth
+
+# ===== RÉSULTATS EN STREAMING =====
+#
+# Contrat des handlers streaming : générateur synchrone
+# stream_website_tool(tool_name, arguments, brand_id) qui produit des
+# événements dict, consommés au fil de l'eau par http_api (/execute/stream) :
+#   {'type': 'meta', ...}     une fois, en premier (contexte, filtres)
+#   {'type': 'item', 'data'}  une ligne de résultat
+#   {'type': 'summary', ...}  une fois, en dernier (compteurs)
+#   {'type': 'error', 'error'} à la place des événements restants
+# Les lignes viennent d'un queryset.values().iterator() : mémoire constante.
+
+WEBSITE_STREAMING_TOOLS = ['get_used_keywords', 'list_page_keywords']
+
+STREAM_CHUNK_SIZE = 2000
+
+
+def iter_used_keyword_rows(website, PageKeyword):
+    """Mots-clés utilisés sur un site, une ligne par association page/mot-clé"""
+    rows = (
+        PageKeyword.objects.filter(page__website=website)
+        .order_by('keyword__keyword', 'id')
+        .values(
+            'keyword_id', 'keyword__keyword', 'keyword__volume', 'keyword_type',
+            'page_id', 'page__title', 'page__url_path'
+        )
+    )
+    for row in rows.iterator(chunk_size=STREAM_CHUNK_SIZE):
+        yield {
+            'keyword_id': row['keyword_id'],
+            'keyword': row['keyword__keyword'],
+            'volume': row['keyword__volume'],
+            'keyword_type': row['keyword_type'],
+            'page_id': row['page_id'],
+            'page_title': row['page__title'],
+            'page_url': row['page__url_path']
+        }
+
+
+def used_keyword_stats(website, PageKeyword):
+    """Stats d'utilisation des mots-clés d'un site en une requête agrégée"""
+    from django.db.models import Count, Q
+    
+    return PageKeyword.objects.filter(page__website=website).aggregate(
+        total_keywords_used=Count('id'),
+        unique_keywords=Count('keyword_id', distinct=True),
+        primary_keywords=Count('id', filter=Q(keyword_type='primary')),
+        secondary_keywords=Count('id', filter=Q(keyword_type='secondary')),
+        anchor_keywords=Count('id', filter=Q(keyword_type='anchor'))
+    )
+
+
+def filter_page_keywords(queryset, arguments):
+    """Filtres de PageKeywordFilter appliqués aux arguments de l'outil"""
+    filters = {
+        'page_id': arguments.get('page_id'),
+        'keyword_id': arguments.get('keyword_id'),
+        'keyword_type': arguments.get('keyword_type'),
+        'is_ai_selected': arguments.get('is_ai_selected')
+    }
+    
+    if filters['page_id']:
+        queryset = queryset.filter(page_id=filters['page_id'])
+    if filters['keyword_id']:
+        queryset = queryset.filter(keyword_id=filters['keyword_id'])
+    if filters['keyword_type']:
+        queryset = queryset.filter(keyword_type=filters['keyword_type'])
+    if filters['is_ai_selected'] is not None:
+        queryset = queryset.filter(is_ai_selected=filters['is_ai_selected'])
+    
+    source_cocoon = arguments.get('source_cocoon')
+    if source_cocoon:
+        queryset = queryset.filter(source_cocoon_id=source_cocoon)
+    
+    return queryset, filters
+
+
+def stream_website_tool(tool_name: str, arguments: dict, brand_id: int):
+    """Handler streaming des outils website (voir contrat ci-dessus)"""
+    from seo_analyzer.models import Website, PageKeyword
+    from business.models import Brand
+    from request_scope import get_brand, get_website
+    
+    try:
+        brand = get_brand(brand_id)
+    except Brand.DoesNotExist:
+        yield {'type': 'error', 'error': f'Brand {brand_id} not found'}
+        return
+    
+    if tool_name == "get_used_keywords":
+        website_id = arguments.get('website_id')
+        try:
+            website = get_website(website_id, brand)
+        except Website.DoesNotExist:
+            yield {'type': 'error', 'error': f'Website {website_id} not found or not accessible'}
+            return
+        
+        yield {
+            'type': 'meta',
+            'tool': tool_name,
+            'website': {'id': website.id, 'name': website.name, 'url': website.url}
+        }
+        
+        # Stats calculées pendant le parcours : pas de seconde requête
+        stats = {
+            'total_keywords_used': 0,
+            'unique_keywords': 0,
+            'primary_keywords': 0,
+            'secondary_keywords': 0,
+            'anchor_keywords': 0
+        }
+        seen_keywords = set()
+        for row in iter_used_keyword_rows(website, PageKeyword):
+            stats['total_keywords_used'] += 1
+            seen_keywords.add(row['keyword_id'])
+            type_key = f"{row['keyword_type']}_keywords"
+            if type_key in stats:
+                stats[type_key] += 1
+            yield {'type': 'item', 'data': row}
+        stats['unique_keywords'] = len(seen_keywords)
+        
+        yield {'type': 'summary', 'stats': stats}
+    
+    elif tool_name == "list_page_keywords":
+        queryset = PageKeyword.objects.filter(page__website__brand=brand)
+        queryset, filters = filter_page_keywords(queryset, arguments)
+        
+        # En streaming, limit est optionnel : sans limit, tout est parcouru
+        limit = arguments.get('limit')
+        rows = queryset.order_by('id').values(
+            'id', 'page_id', 'page__title', 'page__url_path', 'page__website__name',
+            'keyword_id', 'keyword__keyword', 'keyword__volume', 'keyword__search_intent',
+            'keyword_type', 'position', 'is_ai_selected',
+            'source_cocoon_id', 'source_cocoon__name', 'created_at'
+        )
+        if limit:
+            rows = rows[:limit]
+        
+        yield {
+            'type': 'meta',
+            'tool': tool_name,
+            'brand_context': {'id': brand.id, 'name': brand.name},
+            'filters_applied': filters
+        }
+        
+        returned = 0
+        for row in rows.iterator(chunk_size=STREAM_CHUNK_SIZE):
+            returned += 1
+            yield {
+                'type': 'item',
+                'data': {
+                    'id': row['id'],
+                    'page': {
+                        'id': row['page_id'],
+                        'title': row['page__title'],
+                        'url_path': row['page__url_path'],
+                        'website_name': row['page__website__name']
+                    },
+                    'keyword': {
+                        'id': row['keyword_id'],
+                        'keyword': row['keyword__keyword'],
+                        'volume': row['keyword__volume'],
+                        'search_intent': row['keyword__search_intent']
+                    },
+                    'keyword_type': row['keyword_type'],
+                    'position': row['position'],
+                    'is_ai_selected': row['is_ai_selected'],
+                    'source_cocoon': {
+                        'id': row['source_cocoon_id'],
+                        'name': row['source_cocoon__name']
+                    } if row['source_cocoon_id'] else None,
+                    'created_at': row['created_at']
+                }
+            }
+        
+        yield {'type': 'summary', 'returned_count': returned}
+    
+    else:
+        yield {'type': 'error', 'error': f'Tool {tool_name} does not support streaming'}
+
 def handle_website_tool(tool_name: str, arguments: dict, brand_id: int) -> dict:
     """Handler pour les outils website - ALIGNÉ SUR VIEWS DJANGO"""
     try:
-        from seo_analyzer.models import Website, Page, PageKeyword
+        from seo_analyzer.models import Website, Page, PageKeyword, SemanticCocoon
         from business.models import Brand
+        from request_scope import get_brand, get_website
         from django.db.models import Count, Prefetch, Q, Sum, Avg
         from django.utils import timezone
         
         # Vérifier l'accès à la brand
         try:
-            brand = Brand.objects.get(id=brand_id)
+            brand = get_brand(brand_id)
         except Brand.DoesNotExist:
             return {'success': False, 'error': f'Brand {brand_id} not found'}
         
@@ -196,6 +438,15 @@ def handle_website_tool(tool_name: str, arguments: dict, brand_id: int) -> dict:
             websites = queryset.select_related('brand').annotate(
                 pages_count=Count('pages', distinct=True)
             ).order_by('name')
+            websites = list(websites)
+            
+            # Un seul comptage groupé au lieu d'une requête par website
+            keywords_counts = dict(
+                PageKeyword.objects.filter(page__website__in=websites)
+                .values('page__website_id')
+                .annotate(count=Count('id'))
+                .values_list('page__website_id', 'count')
+            )
             
             return {
                 'success': True,
@@ -209,13 +460,13 @@ def handle_website_tool(tool_name: str, arguments: dict, brand_id: int) -> dict:
                             'url': website.url,
                             'domain_authority': website.domain_authority,
                             'pages_count': website.pages_count,
-                            'keywords_count': PageKeyword.objects.filter(page__website=website).count(),
+                            'keywords_count': keywords_counts.get(website.id, 0),
                             'max_competitor_backlinks': website.max_competitor_backlinks,
                             'max_competitor_kd': website.max_competitor_kd
                         }
                         for website in websites
                     ],
-                    'total_websites': websites.count()
+                    'total_websites': len(websites)
                 }
             }
         
@@ -223,29 +474,12 @@ def handle_website_tool(tool_name: str, arguments: dict, brand_id: int) -> dict:
             # EXACTEMENT comme website_tools original mais amélioré
             website_id = arguments.get('website_id')
             try:
-                website = Website.objects.get(id=website_id, brand=brand)
+                website = get_website(website_id, brand)
             except Website.DoesNotExist:
                 return {'success': False, 'error': f'Website {website_id} not found or not accessible'}
             
-            # Pages hiérarchiques : racines d'abord
-            root_pages = website.pages.filter(parent__isnull=True).order_by('title')
-            
-            def build_page_tree(page):
-                """Construit l'arbre hiérarchique d'une page avec stats"""
-                return {
-                    'id': page.id,
-                    'title': page.title,
-                    'url_path': page.url_path,
-                    'page_type': page.page_type,
-                    'search_intent': page.search_intent,
-                    'keywords_count': page.page_keywords.count(),
-                    'cocoons_count': page.cocoons.count(),
-                    'exclude_from_sitemap': page.exclude_from_sitemap,
-                    'children': [
-                        build_page_tree(child) 
-                        for child in page.children.order_by('title')
-                    ]
-                }
+            # Arbre complet en 2 requêtes, assemblé en mémoire
+            structure, total_pages, max_depth = load_page_tree(website, Page, PageKeyword)
             
             return {
                 'success': True,
@@ -257,9 +491,9 @@ def handle_website_tool(tool_name: str, arguments: dict, brand_id: int) -> dict:
                         'domain_authority': website.domain_authority,
                         'brand_name': brand.name
                     },
-                    'structure': [build_page_tree(page) for page in root_pages],
-                    'total_pages': website.pages.count(),
-                    'max_depth': 3  # Limite connue
+                    'structure': structure,
+                    'total_pages': total_pages,
+                    'max_depth': max_depth
                 }
             }
         
@@ -394,7 +628,7 @@ def handle_website_tool(tool_name: str, arguments: dict, brand_id: int) -> dict:
             
             try:
                 # Vérifier que le website appartient à la brand
-                website = Website.objects.get(id=website_id, brand=brand)
+                website = get_website(website_id, brand)
                 
                 # Requête optimisée comme la view
                 page = Page.objects.select_related(
@@ -476,7 +710,7 @@ def handle_website_tool(tool_name: str, arguments: dict, brand_id: int) -> dict:
             website_id = arguments.get('website_id')
             
             try:
-                website = Website.objects.get(id=website_id, brand=brand)
+                website = get_website(website_id, brand)
             except Website.DoesNotExist:
                 return {'success': False, 'error': f'Website {website_id} not found or not accessible'}
             
@@ -577,7 +811,7 @@ def handle_website_tool(tool_name: str, arguments: dict, brand_id: int) -> dict:
             website_id = arguments.get('website_id')
             
             try:
-                website = Website.objects.get(id=website_id, brand=brand)
+                website = get_website(website_id, brand)
             except Website.DoesNotExist:
                 return {'success': False, 'error': f'Website {website_id} not found or not accessible'}
             
@@ -613,7 +847,7 @@ def handle_website_tool(tool_name: str, arguments: dict, brand_id: int) -> dict:
             page_id = arguments.get('page_id')
             
             try:
-                website = Website.objects.get(id=website_id, brand=brand)
+                website = get_website(website_id, brand)
             except Website.DoesNotExist:
                 return {'success': False, 'error': f'Website {website_id} not found or not accessible'}
             
@@ -731,25 +965,7 @@ def handle_website_tool(tool_name: str, arguments: dict, brand_id: int) -> dict:
             queryset = queryset.filter(page__website__brand=brand)
             
             # ✅ FILTRES comme PageKeywordFilter
-            page_id = arguments.get('page_id')
-            if page_id:
-                queryset = queryset.filter(page_id=page_id)
-            
-            keyword_id = arguments.get('keyword_id')
-            if keyword_id:
-                queryset = queryset.filter(keyword_id=keyword_id)
-            
-            keyword_type = arguments.get('keyword_type')
-            if keyword_type:
-                queryset = queryset.filter(keyword_type=keyword_type)
-            
-            is_ai_selected = arguments.get('is_ai_selected')
-            if is_ai_selected is not None:
-                queryset = queryset.filter(is_ai_selected=is_ai_selected)
-            
-            source_cocoon = arguments.get('source_cocoon')
-            if source_cocoon:
-                queryset = queryset.filter(source_cocoon_id=source_cocoon)
+            queryset, filters = filter_page_keywords(queryset, arguments)
             
             # Préchargement des PPAs comme dans la view
             queryset = queryset.prefetch_related(
@@ -792,12 +1008,7 @@ def handle_website_tool(tool_name: str, arguments: dict, brand_id: int) -> dict:
                     ],
                     'total_matching': queryset.count(),
                     'returned_count': len(page_keywords),
-                    'filters_applied': {
-                        'page_id': page_id,
-                        'keyword_id': keyword_id,
-                        'keyword_type': keyword_type,
-                        'is_ai_selected': is_ai_selected
-                    }
+                    'filters_applied': filters
                 }
             }
         
@@ -808,35 +1019,14 @@ def handle_website_tool(tool_name: str, arguments: dict, brand_id: int) -> dict:
             website_id = arguments.get('website_id')
             
             try:
-                website = Website.objects.get(id=website_id, brand=brand)
+                website = get_website(website_id, brand)
             except Website.DoesNotExist:
                 return {'success': False, 'error': f'Website {website_id} not found or not accessible'}
             
-            # Tous les mots-clés utilisés sur le site
-            used_keywords = PageKeyword.objects.filter(
-                page__website=website
-            ).select_related('keyword', 'page').order_by('keyword__keyword')
-            
-            keywords_list = []
-            for pk in used_keywords:
-                keywords_list.append({
-                    'keyword_id': pk.keyword.id,
-                    'keyword': pk.keyword.keyword,
-                    'volume': pk.keyword.volume,
-                    'keyword_type': pk.keyword_type,
-                    'page_id': pk.page.id,
-                    'page_title': pk.page.title,
-                    'page_url': pk.page.url_path
-                })
-            
-            # Stats d'utilisation
-            stats = {
-                'total_keywords_used': used_keywords.count(),
-                'unique_keywords': used_keywords.values('keyword_id').distinct().count(),
-                'primary_keywords': used_keywords.filter(keyword_type='primary').count(),
-                'secondary_keywords': used_keywords.filter(keyword_type='secondary').count(),
-                'anchor_keywords': used_keywords.filter(keyword_type='anchor').count()
-            }
+            # Lignes en values() et stats en une requête agrégée
+            # (version streaming : stream_website_tool)
+            keywords_list = list(iter_used_keyword_rows(website, PageKeyword))
+            stats = used_keyword_stats(website, PageKeyword)
             
             return {
                 'success': True,
@@ -856,7 +1046,7 @@ def handle_website_tool(tool_name: str, arguments: dict, brand_id: int) -> dict:
             website_id = arguments.get('website_id')
             
             try:
-                website = Website.objects.get(id=website_id, brand=brand)
+                website = get_website(website_id, brand)
             except Website.DoesNotExist:
                 return {'success': False, 'error': f'Website {website_id} not found or not accessible'}
             
@@ -950,7 +1140,12 @@ def handle_website_tool(tool_name: str, arguments: dict, brand_id: int) -> dict:
                     'children',
                     'page_keywords__keyword',
                     'page_keywords__source_cocoon',
-                    'cocoons'
+                    Prefetch(
+                        'cocoons',
+                        queryset=SemanticCocoon.objects.annotate(
+                            keywords_count=Count('cocoon_keywords', distinct=True)
+                        )
+                    )
                 ).get(id=page_id, website__brand=brand)
                 
                 # Informations hiérarchiques
@@ -1008,7 +1203,7 @@ def handle_website_tool(tool_name: str, arguments: dict, brand_id: int) -> dict:
                     associated_cocoons.append({
                         'id': cocoon.id,
                         'name': cocoon.name,
-                        'keywords_count': cocoon.cocoon_keywords.count()
+                        'keywords_count': cocoon.keywords_count
                     })
                 
                 return {
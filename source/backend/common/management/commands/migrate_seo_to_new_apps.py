@@ -1,36 +1,36 @@
 # backend/common/management/commands/migrate_seo_to_new_apps.py
 
 import logging
-import os
-from collections import defaultdict
-from django.core.management.base import BaseCommand
-from django.db import transaction, connection
+from django.db import connection
+from django.db.models import Q
 from django.utils import timezone
 from django.utils.text import slugify
 
+from common.utils.bulk_migration import BulkMigrationCommand, MigrationStep
+
 logger = logging.getLogger(__name__)
 
-class Command(BaseCommand):
+class Command(BulkMigrationCommand):
     """
     🚀 MIGRATION COMPLÈTE SEO_ANALYZER → KEYWORD_RESEARCH + WEBSITE_MANAGER
     
     Migration intelligente par MATCHING DE CONTENU (pas d'IDs préservés).
     Génère de nouveaux IDs séquentiels propres.
     
+    Plages d'ids en parallèle ; les correspondances ancien → nouvel id sont
+    résolues par plage (requêtes IN sur les clés naturelles), ce qui permet
+    la reprise après interruption (checkpoints par plage).
+    
     Usage:
-        python manage.py migrate_seo_to_new_apps --dry-run
+        python manage.py migrate_seo_to_new_apps --all --dry-run
         python manage.py migrate_seo_to_new_apps --all --backup --clear-existing
-        python manage.py migrate_seo_to_new_apps --brand-id=9 --clear-existing
+        python manage.py migrate_seo_to_new_apps --brand-id=9 --workers=8
     """
     
     help = 'Migration complète seo_analyzer vers keyword_research + website_manager'
     
     def add_arguments(self, parser):
-        parser.add_argument(
-            '--dry-run',
-            action='store_true',
-            help='Mode simulation - aucune donnée créée'
-        )
+        super().add_arguments(parser)
         parser.add_argument(
             '--brand-id',
             type=int,
@@ -44,7 +44,7 @@ class Command(BaseCommand):
         parser.add_argument(
             '--clear-existing',
             action='store_true',
-            help='Vider les nouvelles tables avant migration'
+            help='Vider les nouvelles tables avant migration (implique --restart)'
         )
         parser.add_argument(
             '--backup',
@@ -55,21 +55,12 @@ class Command(BaseCommand):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.dry_run = False
-        self.stats = defaultdict(int)
-        self.id_mappings = {
-            'keywords': {},
-            'cocoons': {},
-            'pages': {},
-            'websites': {},
-            'ppas': {},
-            'content_types': {},
-            'categories': {}
-        }
+        self.brand_id = None
     
     def handle(self, *args, **options):
         """Point d'entrée principal"""
         self.dry_run = options['dry_run']
-        brand_id = options.get('brand_id')
+        self.brand_id = options.get('brand_id')
         migrate_all = options.get('all')
         clear_existing = options.get('clear_existing')
         backup = options.get('backup')
@@ -81,7 +72,7 @@ class Command(BaseCommand):
             )
         )
         
-        if not migrate_all and not brand_id:
+        if not migrate_all and not self.brand_id:
             self.stdout.write(
                 self.style.ERROR("❌ Spécifiez --all ou --brand-id=X")
             )
@@ -95,20 +86,21 @@ class Command(BaseCommand):
             if backup and not self.dry_run:
                 self._create_backup()
             
-            # Clear optionnel
+            # Clear optionnel : les checkpoints ne correspondent plus à rien
             if clear_existing and not self.dry_run:
                 self._clear_existing_data()
+                options['restart'] = True
             
             # Migration principale
-            if brand_id:
-                self.stdout.write(f"🎯 Migration de la brand {brand_id}")
-                self._migrate_brand(brand_id)
+            if self.brand_id:
+                self.stdout.write(f"🎯 Migration de la brand {self.brand_id}")
             else:
                 self.stdout.write(f"🌍 Migration de toutes les brands")
-                self._migrate_all_brands()
+            results = self.run_migration(options)
             
             # Rapport final
-            self._print_final_report()
+            if not self.dry_run:
+                self._print_final_report(results)
             
         except Exception as e:
             self.stdout.write(
@@ -117,6 +109,58 @@ class Command(BaseCommand):
             logger.error(f"Migration failed: {str(e)}", exc_info=True)
             raise
     
+    def get_job_name(self, options):
+        scope = f"brand-{self.brand_id}" if self.brand_id else 'all'
+        return f"seo_to_new_apps:{scope}"
+    
+    def get_steps(self, options):
+        """Ordre de migration (FK) : keyword_research puis website_manager"""
+        old = self.models['old']
+        pages = self._brand_pages()
+        page_keyword_ids = old['PageKeyword'].objects.filter(page__in=pages).values('keyword_id')
+        
+        # Keywords utilisés par les pages de la brand + keywords des cocons (global)
+        keywords = old['Keyword'].objects.filter(
+            Q(id__in=page_keyword_ids) | Q(id__in=old['CocoonKeyword'].objects.values('keyword_id'))
+        )
+        keyword_ppas = old['KeywordPPA'].objects.filter(keyword_id__in=page_keyword_ids)
+        keyword_content_types = old['KeywordContentType'].objects.filter(keyword_id__in=page_keyword_ids)
+        draft_keywords = old['DraftKeyword'].objects.all()
+        if self.brand_id:
+            draft_keywords = draft_keywords.filter(brand_id=self.brand_id)
+        
+        return [
+            # 1. PHASE KEYWORD_RESEARCH (sans dépendances cross-app)
+            MigrationStep('Categories', old['CocoonCategory'].objects.all, self._migrate_categories),
+            MigrationStep('Keywords', lambda: keywords, self._migrate_keywords),
+            MigrationStep(
+                'PPAs',
+                lambda: old['PPA'].objects.filter(id__in=keyword_ppas.values('ppa_id')),
+                self._migrate_ppas
+            ),
+            MigrationStep('KeywordPPAs', lambda: keyword_ppas, self._migrate_keyword_ppas),
+            MigrationStep(
+                'ContentTypes',
+                lambda: old['ContentType'].objects.filter(id__in=keyword_content_types.values('content_type_id')),
+                self._migrate_content_types
+            ),
+            MigrationStep('KeywordContentTypes', lambda: keyword_content_types, self._migrate_keyword_content_types),
+            # Slugs uniques générés à la volée : plages séquentielles
+            MigrationStep('Cocons', old['SemanticCocoon'].objects.all, self._migrate_cocoons, parallel=False),
+            MigrationStep('CocoonKeywords', old['CocoonKeyword'].objects.all, self._migrate_cocoon_keywords),
+            MigrationStep('DraftKeywords', lambda: draft_keywords, self._migrate_draft_keywords),
+            
+            # 2. PHASE WEBSITE_MANAGER (avec références vers keyword_research)
+            MigrationStep('Websites', self._brand_websites, self._migrate_websites),
+            MigrationStep('Pages', lambda: pages, self._migrate_pages),
+            MigrationStep('PageHierarchy', lambda: pages.filter(parent__isnull=False), self._migrate_page_hierarchy),
+            MigrationStep(
+                'PageKeywords',
+                lambda: old['PageKeyword'].objects.filter(page__in=pages),
+                self._migrate_page_keywords
+            ),
+        ]
+    
     def _import_models(self):
         """Import des modèles pour éviter les circular imports"""
         
@@ -285,72 +329,6 @@ class Command(BaseCommand):
                 except Exception:
                     pass  # Séquence n'existe peut-être pas
     
-    def _migrate_all_brands(self):
-        """Migre toutes les brands"""
-        brands = self.models['old']['Website'].objects.values_list('brand_id', flat=True).distinct()
-        
-        for brand_id in brands:
-            self.stdout.write(f"\n🏢 Migration Brand {brand_id}")
-            self._migrate_brand(brand_id)
-    
-    def _migrate_brand(self, brand_id):
-        """Migre une brand complète"""
-        
-        try:
-            with transaction.atomic():
-                # 1. PHASE KEYWORD_RESEARCH (sans dépendances cross-app)
-                self.stdout.write("  📦 Phase 1: keyword_research...")
-                self._migrate_keyword_research_for_brand(brand_id)
-                
-                # 2. PHASE WEBSITE_MANAGER (avec références vers keyword_research)
-                self.stdout.write("  🌐 Phase 2: website_manager...")
-                self._migrate_website_manager_for_brand(brand_id)
-                
-                self.stdout.write(
-                    self.style.SUCCESS(f"  ✅ Brand {brand_id} migrée avec succès")
-                )
-                
-        except Exception as e:
-            self.stats['errors'] += 1
-            self.stdout.write(
-                self.style.ERROR(f"  ❌ Erreur Brand {brand_id}: {str(e)}")
-            )
-            raise
-    
-    def _migrate_keyword_research_for_brand(self, brand_id):
-        """Migre les données keyword_research pour une brand"""
-        
-        # 1. Categories (globales, pas de brand)
-        self._migrate_categories()
-        
-        # 2. Keywords utilisés par cette brand
-        self._migrate_keywords_for_brand(brand_id)
-        
-        # 3. PPAs des keywords de cette brand
-        self._migrate_ppas_for_brand(brand_id)
-        
-        # 4. ContentTypes des keywords de cette brand
-        self._migrate_content_types_for_brand(brand_id)
-        
-        # 5. Cocons de cette brand (avec leurs keywords)
-        self._migrate_cocoons_for_brand(brand_id)
-        
-        # 6. DraftKeywords de cette brand
-        self._migrate_draft_keywords_for_brand(brand_id)
-    
-    def _migrate_website_manager_for_brand(self, brand_id):
-        """Migre les données website_manager pour une brand"""
-        
-        # 1. Website de cette brand
-        website = self._migrate_website_for_brand(brand_id)
-        
-        if website:
-            # 2. Pages de ce website
-            self._migrate_pages_for_website(website)
-            
-            # 3. PageKeywords (avec références vers keyword_research)
-            self._migrate_page_keywords_for_website(website)
-    
     # ==================== HELPER FUNCTIONS ====================
     
     def _safe_get_field(self, obj, field_name, default=None):
@@ -374,507 +352,397 @@ class Command(BaseCommand):
             'updated_at': updated_at
         }
     
+    def _brand_websites(self):
+        """Websites source de la brand (toutes les brands avec --all)"""
+        websites = self.models['old']['Website'].objects.all()
+        if self.brand_id:
+            websites = websites.filter(brand_id=self.brand_id)
+        return websites
+    
+    def _brand_pages(self):
+        return self.models['old']['Page'].objects.filter(website__in=self._brand_websites())
+    
+    def _url_path(self, old_page):
+        # URL path avec fallback
+        return self._safe_get_field(old_page, 'url_path', f'/page-{old_page.id}')
+    
+    @staticmethod
+    def _ids_by(model, field, values):
+        """🗺️ Clé naturelle → nouvel id, une requête IN par plage"""
+        return dict(model.objects.filter(**{f'{field}__in': set(values)}).values_list(field, 'id'))
+    
+    def _page_ids(self, old_pages):
+        """🗺️ (brand_id, url_path) d'une ancienne page → nouvel id de page"""
+        keys = {(old_page.website.brand_id, self._url_path(old_page)) for old_page in old_pages}
+        website_ids = self._ids_by(self.models['new_wm']['Website'], 'brand_id', [brand_id for brand_id, _ in keys])
+        brands = {website_id: brand_id for brand_id, website_id in website_ids.items()}
+        rows = self.models['new_wm']['Page'].objects.filter(
+            website_id__in=brands.keys(),
+            url_path__in={url_path for _, url_path in keys}
+        ).values_list('website_id', 'url_path', 'id')
+        return {(brands[website_id], url_path): page_id for website_id, url_path, page_id in rows}
+    
+    @staticmethod
+    def _create_missing(model, objects, key_fields):
+        """
+        ✅ MATCHING PAR CLÉ NATURELLE : insère en masse les objets absents de
+        la table cible (une requête IN par plage), retourne le nombre créé
+        """
+        if not objects:
+            return 0
+        lookups = {f'{field}__in': {getattr(obj, field) for obj in objects} for field in key_fields}
+        existing = set(model.objects.filter(**lookups).values_list(*key_fields))
+        
+        missing = {}
+        for obj in objects:
+            key = tuple(getattr(obj, field) for field in key_fields)
+            if key not in existing:
+                missing.setdefault(key, obj)
+        
+        # ignore_conflicts : deux plages parallèles peuvent viser la même clé
+        model.objects.bulk_create(list(missing.values()), ignore_conflicts=True)
+        return len(missing)
+    
+    def _warn_unresolved(self, label, total, resolved):
+        if total > resolved:
+            self.stdout.write(
+                self.style.WARNING(f"    ⚠️  {total - resolved} {label} ignorés (IDs manquants)")
+            )
+    
     # ==================== KEYWORD_RESEARCH MIGRATION ====================
     
-    def _migrate_categories(self):
-        """🎯 Migre toutes les catégories par MATCHING NAME"""
-        old_categories = self.models['old']['CocoonCategory'].objects.all()
-        
-        for old_cat in old_categories:
-            if self.dry_run:
-                self.stats['categories'] += 1
-                continue
-            
-            # ✅ MATCHING PAR NAME (unique) avec gestion des champs manquants
-            defaults = {
-                'description': self._safe_get_field(old_cat, 'description', ''),
-                'color': self._safe_get_field(old_cat, 'color', '#3498db'),
-            }
-            
-            # Ajouter timestamps s'ils existent
-            defaults.update(self._get_timestamp_fields(old_cat))
-            
-            new_cat, created = self.models['new_kr']['CocoonCategory'].objects.get_or_create(
+    def _migrate_categories(self, old_categories):
+        """🎯 Migre les catégories par MATCHING NAME"""
+        NewCategory = self.models['new_kr']['CocoonCategory']
+        new_categories = [
+            NewCategory(
                 name=old_cat.name,  # ← Clé unique
-                defaults=defaults
+                description=self._safe_get_field(old_cat, 'description', ''),
+                color=self._safe_get_field(old_cat, 'color', '#3498db'),
+                **self._get_timestamp_fields(old_cat)
             )
-            
-            if created:
-                self.stats['categories'] += 1
-            
-            # 🗺️ MAPPING ancien_id → nouveau_id
-            self.id_mappings['categories'][old_cat.id] = new_cat.id
+            for old_cat in old_categories
+        ]
+        return self._create_missing(NewCategory, new_categories, ['name'])
     
-    def _migrate_keywords_for_brand(self, brand_id):
-        """🎯 Migre les keywords par MATCHING KEYWORD (déjà bon)"""
-        
-        # Keywords utilisés par les pages de cette brand
-        old_keywords = self.models['old']['Keyword'].objects.filter(
-            keyword_pages__page__website__brand_id=brand_id
-        ).distinct()
-        
-        # + Keywords des cocons (global) - CORRECTION ICI
-        cocoon_keywords = self.models['old']['Keyword'].objects.filter(
-            cocoon_associations__cocoon__in=self.models['old']['SemanticCocoon'].objects.all()
-        ).distinct()
-        
-        # Union des deux
-        all_keywords = (old_keywords | cocoon_keywords).distinct()
-        
-        for old_kw in all_keywords:
-            if self.dry_run:
-                self.stats['keywords'] += 1
-                continue
-            
-            # ✅ MATCHING PAR KEYWORD (unique) avec gestion des champs optionnels
-            defaults = {
-                'volume': self._safe_get_field(old_kw, 'volume'),
-                'content_types': self._safe_get_field(old_kw, 'content_types', ''),
-                'da_min': self._safe_get_field(old_kw, 'da_min'),
-                'da_max': self._safe_get_field(old_kw, 'da_max'),
-                'da_median': self._safe_get_field(old_kw, 'da_median'),
-                'da_q1': self._safe_get_field(old_kw, 'da_q1'),
-                'da_q3': self._safe_get_field(old_kw, 'da_q3'),
-                'bl_min': self._safe_get_field(old_kw, 'bl_min'),
-                'bl_max': self._safe_get_field(old_kw, 'bl_max'),
-                'bl_median': self._safe_get_field(old_kw, 'bl_median'),
-                'bl_q1': self._safe_get_field(old_kw, 'bl_q1'),
-                'bl_q3': self._safe_get_field(old_kw, 'bl_q3'),
-                'kdifficulty': self._safe_get_field(old_kw, 'kdifficulty', ''),
-                'search_intent': self._safe_get_field(old_kw, 'search_intent'),
-                'cpc': self._safe_get_field(old_kw, 'cpc', ''),
-                'youtube_videos': self._safe_get_field(old_kw, 'youtube_videos', ''),
-                'local_pack': self._safe_get_field(old_kw, 'local_pack', False),
-                'search_results': self._safe_get_field(old_kw, 'search_results', {}),
-            }
-            
-            # Ajouter timestamps
-            defaults.update(self._get_timestamp_fields(old_kw))
-            
-            new_kw, created = self.models['new_kr']['Keyword'].objects.get_or_create(
+    def _migrate_keywords(self, old_keywords):
+        """🎯 Migre les keywords par MATCHING KEYWORD"""
+        NewKeyword = self.models['new_kr']['Keyword']
+        new_keywords = [
+            NewKeyword(
                 keyword=old_kw.keyword,  # ← Clé unique
-                defaults=defaults
+                volume=self._safe_get_field(old_kw, 'volume'),
+                content_types=self._safe_get_field(old_kw, 'content_types', ''),
+                da_min=self._safe_get_field(old_kw, 'da_min'),
+                da_max=self._safe_get_field(old_kw, 'da_max'),
+                da_median=self._safe_get_field(old_kw, 'da_median'),
+                da_q1=self._safe_get_field(old_kw, 'da_q1'),
+                da_q3=self._safe_get_field(old_kw, 'da_q3'),
+                bl_min=self._safe_get_field(old_kw, 'bl_min'),
+                bl_max=self._safe_get_field(old_kw, 'bl_max'),
+                bl_median=self._safe_get_field(old_kw, 'bl_median'),
+                bl_q1=self._safe_get_field(old_kw, 'bl_q1'),
+                bl_q3=self._safe_get_field(old_kw, 'bl_q3'),
+                kdifficulty=self._safe_get_field(old_kw, 'kdifficulty', ''),
+                search_intent=self._safe_get_field(old_kw, 'search_intent'),
+                cpc=self._safe_get_field(old_kw, 'cpc', ''),
+                youtube_videos=self._safe_get_field(old_kw, 'youtube_videos', ''),
+                local_pack=self._safe_get_field(old_kw, 'local_pack', False),
+                search_results=self._safe_get_field(old_kw, 'search_results', {}),
+                **self._get_timestamp_fields(old_kw)
             )
-            
-            if created:
-                self.stats['keywords'] += 1
-            
-            # 🗺️ MAPPING ancien_id → nouveau_id
-            self.id_mappings['keywords'][old_kw.id] = new_kw.id
+            for old_kw in old_keywords
+        ]
+        return self._create_missing(NewKeyword, new_keywords, ['keyword'])
     
-    def _migrate_ppas_for_brand(self, brand_id):
+    def _migrate_ppas(self, old_ppas):
         """🎯 Migre les PPAs par MATCHING QUESTION"""
-        
-        # PPAs des keywords de cette brand - CORRECTION ICI
-        old_ppas = self.models['old']['PPA'].objects.filter(
-            keyword_associations__keyword__keyword_pages__page__website__brand_id=brand_id
-        ).distinct()
-        
-        for old_ppa in old_ppas:
-            if self.dry_run:
-                self.stats['ppas'] += 1
-                continue
-            
-            # ✅ MATCHING PAR QUESTION (unique)
-            defaults = self._get_timestamp_fields(old_ppa)
-            
-            new_ppa, created = self.models['new_kr']['PPA'].objects.get_or_create(
+        NewPPA = self.models['new_kr']['PPA']
+        new_ppas = [
+            NewPPA(
                 question=old_ppa.question,  # ← Clé unique
-                defaults=defaults
+                **self._get_timestamp_fields(old_ppa)
             )
-            
-            if created:
-                self.stats['ppas'] += 1
-            
-            # 🗺️ MAPPING ancien_id → nouveau_id
-            self.id_mappings['ppas'][old_ppa.id] = new_ppa.id
-        
-        # Relations KeywordPPA avec nouveaux IDs
-        old_kw_ppas = self.models['old']['KeywordPPA'].objects.filter(
-            keyword__keyword_pages__page__website__brand_id=brand_id
-        ).distinct()
+            for old_ppa in old_ppas
+        ]
+        return self._create_missing(NewPPA, new_ppas, ['question'])
+    
+    def _migrate_keyword_ppas(self, old_kw_ppas):
+        """Relations KeywordPPA avec nouveaux IDs"""
+        old_kw_ppas = list(old_kw_ppas.select_related('keyword', 'ppa'))
+        keyword_ids = self._ids_by(
+            self.models['new_kr']['Keyword'], 'keyword', [old.keyword.keyword for old in old_kw_ppas]
+        )
+        ppa_ids = self._ids_by(self.models['new_kr']['PPA'], 'question', [old.ppa.question for old in old_kw_ppas])
         
+        NewKeywordPPA = self.models['new_kr']['KeywordPPA']
+        new_kw_ppas = []
         for old_kw_ppa in old_kw_ppas:
-            if self.dry_run:
-                self.stats['keyword_ppas'] += 1
-                continue
-            
-            # Utiliser les nouveaux IDs via mapping
-            new_keyword_id = self.id_mappings['keywords'].get(old_kw_ppa.keyword_id)
-            new_ppa_id = self.id_mappings['ppas'].get(old_kw_ppa.ppa_id)
-            
+            new_keyword_id = keyword_ids.get(old_kw_ppa.keyword.keyword)
+            new_ppa_id = ppa_ids.get(old_kw_ppa.ppa.question)
             if new_keyword_id and new_ppa_id:
-                try:
-                    defaults = {
-                        'position': self._safe_get_field(old_kw_ppa, 'position', 1),
-                    }
-                    defaults.update(self._get_timestamp_fields(old_kw_ppa))
-                    
-                    new_kw_ppa, created = self.models['new_kr']['KeywordPPA'].objects.get_or_create(
-                        keyword_id=new_keyword_id,
-                        ppa_id=new_ppa_id,
-                        defaults=defaults
-                    )
-                    
-                    if created:
-                        self.stats['keyword_ppas'] += 1
-                except Exception as e:
-                    self.stdout.write(
-                        self.style.WARNING(f"    ⚠️  Erreur KeywordPPA: {str(e)}")
-                    )
-    
-    def _migrate_content_types_for_brand(self, brand_id):
+                new_kw_ppas.append(NewKeywordPPA(
+                    keyword_id=new_keyword_id,
+                    ppa_id=new_ppa_id,
+                    position=self._safe_get_field(old_kw_ppa, 'position', 1),
+                    **self._get_timestamp_fields(old_kw_ppa)
+                ))
+        
+        self._warn_unresolved('KeywordPPA', len(old_kw_ppas), len(new_kw_ppas))
+        return self._create_missing(NewKeywordPPA, new_kw_ppas, ['keyword_id', 'ppa_id'])
+    
+    def _migrate_content_types(self, old_content_types):
         """🎯 Migre les ContentTypes par MATCHING NAME"""
-        
-        old_content_types = self.models['old']['ContentType'].objects.filter(
-            keyword_associations__keyword__keyword_pages__page__website__brand_id=brand_id
-        ).distinct()
-        
-        for old_ct in old_content_types:
-            if self.dry_run:
-                self.stats['content_types'] += 1
-                continue
-            
-            # ✅ MATCHING PAR NAME (unique)
-            defaults = {
-                'description': self._safe_get_field(old_ct, 'description', ''),
-            }
-            defaults.update(self._get_timestamp_fields(old_ct))
-            
-            new_ct, created = self.models['new_kr']['ContentType'].objects.get_or_create(
+        NewContentType = self.models['new_kr']['ContentType']
+        new_content_types = [
+            NewContentType(
                 name=old_ct.name,  # ← Clé unique
-                defaults=defaults
+                description=self._safe_get_field(old_ct, 'description', ''),
+                **self._get_timestamp_fields(old_ct)
             )
-            
-            if created:
-                self.stats['content_types'] += 1
-            
-            # 🗺️ MAPPING ancien_id → nouveau_id
-            self.id_mappings['content_types'][old_ct.id] = new_ct.id
-        
-        # Relations KeywordContentType avec nouveaux IDs
-        old_kw_cts = self.models['old']['KeywordContentType'].objects.filter(
-            keyword__keyword_pages__page__website__brand_id=brand_id
-        ).distinct()
+            for old_ct in old_content_types
+        ]
+        return self._create_missing(NewContentType, new_content_types, ['name'])
+    
+    def _migrate_keyword_content_types(self, old_kw_cts):
+        """Relations KeywordContentType avec nouveaux IDs"""
+        old_kw_cts = list(old_kw_cts.select_related('keyword', 'content_type'))
+        keyword_ids = self._ids_by(
+            self.models['new_kr']['Keyword'], 'keyword', [old.keyword.keyword for old in old_kw_cts]
+        )
+        content_type_ids = self._ids_by(
+            self.models['new_kr']['ContentType'], 'name', [old.content_type.name for old in old_kw_cts]
+        )
         
+        NewKeywordContentType = self.models['new_kr']['KeywordContentType']
+        new_kw_cts = []
         for old_kw_ct in old_kw_cts:
-            if self.dry_run:
-                self.stats['keyword_content_types'] += 1
-                continue
-            
-            # Utiliser les nouveaux IDs via mapping
-            new_keyword_id = self.id_mappings['keywords'].get(old_kw_ct.keyword_id)
-            new_content_type_id = self.id_mappings['content_types'].get(old_kw_ct.content_type_id)
-            
+            new_keyword_id = keyword_ids.get(old_kw_ct.keyword.keyword)
+            new_content_type_id = content_type_ids.get(old_kw_ct.content_type.name)
             if new_keyword_id and new_content_type_id:
-                try:
-                    defaults = {
-                        'priority': self._safe_get_field(old_kw_ct, 'priority', 0),
-                    }
-                    defaults.update(self._get_timestamp_fields(old_kw_ct))
-                    
-                    new_kw_ct, created = self.models['new_kr']['KeywordContentType'].objects.get_or_create(
-                        keyword_id=new_keyword_id,
-                        content_type_id=new_content_type_id,
-                        defaults=defaults
-                    )
-                    
-                    if created:
-                        self.stats['keyword_content_types'] += 1
-                except Exception as e:
-                    self.stdout.write(
-                        self.style.WARNING(f"    ⚠️  Erreur KeywordContentType: {str(e)}")
-                    )
-    
-    def _migrate_cocoons_for_brand(self, brand_id):
-        """🎯 Migre tous les cocons par MATCHING NAME"""
-        
-        old_cocoons = self.models['old']['SemanticCocoon'].objects.all()
+                new_kw_cts.append(NewKeywordContentType(
+                    keyword_id=new_keyword_id,
+                    content_type_id=new_content_type_id,
+                    priority=self._safe_get_field(old_kw_ct, 'priority', 0),
+                    **self._get_timestamp_fields(old_kw_ct)
+                ))
+        
+        self._warn_unresolved('KeywordContentType', len(old_kw_cts), len(new_kw_cts))
+        return self._create_missing(NewKeywordContentType, new_kw_cts, ['keyword_id', 'content_type_id'])
+    
+    def _migrate_cocoons(self, old_cocoons):
+        """🎯 Migre les cocons par MATCHING NAME (étape séquentielle : slugs uniques)"""
+        NewCocoon = self.models['new_kr']['SemanticCocoon']
+        old_cocoons = list(old_cocoons.prefetch_related('categories'))
+        existing_names = set(
+            NewCocoon.objects.filter(name__in=[c.name for c in old_cocoons]).values_list('name', flat=True)
+        )
+        taken_slugs = set(NewCocoon.objects.values_list('slug', flat=True))
         
+        new_cocoons = []
+        created = []
         for old_cocoon in old_cocoons:
-            if self.dry_run:
-                self.stats['cocoons'] += 1
+            if old_cocoon.name in existing_names:
                 continue
+            existing_names.add(old_cocoon.name)
             
             # Générer slug unique
             base_slug = slugify(old_cocoon.name)
             slug = base_slug
             counter = 1
-            while self.models['new_kr']['SemanticCocoon'].objects.filter(slug=slug).exists():
+            while slug in taken_slugs:
                 slug = f"{base_slug}-{counter}"
                 counter += 1
+            taken_slugs.add(slug)
             
-            # ✅ MATCHING PAR NAME (unique)
-            defaults = {
-                'description': self._safe_get_field(old_cocoon, 'description', ''),
-                'slug': slug,
-                'openai_file_id': self._safe_get_field(old_cocoon, 'openai_file_id', ''),
-                'openai_vector_store_id': self._safe_get_field(old_cocoon, 'openai_vector_store_id', ''),
-                'openai_storage_type': self._safe_get_field(old_cocoon, 'openai_storage_type', 'vector_store'),
-                'openai_file_version': self._safe_get_field(old_cocoon, 'openai_file_version', 0),
-                'last_pushed_at': self._safe_get_field(old_cocoon, 'last_pushed_at'),
-            }
-            defaults.update(self._get_timestamp_fields(old_cocoon))
-            
-            new_cocoon, created = self.models['new_kr']['SemanticCocoon'].objects.get_or_create(
+            new_cocoons.append(NewCocoon(
                 name=old_cocoon.name,  # ← Clé unique
-                defaults=defaults
-            )
-            
-            if created:
-                self.stats['cocoons'] += 1
-                
-                # Migrer les relations ManyToMany categories avec nouveaux IDs
-                if hasattr(old_cocoon, 'categories'):
-                    for old_category in old_cocoon.categories.all():
-                        new_category_id = self.id_mappings['categories'].get(old_category.id)
-                        if new_category_id:
-                            try:
-                                new_category = self.models['new_kr']['CocoonCategory'].objects.get(id=new_category_id)
-                                new_cocoon.categories.add(new_category)
-                            except Exception:
-                                pass
-            
-            # 🗺️ MAPPING ancien_id → nouveau_id
-            self.id_mappings['cocoons'][old_cocoon.id] = new_cocoon.id
-        
-        # Relations CocoonKeyword avec nouveaux IDs
-        old_cocoon_keywords = self.models['old']['CocoonKeyword'].objects.all()
+                description=self._safe_get_field(old_cocoon, 'description', ''),
+                slug=slug,
+                openai_file_id=self._safe_get_field(old_cocoon, 'openai_file_id', ''),
+                openai_vector_store_id=self._safe_get_field(old_cocoon, 'openai_vector_store_id', ''),
+                openai_storage_type=self._safe_get_field(old_cocoon, 'openai_storage_type', 'vector_store'),
+                openai_file_version=self._safe_get_field(old_cocoon, 'openai_file_version', 0),
+                last_pushed_at=self._safe_get_field(old_cocoon, 'last_pushed_at'),
+                **self._get_timestamp_fields(old_cocoon)
+            ))
+            created.append(old_cocoon)
+        NewCocoon.objects.bulk_create(new_cocoons)
+        
+        # Relations ManyToMany categories des cocons créés, avec nouveaux IDs
+        pairs = [(old_cocoon.name, category.name) for old_cocoon in created for category in old_cocoon.categories.all()]
+        cocoon_ids = self._ids_by(NewCocoon, 'name', [cocoon.name for cocoon in new_cocoons])
+        category_ids = self._ids_by(self.models['new_kr']['CocoonCategory'], 'name', [name for _, name in pairs])
+        Through = NewCocoon.categories.through
+        Through.objects.bulk_create(
+            [
+                Through(semanticcocoon_id=cocoon_ids[cocoon_name], cocooncategory_id=category_ids[category_name])
+                for cocoon_name, category_name in pairs
+                if category_name in category_ids
+            ],
+            ignore_conflicts=True
+        )
+        return len(new_cocoons)
+    
+    def _migrate_cocoon_keywords(self, old_cocoon_keywords):
+        """Relations CocoonKeyword avec nouveaux IDs"""
+        old_cocoon_keywords = list(old_cocoon_keywords.select_related('cocoon', 'keyword'))
+        cocoon_ids = self._ids_by(
+            self.models['new_kr']['SemanticCocoon'], 'name', [old.cocoon.name for old in old_cocoon_keywords]
+        )
+        keyword_ids = self._ids_by(
+            self.models['new_kr']['Keyword'], 'keyword', [old.keyword.keyword for old in old_cocoon_keywords]
+        )
         
+        NewCocoonKeyword = self.models['new_kr']['CocoonKeyword']
+        new_cocoon_keywords = []
         for old_ck in old_cocoon_keywords:
-            if self.dry_run:
-                self.stats['cocoon_keywords'] += 1
-                continue
-            
-            # Utiliser les nouveaux IDs via mapping
-            new_cocoon_id = self.id_mappings['cocoons'].get(old_ck.cocoon_id)
-            new_keyword_id = self.id_mappings['keywords'].get(old_ck.keyword_id)
-            
+            new_cocoon_id = cocoon_ids.get(old_ck.cocoon.name)
+            new_keyword_id = keyword_ids.get(old_ck.keyword.keyword)
             if new_cocoon_id and new_keyword_id:
-                try:
-                    defaults = self._get_timestamp_fields(old_ck)
-                    
-                    new_ck, created = self.models['new_kr']['CocoonKeyword'].objects.get_or_create(
-                        cocoon_id=new_cocoon_id,
-                        keyword_id=new_keyword_id,
-                        defaults=defaults
-                    )
-                    
-                    if created:
-                        self.stats['cocoon_keywords'] += 1
-                except Exception as e:
-                    self.stdout.write(
-                        self.style.WARNING(f"    ⚠️  Erreur CocoonKeyword: {str(e)}")
-                    )
-    
-    def _migrate_draft_keywords_for_brand(self, brand_id):
+                new_cocoon_keywords.append(NewCocoonKeyword(
+                    cocoon_id=new_cocoon_id,
+                    keyword_id=new_keyword_id,
+                    **self._get_timestamp_fields(old_ck)
+                ))
+        
+        self._warn_unresolved('CocoonKeyword', len(old_cocoon_keywords), len(new_cocoon_keywords))
+        return self._create_missing(NewCocoonKeyword, new_cocoon_keywords, ['cocoon_id', 'keyword_id'])
+    
+    def _migrate_draft_keywords(self, old_drafts):
         """🎯 Migre les DraftKeywords par MATCHING KEYWORD+BRAND+USER"""
-        
-        old_drafts = self.models['old']['DraftKeyword'].objects.filter(brand_id=brand_id)
-        
-        for old_draft in old_drafts:
-            if self.dry_run:
-                self.stats['draft_keywords'] += 1
-                continue
-            
-            # ✅ MATCHING PAR KEYWORD+BRAND+USER (unique_together)
-            defaults = {
-                'note': self._safe_get_field(old_draft, 'note', ''),
-            }
-            defaults.update(self._get_timestamp_fields(old_draft))
-            
-            new_draft, created = self.models['new_kr']['DraftKeyword'].objects.get_or_create(
+        NewDraftKeyword = self.models['new_kr']['DraftKeyword']
+        new_drafts = [
+            NewDraftKeyword(
                 keyword=old_draft.keyword,
                 brand_id=old_draft.brand_id,
                 user_id=old_draft.user_id,
-                defaults=defaults
+                note=self._safe_get_field(old_draft, 'note', ''),
+                **self._get_timestamp_fields(old_draft)
             )
-            
-            if created:
-                self.stats['draft_keywords'] += 1
+            for old_draft in old_drafts
+        ]
+        # ✅ unique_together
+        return self._create_missing(NewDraftKeyword, new_drafts, ['keyword', 'brand_id', 'user_id'])
     
     # ==================== WEBSITE_MANAGER MIGRATION ====================
     
-    def _migrate_website_for_brand(self, brand_id):
-        """🎯 Migre le website par MATCHING BRAND_ID"""
-        
-        try:
-            old_website = self.models['old']['Website'].objects.get(brand_id=brand_id)
-        except self.models['old']['Website'].DoesNotExist:
-            self.stdout.write(f"    ⚠️  Aucun website pour brand {brand_id}")
-            return None
-        
-        if self.dry_run:
-            self.stats['websites'] += 1
-            return f"dry_run_website_{brand_id}"
-        
-        # ✅ MATCHING PAR BRAND_ID (unique OneToOne)
-        defaults = {
-            'name': self._safe_get_field(old_website, 'name', f'Site Brand {brand_id}'),
-            'url': self._safe_get_field(old_website, 'url', 'https://example.com'),
-            'domain_authority': self._safe_get_field(old_website, 'domain_authority'),
-            'max_competitor_backlinks': self._safe_get_field(old_website, 'max_competitor_backlinks'),
-            'max_competitor_kd': self._safe_get_field(old_website, 'max_competitor_kd'),
-            'last_openai_sync': self._safe_get_field(old_website, 'last_openai_sync'),
-            'openai_sync_version': self._safe_get_field(old_website, 'openai_sync_version', 0),
-        }
-        defaults.update(self._get_timestamp_fields(old_website))
-        
-        new_website, created = self.models['new_wm']['Website'].objects.get_or_create(
-            brand_id=old_website.brand_id,  # ← Clé unique
-            defaults=defaults
-        )
-        
-        if created:
-            self.stats['websites'] += 1
-        
-        # 🗺️ MAPPING ancien_id → nouveau_id
-        self.id_mappings['websites'][old_website.id] = new_website.id
-        return new_website
+    def _migrate_websites(self, old_websites):
+        """🎯 Migre les websites par MATCHING BRAND_ID"""
+        NewWebsite = self.models['new_wm']['Website']
+        new_websites = [
+            NewWebsite(
+                brand_id=old_website.brand_id,  # ← Clé unique
+                name=self._safe_get_field(old_website, 'name', f'Site Brand {old_website.brand_id}'),
+                url=self._safe_get_field(old_website, 'url', 'https://example.com'),
+                domain_authority=self._safe_get_field(old_website, 'domain_authority'),
+                max_competitor_backlinks=self._safe_get_field(old_website, 'max_competitor_backlinks'),
+                max_competitor_kd=self._safe_get_field(old_website, 'max_competitor_kd'),
+                last_openai_sync=self._safe_get_field(old_website, 'last_openai_sync'),
+                openai_sync_version=self._safe_get_field(old_website, 'openai_sync_version', 0),
+                **self._get_timestamp_fields(old_website)
+            )
+            for old_website in old_websites
+        ]
+        return self._create_missing(NewWebsite, new_websites, ['brand_id'])
     
-    def _migrate_pages_for_website(self, website):
-        """🎯 Migre toutes les pages par MATCHING WEBSITE+URL_PATH"""
+    def _migrate_pages(self, old_pages):
+        """🎯 Migre les pages par MATCHING WEBSITE+URL_PATH (sans parent)"""
+        old_pages = list(old_pages.select_related('website'))
+        website_ids = self._ids_by(
+            self.models['new_wm']['Website'], 'brand_id', [old_page.website.brand_id for old_page in old_pages]
+        )
         
-        if self.dry_run:
-            old_pages = self.models['old']['Page'].objects.filter(
-                website_id=list(self.id_mappings['websites'].keys())[0] if self.id_mappings['websites'] else 1
+        NewPage = self.models['new_wm']['Page']
+        new_pages = [
+            NewPage(
+                website_id=website_ids[old_page.website.brand_id],
+                url_path=self._url_path(old_page),
+                title=self._safe_get_field(old_page, 'title', 'Page sans titre'),
+                meta_description=self._safe_get_field(old_page, 'meta_description', ''),
+                search_intent=self._safe_get_field(old_page, 'search_intent'),
+                page_type=self._safe_get_field(old_page, 'page_type', 'vitrine'),
+                status=self._safe_get_field(old_page, 'status', 'draft'),
+                status_changed_at=self._safe_get_field(old_page, 'status_changed_at'),
+                status_changed_by_id=self._safe_get_field(old_page, 'status_changed_by_id'),
+                production_notes=self._safe_get_field(old_page, 'production_notes', ''),
+                scheduled_publish_date=self._safe_get_field(old_page, 'scheduled_publish_date'),
+                sitemap_priority=self._safe_get_field(old_page, 'sitemap_priority', 0.5),
+                sitemap_changefreq=self._safe_get_field(old_page, 'sitemap_changefreq', 'weekly'),
+                exclude_from_sitemap=self._safe_get_field(old_page, 'exclude_from_sitemap', False),
+                page_template=self._safe_get_field(old_page, 'page_template', 'default'),
+                featured_image=self._safe_get_field(old_page, 'featured_image'),
+                last_rendered_at=self._safe_get_field(old_page, 'last_rendered_at'),
+                **self._get_timestamp_fields(old_page)
             )
-            self.stats['pages'] += old_pages.count()
-            return
-        
-        old_pages = self.models['old']['Page'].objects.filter(
-            website_id=[k for k, v in self.id_mappings['websites'].items() if v == website.id][0]
-        ).order_by('id')
+            for old_page in old_pages
+            if old_page.website.brand_id in website_ids
+        ]
         
-        # Phase 1: Créer toutes les pages sans parent
-        for old_page in old_pages:
-            # ✅ MATCHING PAR WEBSITE+URL_PATH (unique_together)
-            defaults = {
-                'title': self._safe_get_field(old_page, 'title', 'Page sans titre'),
-                'meta_description': self._safe_get_field(old_page, 'meta_description', ''),
-                'search_intent': self._safe_get_field(old_page, 'search_intent'),
-                'page_type': self._safe_get_field(old_page, 'page_type', 'vitrine'),
-                'status': self._safe_get_field(old_page, 'status', 'draft'),
-                'status_changed_at': self._safe_get_field(old_page, 'status_changed_at'),
-                'status_changed_by_id': self._safe_get_field(old_page, 'status_changed_by_id'),
-                'production_notes': self._safe_get_field(old_page, 'production_notes', ''),
-                'scheduled_publish_date': self._safe_get_field(old_page, 'scheduled_publish_date'),
-                'sitemap_priority': self._safe_get_field(old_page, 'sitemap_priority', 0.5),
-                'sitemap_changefreq': self._safe_get_field(old_page, 'sitemap_changefreq', 'weekly'),
-                'exclude_from_sitemap': self._safe_get_field(old_page, 'exclude_from_sitemap', False),
-                'page_template': self._safe_get_field(old_page, 'page_template', 'default'),
-                'featured_image': self._safe_get_field(old_page, 'featured_image'),
-                'last_rendered_at': self._safe_get_field(old_page, 'last_rendered_at'),
-            }
-            defaults.update(self._get_timestamp_fields(old_page))
-            
-            # URL path avec fallback
-            url_path = self._safe_get_field(old_page, 'url_path', f'/page-{old_page.id}')
-            
-            new_page, created = self.models['new_wm']['Page'].objects.get_or_create(
-                website=website,
-                url_path=url_path,
-                defaults=defaults
-            )
-            
-            if created:
-                self.stats['pages'] += 1
-            
-            # 🗺️ MAPPING ancien_id → nouveau_id
-            self.id_mappings['pages'][old_page.id] = new_page.id
+        self._warn_unresolved('Pages', len(old_pages), len(new_pages))
+        # ✅ unique_together
+        return self._create_missing(NewPage, new_pages, ['website_id', 'url_path'])
+    
+    def _migrate_page_hierarchy(self, old_pages):
+        """Hiérarchie parent-enfant avec nouveaux IDs (pages toutes créées à l'étape précédente)"""
+        old_pages = list(old_pages.select_related('website', 'parent__website'))
+        page_ids = self._page_ids(old_pages + [old_page.parent for old_page in old_pages])
         
-        # Phase 2: Fixer la hiérarchie parent-enfant avec nouveaux IDs
+        NewPage = self.models['new_wm']['Page']
+        updates = []
         for old_page in old_pages:
-            if hasattr(old_page, 'parent_id') and old_page.parent_id:
-                new_parent_id = self.id_mappings['pages'].get(old_page.parent_id)
-                new_page_id = self.id_mappings['pages'].get(old_page.id)
-                
-                if new_parent_id and new_page_id:
-                    try:
-                        new_page = self.models['new_wm']['Page'].objects.get(id=new_page_id)
-                        new_parent = self.models['new_wm']['Page'].objects.get(id=new_parent_id)
-                        new_page.parent = new_parent
-                        new_page.save(update_fields=['parent'])
-                    except Exception as e:
-                        self.stdout.write(
-                            self.style.WARNING(f"    ⚠️  Erreur hiérarchie page {old_page.id}: {str(e)}")
-                        )
-    
-    def _migrate_page_keywords_for_website(self, website):
+            new_page_id = page_ids.get((old_page.website.brand_id, self._url_path(old_page)))
+            new_parent_id = page_ids.get((old_page.parent.website.brand_id, self._url_path(old_page.parent)))
+            if new_page_id and new_parent_id:
+                updates.append(NewPage(id=new_page_id, parent_id=new_parent_id))
+        
+        self._warn_unresolved('liens de hiérarchie', len(old_pages), len(updates))
+        NewPage.objects.bulk_update(updates, ['parent'], batch_size=1000)
+        return len(updates)
+    
+    def _migrate_page_keywords(self, old_page_keywords):
         """🎯 Migre les PageKeywords avec nouveaux IDs"""
+        old_page_keywords = list(
+            old_page_keywords.select_related('page__website', 'keyword', 'source_cocoon')
+        )
+        page_ids = self._page_ids([old_pk.page for old_pk in old_page_keywords])
+        keyword_ids = self._ids_by(
+            self.models['new_kr']['Keyword'], 'keyword', [old_pk.keyword.keyword for old_pk in old_page_keywords]
+        )
+        cocoon_ids = self._ids_by(
+            self.models['new_kr']['SemanticCocoon'],
+            'name',
+            [old_pk.source_cocoon.name for old_pk in old_page_keywords if old_pk.source_cocoon_id]
+        )
         
-        if self.dry_run:
-            # Compter approximativement
-            self.stats['page_keywords'] += 100  # Estimation
-            return
-        
-        # Trouver l'ancien website_id via mapping inversé
-        old_website_id = None
-        for old_id, new_id in self.id_mappings['websites'].items():
-            if new_id == website.id:
-                old_website_id = old_id
-                break
-        
-        if not old_website_id:
-            self.stdout.write(f"    ⚠️  Impossible de trouver l'ancien website_id")
-            return
-        
-        old_page_keywords = self.models['old']['PageKeyword'].objects.filter(
-            page__website_id=old_website_id
-        ).select_related('page', 'keyword', 'source_cocoon')
-        
+        NewPageKeyword = self.models['new_wm']['PageKeyword']
+        new_page_keywords = []
         for old_pk in old_page_keywords:
-            # Utiliser les nouveaux IDs via mapping
-            new_page_id = self.id_mappings['pages'].get(old_pk.page_id)
-            new_keyword_id = self.id_mappings['keywords'].get(old_pk.keyword_id)
-            new_source_cocoon_id = None
-            
-            if hasattr(old_pk, 'source_cocoon_id') and old_pk.source_cocoon_id:
-                new_source_cocoon_id = self.id_mappings['cocoons'].get(old_pk.source_cocoon_id)
+            new_page_id = page_ids.get((old_pk.page.website.brand_id, self._url_path(old_pk.page)))
+            new_keyword_id = keyword_ids.get(old_pk.keyword.keyword)
+            if not (new_page_id and new_keyword_id):
+                continue
             
-            if new_page_id and new_keyword_id:
-                try:
-                    defaults = {
-                        'position': self._safe_get_field(old_pk, 'position'),
-                        'keyword_type': self._safe_get_field(old_pk, 'keyword_type', 'secondary'),
-                        'source_cocoon_id': new_source_cocoon_id,
-                        'is_ai_selected': self._safe_get_field(old_pk, 'is_ai_selected', False),
-                        'notes': self._safe_get_field(old_pk, 'notes', ''),
-                    }
-                    defaults.update(self._get_timestamp_fields(old_pk))
-                    
-                    new_pk, created = self.models['new_wm']['PageKeyword'].objects.get_or_create(
-                        page_id=new_page_id,
-                        keyword_id=new_keyword_id,
-                        defaults=defaults
-                    )
-                    
-                    if created:
-                        self.stats['page_keywords'] += 1
-                        
-                except Exception as e:
-                    self.stdout.write(
-                        self.style.WARNING(
-                            f"    ⚠️  Erreur PageKeyword page:{old_pk.page_id}→{new_page_id} "
-                            f"keyword:{old_pk.keyword_id}→{new_keyword_id}: {str(e)}"
-                        )
-                    )
-            else:
-                self.stdout.write(
-                    self.style.WARNING(
-                        f"    ⚠️  IDs manquants PageKeyword page:{old_pk.page_id}→{new_page_id} "
-                        f"keyword:{old_pk.keyword_id}→{new_keyword_id}"
-                    )
-                )
+            new_page_keywords.append(NewPageKeyword(
+                page_id=new_page_id,
+                keyword_id=new_keyword_id,
+                position=self._safe_get_field(old_pk, 'position'),
+                keyword_type=self._safe_get_field(old_pk, 'keyword_type', 'secondary'),
+                source_cocoon_id=cocoon_ids.get(old_pk.source_cocoon.name) if old_pk.source_cocoon_id else None,
+                is_ai_selected=self._safe_get_field(old_pk, 'is_ai_selected', False),
+                notes=self._safe_get_field(old_pk, 'notes', ''),
+                **self._get_timestamp_fields(old_pk)
+            ))
+        
+        self._warn_unresolved('PageKeyword', len(old_page_keywords), len(new_page_keywords))
+        return self._create_missing(NewPageKeyword, new_page_keywords, ['page_id', 'keyword_id'])
     
-    def _print_final_report(self):
-        """Affiche le rapport final détaillé"""
-        
-        mode = "🧪 SIMULATION" if self.dry_run else "🚀 MIGRATION RÉELLE"
+    def _print_final_report(self, results):
+        """Affiche le rapport final détaillé (enregistrements créés par étape)"""
         
         self.stdout.write(f"\n" + "="*80)
         self.stdout.write(
-            self.style.SUCCESS(f"🎉 {mode} TERMINÉE !")
+            self.style.SUCCESS(f"🎉 🚀 MIGRATION RÉELLE TERMINÉE !")
         )
         self.stdout.write("="*80)
         
@@ -883,66 +751,35 @@ class Command(BaseCommand):
             self.style.SUCCESS("📦 KEYWORD_RESEARCH:")
         )
         kr_stats = [
-            ('Categories', self.stats['categories']),
-            ('Keywords', self.stats['keywords']),
-            ('PPAs', self.stats['ppas']),
-            ('KeywordPPAs', self.stats['keyword_ppas']),
-            ('ContentTypes', self.stats['content_types']),
-            ('KeywordContentTypes', self.stats['keyword_content_types']),
-            ('Cocons', self.stats['cocoons']),
-            ('CocoonKeywords', self.stats['cocoon_keywords']),
-            ('DraftKeywords', self.stats['draft_keywords']),
+            'Categories', 'Keywords', 'PPAs', 'KeywordPPAs', 'ContentTypes',
+            'KeywordContentTypes', 'Cocons', 'CocoonKeywords', 'DraftKeywords',
         ]
         
-        for name, count in kr_stats:
-            self.stdout.write(f"  📊 {name}: {count}")
+        for name in kr_stats:
+            self.stdout.write(f"  📊 {name}: {results.get(name, 0)}")
         
         # Rapport website_manager
         self.stdout.write(
             self.style.SUCCESS("\n🌐 WEBSITE_MANAGER:")
         )
-        wm_stats = [
-            ('Websites', self.stats['websites']),
-            ('Pages', self.stats['pages']),
-            ('PageKeywords', self.stats['page_keywords']),
-        ]
+        wm_stats = ['Websites', 'Pages', 'PageHierarchy', 'PageKeywords']
         
-        for name, count in wm_stats:
-            self.stdout.write(f"  📊 {name}: {count}")
-        
-        # Rapport mappings d'IDs
-        self.stdout.write(
-            self.style.SUCCESS("\n🗺️  MAPPINGS CRÉÉS:")
-        )
-        for entity_type, mapping in self.id_mappings.items():
-            if mapping:
-                self.stdout.write(f"  📋 {entity_type}: {len(mapping)} mappings")
+        for name in wm_stats:
+            self.stdout.write(f"  📊 {name}: {results.get(name, 0)}")
         
         # Total
-        total = sum(self.stats.values())
+        total = sum(results.values())
         self.stdout.write(
             self.style.SUCCESS(f"\n🎯 TOTAL: {total} entités migrées")
         )
         
-        if self.stats['errors']:
-            self.stdout.write(
-                self.style.ERROR(f"❌ Erreurs: {self.stats['errors']}")
-            )
-        
-        if self.dry_run:
-            self.stdout.write(
-                self.style.WARNING(
-                    "\n💡 Mode simulation - Lancez sans --dry-run pour migrer réellement"
-                )
+        self.stdout.write(
+            self.style.SUCCESS(
+                "\n✅ Migration intelligente terminée avec succès !"
             )
-        else:
-            self.stdout.write(
-                self.style.SUCCESS(
-                    "\n✅ Migration intelligente terminée avec succès !"
-                )
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                "🔥 Nouveaux IDs séquentiels propres générés dans les nouvelles apps"
             )
-            self.stdout.write(
-                self.style.SUCCESS(
-                    "🔥 Nouveaux IDs séquentiels propres générés dans les nouvelles apps"
-                )
-            )
\ No newline at end of file
+        )
@@ -0,0 +1,35 @@
+# backend/common/migrations/0001_migration_checkpoint.py
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MigrationCheckpoint',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('job', models.CharField(max_length=100)),
+                ('step', models.CharField(max_length=100)),
+                ('start_id', models.BigIntegerField()),
+                ('end_id', models.BigIntegerField()),
+                ('rows', models.IntegerField(default=0)),
+                ('duration', models.FloatField(default=0)),
+                ('completed_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'db_table': 'common_migrationcheckpoint',
+                'ordering': ['job', 'step', 'start_id'],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='migrationcheckpoint',
+            constraint=models.UniqueConstraint(fields=('job', 'step', 'start_id', 'end_id'), name='common_migration_checkpoint_uniq'),
+        ),
+    ]
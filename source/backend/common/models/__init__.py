@@ -6,10 +6,12 @@ from .mixins import (
     BrandScopedMixin,
     SlugMixin
 )
+from .migration_models import MigrationCheckpoint
 
 __all__ = [
     'TimestampedMixin',
     'SoftDeleteMixin', 
     'BrandScopedMixin',
-    'SlugMixin'
-]
\ No newline at end of file
+    'SlugMixin',
+    'MigrationCheckpoint'
+]
@@ -0,0 +1,30 @@
+# backend/common/models/migration_models.py
+
+from django.db import models
+
+class MigrationCheckpoint(models.Model):
+    """
+    Plage d'ids terminée d'une étape de migration de données
+    (common.utils.bulk_migration) : relancer la commande reprend après
+    la dernière plage validée
+    """
+
+    job = models.CharField(max_length=100)
+    step = models.CharField(max_length=100)
+    start_id = models.BigIntegerField()
+    end_id = models.BigIntegerField()
+    rows = models.IntegerField(default=0)
+    duration = models.FloatField(default=0)
+    completed_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"{self.job}/{self.step} [{self.start_id}, {self.end_id})"
+
+    class Meta:
+        db_table = 'common_migrationcheckpoint'
+        ordering = ['job', 'step', 'start_id']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['job', 'step', 'start_id', 'end_id'], name='common_migration_checkpoint_uniq'
+            ),
+        ]
@@ -0,0 +1 @@
+# backend/common/tests/__init__.py
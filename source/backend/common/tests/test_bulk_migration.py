@@ -0,0 +1,61 @@
+# backend/common/tests/test_bulk_migration.py
+
+import pytest
+
+from common.models import MigrationCheckpoint
+from common.utils.bulk_migration import BulkMigrationRunner, MigrationStep
+from seo_keywords_base.models import Keyword
+from seo_keywords_metrics.models import KeywordMetrics
+
+
+def copy_metrics(keywords):
+    metrics = [KeywordMetrics(keyword_id=keyword.id, kdifficulty='10') for keyword in keywords]
+    KeywordMetrics.objects.bulk_create(metrics, ignore_conflicts=True)
+    return len(metrics)
+
+
+def runner(**kwargs):
+    steps = [MigrationStep('Metrics', Keyword.objects.all, copy_metrics)]
+    return BulkMigrationRunner('test_job', steps, chunk_size=4, write=lambda line: None, **kwargs)
+
+
+@pytest.mark.django_db
+class TestBulkMigrationRunner:
+
+    def test_chunks_checkpoints_and_resume(self):
+        keywords = Keyword.objects.bulk_create([Keyword(keyword=f'kw {index}') for index in range(10)])
+
+        plan = runner().plan(runner().steps['Metrics'])
+        assert sum(rows for _, _, rows in plan) == 10
+        assert all(end_id - start_id == 4 for start_id, end_id, _ in plan)
+
+        assert runner().run() == {'Metrics': 10}
+        assert KeywordMetrics.objects.count() == 10
+        assert MigrationCheckpoint.objects.filter(job='test_job').count() == len(plan)
+
+        # Relance : plages validées sautées
+        assert runner().run() == {'Metrics': 0}
+
+        # Plage perdue (interruption) : seule celle-ci est rejouée
+        start_id, end_id, rows = plan[0]
+        KeywordMetrics.objects.filter(keyword_id__gte=start_id, keyword_id__lt=end_id).delete()
+        MigrationCheckpoint.objects.filter(job='test_job', start_id=start_id).delete()
+        assert runner().dry_run() == {'Metrics': (len(plan), 10, len(plan) - 1)}
+        assert runner().run() == {'Metrics': rows}
+        assert KeywordMetrics.objects.count() == len(keywords)
+
+        assert runner(restart=True).run() == {'Metrics': 10}
+
+    def test_failed_chunk_is_not_checkpointed(self):
+        Keyword.objects.bulk_create([Keyword(keyword=f'kw {index}') for index in range(6)])
+
+        def failing(keywords):
+            copy_metrics(keywords)
+            raise RuntimeError('boom')
+
+        steps = [MigrationStep('Metrics', Keyword.objects.all, failing)]
+        with pytest.raises(RuntimeError):
+            BulkMigrationRunner('test_job', steps, chunk_size=4, write=lambda line: None).run()
+
+        assert not MigrationCheckpoint.objects.exists()
+        assert not KeywordMetrics.objects.exists()
@@ -0,0 +1,289 @@
+# backend/common/utils/bulk_migration.py
+"""
+Framework des commandes de migration de données en masse
+
+- Une migration = un job composé d'étapes (MigrationStep) exécutées dans
+  l'ordre (dépendances FK) ; chaque étape lit un queryset source
+- Découpage en plages d'ids alignées sur chunk_size, planifiées par une
+  seule requête groupée (plages vides ignorées, lignes par plage connues)
+- Plages d'une étape traitées en parallèle (pool de processus, fork) ;
+  chaque plage écrit en masse (bulk_create) et enregistre son
+  MigrationCheckpoint dans la même transaction
+- Reprise : une relance saute les plages déjà validées (--restart pour
+  repartir de zéro) ; débit et temps restant affichés en continu
+"""
+
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.core.management.color import no_style
+from django.db import connection, connections, transaction
+from django.db.models import Count, F
+
+from common.models import MigrationCheckpoint
+
+import logging
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 5000
+DEFAULT_WORKERS = 4
+REPORT_INTERVAL = 2.0
+
+# Runners actifs : hérités par les processus du pool (fork), qui ne
+# reçoivent que (job, étape, plage)
+_RUNNERS = {}
+
+
+@dataclass
+class MigrationStep:
+    """
+    Étape de migration : `source()` retourne le queryset à lire,
+    `migrate(queryset)` écrit une plage (queryset filtré sur l'id) et
+    retourne le nombre de lignes traitées. `after()` s'exécute une fois,
+    dans le processus principal, quand toutes les plages sont terminées.
+    parallel=False pour les étapes dont les plages ne peuvent pas
+    s'exécuter simultanément (ex. génération de slugs uniques).
+    """
+    name: str
+    source: callable
+    migrate: callable
+    after: callable = None
+    chunk_size: int = None
+    parallel: bool = True
+
+
+def _run_chunk(job, step_name, start_id, end_id):
+    """Une plage : écriture + checkpoint atomiques (exécuté dans le pool ou en ligne)"""
+    step = _RUNNERS[job].steps[step_name]
+    started = time.monotonic()
+    with transaction.atomic():
+        rows = step.migrate(step.source().filter(id__gte=start_id, id__lt=end_id))
+        duration = time.monotonic() - started
+        MigrationCheckpoint.objects.create(
+            job=job, step=step_name, start_id=start_id, end_id=end_id, rows=rows or 0, duration=duration
+        )
+    return rows or 0
+
+
+def reset_sequences(*models):
+    """Séquences PostgreSQL recalées après insertion d'ids explicites"""
+    statements = connection.ops.sequence_reset_sql(no_style(), list(models))
+    if statements:
+        with connection.cursor() as cursor:
+            for sql in statements:
+                cursor.execute(sql)
+
+
+class MigrationProgress:
+    """Débit et temps restant d'une étape (lignes source planifiées)"""
+
+    def __init__(self, write, step_name, total_chunks, total_rows):
+        self.write = write
+        self.step_name = step_name
+        self.total_chunks = total_chunks
+        self.total_rows = total_rows
+        self.done_chunks = 0
+        self.done_rows = 0
+        self.written = 0
+        self.started = time.monotonic()
+        self.last_report = 0
+
+    def update(self, planned_rows, written):
+        self.done_chunks += 1
+        self.done_rows += planned_rows
+        self.written += written
+        now = time.monotonic()
+        if now - self.last_report >= REPORT_INTERVAL or self.done_chunks == self.total_chunks:
+            self.last_report = now
+            self.write(self.line())
+
+    def line(self):
+        elapsed = max(time.monotonic() - self.started, 1e-6)
+        throughput = self.done_rows / elapsed
+        remaining = (self.total_rows - self.done_rows) / throughput if throughput else 0
+        return (
+            f"   ⏳ {self.step_name}: {self.done_chunks}/{self.total_chunks} plages · "
+            f"{self.done_rows}/{self.total_rows} lignes · {throughput:.0f} l/s · "
+            f"reste {timedelta(seconds=round(remaining))}"
+        )
+
+
+class BulkMigrationRunner:
+    """Exécute les étapes d'un job, plage par plage, avec reprise"""
+
+    def __init__(self, job, steps, workers=DEFAULT_WORKERS, chunk_size=DEFAULT_CHUNK_SIZE,
+                 restart=False, write=None):
+        self.job = job
+        self.steps = {step.name: step for step in steps}
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.restart = restart
+        self.write = write or logger.info
+
+    def plan(self, step):
+        """[(start_id, end_id, lignes)] des plages non vides, une requête groupée"""
+        chunk_size = step.chunk_size or self.chunk_size
+        buckets = (
+            step.source().order_by()
+            .annotate(migration_bucket=F('id') / chunk_size)
+            .values('migration_bucket')
+            .annotate(rows=Count('id', distinct=True))
+            .order_by('migration_bucket')
+        )
+        return [
+            (bucket['migration_bucket'] * chunk_size, (bucket['migration_bucket'] + 1) * chunk_size, bucket['rows'])
+            for bucket in buckets
+        ]
+
+    def pending_chunks(self, step, chunks):
+        done = set(
+            MigrationCheckpoint.objects.filter(job=self.job, step=step.name).values_list('start_id', 'end_id')
+        )
+        return [chunk for chunk in chunks if chunk[:2] not in done]
+
+    def dry_run(self):
+        """Plan sans écriture : {étape: (plages, lignes, plages déjà faites)}"""
+        report = {}
+        for step in self.steps.values():
+            chunks = self.plan(step)
+            pending = chunks if self.restart else self.pending_chunks(step, chunks)
+            report[step.name] = (len(chunks), sum(rows for _, _, rows in chunks), len(chunks) - len(pending))
+        return report
+
+    def run(self, on_step_start=None, on_step_done=None):
+        """Toutes les étapes dans l'ordre ; retourne {étape: lignes écrites}"""
+        if self.restart:
+            MigrationCheckpoint.objects.filter(job=self.job).delete()
+
+        results = {}
+        _RUNNERS[self.job] = self
+        try:
+            for step in self.steps.values():
+                if on_step_start:
+                    on_step_start(step.name)
+                results[step.name] = self._run_step(step)
+                if on_step_done:
+                    on_step_done(step.name, results[step.name])
+        finally:
+            _RUNNERS.pop(self.job, None)
+        return results
+
+    def _run_step(self, step):
+        chunks = self.plan(step)
+        pending = self.pending_chunks(step, chunks)
+        skipped = len(chunks) - len(pending)
+        if skipped:
+            self.write(f"   ↪️  {step.name}: {skipped}/{len(chunks)} plages déjà migrées (reprise)")
+
+        progress = MigrationProgress(
+            self.write, step.name, len(pending), sum(rows for _, _, rows in pending)
+        )
+        if pending:
+            if self._use_pool(step):
+                self._run_in_pool(step, pending, progress)
+            else:
+                for start_id, end_id, rows in pending:
+                    progress.update(rows, _run_chunk(self.job, step.name, start_id, end_id))
+
+        if step.after:
+            step.after()
+        return progress.written
+
+    def _use_pool(self, step):
+        # SQLite (tests) : une seule connexion en mémoire, pas de fork
+        return step.parallel and self.workers > 1 and connection.vendor != 'sqlite'
+
+    def _run_in_pool(self, step, pending, progress):
+        # Connexions fermées avant fork : chaque processus ouvre la sienne
+        connections.close_all()
+        executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context('fork'))
+        try:
+            futures = {
+                executor.submit(_run_chunk, self.job, step.name, start_id, end_id): (start_id, end_id, rows)
+                for start_id, end_id, rows in pending
+            }
+            for future in as_completed(futures):
+                start_id, end_id, rows = futures[future]
+                try:
+                    written = future.result()
+                except Exception as e:
+                    raise CommandError(
+                        f"{step.name} [{start_id}, {end_id}) : {e} — relancer la commande pour reprendre"
+                    ) from e
+                progress.update(rows, written)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+class BulkMigrationCommand(BaseCommand):
+    """
+    Base des commandes de migration : options communes et exécution.
+    Les sous-classes définissent get_job_name(options) et get_steps(options).
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Affiche le plan (plages, lignes, reprise) sans rien écrire'
+        )
+        parser.add_argument(
+            '--chunk-size',
+            '--batch-size',
+            dest='chunk_size',
+            type=int,
+            default=DEFAULT_CHUNK_SIZE,
+            help=f'Taille des plages d\'ids (défaut: {DEFAULT_CHUNK_SIZE})'
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=DEFAULT_WORKERS,
+            help=f'Processus en parallèle (défaut: {DEFAULT_WORKERS}, 1 = séquentiel)'
+        )
+        parser.add_argument(
+            '--restart',
+            action='store_true',
+            help='Ignorer les checkpoints et tout remigrer'
+        )
+
+    def get_job_name(self, options):
+        raise NotImplementedError
+
+    def get_steps(self, options):
+        raise NotImplementedError
+
+    def run_migration(self, options):
+        """Retourne {étape: lignes écrites} (plan en dry-run)"""
+        runner = BulkMigrationRunner(
+            self.get_job_name(options),
+            self.get_steps(options),
+            workers=options['workers'],
+            chunk_size=options['chunk_size'],
+            restart=options['restart'],
+            write=self.stdout.write,
+        )
+
+        if options['dry_run']:
+            self.stdout.write(self.style.WARNING('🧪 MODE DRY-RUN - Aucune modification effectuée'))
+            report = runner.dry_run()
+            for step_name, (chunks, rows, done) in report.items():
+                self.stdout.write(f"   • {step_name}: {rows} lignes, {chunks} plages ({done} déjà migrées)")
+            return report
+
+        started = time.monotonic()
+        results = runner.run(
+            on_step_start=lambda step_name: self.stdout.write(f'\n📋 {step_name}...'),
+            on_step_done=lambda step_name, written: self.stdout.write(
+                self.style.SUCCESS(f'   ✅ {written} enregistrements migrés')
+            ),
+        )
+
+        self.stdout.write(self.style.SUCCESS(
+            f"\n🎉 {sum(results.values())} enregistrements en {timedelta(seconds=round(time.monotonic() - started))}"
+        ))
+        return results
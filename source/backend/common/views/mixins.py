@@ -169,13 +169,21 @@ class BulkActionViewSetMixin:
             )
         
         queryset = self.get_queryset().filter(id__in=ids)
-        updated_count = queryset.update(**updates)
+        updated_count = self.perform_bulk_update(queryset, updates)
         
         return Response({
             'updated_count': updated_count,
             'message': f'{updated_count} éléments mis à jour'
         })
     
+    def perform_bulk_update(self, queryset, updates):
+        """Hook : écriture en masse (données dérivées à recalculer après coup)"""
+        return queryset.update(**self.get_bulk_update_values(updates))
+    
+    def get_bulk_update_values(self, updates):
+        """Hook : queryset.update() n'appelle pas save(), les champs dérivés sont ajoutés ici"""
+        return updates
+    
     @action(detail=False, methods=['post'])
     def bulk_delete(self, request):
         """
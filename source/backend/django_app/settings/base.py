@@ -19,6 +19,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',  # Lookups trigram_similar / search (recherche mots-clés)
     'rest_framework',
     'rest_framework.authtoken',
     'rest_framework_simplejwt.token_blacklist',
@@ -293,6 +294,7 @@ REST_FRAMEWORK = {
         'user': '10000/day',
         'public_tools_anon': '200/hour',
         'public_tools_process': '100/hour',
+        'public_tools_bulk': '20/hour',
         'glossary_read': '1000/hour',
         'glossary_search': '300/hour',
         'glossary_stats': '100/hour',
@@ -344,8 +346,19 @@ CELERY_BEAT_SCHEDULE = {
         'task': 'public_tools.tasks.cleanup_old_quotas',
         'schedule': crontab(hour=3, minute=0),
     },
+    'refresh-serp-results': {
+        'task': 'seo_keywords_metrics.tasks.refresh_serp_results_task',
+        'schedule': crontab(hour=3, minute=30),
+    },
+    'cluster-new-keywords': {
+        'task': 'seo_keywords_cocoons.tasks.cluster_new_keywords_task',
+        'schedule': crontab(hour=4, minute=0),
+    },
 }
 
+# Redis du service url_shortener (Flask) : invalidation de son cache de redirections
+SHORTENER_REDIS_URL = os.environ.get('SHORTENER_REDIS_URL') or os.environ.get('REDIS_URL')
+
 # Cache configuration
 CACHES = {
     'default': {
@@ -495,6 +495,12 @@ urlpatterns = [
         # GET/POST /seo/cocoons/categories/ → Catégories de cocons
         # GET /seo/cocoons/{id}/stats/ → Statistiques cocon
         path('cocoons/', include(('seo_keywords_cocoons.urls', 'seo_keywords_cocoons'), namespace='seo_cocoons')),
+        
+        # SERP extraits
+        # GET /seo/keywords-metrics/serp/?domain=site.fr → Positions d'un domaine
+        # GET /seo/keywords-metrics/serp/domains/ → Domaines les plus présents
+        # POST /seo/keywords-metrics/serp/refresh/ → Extraction asynchrone (202 + task_id)
+        path('keywords-metrics/', include(('seo_keywords_metrics.urls', 'seo_keywords_metrics'), namespace='seo_keywords_metrics')),
     ])),
     
 
@@ -5,3 +5,7 @@ from django.apps import AppConfig
 class PublicToolsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'public_tools'
+
+    def ready(self):
+        from public_tools.signals import connect_short_url_signals
+        connect_short_url_signals()
@@ -0,0 +1,26 @@
+# backend/public_tools/migrations/0002_shortidsequence.py
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('public_tools', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ShortIdSequence',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=50, unique=True)),
+                ('next_value', models.PositiveBigIntegerField(default=0)),
+                ('permutation_key', models.CharField(max_length=64)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'public_tools_short_id_sequence',
+            },
+        ),
+    ]
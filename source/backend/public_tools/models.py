@@ -1,7 +1,9 @@
 # backend/public_tools/models.py
-from django.db import models
+import secrets
 import uuid
 from datetime import timedelta
+
+from django.db import models, transaction
 from django.utils import timezone
 
 class ToolUsage(models.Model):
@@ -388,4 +390,35 @@ class PublicOptimizationQuota(models.Model):
         """Incrémente les compteurs"""
         self.hourly_usage += 1
         self.daily_usage += 1
-        self.save()
\ No newline at end of file
+        self.save()
+
+
+class ShortIdSequence(models.Model):
+    """
+    Séquence de génération des short_id (voir utils/short_ids.py).
+    Les valeurs sont réservées par blocs : une seule requête pour N liens.
+    La clé de permutation est liée à la séquence et ne doit jamais changer.
+    """
+    name = models.CharField(max_length=50, unique=True)
+    next_value = models.PositiveBigIntegerField(default=0)
+    permutation_key = models.CharField(max_length=64)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        db_table = 'public_tools_short_id_sequence'
+    
+    @classmethod
+    def reserve(cls, count, name='public_short_url'):
+        """Réserve `count` valeurs consécutives -> (première valeur, clé)"""
+        with transaction.atomic():
+            sequence, _ = cls.objects.select_for_update().get_or_create(
+                name=name,
+                defaults={'permutation_key': secrets.token_hex(32)}
+            )
+            start = sequence.next_value
+            sequence.next_value = start + count
+            sequence.save(update_fields=['next_value', 'updated_at'])
+        return start, sequence.permutation_key
+    
+    def __str__(self):
+        return f"{self.name} ({self.next_value})"
@@ -3,6 +3,54 @@ from rest_framework import serializers
 import re
 from urllib.parse import urlparse
 
+SUSPICIOUS_URL_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE) for pattern in (
+        r'\.\./', r'<script', r'javascript:', r'data:',
+        r'eval\(', r'exec\(', r'system\(', r'shell\('
+    )
+]
+
+def validate_destination_url(value):
+    """
+    Validation sécurisée d'une URL de destination.
+    Exécutée une fois à la création du lien (unitaire ou bulk).
+    """
+    
+    # 1. Validation format de base
+    try:
+        parsed = urlparse(value)
+        if not parsed.scheme or not parsed.netloc:
+            raise serializers.ValidationError("Format d'URL invalide")
+    except Exception:
+        raise serializers.ValidationError("Format d'URL invalide")
+    
+    # 2. Protocoles autorisés
+    if parsed.scheme not in ['http', 'https']:
+        raise serializers.ValidationError("Seuls les protocoles HTTP et HTTPS sont autorisés")
+    
+    # 3. Domaines bloqués
+    hostname = parsed.netloc.lower()
+    blocked_domains = [
+        'localhost', '127.0.0.1', '0.0.0.0',
+        '10.', '192.168.', '172.16.', '172.17.',
+        '169.254.', 'bit.ly', 'tinyurl.com', 't.co'
+    ]
+    
+    for blocked in blocked_domains:
+        if blocked in hostname:
+            raise serializers.ValidationError(f"Domaine non autorisé: {hostname}")
+    
+    # 4. Patterns suspects
+    for pattern in SUSPICIOUS_URL_PATTERNS:
+        if pattern.search(value):
+            raise serializers.ValidationError("URL contient des éléments suspects")
+    
+    # 5. Longueur maximale pour public
+    if len(value) > 1000:
+        raise serializers.ValidationError("URL trop longue pour usage public (max 1000 caractères)")
+    
+    return value
+
 class UrlShorteningRequestSerializer(serializers.Serializer):
     """Serializer pour raccourcissement d'URL via WordPress"""
     
@@ -10,46 +58,7 @@ class UrlShorteningRequestSerializer(serializers.Serializer):
     
     def validate_url(self, value):
         """Validation sécurisée de l'URL"""
-        
-        # 1. Validation format de base
-        try:
-            parsed = urlparse(value)
-            if not parsed.scheme or not parsed.netloc:
-                raise serializers.ValidationError("Format d'URL invalide")
-        except Exception:
-            raise serializers.ValidationError("Format d'URL invalide")
-        
-        # 2. Protocoles autorisés
-        if parsed.scheme not in ['http', 'https']:
-            raise serializers.ValidationError("Seuls les protocoles HTTP et HTTPS sont autorisés")
-        
-        # 3. Domaines bloqués
-        hostname = parsed.netloc.lower()
-        blocked_domains = [
-            'localhost', '127.0.0.1', '0.0.0.0',
-            '10.', '192.168.', '172.16.', '172.17.',
-            '169.254.', 'bit.ly', 'tinyurl.com', 't.co'
-        ]
-        
-        for blocked in blocked_domains:
-            if blocked in hostname:
-                raise serializers.ValidationError(f"Domaine non autorisé: {hostname}")
-        
-        # 4. Patterns suspects
-        suspicious_patterns = [
-            r'\.\./', r'<script', r'javascript:', r'data:',
-            r'eval\(', r'exec\(', r'system\(', r'shell\('
-        ]
-        
-        for pattern in suspicious_patterns:
-            if re.search(pattern, value, re.IGNORECASE):
-                raise serializers.ValidationError("URL contient des éléments suspects")
-        
-        # 5. Longueur maximale pour public
-        if len(value) > 1000:
-            raise serializers.ValidationError("URL trop longue pour usage public (max 1000 caractères)")
-        
-        return value
+        return validate_destination_url(value)
 
 class QrGenerationRequestSerializer(serializers.Serializer):
     """Serializer pour génération QR code (futur)"""
@@ -1,3 +1,253 @@
 # backend/public_tools/services/web_services.py
-# Web services - à implémenter  
-pass
\ No newline at end of file
+import csv
+import io
+import logging
+from datetime import timedelta
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.core.validators import URLValidator
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from rest_framework import serializers
+
+from public_tools.models import ShortIdSequence
+from public_tools.serializers.web_serializers import validate_destination_url
+from public_tools.utils.short_ids import ShortIdPermutation
+
+logger = logging.getLogger(__name__)
+
+SHORT_URL_BASE = 'https://hiurl.fr/'
+
+
+class BulkShortUrlService:
+    """
+    Création de liens courts en masse (campagnes)
+
+    - Destinations validées une seule fois, à la création
+    - short_id issus d'une séquence réservée par blocs + permutation :
+      pas de tirage aléatoire ni de retry sur collision
+    - Insertion par lots (bulk_create), résultats produits au fil de l'eau
+      pour être streamés en CSV
+    """
+
+    BATCH_SIZE = 1000
+    MAX_LINKS = 50000
+    EXPIRES_IN_DAYS = 30
+    MAX_REISSUE_ATTEMPTS = 3
+    MAX_URL_LENGTH = 2000
+    MAX_REF_LENGTH = 255
+
+    OUTPUT_COLUMNS = ['ref', 'original_url', 'short_id', 'short_url', 'expires_at', 'status', 'error']
+
+    # ===== ENTRÉES =====
+
+    # Destinations : tuples (url, ref, erreur de lecture ou None)
+
+    @staticmethod
+    def iter_json_destinations(items):
+        """Liste JSON : ["https://...", ...] ou [{"url": ..., "ref": ...}, ...]"""
+        for item in items:
+            if isinstance(item, dict):
+                yield str(item.get('url') or '').strip(), str(item.get('ref') or ''), None
+            else:
+                yield str(item or '').strip(), '', None
+
+    @staticmethod
+    def iter_csv_destinations(text_stream):
+        """
+        CSV avec en-tête url[,ref] ou une URL par ligne (première colonne).
+        Une ligne illisible (champ au-delà de la limite du module csv...) est
+        rejetée individuellement, la lecture continue à la ligne suivante.
+        """
+        reader = csv.reader(text_stream)
+        url_index, ref_index = 0, None
+        first_row = True
+        while True:
+            try:
+                row = next(reader)
+            except StopIteration:
+                return
+            except csv.Error as e:
+                first_row = False
+                yield '', '', f"Ligne CSV {reader.line_num} illisible : {str(e)}"
+                continue
+            if not row:
+                continue
+            if first_row:
+                first_row = False
+                header = [cell.strip().lower() for cell in row]
+                if 'url' in header:
+                    url_index = header.index('url')
+                    ref_index = header.index('ref') if 'ref' in header else None
+                    continue
+            url = row[url_index].strip() if len(row) > url_index else ''
+            ref = row[ref_index] if ref_index is not None and len(row) > ref_index else ''
+            yield url, ref, None
+
+    @classmethod
+    def destinations_from_request(cls, request):
+        """Itérateur (url, ref) depuis un fichier CSV, un corps text/csv ou du JSON"""
+        upload = request.FILES.get('file')
+        if upload:
+            return cls.iter_csv_destinations(io.TextIOWrapper(upload.file, encoding='utf-8-sig'))
+
+        if request.content_type in ('text/csv', 'text/plain'):
+            return cls.iter_csv_destinations(io.StringIO(request.body.decode('utf-8-sig')))
+
+        data = request.data
+        items = data.get('urls') if isinstance(data, dict) else data
+        if not isinstance(items, list):
+            raise serializers.ValidationError("Fournir une liste 'urls' ou un fichier CSV")
+        return cls.iter_json_destinations(items)
+
+    # ===== VALIDATION =====
+
+    @classmethod
+    def validate_destination(cls, url):
+        """Retourne un message d'erreur ou None si la destination est acceptée"""
+        if not url:
+            return "URL manquante"
+        if len(url) > cls.MAX_URL_LENGTH:
+            return f"URL trop longue (max {cls.MAX_URL_LENGTH} caractères)"
+        try:
+            URLValidator(schemes=['http', 'https'])(url)
+            validate_destination_url(url)
+        except DjangoValidationError:
+            return "Format d'URL invalide"
+        except serializers.ValidationError as e:
+            return str(e.detail[0]) if e.detail else "URL invalide"
+        return None
+
+    @classmethod
+    def destination_error(cls, url, ref, read_error=None):
+        """Erreur d'une ligne d'entrée (lecture, référence, destination) ou None"""
+        if read_error:
+            return read_error
+        if len(ref) > cls.MAX_REF_LENGTH:
+            return f"Référence trop longue (max {cls.MAX_REF_LENGTH} caractères)"
+        return cls.validate_destination(url)
+
+    # ===== CRÉATION =====
+
+    @classmethod
+    def create_links(cls, destinations):
+        """
+        Génère une ligne de résultat par destination, dans l'ordre d'entrée.
+        Les destinations au-delà de MAX_LINKS sont rejetées.
+        """
+        batch = []
+        for position, (url, ref, error) in enumerate(destinations):
+            if position >= cls.MAX_LINKS:
+                yield cls._row(ref[:cls.MAX_REF_LENGTH], url[:cls.MAX_URL_LENGTH], status='rejected',
+                               error=f"Limite de {cls.MAX_LINKS} liens par requête atteinte")
+                continue
+            batch.append((url, ref, error))
+            if len(batch) >= cls.BATCH_SIZE:
+                yield from cls._create_batch(batch)
+                batch = []
+        if batch:
+            yield from cls._create_batch(batch)
+
+    @classmethod
+    def _create_batch(cls, batch):
+        from url_shortener.models import PublicShortUrl
+
+        rows = [None] * len(batch)
+        valid = []
+        for index, (url, ref, read_error) in enumerate(batch):
+            error = cls.destination_error(url, ref, read_error)
+            if error:
+                # Valeurs tronquées : une ligne géante n'est pas renvoyée telle quelle
+                rows[index] = cls._row(
+                    ref[:cls.MAX_REF_LENGTH], url[:cls.MAX_URL_LENGTH], status='invalid', error=error
+                )
+            else:
+                valid.append(index)
+
+        expires_at = timezone.now() + timedelta(days=cls.EXPIRES_IN_DAYS)
+        short_ids = cls._allocate(len(valid))
+
+        for attempt in range(cls.MAX_REISSUE_ATTEMPTS + 1):
+            links = [
+                PublicShortUrl(short_id=short_id, original_url=batch[index][0], expires_at=expires_at)
+                for index, short_id in zip(valid, short_ids)
+            ]
+            try:
+                with transaction.atomic():
+                    PublicShortUrl.objects.bulk_create(links, batch_size=cls.BATCH_SIZE)
+                break
+            except IntegrityError:
+                # Seul cas possible : un ancien lien à ID aléatoire occupe déjà une valeur
+                taken = set(
+                    PublicShortUrl.objects.filter(short_id__in=short_ids)
+                    .values_list('short_id', flat=True)
+                )
+                if not taken or attempt == cls.MAX_REISSUE_ATTEMPTS:
+                    raise
+                fresh = iter(cls._allocate(len(taken)))
+                short_ids = [next(fresh) if sid in taken else sid for sid in short_ids]
+                logger.warning(f"Bulk shortener: {len(taken)} short_id déjà pris, réémis")
+
+        for index, short_id in zip(valid, short_ids):
+            url, ref, _ = batch[index]
+            rows[index] = cls._row(
+                ref, url,
+                short_id=short_id,
+                short_url=f"{SHORT_URL_BASE}{short_id}",
+                expires_at=expires_at.isoformat(),
+                status='created',
+            )
+        return rows
+
+    @staticmethod
+    def _allocate(count):
+        """Réserve `count` valeurs de séquence et les transforme en short_id"""
+        if not count:
+            return []
+        start, key = ShortIdSequence.reserve(count)
+        permutation = ShortIdPermutation(key)
+        return [permutation.short_id(value) for value in range(start, start + count)]
+
+    @classmethod
+    def _row(cls, ref, url, short_id='', short_url='', expires_at='', status='', error=''):
+        return {
+            'ref': ref,
+            'original_url': url,
+            'short_id': short_id,
+            'short_url': short_url,
+            'expires_at': expires_at,
+            'status': status,
+            'error': error,
+        }
+
+    # ===== SORTIE =====
+
+    @classmethod
+    def stream_csv(cls, destinations):
+        """Lignes CSV produites au fur et à mesure des lots"""
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=cls.OUTPUT_COLUMNS)
+
+        def flush():
+            value = buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate(0)
+            return value
+
+        writer.writeheader()
+        yield flush()
+
+        stats = {'created': 0, 'invalid': 0, 'rejected': 0}
+        try:
+            for row in cls.create_links(destinations):
+                stats[row['status']] = stats.get(row['status'], 0) + 1
+                writer.writerow(row)
+                # Un chunk par ligne serait trop bavard : on regroupe
+                if buffer.tell() > 64 * 1024:
+                    yield flush()
+        except Exception as e:
+            logger.error(f"Bulk shortener interrompu: {str(e)}")
+            writer.writerow(cls._row('', '', status='error', error='Erreur serveur, résultats partiels'))
+
+        yield flush()
+        logger.info(f"Bulk shortener terminé: {stats}")
@@ -0,0 +1,27 @@
+# backend/public_tools/signals.py
+
+from functools import partial
+
+from django.apps import apps
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+
+from public_tools.utils.short_url_cache import invalidate_short_ids
+
+# Modèles lus par le service url_shortener (app optionnelle)
+SHORT_URL_MODELS = ('ShortUrl', 'PublicShortUrl')
+
+
+def invalidate_short_url(sender, instance, using, **kwargs):
+    """Désactivation / modification / suppression : cache de redirection purgé après commit"""
+    transaction.on_commit(partial(invalidate_short_ids, [instance.short_id]), using=using)
+
+
+def connect_short_url_signals():
+    for model_name in SHORT_URL_MODELS:
+        try:
+            model = apps.get_model('url_shortener', model_name)
+        except LookupError:
+            continue
+        post_save.connect(invalidate_short_url, sender=model, dispatch_uid=f'invalidate_{model_name}_save')
+        post_delete.connect(invalidate_short_url, sender=model, dispatch_uid=f'invalidate_{model_name}_delete')
@@ -1,4 +1,82 @@
 # backend/public_tools/tests.py
-from django.test import TestCase
+import csv
+import io
 
-# Create your tests here.
+from django.test import SimpleTestCase
+
+from public_tools.services.web_services import BulkShortUrlService
+from public_tools.utils.short_ids import ID_SPACE, ShortIdPermutation, base62_encode
+
+
+class ShortIdPermutationTestCase(SimpleTestCase):
+    """Permutation Feistel + cycle walking : bijection sur tout le domaine"""
+
+    KEY = 'test-permutation-key'
+
+    def test_bijection_on_small_domains(self):
+        # Domaines énumérables, dont des tailles qui forcent le cycle walking
+        for space, half_bits in [(1000, 5), (1024, 5), (62 ** 2, 6), (5, 2)]:
+            permutation = ShortIdPermutation(self.KEY, space=space, half_bits=half_bits)
+            images = [permutation.permute(value) for value in range(space)]
+
+            self.assertEqual(sorted(images), list(range(space)), f"space={space}")
+            self.assertEqual([permutation.invert(image) for image in images], list(range(space)))
+
+    def test_round_trip_on_short_id_space(self):
+        permutation = ShortIdPermutation(self.KEY)
+        values = list(range(5000)) + [ID_SPACE - 1 - value for value in range(1000)]
+
+        short_ids = [permutation.short_id(value) for value in values]
+
+        self.assertEqual(len(set(short_ids)), len(values))
+        self.assertTrue(all(len(short_id) == 8 for short_id in short_ids))
+        self.assertEqual([permutation.invert(permutation.permute(value)) for value in values], values)
+
+    def test_key_and_bounds(self):
+        self.assertNotEqual(
+            ShortIdPermutation('key-a').permute(42), ShortIdPermutation('key-b').permute(42)
+        )
+        with self.assertRaises(ValueError):
+            ShortIdPermutation(self.KEY).permute(ID_SPACE)
+        with self.assertRaises(ValueError):
+            ShortIdPermutation(self.KEY, space=2 ** 11, half_bits=5)
+        self.assertEqual(base62_encode(61, length=3), '00z')
+
+
+class BulkShortUrlInputTestCase(SimpleTestCase):
+    """Lecture CSV du raccourcissement en masse : lignes invalides rejetées une à une"""
+
+    def read(self, text):
+        return list(BulkShortUrlService.iter_csv_destinations(io.StringIO(text)))
+
+    def test_header_and_columns(self):
+        rows = self.read('ref,url\nA, https://example.com/a \n\nB\n')
+
+        self.assertEqual(rows, [('https://example.com/a', 'A', None), ('', 'B', None)])
+        self.assertEqual(BulkShortUrlService.destination_error(*rows[1]), "URL manquante")
+
+    def test_unreadable_row_rejected_and_reading_continues(self):
+        limit = csv.field_size_limit()
+        csv.field_size_limit(100)
+        try:
+            rows = self.read(f'url\nhttps://example.com/a\n"{"x" * 500}"\nhttps://example.com/b\n')
+        finally:
+            csv.field_size_limit(limit)
+
+        self.assertEqual([row[0] for row in rows], ['https://example.com/a', '', 'https://example.com/b'])
+        self.assertIn('Ligne CSV 3 illisible', BulkShortUrlService.destination_error(*rows[1]))
+
+    def test_oversized_and_malformed_values_rejected(self):
+        long_url = 'https://example.com/' + 'a' * BulkShortUrlService.MAX_URL_LENGTH
+        long_ref = 'r' * (BulkShortUrlService.MAX_REF_LENGTH + 1)
+        text = f'url,ref\n{long_url},ok\nhttps://example.com,{long_ref}\nnot a url,x\nftp://example.com/f,y\n'
+
+        errors = [BulkShortUrlService.destination_error(*row) for row in self.read(text)]
+
+        self.assertIn('URL trop longue', errors[0])
+        self.assertIn('Référence trop longue', errors[1])
+        self.assertEqual(errors[2], "Format d'URL invalide")
+        self.assertEqual(errors[3], "Format d'URL invalide")
+
+    def test_valid_destination_accepted(self):
+        self.assertIsNone(BulkShortUrlService.destination_error('https://example.com/page', 'ref'))
@@ -25,4 +25,10 @@ class PublicToolsProcessThrottle(AnonRateThrottle):
         ident = self.get_ident(request)
         # Ajouter le type d'outil pour un rate limit par outil
         tool_type = getattr(view, 'tool_type', 'unknown')
-        return f"public_tools_process_{tool_type}_{ident}"
\ No newline at end of file
+        return f"public_tools_process_{tool_type}_{ident}"
+
+class PublicToolsBulkThrottle(UserRateThrottle):
+    """
+    Rate limiting des créations en masse (par utilisateur authentifié)
+    """
+    scope = 'public_tools_bulk'
@@ -22,6 +22,7 @@ urlpatterns = [
     # Web tools
     path('web/shortener/render/', web_views.render_shortener, name='shortener_render'),
     path('web/shortener/process/', web_views.process_url_shortening, name='shortener_process'),
+    path('web/shortener/bulk/', web_views.process_bulk_url_shortening, name='shortener_bulk'),
     
     # Real estate tools
     path('real-estate/simulator/render/', real_estate_views.render_simulator, name='simulator_render'),
@@ -0,0 +1,83 @@
+# backend/public_tools/utils/short_ids.py
+"""
+Génération de short_id sans collision
+
+short_id = base62(permutation(n)) où n vient d'une séquence en base
+(voir ShortIdSequence). La permutation est une bijection : deux valeurs
+de séquence distinctes donnent toujours deux short_id distincts, donc
+aucune vérification/retry à l'insertion. Elle masque l'ordre de création
+(les IDs consécutifs ne se ressemblent pas).
+
+Permutation : réseau de Feistel à 4 tours sur 48 bits (blake2b à clé),
+avec "cycle walking" pour rester dans [0, 62^8). L'espace et la taille
+des demi-blocs sont paramétrables (petits domaines vérifiables en test).
+"""
+import hashlib
+
+BASE62_ALPHABET = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz'
+SHORT_ID_LENGTH = 8
+ID_SPACE = 62 ** SHORT_ID_LENGTH
+
+_HALF_BITS = 24
+_ROUNDS = 4
+
+
+def base62_encode(value, length=SHORT_ID_LENGTH):
+    """Encode un entier en base62, complété à gauche jusqu'à `length`"""
+    chars = []
+    while value:
+        value, remainder = divmod(value, 62)
+        chars.append(BASE62_ALPHABET[remainder])
+    return ''.join(reversed(chars)).rjust(length, BASE62_ALPHABET[0])
+
+
+class ShortIdPermutation:
+    """Bijection de [0, space) paramétrée par une clé secrète (défaut : [0, 62^8))"""
+
+    def __init__(self, key, space=ID_SPACE, half_bits=_HALF_BITS):
+        if space > 1 << (2 * half_bits):
+            raise ValueError(f"Espace {space} trop grand pour des demi-blocs de {half_bits} bits")
+        self.key = key.encode('utf-8') if isinstance(key, str) else key
+        self.space = space
+        self.half_bits = half_bits
+        self.half_mask = (1 << half_bits) - 1
+        self.half_bytes = (half_bits + 7) // 8
+
+    def _round(self, round_index, half):
+        digest = hashlib.blake2b(
+            round_index.to_bytes(1, 'big') + half.to_bytes(self.half_bytes, 'big'),
+            key=self.key[:64],
+            digest_size=self.half_bytes,
+        ).digest()
+        return int.from_bytes(digest, 'big') & self.half_mask
+
+    def _feistel(self, value):
+        left, right = value >> self.half_bits, value & self.half_mask
+        for round_index in range(_ROUNDS):
+            left, right = right, left ^ self._round(round_index, right)
+        return (left << self.half_bits) | right
+
+    def _feistel_inverse(self, value):
+        left, right = value >> self.half_bits, value & self.half_mask
+        for round_index in reversed(range(_ROUNDS)):
+            left, right = right ^ self._round(round_index, left), left
+        return (left << self.half_bits) | right
+
+    def _walk(self, step, value):
+        if not 0 <= value < self.space:
+            raise ValueError(f"Valeur hors de l'espace des short_id: {value}")
+        # Cycle walking : space < 2^(2*half_bits), on réapplique tant qu'on sort de l'espace
+        value = step(value)
+        while value >= self.space:
+            value = step(value)
+        return value
+
+    def permute(self, value):
+        return self._walk(self._feistel, value)
+
+    def invert(self, value):
+        """Valeur de séquence d'origine d'une valeur permutée"""
+        return self._walk(self._feistel_inverse, value)
+
+    def short_id(self, value):
+        return base62_encode(self.permute(value))
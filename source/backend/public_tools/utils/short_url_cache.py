@@ -0,0 +1,49 @@
+# backend/public_tools/utils/short_url_cache.py
+"""
+Invalidation du cache de redirections du service url_shortener (Flask)
+
+Le service garde les redirections dans un LRU par worker + Redis. Quand un
+lien est désactivé ou modifié côté Django, la clé Redis est supprimée et le
+short_id publié sur le canal écouté par chaque worker (LRU purgé).
+Clé et canal : doivent correspondre à url_shortener/cache.py.
+"""
+import logging
+
+from django.conf import settings
+
+try:
+    import redis
+except ImportError:  # Redis optionnel
+    redis = None
+
+logger = logging.getLogger(__name__)
+
+REDIS_KEY_PREFIX = 'shortener:url:'
+INVALIDATION_CHANNEL = 'shortener:invalidate'
+
+_client = None
+
+
+def _get_client():
+    global _client
+    redis_url = getattr(settings, 'SHORTENER_REDIS_URL', None)
+    if _client is None and redis_url and redis is not None:
+        _client = redis.Redis.from_url(redis_url, socket_timeout=0.5, socket_connect_timeout=0.5)
+    return _client
+
+
+def invalidate_short_ids(short_ids):
+    """Supprime les entrées Redis et notifie les workers ; sans effet si Redis absent"""
+    short_ids = [short_id for short_id in short_ids if short_id]
+    client = _get_client()
+    if not short_ids or client is None:
+        return
+    try:
+        pipeline = client.pipeline(transaction=False)
+        pipeline.delete(*[REDIS_KEY_PREFIX + short_id for short_id in short_ids])
+        for short_id in short_ids:
+            pipeline.publish(INVALIDATION_CHANNEL, short_id)
+        pipeline.execute()
+    except Exception as e:
+        # Cache dérivé : l'écriture d'origine ne doit pas échouer (TTL local en filet)
+        logger.warning(f"Short URL cache invalidation failed for {len(short_ids)} ids: {str(e)}")
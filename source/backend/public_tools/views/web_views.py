@@ -1,15 +1,18 @@
 # backend/public_tools/views/web_views.py
 from rest_framework.decorators import api_view, permission_classes, throttle_classes
 from rest_framework.response import Response
-from django.http import HttpResponse
+from rest_framework.permissions import IsAuthenticated
+from django.http import HttpResponse, StreamingHttpResponse
+from django.utils import timezone
 from django.shortcuts import render
 from django.views.decorators.csrf import csrf_exempt
 import logging
 
 from public_tools.permissions import PublicToolsOnly, WordPressDomainOnly
-from public_tools.throttling import PublicToolsAnonThrottle, PublicToolsProcessThrottle
+from public_tools.throttling import PublicToolsAnonThrottle, PublicToolsProcessThrottle, PublicToolsBulkThrottle
 from public_tools.serializers.web_serializers import UrlShorteningRequestSerializer
 from public_tools.models import ToolUsage
+from public_tools.services.web_services import BulkShortUrlService
 
 logger = logging.getLogger(__name__)
 
@@ -285,6 +288,33 @@ def process_url_shortening_server(request):
         '''
         return HttpResponse(error_html)
 
+@api_view(['POST'])
+@permission_classes([IsAuthenticated, PublicToolsOnly])
+@throttle_classes([PublicToolsBulkThrottle])
+def process_bulk_url_shortening(request):
+    """
+    Création en masse pour les campagnes (JSON {"urls": [...]} ou CSV url[,ref]).
+    Le résultat est streamé en CSV au fur et à mesure des lots.
+    """
+    try:
+        destinations = BulkShortUrlService.destinations_from_request(request)
+    except Exception as e:
+        return Response({'error': 'Entrée invalide', 'details': str(e)}, status=400)
+    
+    ip_address = get_client_ip(request)
+    ToolUsage.objects.create(tool_name='shortener_bulk', ip_address=ip_address)
+    logger.info(f"Bulk shortener démarré par {request.user} ({ip_address})")
+    
+    filename = f"short_links_{timezone.now():%Y%m%d_%H%M%S}.csv"
+    response = StreamingHttpResponse(
+        BulkShortUrlService.stream_csv(destinations),
+        content_type='text/csv; charset=utf-8'
+    )
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    response['X-Content-Type-Options'] = 'nosniff'
+    response['Cache-Control'] = 'no-store'
+    return response
+
 @api_view(['GET'])
 @permission_classes([PublicToolsOnly])
 @throttle_classes([PublicToolsAnonThrottle])
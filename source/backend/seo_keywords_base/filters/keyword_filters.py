@@ -2,8 +2,6 @@
 
 import django_filters
 from django.db.models import Q, Exists, OuterRef
-from django.db.models.functions import Cast, Replace
-from django.db.models import FloatField, Value
 from ..models import Keyword
 
 class KeywordFilter(django_filters.FilterSet):
@@ -97,13 +95,11 @@ class KeywordFilter(django_filters.FilterSet):
         ]
     
     def filter_search(self, queryset, name, value):
-        """Recherche textuelle étendue"""
+        """Recherche textuelle étendue (plein texte + trigrammes sous PostgreSQL)"""
         if not value:
             return queryset
-        return queryset.filter(
-            Q(keyword__icontains=value) |
-            Q(content_types__icontains=value)
-        )
+        from ..services.keyword_search_service import KeywordSearchService
+        return KeywordSearchService.search(queryset, value)
     
     # ===== MÉTHODES MÉTRIQUES =====
     
@@ -159,77 +155,20 @@ class KeywordFilter(django_filters.FilterSet):
             return queryset.none()
     
     def filter_kdifficulty_gte(self, queryset, name, value):
-        """Filtrage difficulté avec normalisation"""
-        try:
-            from seo_keywords_metrics.models import KeywordMetrics
-            
-            # Annotation pour normaliser KD
-            normalized_queryset = queryset.annotate(
-                kd_normalized=Cast(
-                    Replace(
-                        Replace('metrics__kdifficulty', Value('%'), Value('')),
-                        Value(','), Value('.')
-                    ),
-                    FloatField()
-                )
-            )
-            
-            return normalized_queryset.filter(kd_normalized__gte=value)
-        except ImportError:
-            return queryset
+        """Filtrage difficulté sur la colonne numérique indexée"""
+        return self._filter_metrics_field(queryset, 'kdifficulty_value__gte', value)
     
     def filter_kdifficulty_lte(self, queryset, name, value):
-        """Filtrage difficulté max avec normalisation"""
-        try:
-            from seo_keywords_metrics.models import KeywordMetrics
-            
-            normalized_queryset = queryset.annotate(
-                kd_normalized=Cast(
-                    Replace(
-                        Replace('metrics__kdifficulty', Value('%'), Value('')),
-                        Value(','), Value('.')
-                    ),
-                    FloatField()
-                )
-            )
-            
-            return normalized_queryset.filter(kd_normalized__lte=value)
-        except ImportError:
-            return queryset
+        """Filtrage difficulté max sur la colonne numérique indexée"""
+        return self._filter_metrics_field(queryset, 'kdifficulty_value__lte', value)
     
     def filter_cpc_gte(self, queryset, name, value):
-        """Filtrage CPC avec normalisation"""
-        cpc_normalized = Cast(
-            Replace(
-                Replace(
-                    Replace('cpc', Value('€'), Value('')),
-                    Value(','), Value('.')
-                ),
-                Value(' '), Value('')
-            ),
-            FloatField()
-        )
-        
-        return queryset.annotate(
-            cpc_normalized=cpc_normalized
-        ).filter(cpc_normalized__gte=value)
+        """Filtrage CPC sur la colonne numérique indexée"""
+        return queryset.filter(cpc_value__gte=value)
     
     def filter_cpc_lte(self, queryset, name, value):
-        """Filtrage CPC max avec normalisation"""
-        cpc_normalized = Cast(
-            Replace(
-                Replace(
-                    Replace('cpc', Value('€'), Value('')),
-                    Value(','), Value('.')
-                ),
-                Value(' '), Value('')
-            ),
-            FloatField()
-        )
-        
-        return queryset.annotate(
-            cpc_normalized=cpc_normalized
-        ).filter(cpc_normalized__lte=value)
+        """Filtrage CPC max sur la colonne numérique indexée"""
+        return queryset.filter(cpc_value__lte=value)
     
     # ===== MÉTHODES RELATIONS =====
     
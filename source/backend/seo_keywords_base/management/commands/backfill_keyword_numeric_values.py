@@ -0,0 +1,39 @@
+# backend/seo_keywords_base/management/commands/backfill_keyword_numeric_values.py
+
+from django.apps import apps
+from django.core.management.base import BaseCommand
+
+from seo_keywords_base.services.numeric_backfill import NUMERIC_COLUMNS, backfill_numeric_column
+
+
+class Command(BaseCommand):
+    help = 'Recalcule cpc_value et kdifficulty_value depuis les chaînes brutes (par lots)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=2000,
+            help='Taille des lots (défaut: 2000)'
+        )
+        parser.add_argument(
+            '--all',
+            action='store_true',
+            help='Recalcule toutes les lignes, pas seulement les valeurs manquantes'
+        )
+
+    def handle(self, *args, **options):
+        for app_label, model_name, raw_field, value_field, value_parser in NUMERIC_COLUMNS:
+            model = apps.get_model(app_label, model_name)
+            self.stdout.write(f"🔄 {model_name}.{value_field} depuis {raw_field}...")
+
+            def progress(last_id, updated):
+                self.stdout.write(f"   id <= {last_id} : {updated} mis à jour", ending='\r')
+
+            updated = backfill_numeric_column(
+                model, raw_field, value_field, value_parser,
+                batch_size=options['batch_size'],
+                only_missing=not options['all'],
+                progress=progress,
+            )
+            self.stdout.write(self.style.SUCCESS(f"\n✅ {model_name}.{value_field} : {updated} lignes mises à jour"))
@@ -0,0 +1,80 @@
+# backend/seo_keywords_base/management/commands/import_keywords.py
+
+import json
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+
+from seo_keywords_base.services.keyword_import_service import IMPORT_BATCH_SIZE, KeywordImportService
+
+
+class Command(BaseCommand):
+    help = 'Importe un export de mots-clés CSV/XLSX (Keyword, KeywordMetrics, PPA) par lots'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='Fichier CSV ou XLSX')
+        parser.add_argument(
+            '--format',
+            choices=['csv', 'xlsx'],
+            help="Format du fichier (défaut: déduit de l'extension)"
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=IMPORT_BATCH_SIZE,
+            help=f'Taille des lots (défaut: {IMPORT_BATCH_SIZE})'
+        )
+        parser.add_argument(
+            '--mapping',
+            help='Correspondance en-tête -> champ en JSON, ex: \'{"Requête": "keyword"}\''
+        )
+        parser.add_argument(
+            '--errors',
+            help='Fichier CSV des lignes rejetées (défaut: <fichier>.errors.csv)'
+        )
+
+    def handle(self, *args, **options):
+        path = options['path']
+        if not os.path.exists(path):
+            raise CommandError(f"Fichier introuvable: {path}")
+
+        try:
+            file_format = options['format'] or KeywordImportService.detect_format(path)
+            column_mapping = json.loads(options['mapping']) if options['mapping'] else None
+        except (ValueError, json.JSONDecodeError) as e:
+            raise CommandError(str(e))
+
+        errors_path = options['errors'] or f"{os.path.splitext(path)[0]}.errors.csv"
+
+        def progress(stats):
+            self.stdout.write(
+                f"   {stats['processed_rows']}/{stats['total_rows']} lignes "
+                f"({stats['created']} créés, {stats['updated']} mis à jour, {stats['failed']} rejetés)",
+                ending='\r'
+            )
+
+        self.stdout.write(f"📥 Import {path} ({file_format})...")
+        with open(path, 'rb') as fileobj, open(errors_path, 'w', encoding='utf-8', newline='') as error_stream:
+            try:
+                stats = KeywordImportService.run(
+                    fileobj,
+                    file_format=file_format,
+                    column_mapping=column_mapping,
+                    batch_size=options['batch_size'],
+                    error_stream=error_stream,
+                    progress=progress,
+                )
+            except ValueError as e:
+                raise CommandError(str(e))
+
+        if stats['ignored_columns']:
+            self.stdout.write(self.style.WARNING(f"\n⚠️  Colonnes ignorées: {', '.join(stats['ignored_columns'])}"))
+
+        self.stdout.write(self.style.SUCCESS(
+            f"\n✅ {stats['processed_rows']} lignes : {stats['created']} créés, "
+            f"{stats['updated']} mis à jour, {stats['duplicates']} doublons"
+        ))
+        if stats['failed']:
+            self.stdout.write(self.style.WARNING(f"❌ {stats['failed']} lignes rejetées -> {errors_path}"))
+        else:
+            os.remove(errors_path)
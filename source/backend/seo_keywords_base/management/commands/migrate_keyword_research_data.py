@@ -1,35 +1,29 @@
 # backend/seo_keywords_base/management/commands/migrate_keyword_research_data.py
 
-from django.core.management.base import BaseCommand
-from django.db import transaction
 from django.apps import apps
 import logging
 
+from common.utils.bulk_migration import BulkMigrationCommand, MigrationStep, reset_sequences
+from seo_keywords_base.services.keyword_search_service import KeywordSearchService
+from seo_keywords_base.utils.normalization import parse_cpc, parse_kdifficulty
+
 logger = logging.getLogger(__name__)
 
-class Command(BaseCommand):
+JOB_NAME = 'keyword_research_data'
+
+class Command(BulkMigrationCommand):
+    """
+    Migre keyword_research vers les 5 apps seo_keywords_* (ids conservés).
+
+    Plages d'ids en parallèle, reprise automatique après interruption :
+        python manage.py migrate_keyword_research_data --dry-run
+        python manage.py migrate_keyword_research_data --workers=8
+        python manage.py migrate_keyword_research_data --restart
+    """
+
     help = 'Migre toutes les données de keyword_research vers les 5 nouvelles apps SEO'
-    
-    def add_arguments(self, parser):
-        parser.add_argument(
-            '--dry-run',
-            action='store_true',
-            help='Affiche ce qui serait migré sans effectuer la migration'
-        )
-        parser.add_argument(
-            '--batch-size',
-            type=int,
-            default=1000,
-            help='Taille des batches pour la migration (défaut: 1000)'
-        )
-    
+
     def handle(self, *args, **options):
-        self.dry_run = options['dry_run']
-        self.batch_size = options['batch_size']
-        
-        if self.dry_run:
-            self.stdout.write(self.style.WARNING('🧪 MODE DRY-RUN - Aucune modification effectuée'))
-        
         try:
             # Vérifier que l'ancienne app existe encore
             old_app = apps.get_app_config('keyword_research')
@@ -37,16 +31,16 @@ class Command(BaseCommand):
         except LookupError:
             self.stdout.write(self.style.ERROR('❌ App keyword_research introuvable'))
             return
-        
+
         # Vérifier les nouvelles apps
         new_apps = [
             'seo_keywords_base',
-            'seo_keywords_metrics', 
+            'seo_keywords_metrics',
             'seo_keywords_cocoons',
             'seo_keywords_ppa',
             'seo_keywords_content_types'
         ]
-        
+
         for app_name in new_apps:
             try:
                 apps.get_app_config(app_name)
@@ -54,101 +48,61 @@ class Command(BaseCommand):
             except LookupError:
                 self.stdout.write(self.style.ERROR(f'❌ App {app_name} introuvable'))
                 return
-        
-        if not self.dry_run:
-            with transaction.atomic():
-                self._migrate_all_data()
-        else:
-            self._analyze_migration()
-    
-    def _analyze_migration(self):
-        """Analyse ce qui serait migré en mode dry-run"""
-        from keyword_research.models import (
-            Keyword, ContentType, KeywordContentType,
-            SemanticCocoon, CocoonCategory, CocoonKeyword,
-            PPA, KeywordPPA
-        )
-        
-        # Compter les données source
-        keywords_count = Keyword.objects.count()
-        content_types_count = ContentType.objects.count()
-        cocoons_count = SemanticCocoon.objects.count()
-        categories_count = CocoonCategory.objects.count()
-        ppas_count = PPA.objects.count()
-        
-        self.stdout.write(f"📊 ANALYSE DES DONNÉES À MIGRER:")
-        self.stdout.write(f"   • Keywords: {keywords_count}")
-        self.stdout.write(f"   • ContentTypes: {content_types_count}")
-        self.stdout.write(f"   • SemanticCocoons: {cocoons_count}")
-        self.stdout.write(f"   • CocoonCategories: {categories_count}")
-        self.stdout.write(f"   • PPAs: {ppas_count}")
-        
-        # Analyser les métriques
-        keywords_with_metrics = Keyword.objects.exclude(
-            da_min__isnull=True, da_max__isnull=True, 
-            bl_min__isnull=True, bl_max__isnull=True,
-            kdifficulty__isnull=True
-        ).count()
-        
-        self.stdout.write(f"   • Keywords avec métriques: {keywords_with_metrics}")
-        
-        # Analyser les associations
-        keyword_content_associations = KeywordContentType.objects.count()
-        cocoon_keyword_associations = CocoonKeyword.objects.count()
-        keyword_ppa_associations = KeywordPPA.objects.count()
-        
-        self.stdout.write(f"   • Associations Keyword-ContentType: {keyword_content_associations}")
-        self.stdout.write(f"   • Associations Cocoon-Keyword: {cocoon_keyword_associations}")
-        self.stdout.write(f"   • Associations Keyword-PPA: {keyword_ppa_associations}")
-    
-    def _migrate_all_data(self):
-        """Migration complète des données"""
-        
-        self.stdout.write(self.style.SUCCESS('🚀 DÉBUT DE LA MIGRATION'))
-        
-        # Ordre de migration (pour respecter les FK)
-        migration_steps = [
-            ('Keywords Base', self._migrate_keywords_base),
-            ('Content Types', self._migrate_content_types),
-            ('Keywords Metrics', self._migrate_keywords_metrics),
-            ('Cocoon Categories', self._migrate_cocoon_categories),
-            ('Semantic Cocoons', self._migrate_semantic_cocoons),
-            ('PPAs', self._migrate_ppas),
-            ('Keyword-ContentType Associations', self._migrate_keyword_content_type_associations),
-            ('Cocoon-Keyword Associations', self._migrate_cocoon_keyword_associations),
-            ('Keyword-PPA Associations', self._migrate_keyword_ppa_associations),
+
+        if not options['dry_run']:
+            self.stdout.write(self.style.SUCCESS('🚀 DÉBUT DE LA MIGRATION'))
+        self.run_migration(options)
+
+    def get_job_name(self, options):
+        return JOB_NAME
+
+    def get_steps(self, options):
+        """Ordre de migration (pour respecter les FK)"""
+        from keyword_research import models as old
+
+        return [
+            MigrationStep('Keywords Base', old.Keyword.objects.all, self._migrate_keywords_base,
+                          after=self._after_keywords_base),
+            MigrationStep('Content Types', old.ContentType.objects.all, self._migrate_content_types,
+                          after=lambda: self._reset_sequences('seo_keywords_content_types.ContentType')),
+            MigrationStep('Keywords Metrics', self._old_keywords_with_metrics, self._migrate_keywords_metrics),
+            MigrationStep('Cocoon Categories', old.CocoonCategory.objects.all, self._migrate_cocoon_categories,
+                          after=lambda: self._reset_sequences('seo_keywords_cocoons.CocoonCategory')),
+            MigrationStep('Semantic Cocoons', old.SemanticCocoon.objects.all, self._migrate_semantic_cocoons,
+                          after=lambda: self._reset_sequences('seo_keywords_cocoons.SemanticCocoon')),
+            MigrationStep('PPAs', old.PPA.objects.all, self._migrate_ppas,
+                          after=lambda: self._reset_sequences('seo_keywords_ppa.PPA')),
+            MigrationStep('Keyword-ContentType Associations', old.KeywordContentType.objects.all,
+                          self._migrate_keyword_content_type_associations),
+            MigrationStep('Cocoon-Keyword Associations', old.CocoonKeyword.objects.all,
+                          self._migrate_cocoon_keyword_associations, after=self._after_cocoon_keywords),
+            MigrationStep('Keyword-PPA Associations', old.KeywordPPA.objects.all,
+                          self._migrate_keyword_ppa_associations),
         ]
-        
-        for step_name, migration_func in migration_steps:
-            self.stdout.write(f'\n📋 {step_name}...')
-            try:
-                count = migration_func()
-                self.stdout.write(
-                    self.style.SUCCESS(f'   ✅ {count} enregistrements migrés')
-                )
-            except Exception as e:
-                self.stdout.write(
-                    self.style.ERROR(f'   ❌ Erreur: {str(e)}')
-                )
-                raise
-        
-        self.stdout.write(self.style.SUCCESS('\n🎉 MIGRATION TERMINÉE AVEC SUCCÈS'))
-    
-    def _migrate_keywords_base(self):
+
+    def _reset_sequences(self, *labels):
+        """Ids conservés : séquences recalées pour les créations suivantes"""
+        reset_sequences(*(apps.get_model(label) for label in labels))
+
+    @staticmethod
+    def _existing_ids(model, ids):
+        """Ids présents dans la table cible : une requête par plage (plus de get() par ligne)"""
+        return set(model.objects.filter(id__in=set(ids)).values_list('id', flat=True))
+
+    # ===== ÉTAPES (une plage d'ids source par appel) =====
+
+    def _migrate_keywords_base(self, old_keywords):
         """Migre les keywords (données de base uniquement)"""
-        from keyword_research.models import Keyword as OldKeyword
         from seo_keywords_base.models import Keyword as NewKeyword
-        
-        old_keywords = OldKeyword.objects.all()
-        new_keywords = []
-        
-        for old_kw in old_keywords.iterator(chunk_size=self.batch_size):
-            new_kw = NewKeyword(
+
+        new_keywords = [
+            NewKeyword(
                 id=old_kw.id,  # Préserver les IDs pour les FK
                 keyword=old_kw.keyword,
                 volume=old_kw.volume,
                 search_intent=old_kw.search_intent,
                 cpc=old_kw.cpc,
+                cpc_value=parse_cpc(old_kw.cpc),  # bulk_create n'appelle pas save()
                 youtube_videos=old_kw.youtube_videos,
                 local_pack=old_kw.local_pack,
                 search_results=old_kw.search_results,
@@ -156,98 +110,85 @@ class Command(BaseCommand):
                 created_at=old_kw.created_at,
                 updated_at=old_kw.updated_at,
             )
-            new_keywords.append(new_kw)
-            
-            if len(new_keywords) >= self.batch_size:
-                NewKeyword.objects.bulk_create(new_keywords, ignore_conflicts=True)
-                new_keywords = []
-        
-        if new_keywords:
-            NewKeyword.objects.bulk_create(new_keywords, ignore_conflicts=True)
-        
-        return old_keywords.count()
-    
-    def _migrate_keywords_metrics(self):
-        """Migre les métriques SEO des keywords"""
-        from keyword_research.models import Keyword as OldKeyword
-        from seo_keywords_metrics.models import KeywordMetrics
+            for old_kw in old_keywords
+        ]
+        NewKeyword.objects.bulk_create(new_keywords, ignore_conflicts=True)
+        return len(new_keywords)
+
+    def _after_keywords_base(self):
         from seo_keywords_base.models import Keyword as NewKeyword
-        
-        # Seulement les keywords qui ont des métriques
-        old_keywords_with_metrics = OldKeyword.objects.exclude(
-            da_min__isnull=True, da_max__isnull=True, 
+
+        # bulk_create n'appelle pas save() : vecteurs de recherche calculés en lot
+        KeywordSearchService.refresh_search_vectors(NewKeyword.objects.filter(search_vector__isnull=True))
+        self._reset_sequences('seo_keywords_base.Keyword')
+
+    def _old_keywords_with_metrics(self):
+        """Seulement les keywords qui ont des métriques"""
+        from keyword_research.models import Keyword as OldKeyword
+
+        return OldKeyword.objects.exclude(
+            da_min__isnull=True, da_max__isnull=True,
             bl_min__isnull=True, bl_max__isnull=True,
             kdifficulty__isnull=True
         )
-        
+
+    def _migrate_keywords_metrics(self, old_keywords):
+        """Migre les métriques SEO des keywords"""
+        from seo_keywords_metrics.models import KeywordMetrics
+        from seo_keywords_base.models import Keyword as NewKeyword
+
+        old_keywords = list(old_keywords)
+        existing = self._existing_ids(NewKeyword, [old_kw.id for old_kw in old_keywords])
+
         metrics_to_create = []
-        
-        for old_kw in old_keywords_with_metrics.iterator(chunk_size=self.batch_size):
-            try:
-                new_keyword = NewKeyword.objects.get(id=old_kw.id)
-                
-                metrics = KeywordMetrics(
-                    keyword=new_keyword,
-                    da_min=old_kw.da_min,
-                    da_max=old_kw.da_max,
-                    da_median=old_kw.da_median,
-                    da_q1=old_kw.da_q1,
-                    da_q3=old_kw.da_q3,
-                    bl_min=old_kw.bl_min,
-                    bl_max=old_kw.bl_max,
-                    bl_median=old_kw.bl_median,
-                    bl_q1=old_kw.bl_q1,
-                    bl_q3=old_kw.bl_q3,
-                    kdifficulty=old_kw.kdifficulty,
-                    created_at=old_kw.created_at,
-                    updated_at=old_kw.updated_at,
-                )
-                metrics_to_create.append(metrics)
-                
-                if len(metrics_to_create) >= self.batch_size:
-                    KeywordMetrics.objects.bulk_create(metrics_to_create, ignore_conflicts=True)
-                    metrics_to_create = []
-                    
-            except NewKeyword.DoesNotExist:
+        for old_kw in old_keywords:
+            if old_kw.id not in existing:
                 logger.warning(f"Keyword {old_kw.id} non trouvé dans nouvelle app")
                 continue
-        
-        if metrics_to_create:
-            KeywordMetrics.objects.bulk_create(metrics_to_create, ignore_conflicts=True)
-        
-        return old_keywords_with_metrics.count()
-    
-    def _migrate_content_types(self):
+            metrics_to_create.append(KeywordMetrics(
+                keyword_id=old_kw.id,
+                da_min=old_kw.da_min,
+                da_max=old_kw.da_max,
+                da_median=old_kw.da_median,
+                da_q1=old_kw.da_q1,
+                da_q3=old_kw.da_q3,
+                bl_min=old_kw.bl_min,
+                bl_max=old_kw.bl_max,
+                bl_median=old_kw.bl_median,
+                bl_q1=old_kw.bl_q1,
+                bl_q3=old_kw.bl_q3,
+                kdifficulty=old_kw.kdifficulty,
+                kdifficulty_value=parse_kdifficulty(old_kw.kdifficulty),
+                created_at=old_kw.created_at,
+                updated_at=old_kw.updated_at,
+            ))
+
+        KeywordMetrics.objects.bulk_create(metrics_to_create, ignore_conflicts=True)
+        return len(metrics_to_create)
+
+    def _migrate_content_types(self, old_content_types):
         """Migre les types de contenu"""
-        from keyword_research.models import ContentType as OldContentType
         from seo_keywords_content_types.models import ContentType as NewContentType
-        
-        old_content_types = OldContentType.objects.all()
-        new_content_types = []
-        
-        for old_ct in old_content_types:
-            new_ct = NewContentType(
+
+        new_content_types = [
+            NewContentType(
                 id=old_ct.id,
                 name=old_ct.name,
                 description=old_ct.description,
                 created_at=old_ct.created_at,
                 updated_at=old_ct.updated_at,
             )
-            new_content_types.append(new_ct)
-        
+            for old_ct in old_content_types
+        ]
         NewContentType.objects.bulk_create(new_content_types, ignore_conflicts=True)
         return len(new_content_types)
-    
-    def _migrate_cocoon_categories(self):
+
+    def _migrate_cocoon_categories(self, old_categories):
         """Migre les catégories de cocons"""
-        from keyword_research.models import CocoonCategory as OldCategory
         from seo_keywords_cocoons.models import CocoonCategory as NewCategory
-        
-        old_categories = OldCategory.objects.all()
-        new_categories = []
-        
-        for old_cat in old_categories:
-            new_cat = NewCategory(
+
+        new_categories = [
+            NewCategory(
                 id=old_cat.id,
                 name=old_cat.name,
                 description=old_cat.description,
@@ -255,20 +196,18 @@ class Command(BaseCommand):
                 created_at=old_cat.created_at,
                 updated_at=old_cat.updated_at,
             )
-            new_categories.append(new_cat)
-        
+            for old_cat in old_categories
+        ]
         NewCategory.objects.bulk_create(new_categories, ignore_conflicts=True)
         return len(new_categories)
-    
-    def _migrate_semantic_cocoons(self):
-        """Migre les cocons sémantiques"""
+
+    def _migrate_semantic_cocoons(self, old_cocoons):
+        """Migre les cocons sémantiques et leurs catégories (ManyToMany)"""
         from keyword_research.models import SemanticCocoon as OldCocoon
         from seo_keywords_cocoons.models import SemanticCocoon as NewCocoon
-        
-        old_cocoons = OldCocoon.objects.all()
-        
-        for old_cocoon in old_cocoons:
-            new_cocoon = NewCocoon.objects.create(
+
+        new_cocoons = [
+            NewCocoon(
                 id=old_cocoon.id,
                 name=old_cocoon.name,
                 description=old_cocoon.description,
@@ -281,139 +220,122 @@ class Command(BaseCommand):
                 created_at=old_cocoon.created_at,
                 updated_at=old_cocoon.updated_at,
             )
-            
-            # Migrer les relations ManyToMany avec les catégories
-            category_ids = list(old_cocoon.categories.values_list('id', flat=True))
-            new_cocoon.categories.set(category_ids)
-        
-        return old_cocoons.count()
-    
-    def _migrate_ppas(self):
+            for old_cocoon in old_cocoons
+        ]
+        NewCocoon.objects.bulk_create(new_cocoons, ignore_conflicts=True)
+
+        # Relations ManyToMany avec les catégories (ids conservés)
+        OldThrough = OldCocoon.categories.through
+        NewThrough = NewCocoon.categories.through
+        NewThrough.objects.bulk_create(
+            [
+                NewThrough(semanticcocoon_id=cocoon_id, cocooncategory_id=category_id)
+                for cocoon_id, category_id in OldThrough.objects.filter(
+                    semanticcocoon_id__in=[cocoon.id for cocoon in new_cocoons]
+                ).values_list('semanticcocoon_id', 'cocooncategory_id')
+            ],
+            ignore_conflicts=True
+        )
+        return len(new_cocoons)
+
+    def _migrate_ppas(self, old_ppas):
         """Migre les questions PPA"""
-        from keyword_research.models import PPA as OldPPA
         from seo_keywords_ppa.models import PPA as NewPPA
-        
-        old_ppas = OldPPA.objects.all()
-        new_ppas = []
-        
-        for old_ppa in old_ppas:
-            new_ppa = NewPPA(
+
+        new_ppas = [
+            NewPPA(
                 id=old_ppa.id,
                 question=old_ppa.question,
                 created_at=old_ppa.created_at,
                 updated_at=old_ppa.updated_at,
             )
-            new_ppas.append(new_ppa)
-        
+            for old_ppa in old_ppas
+        ]
         NewPPA.objects.bulk_create(new_ppas, ignore_conflicts=True)
         return len(new_ppas)
-    
-    def _migrate_keyword_content_type_associations(self):
+
+    def _migrate_keyword_content_type_associations(self, old_associations):
         """Migre les associations Keyword-ContentType"""
-        from keyword_research.models import KeywordContentType as OldAssoc
         from seo_keywords_content_types.models import KeywordContentType as NewAssoc
         from seo_keywords_base.models import Keyword as NewKeyword
         from seo_keywords_content_types.models import ContentType as NewContentType
-        
-        old_associations = OldAssoc.objects.all()
-        new_associations = []
-        
-        for old_assoc in old_associations.iterator(chunk_size=self.batch_size):
-            try:
-                new_keyword = NewKeyword.objects.get(id=old_assoc.keyword_id)
-                new_content_type = NewContentType.objects.get(id=old_assoc.content_type_id)
-                
-                new_assoc = NewAssoc(
-                    keyword=new_keyword,
-                    content_type=new_content_type,
-                    priority=old_assoc.priority,
-                    created_at=old_assoc.created_at,
-                    updated_at=old_assoc.updated_at,
-                )
-                new_associations.append(new_assoc)
-                
-                if len(new_associations) >= self.batch_size:
-                    NewAssoc.objects.bulk_create(new_associations, ignore_conflicts=True)
-                    new_associations = []
-                    
-            except (NewKeyword.DoesNotExist, NewContentType.DoesNotExist) as e:
-                logger.warning(f"Association ignorée: {str(e)}")
-                continue
-        
-        if new_associations:
-            NewAssoc.objects.bulk_create(new_associations, ignore_conflicts=True)
-        
-        return old_associations.count()
-    
-    def _migrate_cocoon_keyword_associations(self):
+
+        old_associations = list(old_associations)
+        keyword_ids = self._existing_ids(NewKeyword, [assoc.keyword_id for assoc in old_associations])
+        content_type_ids = self._existing_ids(NewContentType, [assoc.content_type_id for assoc in old_associations])
+
+        new_associations = [
+            NewAssoc(
+                keyword_id=old_assoc.keyword_id,
+                content_type_id=old_assoc.content_type_id,
+                priority=old_assoc.priority,
+                created_at=old_assoc.created_at,
+                updated_at=old_assoc.updated_at,
+            )
+            for old_assoc in old_associations
+            if old_assoc.keyword_id in keyword_ids and old_assoc.content_type_id in content_type_ids
+        ]
+        self._log_skipped('Keyword-ContentType', old_associations, new_associations)
+        NewAssoc.objects.bulk_create(new_associations, ignore_conflicts=True)
+        return len(new_associations)
+
+    def _migrate_cocoon_keyword_associations(self, old_associations):
         """Migre les associations Cocoon-Keyword"""
-        from keyword_research.models import CocoonKeyword as OldAssoc
         from seo_keywords_cocoons.models import CocoonKeyword as NewAssoc
         from seo_keywords_base.models import Keyword as NewKeyword
         from seo_keywords_cocoons.models import SemanticCocoon as NewCocoon
-        
-        old_associations = OldAssoc.objects.all()
-        new_associations = []
-        
-        for old_assoc in old_associations.iterator(chunk_size=self.batch_size):
-            try:
-                new_keyword = NewKeyword.objects.get(id=old_assoc.keyword_id)
-                new_cocoon = NewCocoon.objects.get(id=old_assoc.cocoon_id)
-                
-                new_assoc = NewAssoc(
-                    keyword=new_keyword,
-                    cocoon=new_cocoon,
-                    created_at=old_assoc.created_at,
-                    updated_at=old_assoc.updated_at,
-                )
-                new_associations.append(new_assoc)
-                
-                if len(new_associations) >= self.batch_size:
-                    NewAssoc.objects.bulk_create(new_associations, ignore_conflicts=True)
-                    new_associations = []
-                    
-            except (NewKeyword.DoesNotExist, NewCocoon.DoesNotExist) as e:
-                logger.warning(f"Association ignorée: {str(e)}")
-                continue
-        
-        if new_associations:
-            NewAssoc.objects.bulk_create(new_associations, ignore_conflicts=True)
-        
-        return old_associations.count()
-    
-    def _migrate_keyword_ppa_associations(self):
+
+        old_associations = list(old_associations)
+        keyword_ids = self._existing_ids(NewKeyword, [assoc.keyword_id for assoc in old_associations])
+        cocoon_ids = self._existing_ids(NewCocoon, [assoc.cocoon_id for assoc in old_associations])
+
+        new_associations = [
+            NewAssoc(
+                keyword_id=old_assoc.keyword_id,
+                cocoon_id=old_assoc.cocoon_id,
+                created_at=old_assoc.created_at,
+                updated_at=old_assoc.updated_at,
+            )
+            for old_assoc in old_associations
+            if old_assoc.keyword_id in keyword_ids and old_assoc.cocoon_id in cocoon_ids
+        ]
+        self._log_skipped('Cocoon-Keyword', old_associations, new_associations)
+        NewAssoc.objects.bulk_create(new_associations, ignore_conflicts=True)
+        return len(new_associations)
+
+    def _after_cocoon_keywords(self):
+        from seo_keywords_cocoons.services import CocoonStatsService
+
+        # bulk_create ne déclenche pas les signaux : stats des cocons en une passe
+        CocoonStatsService.recompute_all()
+
+    def _migrate_keyword_ppa_associations(self, old_associations):
         """Migre les associations Keyword-PPA"""
-        from keyword_research.models import KeywordPPA as OldAssoc
         from seo_keywords_ppa.models import KeywordPPA as NewAssoc
         from seo_keywords_base.models import Keyword as NewKeyword
         from seo_keywords_ppa.models import PPA as NewPPA
-        
-        old_associations = OldAssoc.objects.all()
-        new_associations = []
-        
-        for old_assoc in old_associations.iterator(chunk_size=self.batch_size):
-            try:
-                new_keyword = NewKeyword.objects.get(id=old_assoc.keyword_id)
-                new_ppa = NewPPA.objects.get(id=old_assoc.ppa_id)
-                
-                new_assoc = NewAssoc(
-                    keyword=new_keyword,
-                    ppa=new_ppa,
-                    position=old_assoc.position,
-                    created_at=old_assoc.created_at,
-                    updated_at=old_assoc.updated_at,
-                )
-                new_associations.append(new_assoc)
-                
-                if len(new_associations) >= self.batch_size:
-                    NewAssoc.objects.bulk_create(new_associations, ignore_conflicts=True)
-                    new_associations = []
-                    
-            except (NewKeyword.DoesNotExist, NewPPA.DoesNotExist) as e:
-                logger.warning(f"Association ignorée: {str(e)}")
-                continue
-        
-        if new_associations:
-            NewAssoc.objects.bulk_create(new_associations, ignore_conflicts=True)
-        
-        return old_associations.count()
\ No newline at end of file
+
+        old_associations = list(old_associations)
+        keyword_ids = self._existing_ids(NewKeyword, [assoc.keyword_id for assoc in old_associations])
+        ppa_ids = self._existing_ids(NewPPA, [assoc.ppa_id for assoc in old_associations])
+
+        new_associations = [
+            NewAssoc(
+                keyword_id=old_assoc.keyword_id,
+                ppa_id=old_assoc.ppa_id,
+                position=old_assoc.position,
+                created_at=old_assoc.created_at,
+                updated_at=old_assoc.updated_at,
+            )
+            for old_assoc in old_associations
+            if old_assoc.keyword_id in keyword_ids and old_assoc.ppa_id in ppa_ids
+        ]
+        self._log_skipped('Keyword-PPA', old_associations, new_associations)
+        NewAssoc.objects.bulk_create(new_associations, ignore_conflicts=True)
+        return len(new_associations)
+
+    @staticmethod
+    def _log_skipped(label, old_associations, new_associations):
+        skipped = len(old_associations) - len(new_associations)
+        if skipped:
+            logger.warning(f"{skipped} associations {label} ignorées (cible introuvable)")
@@ -0,0 +1,22 @@
+# backend/seo_keywords_base/migrations/0002_keyword_cpc_value.py
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('seo_keywords_base', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='keyword',
+            name='cpc_value',
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='keyword',
+            index=models.Index(fields=['cpc_value'], name='seo_keyword_cpc_val_691e6a_idx'),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# backend/seo_keywords_base/migrations/0003_backfill_keyword_cpc_value.py
+
+from django.db import migrations
+
+
+def backfill_cpc_value(apps, schema_editor):
+    from seo_keywords_base.services.numeric_backfill import backfill_numeric_column
+    from seo_keywords_base.utils.normalization import parse_cpc
+
+    Keyword = apps.get_model('seo_keywords_base', 'Keyword')
+    backfill_numeric_column(Keyword, 'cpc', 'cpc_value', parse_cpc)
+
+
+class Migration(migrations.Migration):
+
+    # Un commit par lot : pas de transaction géante sur la table des mots-clés
+    atomic = False
+
+    dependencies = [
+        ('seo_keywords_base', '0002_keyword_cpc_value'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_cpc_value, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,60 @@
+# backend/seo_keywords_base/migrations/0004_keyword_search_vector.py
+
+import django.contrib.postgres.search
+from django.db import migrations
+
+TRGM_INDEX = 'seo_kw_keyword_trgm_idx'
+SEARCH_VECTOR_INDEX = 'seo_kw_search_vector_idx'
+TABLE = 'seo_keywords_base_keyword'
+
+
+def create_search_indexes(apps, schema_editor):
+    """pg_trgm + backfill des vecteurs + index GIN (PostgreSQL seulement)"""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    from seo_keywords_base.services.keyword_search_service import KeywordSearchService
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        cursor.execute(
+            f'CREATE INDEX CONCURRENTLY IF NOT EXISTS {TRGM_INDEX} '
+            f'ON {TABLE} USING gin (keyword gin_trgm_ops)'
+        )
+
+    # Vecteurs calculés avant l'index GIN : pas de maintenance d'index ligne à ligne
+    Keyword = apps.get_model('seo_keywords_base', 'Keyword')
+    KeywordSearchService.refresh_search_vectors(Keyword.objects.filter(search_vector__isnull=True))
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            f'CREATE INDEX CONCURRENTLY IF NOT EXISTS {SEARCH_VECTOR_INDEX} '
+            f'ON {TABLE} USING gin (search_vector)'
+        )
+
+
+def drop_search_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {SEARCH_VECTOR_INDEX}')
+        cursor.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {TRGM_INDEX}')
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY interdit dans une transaction
+    atomic = False
+
+    dependencies = [
+        ('seo_keywords_base', '0003_backfill_keyword_cpc_value'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='keyword',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(blank=True, editable=False, null=True),
+        ),
+        migrations.RunPython(create_search_indexes, drop_search_indexes),
+    ]
@@ -0,0 +1,46 @@
+# backend/seo_keywords_base/migrations/0005_keywordimport.py
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('seo_keywords_base', '0004_keyword_search_vector'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='KeywordImport',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('name', models.CharField(max_length=255)),
+                ('import_file', models.FileField(upload_to='keyword_imports/')),
+                ('file_format', models.CharField(choices=[('csv', 'CSV'), ('xlsx', 'Excel')], default='csv', max_length=10)),
+                ('import_status', models.CharField(choices=[('pending', 'Pending'), ('processing', 'Processing'), ('completed', 'Completed'), ('failed', 'Failed')], default='pending', max_length=20)),
+                ('column_mapping', models.JSONField(blank=True, default=dict)),
+                ('total_rows', models.IntegerField(default=0)),
+                ('processed_rows', models.IntegerField(default=0)),
+                ('created_keywords', models.IntegerField(default=0)),
+                ('updated_keywords', models.IntegerField(default=0)),
+                ('duplicate_rows', models.IntegerField(default=0)),
+                ('failed_rows', models.IntegerField(default=0)),
+                ('error_file', models.FileField(blank=True, null=True, upload_to='keyword_imports/errors/')),
+                ('error_message', models.TextField(blank=True)),
+                ('task_id', models.CharField(blank=True, max_length=255)),
+                ('started_at', models.DateTimeField(blank=True, null=True)),
+                ('completed_at', models.DateTimeField(blank=True, null=True)),
+                ('imported_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='keyword_imports', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'db_table': 'seo_keywords_base_keywordimport',
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
@@ -0,0 +1,54 @@
+# backend/seo_keywords_base/migrations/0006_keyword_lower_index.py
+
+from django.db import migrations, models
+import django.db.models.functions.text
+
+LOWER_INDEX = 'seo_kw_keyword_lower_idx'
+TABLE = 'seo_keywords_base_keyword'
+
+
+def lower_index():
+    return models.Index(django.db.models.functions.text.Lower('keyword'), name=LOWER_INDEX)
+
+
+def create_lower_index(apps, schema_editor):
+    """
+    PostgreSQL : CREATE INDEX CONCURRENTLY, sans bloquer les écritures.
+    Ailleurs (SQLite des tests) : index classique, schema_editor.add_index
+    n'acceptant pas `concurrently`.
+    """
+    if schema_editor.connection.vendor != 'postgresql':
+        schema_editor.add_index(apps.get_model('seo_keywords_base', 'Keyword'), lower_index())
+        return
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(f'CREATE INDEX CONCURRENTLY IF NOT EXISTS {LOWER_INDEX} ON {TABLE} (LOWER(keyword))')
+
+
+def drop_lower_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        schema_editor.remove_index(apps.get_model('seo_keywords_base', 'Keyword'), lower_index())
+        return
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {LOWER_INDEX}')
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY interdit dans une transaction
+    atomic = False
+
+    dependencies = [
+        ('seo_keywords_base', '0005_keywordimport'),
+    ]
+
+    operations = [
+        # État : index déclaré dans Keyword.Meta ; base : construction selon le moteur
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddIndex(model_name='keyword', index=lower_index()),
+            ],
+            database_operations=[
+                migrations.RunPython(create_lower_index, drop_lower_index),
+            ],
+        ),
+    ]
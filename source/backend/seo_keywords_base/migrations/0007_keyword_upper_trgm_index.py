@@ -0,0 +1,42 @@
+# backend/seo_keywords_base/migrations/0007_keyword_upper_trgm_index.py
+
+from django.db import migrations
+
+UPPER_TRGM_INDEX = 'seo_kw_keyword_upper_trgm_idx'
+TABLE = 'seo_keywords_base_keyword'
+
+
+def create_upper_trgm_index(apps, schema_editor):
+    """
+    Index trigramme sur l'expression générée par icontains :
+    UPPER("keyword"::text) LIKE UPPER('%...%') (PostgreSQL seulement)
+    """
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        cursor.execute(
+            f'CREATE INDEX CONCURRENTLY IF NOT EXISTS {UPPER_TRGM_INDEX} '
+            f'ON {TABLE} USING gin ((UPPER(keyword::text)) gin_trgm_ops)'
+        )
+
+
+def drop_upper_trgm_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {UPPER_TRGM_INDEX}')
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY interdit dans une transaction
+    atomic = False
+
+    dependencies = [
+        ('seo_keywords_base', '0006_keyword_lower_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_upper_trgm_index, drop_upper_trgm_index),
+    ]
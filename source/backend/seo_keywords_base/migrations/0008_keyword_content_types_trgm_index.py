@@ -0,0 +1,42 @@
+# backend/seo_keywords_base/migrations/0008_keyword_content_types_trgm_index.py
+
+from django.db import migrations
+
+CONTENT_TYPES_TRGM_INDEX = 'seo_kw_content_types_upper_trgm_idx'
+TABLE = 'seo_keywords_base_keyword'
+
+
+def create_content_types_trgm_index(apps, schema_editor):
+    """
+    Index trigramme pour content_types__icontains :
+    UPPER("content_types"::text) LIKE UPPER('%...%') (PostgreSQL seulement)
+    """
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        cursor.execute(
+            f'CREATE INDEX CONCURRENTLY IF NOT EXISTS {CONTENT_TYPES_TRGM_INDEX} '
+            f'ON {TABLE} USING gin ((UPPER(content_types::text)) gin_trgm_ops)'
+        )
+
+
+def drop_content_types_trgm_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {CONTENT_TYPES_TRGM_INDEX}')
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY interdit dans une transaction
+    atomic = False
+
+    dependencies = [
+        ('seo_keywords_base', '0007_keyword_upper_trgm_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_content_types_trgm_index, drop_content_types_trgm_index),
+    ]
@@ -1,5 +1,6 @@
 # backend/seo_keywords_base/models/__init__.py
 
 from .keyword_models import Keyword
+from .import_models import KeywordImport
 
-__all__ = ['Keyword']
\ No newline at end of file
+__all__ = ['Keyword', 'KeywordImport']
\ No newline at end of file
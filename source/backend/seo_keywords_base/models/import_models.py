@@ -0,0 +1,66 @@
+# backend/seo_keywords_base/models/import_models.py
+
+import uuid
+from django.db import models
+from common.models.mixins import TimestampedMixin
+
+class KeywordImport(TimestampedMixin):
+    """Import d'un export de recherche de mots-clés (CSV/XLSX) - suivi de progression"""
+
+    FILE_FORMATS = [
+        ('csv', 'CSV'),
+        ('xlsx', 'Excel'),
+    ]
+
+    STATUS_CHOICES = [
+        ('pending', 'Pending'),
+        ('processing', 'Processing'),
+        ('completed', 'Completed'),
+        ('failed', 'Failed'),
+    ]
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    name = models.CharField(max_length=255)
+    import_file = models.FileField(upload_to='keyword_imports/')
+    file_format = models.CharField(max_length=10, choices=FILE_FORMATS, default='csv')
+    import_status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
+
+    # En-tête du fichier -> champ (keyword, volume, cpc, kdifficulty, da_q1, ppa_1...)
+    column_mapping = models.JSONField(default=dict, blank=True)
+
+    # Progression (total_rows estimé avant lecture, exact en fin d'import)
+    total_rows = models.IntegerField(default=0)
+    processed_rows = models.IntegerField(default=0)
+    created_keywords = models.IntegerField(default=0)
+    updated_keywords = models.IntegerField(default=0)
+    duplicate_rows = models.IntegerField(default=0)
+    failed_rows = models.IntegerField(default=0)
+
+    # Une ligne par ligne rejetée (numéro, mot-clé, erreur, valeurs d'origine)
+    error_file = models.FileField(upload_to='keyword_imports/errors/', null=True, blank=True)
+    error_message = models.TextField(blank=True)
+
+    task_id = models.CharField(max_length=255, blank=True)
+    imported_by = models.ForeignKey(
+        'users_core.CustomUser',
+        on_delete=models.SET_NULL,
+        null=True, blank=True,
+        related_name='keyword_imports'
+    )
+    started_at = models.DateTimeField(null=True, blank=True)
+    completed_at = models.DateTimeField(null=True, blank=True)
+
+    @property
+    def progress_percentage(self):
+        if self.import_status == 'completed':
+            return 100
+        if not self.total_rows:
+            return 0
+        return min(99, int(self.processed_rows * 100 / self.total_rows))
+
+    def __str__(self):
+        return f"Import: {self.name}"
+
+    class Meta:
+        db_table = 'seo_keywords_base_keywordimport'
+        ordering = ['-created_at']
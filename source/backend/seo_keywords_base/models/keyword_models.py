@@ -1,7 +1,10 @@
 # backend/seo_keywords_base/models/keyword_models.py
 
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
+from django.db.models.functions import Lower
 from common.models.mixins import TimestampedMixin
+from ..utils.normalization import parse_cpc
 
 class Keyword(TimestampedMixin):
     """Modèle central des mots-clés - données de base uniquement"""
@@ -18,6 +21,8 @@ class Keyword(TimestampedMixin):
         null=True, blank=True
     )
     cpc = models.CharField(max_length=50, null=True, blank=True)
+    # Valeur numérique de cpc (filtres/tris), calculée à l'écriture
+    cpc_value = models.FloatField(null=True, blank=True, editable=False)
     youtube_videos = models.CharField(max_length=500, null=True, blank=True)
     local_pack = models.BooleanField(default=False)
     search_results = models.JSONField(default=dict, blank=True)
@@ -25,6 +30,22 @@ class Keyword(TimestampedMixin):
     # Legacy field (sera progressivement remplacé par ContentType)
     content_types = models.TextField(null=True, blank=True)
     
+    # Recherche plein texte (PostgreSQL) : voir KeywordSearchService.
+    # Index GIN (tsvector + pg_trgm sur keyword) créés par la migration 0004,
+    # hors Meta.indexes pour que les tests SQLite créent la table.
+    search_vector = SearchVectorField(null=True, blank=True, editable=False)
+    
+    def save(self, *args, **kwargs):
+        self.cpc_value = parse_cpc(self.cpc)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'cpc' in update_fields:
+            kwargs['update_fields'] = set(update_fields) | {'cpc_value'}
+        super().save(*args, **kwargs)
+        
+        if update_fields is None or {'keyword', 'content_types'} & set(update_fields):
+            from ..services.keyword_search_service import KeywordSearchService
+            KeywordSearchService.refresh_search_vectors(type(self).objects.filter(pk=self.pk))
+    
     def __str__(self):
         return self.keyword
     
@@ -35,4 +56,7 @@ class Keyword(TimestampedMixin):
             models.Index(fields=['keyword']),
             models.Index(fields=['volume']),
             models.Index(fields=['search_intent']),
+            models.Index(fields=['cpc_value']),
+            # Résolution de listes insensible à la casse (KeywordResolutionService)
+            models.Index(Lower('keyword'), name='seo_kw_keyword_lower_idx'),
         ]
\ No newline at end of file
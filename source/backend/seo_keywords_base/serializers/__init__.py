@@ -5,9 +5,11 @@ from .keyword_serializers import (
     KeywordListSerializer, 
     KeywordDetailSerializer
 )
+from .import_serializers import KeywordImportSerializer
 
 __all__ = [
     'KeywordSerializer',
     'KeywordListSerializer',
-    'KeywordDetailSerializer'
+    'KeywordDetailSerializer',
+    'KeywordImportSerializer'
 ]
\ No newline at end of file
@@ -0,0 +1,47 @@
+# backend/seo_keywords_base/serializers/import_serializers.py
+
+from rest_framework import serializers
+from common.serializers.mixins import TimestampedSerializer
+from ..models import KeywordImport
+from ..services.keyword_import_service import KeywordImportService
+
+class KeywordImportSerializer(TimestampedSerializer):
+    """Upload d'un export CSV/XLSX + suivi de progression"""
+    
+    progress_percentage = serializers.IntegerField(read_only=True)
+    # binary=True : accepté en JSON comme en multipart (chaîne JSON)
+    column_mapping = serializers.JSONField(binary=True, required=False)
+    imported_by_username = serializers.CharField(source='imported_by.username', read_only=True, default=None)
+    
+    class Meta:
+        model = KeywordImport
+        fields = [
+            'id', 'name', 'import_file', 'file_format', 'import_status', 'column_mapping',
+            'total_rows', 'processed_rows', 'progress_percentage',
+            'created_keywords', 'updated_keywords', 'duplicate_rows', 'failed_rows',
+            'error_file', 'error_message', 'task_id',
+            'imported_by', 'imported_by_username', 'started_at', 'completed_at',
+            'created_at', 'updated_at'
+        ]
+        read_only_fields = [
+            'file_format', 'import_status', 'total_rows', 'processed_rows',
+            'created_keywords', 'updated_keywords', 'duplicate_rows', 'failed_rows',
+            'error_file', 'error_message', 'task_id', 'imported_by',
+            'started_at', 'completed_at', 'created_at', 'updated_at'
+        ]
+        extra_kwargs = {'name': {'required': False}}
+    
+    def validate(self, attrs):
+        import_file = attrs.get('import_file')
+        if import_file is not None:
+            try:
+                attrs['file_format'] = KeywordImportService.detect_format(import_file.name)
+            except ValueError as e:
+                raise serializers.ValidationError({'import_file': str(e)})
+            attrs.setdefault('name', import_file.name)
+        return attrs
+    
+    def validate_column_mapping(self, value):
+        if not isinstance(value, dict) or not all(isinstance(v, str) for v in value.values()):
+            raise serializers.ValidationError("Objet attendu : {\"en-tête\": \"champ\"}")
+        return value
@@ -92,8 +92,9 @@ class KeywordDetailSerializer(TimestampedSerializer):
     
     class Meta:
         model = Keyword
-        fields = '__all__'
-        read_only_fields = ['created_at', 'updated_at']
+        # search_vector : colonne technique de recherche, jamais exposée
+        exclude = ['search_vector']
+        read_only_fields = ['created_at', 'updated_at', 'cpc_value']
     
     def get_cocoons(self, obj):
         """Cocons associés avec détails"""
@@ -196,8 +197,9 @@ class KeywordSerializer(TimestampedSerializer):
     
     class Meta:
         model = Keyword
-        fields = '__all__'
-        read_only_fields = ['created_at', 'updated_at']
+        # search_vector : colonne technique de recherche, jamais exposée
+        exclude = ['search_vector']
+        read_only_fields = ['created_at', 'updated_at', 'cpc_value']
     
     def validate_keyword(self, value):
         if not value or not value.strip():
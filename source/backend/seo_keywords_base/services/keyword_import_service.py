@@ -0,0 +1,692 @@
+# backend/seo_keywords_base/services/keyword_import_service.py
+"""
+Import en flux d'exports de recherche de mots-clés (CSV / XLSX)
+
+- Lecture ligne à ligne (csv / openpyxl en read_only) : le fichier n'est
+  jamais chargé en entier
+- Normalisation des métriques (volume, CPC, KD, quartiles DA/BL, PPA) ;
+  une ligne invalide est écrite dans le fichier d'erreurs, pas importée
+- Écriture par lots : sous PostgreSQL, COPY dans des tables temporaires
+  puis INSERT ... ON CONFLICT vers Keyword, KeywordMetrics, PPA et
+  KeywordPPA ; ailleurs, bulk_create(update_conflicts=True)
+- Seules les colonnes présentes dans le fichier sont mises à jour : un
+  export partiel n'efface pas les autres données
+- Les PPA d'un mot-clé importé (si le fichier a des colonnes PPA)
+  remplacent ses associations existantes
+"""
+
+import csv
+import io
+import logging
+import unicodedata
+
+from django.apps import apps
+from django.db import DatabaseError, connections, router, transaction
+from django.utils import timezone
+
+from ..models import Keyword
+from ..utils.normalization import parse_bool, parse_cpc, parse_int, parse_kdifficulty
+from .keyword_search_service import KeywordSearchService
+
+logger = logging.getLogger(__name__)
+
+IMPORT_BATCH_SIZE = 5000
+MAX_PPA_POSITIONS = 4
+
+KEYWORD_COLUMNS = ['volume', 'search_intent', 'cpc', 'youtube_videos', 'local_pack', 'content_types']
+METRICS_COLUMNS = [
+    'da_min', 'da_q1', 'da_median', 'da_q3', 'da_max',
+    'bl_min', 'bl_q1', 'bl_median', 'bl_q3', 'bl_max',
+    'kdifficulty',
+]
+# Recalculés depuis SerpResult quand le mot-clé a des résultats SERP extraits
+SERP_QUARTILE_COLUMNS = {column for column in METRICS_COLUMNS if column.startswith(('da_', 'bl_'))}
+PPA_COLUMNS = [f'ppa_{position}' for position in range(1, MAX_PPA_POSITIONS + 1)]
+
+# En-tête normalisé (minuscules, sans accents, espaces -> _) -> champ
+COLUMN_ALIASES = {
+    'keyword': 'keyword', 'keywords': 'keyword', 'mot_cle': 'keyword', 'mots_cles': 'keyword',
+    'requete': 'keyword', 'query': 'keyword',
+    'volume': 'volume', 'search_volume': 'volume', 'volume_de_recherche': 'volume',
+    'search_intent': 'search_intent', 'intent': 'search_intent', 'intention': 'search_intent',
+    'cpc': 'cpc', 'cpc_eur': 'cpc', 'cpc_usd': 'cpc',
+    'youtube_videos': 'youtube_videos', 'videos_youtube': 'youtube_videos',
+    'local_pack': 'local_pack', 'pack_local': 'local_pack',
+    'content_types': 'content_types', 'types_de_contenu': 'content_types',
+    'kd': 'kdifficulty', 'kdifficulty': 'kdifficulty', 'keyword_difficulty': 'kdifficulty',
+    'difficulty': 'kdifficulty', 'difficulte': 'kdifficulty',
+    'ppa': 'ppas', 'ppas': 'ppas', 'people_also_ask': 'ppas',
+    **{column: column for column in METRICS_COLUMNS},
+    **{column: column for column in PPA_COLUMNS},
+}
+
+# Séparateurs d'une colonne PPA unique
+PPA_SEPARATORS = ('\n', '|')
+EMPTY_VALUES = {'', '-', 'n/a', 'na', 'null', 'none'}
+SEARCH_INTENTS = {'TOFU', 'MOFU', 'BOFU'}
+
+
+def normalize_header(header):
+    text = unicodedata.normalize('NFKD', str(header or '')).encode('ascii', 'ignore').decode()
+    text = text.strip().lower()
+    for char in (' ', '-', '.', '/', "'"):
+        text = text.replace(char, '_')
+    while '__' in text:
+        text = text.replace('__', '_')
+    return text.strip('_')
+
+
+# ===== LECTURE =====
+
+def _detect_encoding(sample):
+    if sample.startswith(b'\xef\xbb\xbf'):
+        return 'utf-8-sig'
+    try:
+        sample.decode('utf-8')
+        return 'utf-8'
+    except UnicodeDecodeError as e:
+        # Coupure au milieu d'un caractère multi-octets en fin d'échantillon
+        if e.start >= len(sample) - 3:
+            return 'utf-8'
+    import chardet
+    return chardet.detect(sample).get('encoding') or 'latin-1'
+
+
+def iter_csv_rows(fileobj):
+    """(numéro de ligne, en-têtes, valeurs) ; séparateur et encodage détectés"""
+    sample = fileobj.read(64 * 1024)
+    fileobj.seek(0)
+    encoding = _detect_encoding(sample)
+    text_sample = sample.decode(encoding, errors='ignore')
+    try:
+        dialect = csv.Sniffer().sniff(text_sample, delimiters=',;\t')
+    except csv.Error:
+        dialect = csv.excel
+
+    stream = io.TextIOWrapper(fileobj, encoding=encoding, newline='', errors='replace')
+    try:
+        reader = csv.reader(stream, dialect)
+        headers = next(reader, None)
+        if headers is None:
+            return
+        for values in reader:
+            if any(value.strip() for value in values):
+                yield reader.line_num, headers, values
+    finally:
+        stream.detach()
+
+
+def iter_xlsx_rows(fileobj):
+    """Première feuille, lue en read_only (openpyxl)"""
+    try:
+        from openpyxl import load_workbook
+    except ImportError:
+        raise ValueError("Import XLSX indisponible : openpyxl n'est pas installé")
+
+    workbook = load_workbook(fileobj, read_only=True, data_only=True)
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        headers = next(rows, None)
+        if headers is None:
+            return
+        headers = ['' if header is None else str(header) for header in headers]
+        for line_number, values in enumerate(rows, start=2):
+            if any(value not in (None, '') for value in values):
+                yield line_number, headers, list(values)
+    finally:
+        workbook.close()
+
+
+def estimate_rows(fileobj, file_format):
+    """Nombre de lignes de données (approximatif pour un CSV à cellules multi-lignes)"""
+    if file_format == 'xlsx':
+        try:
+            from openpyxl import load_workbook
+        except ImportError:
+            return 0
+        workbook = load_workbook(fileobj, read_only=True)
+        try:
+            total = max((workbook.active.max_row or 1) - 1, 0)
+        finally:
+            workbook.close()
+            fileobj.seek(0)
+        return total
+
+    total = 0
+    for chunk in iter(lambda: fileobj.read(1024 * 1024), b''):
+        total += chunk.count(b'\n')
+    fileobj.seek(0)
+    return max(total - 1, 0)
+
+
+# ===== NORMALISATION =====
+
+class RowError(ValueError):
+    """Ligne rejetée (écrite dans le fichier d'erreurs)"""
+
+
+class KeywordRowNormalizer:
+    """Convertit une ligne brute en valeurs Keyword / KeywordMetrics / PPA"""
+
+    def __init__(self, headers, column_mapping=None):
+        overrides = {normalize_header(header): field for header, field in (column_mapping or {}).items()}
+        self.columns = {}
+        self.ignored_columns = []
+        for index, header in enumerate(headers):
+            key = normalize_header(header)
+            field = overrides.get(key) or COLUMN_ALIASES.get(key)
+            if field and field not in self.columns.values():
+                self.columns[index] = field
+            elif header:
+                self.ignored_columns.append(header)
+
+        fields = set(self.columns.values())
+        if 'keyword' not in fields:
+            raise ValueError("Colonne mot-clé introuvable (keyword, mot-clé, requête...)")
+
+        self.keyword_fields = [field for field in KEYWORD_COLUMNS if field in fields]
+        if 'cpc' in fields:
+            self.keyword_fields.append('cpc_value')
+        self.metrics_fields = [field for field in METRICS_COLUMNS if field in fields]
+        if 'kdifficulty' in fields:
+            self.metrics_fields.append('kdifficulty_value')
+        self.has_ppas = bool(fields & (set(PPA_COLUMNS) | {'ppas'}))
+
+    def normalize(self, values):
+        raw = {}
+        for index, field in self.columns.items():
+            value = values[index] if index < len(values) else None
+            if isinstance(value, str):
+                value = value.strip()
+                if value.lower() in EMPTY_VALUES:
+                    value = None
+            raw[field] = value
+
+        keyword = ' '.join(str(raw.get('keyword') or '').split())
+        if not keyword:
+            raise RowError("Mot-clé vide")
+        if len(keyword) > Keyword._meta.get_field('keyword').max_length:
+            raise RowError("Mot-clé trop long")
+
+        keyword_values = {}
+        for field in self.keyword_fields:
+            if field == 'cpc_value':
+                continue
+            value = raw.get(field)
+            if field == 'volume':
+                value = self._number(parse_int, value, 'volume')
+            elif field == 'local_pack':
+                value = bool(parse_bool(value))
+            elif field == 'search_intent' and value is not None:
+                value = str(value).upper()
+                if value not in SEARCH_INTENTS:
+                    raise RowError(f"Intention inconnue: {value}")
+            elif value is not None:
+                value = self._text(value, Keyword, field)
+            keyword_values[field] = value
+        if 'cpc' in keyword_values:
+            keyword_values['cpc_value'] = self._number(parse_cpc, raw.get('cpc'), 'cpc')
+
+        metrics_values = None
+        if self.metrics_fields:
+            from seo_keywords_metrics.models import KeywordMetrics
+            metrics_values = {}
+            for field in self.metrics_fields:
+                if field == 'kdifficulty_value':
+                    continue
+                value = raw.get(field)
+                if field == 'kdifficulty':
+                    metrics_values['kdifficulty_value'] = self._number(parse_kdifficulty, value, field)
+                    value = self._text(value, KeywordMetrics, field) if value is not None else None
+                else:
+                    value = self._number(parse_int, value, field)
+                metrics_values[field] = value
+            if all(value is None for value in metrics_values.values()):
+                metrics_values = None
+
+        ppas = None
+        if self.has_ppas:
+            questions = [raw.get(column) for column in PPA_COLUMNS]
+            if raw.get('ppas'):
+                combined = str(raw['ppas'])
+                for separator in PPA_SEPARATORS:
+                    combined = combined.replace(separator, '\n')
+                questions = combined.split('\n')
+            ppas = []
+            for question in questions:
+                question = ' '.join(str(question or '').split())
+                if question and question not in ppas:
+                    ppas.append(question)
+            if len(ppas) > MAX_PPA_POSITIONS:
+                raise RowError(f"Plus de {MAX_PPA_POSITIONS} PPA")
+
+        return keyword, keyword_values, metrics_values, ppas
+
+    def raw_keyword(self, values):
+        for index, field in self.columns.items():
+            if field == 'keyword' and index < len(values):
+                return values[index] or ''
+        return ''
+
+    @staticmethod
+    def _number(parser, value, field):
+        if value is None:
+            return None
+        parsed = parser(value)
+        if parsed is None:
+            raise RowError(f"{field}: valeur numérique invalide ({value})")
+        return parsed
+
+    @staticmethod
+    def _text(value, model, field):
+        value = str(value)
+        max_length = model._meta.get_field(field).max_length
+        if max_length and len(value) > max_length:
+            raise RowError(f"{field}: plus de {max_length} caractères")
+        return value
+
+
+# ===== ÉCRITURE =====
+
+class ImportBatch:
+    """Lignes valides d'un lot, dédoublonnées par mot-clé (la dernière l'emporte)"""
+
+    def __init__(self):
+        self.rows = {}
+        self.duplicates = 0
+
+    def add(self, line_number, keyword, keyword_values, metrics_values, ppas, values):
+        if keyword in self.rows:
+            self.duplicates += 1
+        self.rows[keyword] = (line_number, keyword_values, metrics_values, ppas, values)
+
+    def __len__(self):
+        return len(self.rows)
+
+
+class KeywordBulkWriter:
+    """Upsert d'un lot : COPY + ON CONFLICT sous PostgreSQL, bulk_create sinon"""
+
+    def __init__(self, normalizer, using=None):
+        self.normalizer = normalizer
+        self.using = using or router.db_for_write(Keyword)
+        self.connection = connections[self.using]
+
+    def write(self, batch):
+        """Retourne (créés, mis à jour, ids des mots-clés)"""
+        with transaction.atomic(using=self.using):
+            if self.connection.vendor == 'postgresql':
+                result = self._copy_upsert(batch)
+            else:
+                result = self._orm_upsert(batch)
+        self._refresh_derived(result[1], result[2])
+        return result
+
+    def _refresh_derived(self, updated, keyword_ids):
+        """
+        Données dérivées des lignes déjà committées : un échec est journalisé,
+        jamais compté dans les lignes de l'import
+        """
+        refreshes = [
+            ('search_vector', lambda: KeywordSearchService.refresh_search_vectors(
+                Keyword.objects.using(self.using).filter(id__in=keyword_ids)
+            )),
+        ]
+        if updated and apps.is_installed('seo_keywords_cocoons'):
+            # Mots-clés existants mis à jour : stats des cocons qui les contiennent
+            from seo_keywords_cocoons.services import CocoonStatsService
+            refreshes.append(('cocoon_stats', lambda: CocoonStatsService.refresh_for_keywords(keyword_ids)))
+        if set(self.normalizer.metrics_fields) & SERP_QUARTILE_COLUMNS:
+            # Quartiles importés : ceux calculés depuis les SERP extraits l'emportent
+            from seo_keywords_metrics.services import SerpExtractionService
+            refreshes.append(('serp_quartiles', lambda: SerpExtractionService.recompute_quartiles(keyword_ids)))
+
+        for name, refresh in refreshes:
+            try:
+                # Savepoint : une erreur ne casse pas une transaction englobante
+                with transaction.atomic(using=self.using):
+                    refresh()
+            except Exception as e:
+                logger.error(f"Keyword import: {name} refresh failed for {len(keyword_ids)} keywords: {e}", exc_info=True)
+
+    # --- PostgreSQL ---
+
+    def _copy_upsert(self, batch):
+        from seo_keywords_metrics.models import KeywordMetrics
+        from seo_keywords_ppa.models import PPA, KeywordPPA
+
+        quote = self.connection.ops.quote_name
+        keyword_table = quote(Keyword._meta.db_table)
+        keyword_fields = self.normalizer.keyword_fields
+
+        with self.connection.cursor() as cursor:
+            # ON COMMIT DROP ne suffit pas si l'appelant est déjà dans une transaction
+            cursor.execute("DROP TABLE IF EXISTS kw_import_keyword, kw_import_metrics, kw_import_ppa")
+            self._create_staging(cursor, 'kw_import_keyword', Keyword, ['keyword'] + keyword_fields)
+            self._copy(cursor, 'kw_import_keyword', ['keyword'] + keyword_fields, (
+                [keyword] + [row[1][field] for field in keyword_fields]
+                for keyword, row in batch.rows.items()
+            ))
+
+            # Colonnes NOT NULL sans valeur par défaut en base : valeurs des nouvelles lignes
+            insert_columns = ['keyword'] + keyword_fields
+            select_values = ['s.keyword'] + [f's.{quote(field)}' for field in keyword_fields]
+            for field, default in (('local_pack', 'false'), ('search_results', "'{}'::jsonb")):
+                if field not in keyword_fields:
+                    insert_columns.append(field)
+                    select_values.append(default)
+            updates = [f'{quote(field)} = EXCLUDED.{quote(field)}' for field in keyword_fields]
+
+            cursor.execute(f"""
+                INSERT INTO {keyword_table}
+                    ({', '.join(quote(column) for column in insert_columns)}, created_at, updated_at)
+                SELECT {', '.join(select_values)}, now(), now()
+                FROM kw_import_keyword s
+                ON CONFLICT (keyword) DO UPDATE SET {', '.join(updates + ['updated_at = EXCLUDED.updated_at'])}
+                RETURNING id, (xmax = 0)
+            """)
+            returned = cursor.fetchall()
+            keyword_ids = [row[0] for row in returned]
+            created = sum(1 for row in returned if row[1])
+
+            metrics_fields = self.normalizer.metrics_fields
+            metrics_rows = [
+                [keyword] + [row[2][field] for field in metrics_fields]
+                for keyword, row in batch.rows.items() if row[2] is not None
+            ]
+            if metrics_rows:
+                metrics_table = quote(KeywordMetrics._meta.db_table)
+                self._create_staging(cursor, 'kw_import_metrics', KeywordMetrics, metrics_fields)
+                self._copy(cursor, 'kw_import_metrics', ['keyword'] + metrics_fields, metrics_rows)
+                columns = ', '.join(quote(field) for field in metrics_fields)
+                cursor.execute(f"""
+                    INSERT INTO {metrics_table} (keyword_id, {columns}, created_at, updated_at)
+                    SELECT k.id, {', '.join(f's.{quote(field)}' for field in metrics_fields)}, now(), now()
+                    FROM kw_import_metrics s
+                    JOIN {keyword_table} k ON k.keyword = s.keyword
+                    ON CONFLICT (keyword_id) DO UPDATE SET {', '.join(
+                        [f'{quote(field)} = EXCLUDED.{quote(field)}' for field in metrics_fields]
+                        + ['updated_at = EXCLUDED.updated_at']
+                    )}
+                """)
+
+            if self.normalizer.has_ppas:
+                ppa_table = quote(PPA._meta.db_table)
+                keyword_ppa_table = quote(KeywordPPA._meta.db_table)
+                cursor.execute(
+                    "CREATE TEMP TABLE kw_import_ppa (keyword text, position integer, question text) "
+                    "ON COMMIT DROP"
+                )
+                self._copy(cursor, 'kw_import_ppa', ['keyword', 'position', 'question'], (
+                    [keyword, position, question]
+                    for keyword, row in batch.rows.items()
+                    for position, question in enumerate(row[3] or [], start=1)
+                ))
+                cursor.execute(f"""
+                    INSERT INTO {ppa_table} (question, created_at, updated_at)
+                    SELECT DISTINCT question, now(), now() FROM kw_import_ppa
+                    ON CONFLICT (question) DO NOTHING
+                """)
+                cursor.execute(f"""
+                    DELETE FROM {keyword_ppa_table} kp
+                    USING {keyword_table} k, kw_import_keyword s
+                    WHERE kp.keyword_id = k.id AND k.keyword = s.keyword
+                """)
+                cursor.execute(f"""
+                    INSERT INTO {keyword_ppa_table} (keyword_id, ppa_id, position, created_at, updated_at)
+                    SELECT k.id, p.id, s.position, now(), now()
+                    FROM kw_import_ppa s
+                    JOIN {keyword_table} k ON k.keyword = s.keyword
+                    JOIN {ppa_table} p ON p.question = s.question
+                    ON CONFLICT DO NOTHING
+                """)
+
+        return created, len(keyword_ids) - created, keyword_ids
+
+    def _create_staging(self, cursor, table, model, fields):
+        """Table temporaire aux types des colonnes cibles (+ keyword texte)"""
+        quote = self.connection.ops.quote_name
+        columns = ['keyword text']
+        for field_name in fields:
+            if field_name == 'keyword':
+                continue
+            field = model._meta.get_field(field_name)
+            columns.append(f'{quote(field.column)} {field.db_type(self.connection)}')
+        cursor.execute(f"CREATE TEMP TABLE {table} ({', '.join(columns)}) ON COMMIT DROP")
+
+    @staticmethod
+    def _copy(cursor, table, columns, rows):
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for row in rows:
+            # Vide non quoté = NULL en FORMAT csv
+            writer.writerow([
+                '' if value is None else ('t' if value is True else 'f' if value is False else value)
+                for value in row
+            ])
+        buffer.seek(0)
+        sql = f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)"
+
+        raw_cursor = cursor.cursor
+        if hasattr(raw_cursor, 'copy_expert'):
+            raw_cursor.copy_expert(sql, buffer)  # psycopg2
+        else:
+            with raw_cursor.copy(sql) as copy:  # psycopg 3
+                copy.write(buffer.getvalue())
+
+    # --- Autres bases ---
+
+    def _orm_upsert(self, batch):
+        from seo_keywords_metrics.models import KeywordMetrics
+        from seo_keywords_ppa.models import PPA, KeywordPPA
+
+        keywords = list(batch.rows)
+        manager = Keyword.objects.using(self.using)
+        existing = set(manager.filter(keyword__in=keywords).values_list('keyword', flat=True))
+
+        keyword_fields = self.normalizer.keyword_fields
+        manager.bulk_create(
+            [Keyword(keyword=keyword, **row[1]) for keyword, row in batch.rows.items()],
+            update_conflicts=True,
+            unique_fields=['keyword'],
+            update_fields=keyword_fields + ['updated_at'],
+        )
+        keyword_ids = dict(manager.filter(keyword__in=keywords).values_list('keyword', 'id'))
+
+        metrics = [
+            KeywordMetrics(keyword_id=keyword_ids[keyword], **row[2])
+            for keyword, row in batch.rows.items() if row[2] is not None
+        ]
+        if metrics:
+            KeywordMetrics.objects.using(self.using).bulk_create(
+                metrics,
+                update_conflicts=True,
+                unique_fields=['keyword'],
+                update_fields=self.normalizer.metrics_fields + ['updated_at'],
+            )
+
+        if self.normalizer.has_ppas:
+            questions = {question for row in batch.rows.values() for question in row[3] or []}
+            PPA.objects.using(self.using).bulk_create(
+                [PPA(question=question) for question in questions], ignore_conflicts=True
+            )
+            ppa_ids = dict(
+                PPA.objects.using(self.using).filter(question__in=questions).values_list('question', 'id')
+            )
+            KeywordPPA.objects.using(self.using).filter(keyword_id__in=keyword_ids.values()).delete()
+            KeywordPPA.objects.using(self.using).bulk_create([
+                KeywordPPA(keyword_id=keyword_ids[keyword], ppa_id=ppa_ids[question], position=position)
+                for keyword, row in batch.rows.items()
+                for position, question in enumerate(row[3] or [], start=1)
+            ], ignore_conflicts=True)
+
+        created = len(set(keywords) - existing)
+        return created, len(keywords) - created, list(keyword_ids.values())
+
+
+# ===== ORCHESTRATION =====
+
+class KeywordImportService:
+    """Import complet d'un fichier, avec progression et fichier d'erreurs"""
+
+    READERS = {
+        'csv': iter_csv_rows,
+        'xlsx': iter_xlsx_rows,
+    }
+
+    @staticmethod
+    def detect_format(filename):
+        extension = str(filename).rsplit('.', 1)[-1].lower()
+        if extension in ('xlsx', 'xlsm'):
+            return 'xlsx'
+        if extension in ('csv', 'tsv', 'txt'):
+            return 'csv'
+        raise ValueError(f"Format de fichier non supporté: .{extension}")
+
+    @classmethod
+    def run(cls, fileobj, file_format='csv', column_mapping=None, batch_size=IMPORT_BATCH_SIZE,
+            error_stream=None, progress=None, using=None):
+        """
+        Importe un fichier binaire ouvert (seekable).
+
+        - error_stream : flux texte recevant un CSV des lignes rejetées
+        - progress(stats) : appelé après chaque lot
+        Retourne les compteurs (total_rows estimé puis exact, created, updated...).
+        Lève ValueError si le fichier est inexploitable (format, colonne mot-clé).
+        """
+        reader = cls.READERS.get(file_format)
+        if reader is None:
+            raise ValueError(f"Format de fichier non supporté: {file_format}")
+
+        stats = {
+            'total_rows': estimate_rows(fileobj, file_format),
+            'processed_rows': 0,
+            'created': 0,
+            'updated': 0,
+            'duplicates': 0,
+            'failed': 0,
+            'ignored_columns': [],
+        }
+        errors = ImportErrorWriter(error_stream)
+        normalizer = None
+        writer = None
+        batch = ImportBatch()
+
+        def flush():
+            nonlocal batch
+            if not len(batch):
+                return
+            try:
+                created, updated, _ = writer.write(batch)
+                stats['created'] += created
+                stats['updated'] += updated
+            except DatabaseError as e:
+                # Lot rejeté en bloc par la base : chaque ligne est signalée
+                logger.error(f"Keyword import batch failed: {e}")
+                stats['failed'] += len(batch)
+                for keyword, (line_number, _, _, _, values) in batch.rows.items():
+                    errors.write(line_number, keyword, f"Erreur base de données: {e}", values)
+            stats['duplicates'] += batch.duplicates
+            stats['processed_rows'] += len(batch) + batch.duplicates
+            batch = ImportBatch()
+            if progress:
+                progress(stats)
+
+        for line_number, headers, values in reader(fileobj):
+            if normalizer is None:
+                normalizer = KeywordRowNormalizer(headers, column_mapping)
+                writer = KeywordBulkWriter(normalizer, using=using)
+                stats['ignored_columns'] = normalizer.ignored_columns
+                errors.set_headers(headers)
+
+            try:
+                keyword, keyword_values, metrics_values, ppas = normalizer.normalize(values)
+            except RowError as e:
+                stats['failed'] += 1
+                stats['processed_rows'] += 1
+                errors.write(line_number, normalizer.raw_keyword(values), str(e), values)
+                continue
+
+            batch.add(line_number, keyword, keyword_values, metrics_values, ppas, values)
+            if len(batch) >= batch_size:
+                flush()
+
+        if normalizer is not None:
+            flush()
+        stats['total_rows'] = stats['processed_rows']
+        return stats
+
+
+class ImportErrorWriter:
+    """CSV des lignes rejetées : ligne, mot-clé, erreur, puis les colonnes d'origine"""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.writer = None
+        self.headers = []
+
+    def set_headers(self, headers):
+        self.headers = list(headers)
+
+    def write(self, line_number, keyword, error, values):
+        if self.stream is None:
+            return
+        if self.writer is None:
+            self.writer = csv.writer(self.stream)
+            self.writer.writerow(['line', 'keyword', 'error'] + self.headers)
+        self.writer.writerow([line_number, keyword, error] + ['' if value is None else value for value in values])
+
+
+def run_keyword_import(keyword_import):
+    """Exécute un KeywordImport (tâche Celery) : statut, progression et fichier d'erreurs"""
+    import tempfile
+    from django.core.files import File
+
+    keyword_import.import_status = 'processing'
+    keyword_import.started_at = timezone.now()
+    keyword_import.save(update_fields=['import_status', 'started_at', 'updated_at'])
+
+    def report(stats):
+        keyword_import.total_rows = max(stats['total_rows'], stats['processed_rows'])
+        keyword_import.processed_rows = stats['processed_rows']
+        keyword_import.created_keywords = stats['created']
+        keyword_import.updated_keywords = stats['updated']
+        keyword_import.duplicate_rows = stats['duplicates']
+        keyword_import.failed_rows = stats['failed']
+        keyword_import.save(update_fields=[
+            'total_rows', 'processed_rows', 'created_keywords', 'updated_keywords',
+            'duplicate_rows', 'failed_rows', 'updated_at'
+        ])
+
+    with tempfile.TemporaryFile(mode='w+', encoding='utf-8', newline='') as error_stream:
+        try:
+            with keyword_import.import_file.open('rb') as fileobj:
+                stats = KeywordImportService.run(
+                    fileobj,
+                    file_format=keyword_import.file_format,
+                    column_mapping=keyword_import.column_mapping,
+                    error_stream=error_stream,
+                    progress=report,
+                )
+        except ValueError as e:
+            keyword_import.import_status = 'failed'
+            keyword_import.error_message = str(e)
+            keyword_import.completed_at = timezone.now()
+            keyword_import.save(update_fields=['import_status', 'error_message', 'completed_at', 'updated_at'])
+            return None
+
+        report(stats)
+        if stats['failed']:
+            error_stream.seek(0)
+            keyword_import.error_file.save(
+                f'{keyword_import.id}_errors.csv', File(error_stream), save=False
+            )
+
+    keyword_import.import_status = 'completed'
+    keyword_import.completed_at = timezone.now()
+    keyword_import.save(update_fields=['import_status', 'error_file', 'completed_at', 'updated_at'])
+    logger.info(
+        f"Keyword import {keyword_import.id}: {stats['created']} created, "
+        f"{stats['updated']} updated, {stats['failed']} failed"
+    )
+    return stats
@@ -0,0 +1,128 @@
+# backend/seo_keywords_base/services/keyword_resolution_service.py
+"""
+Résolution en masse de listes de mots-clés (texte -> id)
+
+- Entrées normalisées (espaces multiples, casse) et dédoublonnées ; la
+  comparaison se fait sur LOWER(keyword), couvert par l'index
+  seo_kw_keyword_lower_idx
+- Petites listes : requêtes IN par tranches de RESOLVE_CHUNK_SIZE
+- Grandes listes sous PostgreSQL : COPY dans une table temporaire puis
+  semi-jointure (un seul passage, pas de requête IN géante)
+- Résultat : mapping texte d'origine -> id, textes manquants, lignes
+  trouvées (champs demandés)
+
+Le service prend un queryset : il sert aussi bien Keyword
+(seo_keywords_base) que le modèle historique du serveur MCP. Pas d'import
+de modèles au niveau du module pour cette raison.
+"""
+
+import csv
+import io
+import logging
+
+from django.db import connections, transaction
+from django.db.models.expressions import RawSQL
+from django.db.models.functions import Lower
+
+logger = logging.getLogger(__name__)
+
+RESOLVE_CHUNK_SIZE = 5000
+# Au-delà : table temporaire (PostgreSQL)
+TEMP_TABLE_THRESHOLD = 20000
+MAX_RESOLVE_KEYWORDS = 100000
+
+
+def normalize_keyword(text):
+    """'  Assurance   AUTO ' -> 'assurance auto'"""
+    return ' '.join(str(text).split()).lower()
+
+
+class KeywordResolutionService:
+    """Texte -> id pour des listes de mots-clés de plusieurs dizaines de milliers d'entrées"""
+
+    @classmethod
+    def resolve(cls, texts, queryset, fields=None, chunk_size=RESOLVE_CHUNK_SIZE):
+        """
+        Résout `texts` dans `queryset` (modèle avec un champ `keyword`).
+
+        Retourne un dict :
+        - mapping : {texte d'origine: id}
+        - missing : textes d'origine non trouvés (ordre d'entrée)
+        - results : une ligne par mot-clé trouvé ('id', 'keyword' + fields)
+        - checked / duplicates : entrées reçues / doublons après normalisation
+        """
+        # Normalisé -> textes d'origine (ordre d'entrée conservé)
+        inputs = {}
+        for text in texts:
+            if text is None:
+                continue
+            normalized = normalize_keyword(text)
+            if normalized:
+                inputs.setdefault(normalized, []).append(text)
+
+        values = ['id', 'keyword'] + [field for field in (fields or []) if field not in ('id', 'keyword')]
+        queryset = queryset.annotate(keyword_normalized=Lower('keyword'))
+        normalized_list = list(inputs)
+
+        if connections[queryset.db].vendor == 'postgresql' and len(normalized_list) > TEMP_TABLE_THRESHOLD:
+            rows = cls._resolve_with_temp_table(queryset, normalized_list, values)
+        else:
+            rows = []
+            for start in range(0, len(normalized_list), chunk_size):
+                chunk = normalized_list[start:start + chunk_size]
+                rows.extend(queryset.filter(keyword_normalized__in=chunk).values(*values))
+
+        # Variantes de casse en base : l'orthographe exacte de l'entrée l'emporte, sinon le plus petit id
+        candidates = {}
+        for row in sorted(rows, key=lambda row: row['id']):
+            candidates.setdefault(normalize_keyword(row['keyword']), []).append(row)
+
+        mapping = {}
+        results = {}
+        missing = []
+        for normalized, originals in inputs.items():
+            matches = candidates.get(normalized)
+            if not matches:
+                missing.extend(originals)
+                continue
+            for original in originals:
+                row = next((match for match in matches if match['keyword'] == original), matches[0])
+                mapping[original] = row['id']
+                results[row['id']] = row
+
+        checked = sum(len(originals) for originals in inputs.values())
+        return {
+            'mapping': mapping,
+            'missing': missing,
+            'results': list(results.values()),
+            'checked': checked,
+            'duplicates': checked - len(inputs),
+        }
+
+    @staticmethod
+    def _resolve_with_temp_table(queryset, normalized_list, values):
+        connection = connections[queryset.db]
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for normalized in normalized_list:
+            writer.writerow([normalized])
+        buffer.seek(0)
+
+        with transaction.atomic(using=queryset.db):
+            with connection.cursor() as cursor:
+                cursor.execute("DROP TABLE IF EXISTS kw_resolve")
+                cursor.execute("CREATE TEMP TABLE kw_resolve (normalized text PRIMARY KEY) ON COMMIT DROP")
+                sql = "COPY kw_resolve (normalized) FROM STDIN WITH (FORMAT csv)"
+                raw_cursor = cursor.cursor
+                if hasattr(raw_cursor, 'copy_expert'):
+                    raw_cursor.copy_expert(sql, buffer)  # psycopg2
+                else:
+                    with raw_cursor.copy(sql) as copy:  # psycopg 3
+                        copy.write(buffer.getvalue())
+                cursor.execute("ANALYZE kw_resolve")
+
+            return list(
+                queryset.filter(
+                    keyword_normalized__in=RawSQL("SELECT normalized FROM kw_resolve", ())
+                ).values(*values)
+            )
@@ -0,0 +1,151 @@
+# backend/seo_keywords_base/services/keyword_search_service.py
+"""
+Recherche de mots-clés indexée
+
+PostgreSQL :
+- Keyword.search_vector (tsvector, config 'french') : keyword (poids A)
+  + content_types (poids B), index GIN
+- index GIN pg_trgm sur keyword : similarité trigramme (opérateur %,
+  recherche floue, "mots-clés similaires")
+- index GIN pg_trgm sur UPPER(keyword::text) et UPPER(content_types::text) :
+  icontains, que Django compile en UPPER("keyword"::text) LIKE UPPER(...)
+  (l'index sur keyword brut ne sert pas à cette expression). La sous-chaîne
+  sur content_types est conservée : le tsvector racinisé ne trouve pas un
+  terme partiel ('guid' pour 'guide')
+- Résultats classés par ts_rank + similarité trigramme
+
+Ailleurs (SQLite des tests) : repli sur icontains, rang constant, et
+similarité calculée en Python (difflib) sur un lot de candidats.
+
+Le vecteur est maintenu par Keyword.save() ; les écritures en masse
+(bulk_create, update) appellent refresh_search_vectors().
+"""
+
+import difflib
+import logging
+
+from django.db import connections, transaction
+from django.db.models import F, FloatField, Q, Value
+
+logger = logging.getLogger(__name__)
+
+SEARCH_CONFIG = 'french'
+DEFAULT_SIMILARITY_THRESHOLD = 0.3
+FALLBACK_CANDIDATES = 500
+
+
+class KeywordSearchService:
+    """Recherche plein texte, floue et similarité sur Keyword"""
+
+    @staticmethod
+    def is_supported(using='default'):
+        """Recherche indexée disponible (PostgreSQL)"""
+        return connections[using].vendor == 'postgresql'
+
+    @staticmethod
+    def search_vector_expression():
+        from django.contrib.postgres.search import SearchVector
+
+        return (
+            SearchVector('keyword', config=SEARCH_CONFIG, weight='A')
+            + SearchVector('content_types', config=SEARCH_CONFIG, weight='B')
+        )
+
+    @classmethod
+    def refresh_search_vectors(cls, queryset, batch_size=5000):
+        """
+        Recalcule search_vector pour le queryset, par plages d'id.
+        Sans effet hors PostgreSQL. Fonctionne avec les modèles historiques.
+        Retourne le nombre de lignes mises à jour.
+        """
+        if not cls.is_supported(queryset.db):
+            return 0
+
+        expression = cls.search_vector_expression()
+        updated = 0
+        last_id = 0
+        while True:
+            ids = list(
+                queryset.filter(id__gt=last_id).order_by('id').values_list('id', flat=True)[:batch_size]
+            )
+            if not ids:
+                break
+            last_id = ids[-1]
+            updated += queryset.model.objects.filter(id__in=ids).update(search_vector=expression)
+        return updated
+
+    @classmethod
+    def search(cls, queryset, term):
+        """
+        Filtre le queryset sur `term` et annote search_rank
+        (à trier par '-search_rank' pour un classement par pertinence)
+        """
+        term = (term or '').strip()
+        if not term:
+            return queryset.annotate(search_rank=Value(0.0, output_field=FloatField()))
+
+        if not cls.is_supported(queryset.db):
+            return queryset.filter(
+                Q(keyword__icontains=term) | Q(content_types__icontains=term)
+            ).annotate(search_rank=Value(0.0, output_field=FloatField()))
+
+        from django.contrib.postgres.search import SearchQuery, SearchRank, TrigramSimilarity
+
+        query = SearchQuery(term, config=SEARCH_CONFIG, search_type='websearch')
+        return queryset.filter(
+            # Une branche par index GIN (search_vector, UPPER(keyword), keyword,
+            # UPPER(content_types)) : BitmapOr
+            Q(search_vector=query)
+            | Q(keyword__icontains=term)
+            | Q(keyword__trigram_similar=term)
+            | Q(content_types__icontains=term)
+        ).annotate(
+            search_rank=SearchRank(F('search_vector'), query) + TrigramSimilarity('keyword', term)
+        )
+
+    @classmethod
+    def similar(cls, term, limit=20, threshold=DEFAULT_SIMILARITY_THRESHOLD, queryset=None):
+        """
+        Mots-clés proches de `term` (fautes, variantes, ordre des mots),
+        triés par similarité décroissante. Chaque élément porte .similarity.
+        """
+        from ..models import Keyword
+
+        term = (term or '').strip()
+        queryset = Keyword.objects.all() if queryset is None else queryset
+        if not term:
+            return []
+
+        queryset = queryset.exclude(keyword__iexact=term)
+
+        if cls.is_supported(queryset.db):
+            from django.contrib.postgres.search import TrigramSimilarity
+
+            # L'opérateur % (indexé) filtre selon pg_trgm.similarity_threshold :
+            # aligné sur `threshold` le temps de la transaction, sinon un seuil
+            # inférieur au réglage serveur (0.3) serait ignoré
+            with transaction.atomic(using=queryset.db):
+                with connections[queryset.db].cursor() as cursor:
+                    cursor.execute(
+                        "SELECT set_config('pg_trgm.similarity_threshold', %s, true)", [str(threshold)]
+                    )
+                return list(
+                    queryset.filter(keyword__trigram_similar=term)
+                    .annotate(similarity=TrigramSimilarity('keyword', term))
+                    .filter(similarity__gte=threshold)
+                    .order_by('-similarity', F('volume').desc(nulls_last=True))[:limit]
+                )
+
+        # Repli : candidats partageant un mot, classés en Python
+        tokens = [token for token in term.lower().split() if len(token) >= 3] or [term.lower()]
+        condition = Q()
+        for token in tokens:
+            condition |= Q(keyword__icontains=token)
+
+        scored = []
+        for keyword in queryset.filter(condition)[:FALLBACK_CANDIDATES]:
+            keyword.similarity = difflib.SequenceMatcher(None, term.lower(), keyword.keyword.lower()).ratio()
+            if keyword.similarity >= threshold:
+                scored.append(keyword)
+        scored.sort(key=lambda keyword: (-keyword.similarity, -(keyword.volume or 0)))
+        return scored[:limit]
@@ -0,0 +1,56 @@
+# backend/seo_keywords_base/services/numeric_backfill.py
+"""
+Remplissage par lots des colonnes numériques dérivées des chaînes brutes
+(Keyword.cpc -> cpc_value, KeywordMetrics.kdifficulty -> kdifficulty_value).
+
+Utilisé par les migrations de données et par la commande
+backfill_keyword_numeric_values. Parcours par plages d'id : chaque lot est
+une requête indexée + un bulk_update, commités indépendamment.
+"""
+
+from ..utils.normalization import parse_cpc, parse_kdifficulty
+
+# (app_label, model_name, champ brut, champ numérique, parser)
+NUMERIC_COLUMNS = [
+    ('seo_keywords_base', 'Keyword', 'cpc', 'cpc_value', parse_cpc),
+    ('seo_keywords_metrics', 'KeywordMetrics', 'kdifficulty', 'kdifficulty_value', parse_kdifficulty),
+]
+
+
+def backfill_numeric_column(model, raw_field, value_field, parser,
+                            batch_size=2000, only_missing=True, progress=None):
+    """
+    Recalcule value_field depuis raw_field pour toutes les lignes
+    (ou seulement celles dont la valeur est NULL alors que le brut est rempli).
+    Fonctionne aussi avec les modèles historiques des migrations.
+    Retourne le nombre de lignes mises à jour.
+    """
+    queryset = model.objects.filter(**{f'{raw_field}__isnull': False})
+    if only_missing:
+        queryset = queryset.filter(**{f'{value_field}__isnull': True})
+
+    updated = 0
+    last_id = 0
+    while True:
+        rows = list(
+            queryset.filter(id__gt=last_id)
+            .order_by('id')
+            .values_list('id', raw_field, value_field)[:batch_size]
+        )
+        if not rows:
+            break
+        last_id = rows[-1][0]
+
+        changed = []
+        for row_id, raw, current in rows:
+            value = parser(raw)
+            if value != current:
+                changed.append(model(id=row_id, **{value_field: value}))
+        if changed:
+            model.objects.bulk_update(changed, [value_field], batch_size=batch_size)
+            updated += len(changed)
+
+        if progress:
+            progress(last_id, updated)
+
+    return updated
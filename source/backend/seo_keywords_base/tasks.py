@@ -0,0 +1,32 @@
+# backend/seo_keywords_base/tasks.py
+import logging
+from celery import shared_task
+from django.utils import timezone
+
+from .models import KeywordImport
+from .services.keyword_import_service import run_keyword_import
+
+logger = logging.getLogger(__name__)
+
+@shared_task(bind=True)
+def import_keywords_task(self, import_id: str):
+    """Import d'un export CSV/XLSX de mots-clés (progression sur KeywordImport)"""
+    try:
+        keyword_import = KeywordImport.objects.get(id=import_id)
+    except KeywordImport.DoesNotExist:
+        logger.error(f"KeywordImport {import_id} introuvable")
+        return {"status": "failed", "import_id": import_id}
+
+    try:
+        stats = run_keyword_import(keyword_import)
+    except Exception as exc:
+        logger.error(f"Erreur import mots-clés {import_id}: {str(exc)}", exc_info=True)
+        keyword_import.import_status = 'failed'
+        keyword_import.error_message = str(exc)
+        keyword_import.completed_at = timezone.now()
+        keyword_import.save(update_fields=['import_status', 'error_message', 'completed_at', 'updated_at'])
+        return {"status": "failed", "import_id": import_id, "error": str(exc)}
+
+    if stats is None:
+        return {"status": "failed", "import_id": import_id, "error": keyword_import.error_message}
+    return {"status": "success", "import_id": import_id, **stats}
@@ -0,0 +1,147 @@
+# backend/seo_keywords_base/tests/test_keyword_import.py
+
+import csv
+import io
+
+import pytest
+from django.db import DatabaseError
+
+from seo_keywords_base.models import Keyword
+from seo_keywords_base.services.keyword_import_service import KeywordImportService, KeywordRowNormalizer
+from seo_keywords_metrics.models import KeywordMetrics
+from seo_keywords_ppa.models import PPA, KeywordPPA
+
+
+def csv_file(rows, delimiter=';', encoding='utf-8'):
+    buffer = io.StringIO()
+    csv.writer(buffer, delimiter=delimiter).writerows(rows)
+    return io.BytesIO(buffer.getvalue().encode(encoding))
+
+
+HEADERS = ['Mot-clé', 'Volume', 'CPC', 'KD', 'DA Q1', 'BL médian', 'PPA 1', 'PPA 2']
+
+
+def test_headers_are_mapped_with_aliases():
+    normalizer = KeywordRowNormalizer(HEADERS + ['Colonne inconnue'])
+
+    assert normalizer.keyword_fields == ['volume', 'cpc', 'cpc_value']
+    assert normalizer.metrics_fields == ['da_q1', 'bl_median', 'kdifficulty', 'kdifficulty_value']
+    assert normalizer.has_ppas
+    assert normalizer.ignored_columns == ['Colonne inconnue']
+
+
+def test_missing_keyword_column_fails():
+    with pytest.raises(ValueError):
+        KeywordImportService.run(csv_file([['Volume'], ['10']]))
+
+
+@pytest.mark.django_db
+class TestKeywordImport:
+
+    def run(self, rows, **kwargs):
+        errors = io.StringIO()
+        stats = KeywordImportService.run(csv_file(rows), error_stream=errors, **kwargs)
+        return stats, errors.getvalue()
+
+    def test_creates_keywords_metrics_and_ppas(self):
+        stats, errors = self.run([
+            HEADERS,
+            ['assurance auto', '1 200', '2,40 €', '35%', '12', '', 'Quelle assurance ?', 'Combien ça coûte ?'],
+            ['assurance moto', '300', '', '', '', '', 'Quelle assurance ?', ''],
+        ], batch_size=1)
+
+        assert stats['created'] == 2 and stats['failed'] == 0
+        assert stats['processed_rows'] == stats['total_rows'] == 2
+        assert errors == ''
+
+        keyword = Keyword.objects.get(keyword='assurance auto')
+        assert keyword.volume == 1200
+        assert keyword.cpc_value == 2.4
+        assert keyword.metrics.kdifficulty_value == 35.0
+        assert keyword.metrics.da_q1 == 12
+        assert list(keyword.ppa_associations.order_by('position').values_list('ppa__question', flat=True)) == [
+            'Quelle assurance ?', 'Combien ça coûte ?'
+        ]
+        # Métriques toutes vides : pas de ligne KeywordMetrics
+        assert not KeywordMetrics.objects.filter(keyword__keyword='assurance moto').exists()
+        assert PPA.objects.count() == 2
+
+    def test_derived_refresh_failure_does_not_fail_rows(self, mocker):
+        mocker.patch(
+            'seo_keywords_metrics.services.SerpExtractionService.recompute_quartiles',
+            side_effect=DatabaseError('boom')
+        )
+
+        stats, errors = self.run([HEADERS, ['assurance auto', '1200', '', '', '12', '', '', '']])
+
+        # Lignes committées avant le recalcul : ni échec ni fichier d'erreurs
+        assert (stats['created'], stats['failed']) == (1, 0)
+        assert errors == ''
+        assert Keyword.objects.get(keyword='assurance auto').metrics.da_q1 == 12
+
+    def test_reimport_updates_only_present_columns(self):
+        Keyword.objects.create(keyword='credit', volume=10, cpc='1 €', youtube_videos='3')
+
+        stats, _ = self.run([['keyword', 'volume'], ['credit', '5000']])
+
+        keyword = Keyword.objects.get(keyword='credit')
+        assert stats['updated'] == 1 and stats['created'] == 0
+        assert keyword.volume == 5000
+        assert keyword.cpc == '1 €' and keyword.youtube_videos == '3'
+
+    def test_ppas_replace_existing_associations(self):
+        self.run([['keyword', 'ppa_1', 'ppa_2'], ['credit', 'Ancienne ?', 'Autre ?']])
+        self.run([['keyword', 'ppa_1'], ['credit', 'Nouvelle ?']])
+
+        assert list(KeywordPPA.objects.values_list('ppa__question', 'position')) == [('Nouvelle ?', 1)]
+
+    def test_invalid_rows_go_to_error_file(self):
+        stats, errors = self.run([
+            ['volume', 'keyword', 'intent'],
+            ['abc', 'credit', 'TOFU'],
+            ['10', '', 'TOFU'],
+            ['10', 'pret', 'XOFU'],
+            ['10', 'rachat', 'bofu'],
+        ])
+
+        assert stats['failed'] == 3 and stats['created'] == 1
+        assert Keyword.objects.get().search_intent == 'BOFU'
+
+        lines = list(csv.reader(io.StringIO(errors)))
+        assert lines[0] == ['line', 'keyword', 'error', 'volume', 'keyword', 'intent']
+        assert [line[:2] for line in lines[1:]] == [['2', 'credit'], ['3', ''], ['4', 'pret']]
+
+    def test_duplicates_last_row_wins(self):
+        stats, _ = self.run([['keyword', 'volume'], ['credit', '1'], ['credit', '2']])
+
+        assert stats['duplicates'] == 1 and stats['created'] == 1
+        assert Keyword.objects.get().volume == 2
+
+    def test_progress_called_per_batch(self):
+        calls = []
+        self.run([['keyword']] + [[f'kw {i}'] for i in range(5)], batch_size=2, progress=lambda s: calls.append(s['processed_rows']))
+
+        assert calls == [2, 4, 5]
+
+    def test_comma_separated_latin1_file(self):
+        stats = KeywordImportService.run(
+            csv_file([['mot clé', 'volume'], ['prêt immobilier', '10']], delimiter=',', encoding='latin-1')
+        )
+
+        assert stats['created'] == 1
+        assert Keyword.objects.filter(keyword='prêt immobilier').exists()
+
+    def test_xlsx_import(self):
+        openpyxl = pytest.importorskip('openpyxl')
+        workbook = openpyxl.Workbook()
+        workbook.active.append(['Keyword', 'Volume', 'CPC', 'Local pack'])
+        workbook.active.append(['credit', 1200.0, 1.5, 'oui'])
+        fileobj = io.BytesIO()
+        workbook.save(fileobj)
+        fileobj.seek(0)
+
+        stats = KeywordImportService.run(fileobj, file_format='xlsx')
+
+        keyword = Keyword.objects.get()
+        assert stats['created'] == 1
+        assert (keyword.volume, keyword.cpc_value, keyword.local_pack) == (1200, 1.5, True)
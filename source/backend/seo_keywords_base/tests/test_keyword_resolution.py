@@ -0,0 +1,71 @@
+# backend/seo_keywords_base/tests/test_keyword_resolution.py
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from seo_keywords_base.models import Keyword
+from seo_keywords_base.services.keyword_resolution_service import KeywordResolutionService, normalize_keyword
+
+
+def test_normalize_keyword():
+    assert normalize_keyword('  Assurance   AUTO\t') == 'assurance auto'
+
+
+@pytest.mark.django_db
+class TestKeywordResolution:
+
+    @pytest.fixture(autouse=True)
+    def keywords(self):
+        for i in range(25):
+            Keyword.objects.create(keyword=f'kw {i}', volume=i)
+        self.lower = Keyword.objects.create(keyword='credit auto', volume=10)
+        self.title = Keyword.objects.create(keyword='Credit Auto', volume=20)
+
+    def test_resolves_across_chunks(self):
+        texts = [f'kw {i}' for i in range(30)]
+
+        resolution = KeywordResolutionService.resolve(texts, Keyword.objects.all(), chunk_size=4)
+
+        assert len(resolution['mapping']) == 25
+        assert resolution['missing'] == [f'kw {i}' for i in range(25, 30)]
+        assert resolution['checked'] == 30
+
+    def test_case_and_whitespace_are_normalized(self):
+        resolution = KeywordResolutionService.resolve(
+            ['KW 1', 'kw   1', 'CREDIT AUTO', 'Credit Auto', '', None], Keyword.objects.all(), fields=['volume']
+        )
+
+        kw_1 = Keyword.objects.get(keyword='kw 1').id
+        # Variantes de casse : orthographe exacte, sinon le plus petit id
+        assert resolution['mapping'] == {
+            'KW 1': kw_1, 'kw   1': kw_1, 'CREDIT AUTO': self.lower.id, 'Credit Auto': self.title.id
+        }
+        assert resolution['duplicates'] == 2
+        assert {row['id']: row['volume'] for row in resolution['results']} == {kw_1: 1, self.lower.id: 10, self.title.id: 20}
+
+    def test_resolve_endpoint(self):
+        client = APIClient()
+        client.force_authenticate(get_user_model().objects.create_user(username='seo', password='x'))
+        url = reverse('seo_keywords:keywords-resolve')
+
+        response = client.post(url, {'keywords': ['kw 3', 'inconnu'], 'fields': ['volume']}, format='json')
+
+        assert response.status_code == 200
+        assert response.data['mapping'] == {'kw 3': Keyword.objects.get(keyword='kw 3').id}
+        assert response.data['missing'] == ['inconnu']
+        assert response.data['results'][0]['volume'] == 3
+
+        response = client.post(url, {'keywords': ['kw 3'], 'fields': ['search_vector']}, format='json')
+        assert response.status_code == 400
+
+    def test_list_existence_mode(self):
+        client = APIClient()
+        client.force_authenticate(get_user_model().objects.create_user(username='seo', password='x'))
+
+        response = client.get(reverse('seo_keywords:keywords-list'), {'keyword__in': 'kw 1,KW 2,absent'})
+
+        assert response.data['count'] == 2
+        assert response.data['missing'] == ['absent']
+        assert response.data['checked'] == 3
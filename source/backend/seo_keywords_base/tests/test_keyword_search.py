@@ -0,0 +1,52 @@
+# backend/seo_keywords_base/tests/test_keyword_search.py
+
+import pytest
+
+from seo_keywords_base.models import Keyword
+from seo_keywords_base.filters import KeywordFilter
+from seo_keywords_base.services.keyword_search_service import KeywordSearchService
+
+
+@pytest.mark.django_db
+class TestKeywordSearchFallback:
+    """Comportement hors PostgreSQL (SQLite des tests) : icontains + difflib"""
+
+    @pytest.fixture(autouse=True)
+    def keywords(self):
+        Keyword.objects.create(keyword='assurance auto jeune conducteur', volume=900)
+        Keyword.objects.create(keyword='assurance habitation', volume=5000)
+        Keyword.objects.create(keyword='assurence auto', volume=50)
+        Keyword.objects.create(keyword='credit immobilier', volume=8000)
+        Keyword.objects.create(keyword='comparatif mutuelle', volume=300, content_types='guide, comparatif')
+
+    def test_not_supported_on_sqlite(self):
+        assert KeywordSearchService.is_supported() is False
+
+    def test_search_filters_and_annotates_rank(self):
+        results = KeywordSearchService.search(Keyword.objects.all(), 'assurance')
+
+        assert {k.keyword for k in results} == {'assurance auto jeune conducteur', 'assurance habitation'}
+        assert all(k.search_rank == 0.0 for k in results)
+
+    def test_search_matches_partial_content_types(self):
+        results = KeywordSearchService.search(Keyword.objects.all(), 'guid')
+
+        assert [k.keyword for k in results] == ['comparatif mutuelle']
+
+    def test_filter_search_uses_service(self):
+        filterset = KeywordFilter({'search': 'immobilier'}, queryset=Keyword.objects.all())
+
+        assert [k.keyword for k in filterset.qs] == ['credit immobilier']
+
+    def test_similar_ranks_typos_first(self):
+        results = KeywordSearchService.similar('assurance auto', threshold=0.5)
+
+        assert results[0].keyword == 'assurence auto'
+        assert 'credit immobilier' not in [k.keyword for k in results]
+        assert all(0.5 <= k.similarity <= 1 for k in results)
+
+    def test_similar_respects_limit(self):
+        assert len(KeywordSearchService.similar('assurance', limit=1, threshold=0)) == 1
+
+    def test_refresh_is_noop_without_postgres(self):
+        assert KeywordSearchService.refresh_search_vectors(Keyword.objects.all()) == 0
@@ -0,0 +1,65 @@
+# backend/seo_keywords_base/tests/test_numeric_values.py
+
+import pytest
+
+from seo_keywords_base.models import Keyword
+from seo_keywords_base.filters import KeywordFilter
+from seo_keywords_base.services.numeric_backfill import backfill_numeric_column
+from seo_keywords_base.utils.normalization import parse_cpc, parse_kdifficulty
+from seo_keywords_metrics.models import KeywordMetrics
+
+
+@pytest.mark.parametrize('raw, expected', [
+    ('1,25 €', 1.25),
+    ('1 200,50 €', 1200.5),
+    ('0.8', 0.8),
+    ('', None),
+    (None, None),
+    ('n/a', None),
+])
+def test_parse_cpc(raw, expected):
+    assert parse_cpc(raw) == expected
+
+
+def test_parse_kdifficulty_keeps_scale():
+    assert parse_kdifficulty('35%') == 35.0
+    assert parse_kdifficulty('0,42') == 0.42
+
+
+@pytest.mark.django_db
+class TestNumericColumns:
+
+    def test_values_filled_on_save(self):
+        keyword = Keyword.objects.create(keyword='assurance auto', cpc='2,40 €')
+        metrics = KeywordMetrics.objects.create(keyword=keyword, kdifficulty='56%')
+
+        assert keyword.cpc_value == 2.4
+        assert metrics.kdifficulty_value == 56.0
+        assert metrics.get_normalized_difficulty() == 0.56
+
+        keyword.cpc = '3 €'
+        keyword.save(update_fields=['cpc'])
+        keyword.refresh_from_db()
+        assert keyword.cpc_value == 3.0
+
+    def test_filters_use_numeric_columns(self):
+        cheap = Keyword.objects.create(keyword='cheap', cpc='0,50 €')
+        pricey = Keyword.objects.create(keyword='pricey', cpc='4,00 €')
+        KeywordMetrics.objects.create(keyword=cheap, kdifficulty='12%')
+        KeywordMetrics.objects.create(keyword=pricey, kdifficulty='70%')
+
+        by_cpc = KeywordFilter({'cpc_min': '1'}, queryset=Keyword.objects.all()).qs
+        by_kd = KeywordFilter({'kdifficulty_max': '20'}, queryset=Keyword.objects.all()).qs
+
+        assert list(by_cpc) == [pricey]
+        assert list(by_kd) == [cheap]
+
+    def test_backfill_only_missing(self):
+        keyword = Keyword.objects.create(keyword='legacy', cpc='1,10 €')
+        Keyword.objects.filter(pk=keyword.pk).update(cpc_value=None)
+
+        updated = backfill_numeric_column(Keyword, 'cpc', 'cpc_value', parse_cpc, batch_size=1)
+
+        keyword.refresh_from_db()
+        assert updated == 1
+        assert keyword.cpc_value == 1.1
@@ -1,9 +1,11 @@
 # backend/seo_keywords_base/urls.py
 
 from rest_framework.routers import DefaultRouter
-from .views import KeywordViewSet
+from .views import KeywordViewSet, KeywordImportViewSet
 
 router = DefaultRouter()
+# Avant '' : sinon imports/ serait pris pour le détail d'un mot-clé
+router.register(r'imports', KeywordImportViewSet, basename='keyword-imports')
 router.register(r'', KeywordViewSet, basename='keywords')  # ✅ Chaîne vide
 
 urlpatterns = router.urls
\ No newline at end of file
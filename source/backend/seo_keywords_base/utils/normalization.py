@@ -0,0 +1,66 @@
+# backend/seo_keywords_base/utils/normalization.py
+"""
+Conversion des métriques texte (import Semrush/Ahrefs, saisie manuelle)
+en valeurs numériques indexables.
+
+Les chaînes brutes (Keyword.cpc, KeywordMetrics.kdifficulty) sont gardées
+pour l'affichage ; filtres et tris passent par cpc_value / kdifficulty_value,
+remplis à l'écriture.
+"""
+
+import re
+
+_NUMBER_RE = re.compile(r'-?\d+(?:\.\d+)?')
+
+
+def _parse_number(raw, strip_chars):
+    if raw is None:
+        return None
+    if isinstance(raw, (int, float)):
+        return float(raw)
+
+    text = str(raw).strip()
+    for char in strip_chars:
+        text = text.replace(char, '')
+    # Séparateur décimal français, espaces (y compris insécables) de milliers
+    text = text.replace(' ', '').replace('\u00a0', '').replace('\u202f', '').replace(',', '.')
+    if not text:
+        return None
+
+    try:
+        return float(text)
+    except ValueError:
+        # Dernier recours : premier nombre trouvé ("~12.5", "0.80 EUR")
+        match = _NUMBER_RE.search(text)
+        return float(match.group()) if match else None
+
+
+def parse_cpc(raw):
+    """'1,25 €' -> 1.25 ; None si non interprétable"""
+    return _parse_number(raw, ('€', '$', 'EUR', 'USD'))
+
+
+def parse_kdifficulty(raw):
+    """'35%' -> 35.0 (échelle d'origine conservée, comme les anciens filtres)"""
+    return _parse_number(raw, ('%',))
+
+
+def parse_int(raw):
+    """'1 200' / '1200.0' / 1200.0 -> 1200 ; None si vide ou non interprétable"""
+    value = _parse_number(raw, ())
+    return int(round(value)) if value is not None else None
+
+
+_TRUE_VALUES = {'1', 'true', 'vrai', 'yes', 'oui', 'x', 'y', 'o'}
+
+
+def parse_bool(raw):
+    """'oui' / 'x' / 1 / True -> True ; vide -> None"""
+    if raw is None:
+        return None
+    if isinstance(raw, bool):
+        return raw
+    text = str(raw).strip().lower()
+    if not text:
+        return None
+    return text in _TRUE_VALUES
@@ -1,5 +1,6 @@
 # backend/seo_keywords_base/views/__init__.py
 
 from .keyword_views import KeywordViewSet
+from .import_views import KeywordImportViewSet
 
-__all__ = ['KeywordViewSet']
\ No newline at end of file
+__all__ = ['KeywordViewSet', 'KeywordImportViewSet']
\ No newline at end of file
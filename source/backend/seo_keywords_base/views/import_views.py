@@ -0,0 +1,41 @@
+# backend/seo_keywords_base/views/import_views.py
+
+from rest_framework import mixins, viewsets
+from rest_framework.parsers import JSONParser, MultiPartParser, FormParser
+from rest_framework.permissions import IsAuthenticated
+
+from ..models import KeywordImport
+from ..serializers import KeywordImportSerializer
+from ..tasks import import_keywords_task
+
+import logging
+logger = logging.getLogger(__name__)
+
+class KeywordImportViewSet(
+    mixins.CreateModelMixin,
+    mixins.ListModelMixin,
+    mixins.RetrieveModelMixin,
+    viewsets.GenericViewSet
+):
+    """
+    📥 IMPORTS D'EXPORTS MOTS-CLÉS (CSV / XLSX)
+    
+    Endpoints:
+    - POST /keywords/imports/ : Upload (multipart: import_file, column_mapping optionnel)
+    - GET /keywords/imports/ : Historique des imports
+    - GET /keywords/imports/{id}/ : Progression, compteurs, fichier d'erreurs
+    """
+    
+    queryset = KeywordImport.objects.select_related('imported_by')
+    serializer_class = KeywordImportSerializer
+    permission_classes = [IsAuthenticated]
+    parser_classes = [MultiPartParser, FormParser, JSONParser]
+    
+    def perform_create(self, serializer):
+        keyword_import = serializer.save(imported_by=self.request.user)
+        
+        # Traitement asynchrone : la progression se lit sur l'import
+        task = import_keywords_task.delay(str(keyword_import.id))
+        keyword_import.task_id = task.id
+        keyword_import.save(update_fields=['task_id', 'updated_at'])
+        logger.info(f"Import mots-clés {keyword_import.id} lancé (task {task.id})")
@@ -16,6 +16,9 @@ from common.views.mixins import (
 from ..models import Keyword
 from ..serializers import KeywordSerializer, KeywordListSerializer, KeywordDetailSerializer
 from ..filters import KeywordFilter
+from ..utils.normalization import parse_cpc
+from ..services.keyword_search_service import KeywordSearchService, DEFAULT_SIMILARITY_THRESHOLD
+from ..services.keyword_resolution_service import KeywordResolutionService, MAX_RESOLVE_KEYWORDS
 
 import logging
 logger = logging.getLogger(__name__)
@@ -43,6 +46,8 @@ class KeywordViewSet(
     - PUT/PATCH /keywords/{id}/ : Mise à jour
     - DELETE /keywords/{id}/ : Suppression cascade
     - GET /keywords/search/ : Recherche rapide
+    - GET /keywords/similar/ : Mots-clés similaires (recherche floue)
+    - POST /keywords/resolve/ : Résolution en masse texte -> id
     - GET /keywords/stats/ : Analytics globales
     - POST /keywords/bulk-update/ : Actions masse
     """
@@ -53,13 +58,13 @@ class KeywordViewSet(
     filterset_class = KeywordFilter
     search_fields = ['keyword']
     ordering_fields = [
-        # Base
-        'keyword', 'volume', 'search_intent', 'cpc', 'created_at',
+        # Base ('cpc_value' : tri numérique, 'cpc' reste un tri texte)
+        'keyword', 'volume', 'search_intent', 'cpc', 'cpc_value', 'created_at',
         
         # Metrics cross-app (via annotations)
         'da_min', 'da_q1', 'da_median', 'da_q3', 'da_max',
         'bl_min', 'bl_q1', 'bl_median', 'bl_q3', 'bl_max',
-        'kdifficulty_normalized',
+        'kdifficulty_normalized', 'kdifficulty_value',
         
         # Compteurs
         'cocoons_count', 'ppas_count', 'content_types_count'
@@ -105,6 +110,10 @@ class KeywordViewSet(
             )
         )
         
+        # 🔢 COLONNES MÉTRIQUES pour le tri
+        if self._needs_metrics_annotations():
+            queryset = self._add_metrics_annotations(queryset)
+        
         # 📋 PRÉCHARGEMENTS PAR ACTION
         if self.action == 'retrieve':
             queryset = queryset.prefetch_related(
@@ -132,66 +141,53 @@ class KeywordViewSet(
             logger.warning("seo_keywords_metrics app not available")
             return None
     
+    METRICS_ORDERING_FIELDS = [
+        'da_min', 'da_max', 'da_median', 'da_q1', 'da_q3',
+        'bl_min', 'bl_max', 'bl_median', 'bl_q1', 'bl_q3',
+        'kdifficulty_normalized', 'kdifficulty_value'
+    ]
+    
     def _needs_metrics_annotations(self):
-        """Vérifie si les annotations métriques sont nécessaires"""
+        """Annotations métriques nécessaires seulement pour trier dessus
+        (les filtres passent par Exists sur KeywordMetrics)"""
         request = getattr(self, 'request', None)
         if not request:
             return False
         
-        # Si filtrage sur métriques
-        metrics_filters = [
-            'da_min', 'da_max', 'da_median', 'da_q1', 'da_q3',
-            'bl_min', 'bl_max', 'bl_median', 'bl_q1', 'bl_q3',
-            'kdifficulty_min', 'kdifficulty_max'
-        ]
-        
-        return any(
-            param in request.query_params 
-            for param in metrics_filters
-        )
+        ordering = request.query_params.get('ordering', '')
+        requested = {field.strip().lstrip('-') for field in ordering.split(',')}
+        return bool(requested & set(self.METRICS_ORDERING_FIELDS))
     
     def _add_metrics_annotations(self, queryset):
-        """Ajoute annotations métriques pour filtrage"""
-        try:
-            from seo_keywords_metrics.models import KeywordMetrics
-            from django.db.models import F, FloatField, Value
-            from django.db.models.functions import Cast, Replace
-            
-            # Sous-requête pour récupérer les métriques
-            metrics_subquery = KeywordMetrics.objects.filter(
-                keyword=OuterRef('pk')
-            )
-            
-            return queryset.annotate(
-                # DA metrics
-                da_min=metrics_subquery.values('da_min')[:1],
-                da_max=metrics_subquery.values('da_max')[:1],
-                da_median=metrics_subquery.values('da_median')[:1],
-                da_q1=metrics_subquery.values('da_q1')[:1],
-                da_q3=metrics_subquery.values('da_q3')[:1],
-                
-                # BL metrics  
-                bl_min=metrics_subquery.values('bl_min')[:1],
-                bl_max=metrics_subquery.values('bl_max')[:1],
-                bl_median=metrics_subquery.values('bl_median')[:1],
-                bl_q1=metrics_subquery.values('bl_q1')[:1],
-                bl_q3=metrics_subquery.values('bl_q3')[:1],
-                
-                # KD normalisé
-                kdifficulty_normalized=Cast(
-                    Replace(
-                        Replace(
-                            metrics_subquery.values('kdifficulty')[:1], 
-                            Value('%'), Value('')
-                        ),
-                        Value(','), Value('.')
-                    ),
-                    FloatField()
-                )
-            )
-        except ImportError:
-            logger.warning("Could not add metrics annotations")
-            return queryset
+        """Expose les colonnes métriques (déjà jointes via select_related) pour le tri"""
+        from django.db.models import F
+        
+        annotations = {
+            field: F(f'metrics__{field}')
+            for field in self.METRICS_ORDERING_FIELDS
+            if field != 'kdifficulty_normalized'
+        }
+        # Alias historique : tri sur la colonne numérique indexée
+        annotations['kdifficulty_normalized'] = F('metrics__kdifficulty_value')
+        return queryset.annotate(**annotations)
+    
+    def get_bulk_update_values(self, updates):
+        """cpc_value suit cpc (queryset.update contourne Keyword.save)"""
+        if 'cpc' in updates:
+            updates = {**updates, 'cpc_value': parse_cpc(updates['cpc'])}
+        return updates
+    
+    def perform_bulk_update(self, queryset, updates):
+        """Stats des cocons à recalculer si volume / intention changent"""
+        updated_count = super().perform_bulk_update(queryset, updates)
+        if {'volume', 'search_intent'} & set(updates):
+            keyword_ids = self.request.data.get('ids', [])
+            try:
+                from seo_keywords_cocoons.services import CocoonStatsService
+                CocoonStatsService.schedule_refresh_for_keywords(keyword_ids)
+            except ImportError:
+                logger.warning("seo_keywords_cocoons app not available")
+        return updated_count
     
     def _get_cocoons_queryset(self):
         """Queryset optimisé pour cocons"""
@@ -216,18 +212,14 @@ class KeywordViewSet(
         keywords_to_check = request.query_params.get('keyword__in')
         if keywords_to_check:
             keywords_list = keywords_to_check.split(',')
-            existing = self.get_queryset().filter(
-                keyword__in=keywords_list
-            ).values('id', 'keyword', 'volume')
-            
-            existing_keywords = list(existing)
-            existing_texts = [k['keyword'] for k in existing_keywords]
-            missing = [k for k in keywords_list if k not in existing_texts]
+            resolution = KeywordResolutionService.resolve(
+                keywords_list, Keyword.objects.all(), fields=['volume']
+            )
             
             return Response({
-                'count': len(existing_keywords),
-                'results': existing_keywords,
-                'missing': missing,
+                'count': len(resolution['results']),
+                'results': resolution['results'],
+                'missing': resolution['missing'],
                 'checked': len(keywords_list)
             })
         
@@ -314,17 +306,86 @@ class KeywordViewSet(
         if len(query) < 2:
             return Response({'results': []})
         
-        queryset = self.get_queryset().filter(
-            keyword__icontains=query
-        ).annotate(
-            # Annotations légères pour search
-            cocoons_count=Count('cocoon_associations'),
+        # Classement par pertinence (ts_rank + similarité trigramme), puis volume
+        queryset = KeywordSearchService.search(self.get_queryset(), query).annotate(
             has_metrics=Exists(self._get_metrics_subquery())
-        )[:limit]
+        ).order_by('-search_rank', '-volume', 'keyword')[:limit]
         
         serializer = self.get_serializer(queryset, many=True)
         return Response({'results': serializer.data})
     
+    @action(detail=False, methods=['post'])
+    def resolve(self, request):
+        """
+        POST /keywords/resolve/
+        {"keywords": ["assurance auto", ...], "fields": ["volume", "search_intent"]}
+        
+        Résolution en masse texte -> id (casse et espaces normalisés) + manquants
+        """
+        keywords = request.data.get('keywords')
+        if not isinstance(keywords, list) or not all(isinstance(k, str) for k in keywords):
+            return Response(
+                {'error': 'keywords doit être une liste de chaînes'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if len(keywords) > MAX_RESOLVE_KEYWORDS:
+            return Response(
+                {'error': f'Maximum {MAX_RESOLVE_KEYWORDS} mots-clés par requête'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        fields = request.data.get('fields') or []
+        unknown = set(fields) - set(self.RESOLVE_FIELDS)
+        if unknown:
+            return Response(
+                {'error': f"Champs non disponibles: {', '.join(sorted(unknown))}"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        resolution = KeywordResolutionService.resolve(keywords, Keyword.objects.all(), fields=fields)
+        return Response({
+            'count': len(resolution['mapping']),
+            **resolution
+        })
+    
+    RESOLVE_FIELDS = ['volume', 'search_intent', 'cpc', 'cpc_value', 'local_pack', 'created_at']
+    
+    @action(detail=False, methods=['get'])
+    def similar(self, request):
+        """
+        GET /keywords/similar/?q=term&limit=20&threshold=0.3
+        
+        Mots-clés proches (fautes, variantes, ordre des mots) par similarité trigramme
+        """
+        query = request.query_params.get('q', '').strip()
+        if len(query) < 3:
+            return Response({'results': []})
+        
+        try:
+            limit = min(int(request.query_params.get('limit', 20)), 100)
+            threshold = float(request.query_params.get('threshold', DEFAULT_SIMILARITY_THRESHOLD))
+        except ValueError:
+            return Response(
+                {'error': 'limit et threshold doivent être numériques'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        keywords = KeywordSearchService.similar(query, limit=limit, threshold=threshold)
+        return Response({
+            'query': query,
+            'threshold': threshold,
+            'results': [
+                {
+                    'id': keyword.id,
+                    'keyword': keyword.keyword,
+                    'volume': keyword.volume,
+                    'search_intent': keyword.search_intent,
+                    'similarity': round(keyword.similarity, 3)
+                }
+                for keyword in keywords
+            ]
+        })
+    
     @action(detail=False, methods=['get'])
     def export_with_relations(self, request):
         """Export CSV enrichi avec données cross-app"""
@@ -5,3 +5,6 @@ from django.apps import AppConfig
 class SeoKeywordsCocoonsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'seo_keywords_cocoons'
+
+    def ready(self):
+        import seo_keywords_cocoons.signals
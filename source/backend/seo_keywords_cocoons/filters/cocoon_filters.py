@@ -2,14 +2,15 @@
 
 import django_filters
 from django.db import models
-from django.db.models import Count, Q
+from django.db.models import F, Q
+from django.db.models.functions import Coalesce
 from ..models import SemanticCocoon, CocoonCategory
 
 import logging
 logger = logging.getLogger(__name__)
 
 class CocoonFilter(django_filters.FilterSet):
-    """Filtres avancés pour cocons sémantiques"""
+    """Filtres avancés pour cocons sémantiques (compteurs lus dans CocoonStats)"""
     
     # Recherche textuelle
     search = django_filters.CharFilter(method='filter_search')
@@ -63,8 +64,8 @@ class CocoonFilter(django_filters.FilterSet):
     def filter_has_keywords(self, queryset, name, value):
         """Filtre par présence de mots-clés"""
         if value:
-            return queryset.filter(cocoon_keywords__isnull=False).distinct()
-        return queryset.filter(cocoon_keywords__isnull=True)
+            return queryset.filter(stats__keywords_count__gt=0)
+        return queryset.filter(Q(stats__isnull=True) | Q(stats__keywords_count=0))
     
     def filter_keywords_count_min(self, queryset, name, value):
         """Filtre par nombre minimum de mots-clés"""
@@ -73,7 +74,7 @@ class CocoonFilter(django_filters.FilterSet):
             if min_count < 0:
                 return queryset
             return queryset.annotate(
-                kw_count=Count('cocoon_keywords', distinct=True)
+                kw_count=Coalesce(F('stats__keywords_count'), 0)
             ).filter(kw_count__gte=min_count)
         except (ValueError, TypeError):
             logger.warning(f"Invalid keywords_count_min value: {value}")
@@ -86,7 +87,7 @@ class CocoonFilter(django_filters.FilterSet):
             if max_count < 0:
                 return queryset
             return queryset.annotate(
-                kw_count=Count('cocoon_keywords', distinct=True)
+                kw_count=Coalesce(F('stats__keywords_count'), 0)
             ).filter(kw_count__lte=max_count)
         except (ValueError, TypeError):
             logger.warning(f"Invalid keywords_count_max value: {value}")
@@ -0,0 +1,61 @@
+# backend/seo_keywords_cocoons/management/commands/cluster_keywords.py
+
+from django.core.management.base import BaseCommand
+
+from seo_keywords_cocoons.models import ClusteringRun
+from seo_keywords_cocoons.services.keyword_clustering_service import DEFAULT_PARAMETERS, KeywordClusteringService
+from seo_keywords_cocoons.tasks import cluster_keywords_task
+
+
+class Command(BaseCommand):
+    help = 'Regroupe les mots-clés sans cocon et enregistre des propositions de cocons'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--mode',
+            choices=['full', 'incremental'],
+            default='incremental',
+            help='full : tous les mots-clés sans cocon ; incremental : ajoutés depuis le dernier clustering'
+        )
+        parser.add_argument(
+            '--threshold',
+            type=float,
+            default=DEFAULT_PARAMETERS['similarity_threshold'],
+            help=f"Similarité minimale entre voisins (défaut: {DEFAULT_PARAMETERS['similarity_threshold']})"
+        )
+        parser.add_argument(
+            '--block-size',
+            type=int,
+            default=DEFAULT_PARAMETERS['block_size'],
+            help=f"Lignes par bloc de produit matriciel (défaut: {DEFAULT_PARAMETERS['block_size']})"
+        )
+        parser.add_argument(
+            '--async',
+            action='store_true',
+            dest='run_async',
+            help='Lancer via Celery au lieu de traiter dans ce processus'
+        )
+
+    def handle(self, *args, **options):
+        clustering_run = ClusteringRun.objects.create(
+            mode=options['mode'],
+            parameters={
+                'similarity_threshold': options['threshold'],
+                'block_size': options['block_size'],
+            }
+        )
+
+        if options['run_async']:
+            task = cluster_keywords_task.delay(clustering_run.id)
+            clustering_run.task_id = task.id
+            clustering_run.save(update_fields=['task_id', 'updated_at'])
+            self.stdout.write(self.style.SUCCESS(f"✅ Clustering {clustering_run.id} lancé (task {task.id})"))
+            return
+
+        self.stdout.write(f"🔄 Clustering {options['mode']} #{clustering_run.id}...")
+        stats = KeywordClusteringService.run(clustering_run)
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ {stats['total_keywords']} mots-clés : {stats['proposals']} propositions, "
+            f"{stats['assigned_keywords']} rattachés à des cocons existants, "
+            f"{stats['unclustered_keywords']} isolés"
+        ))
@@ -0,0 +1,22 @@
+# backend/seo_keywords_cocoons/management/commands/recompute_cocoon_stats.py
+
+from django.core.management.base import BaseCommand
+
+from seo_keywords_cocoons.services.cocoon_stats_service import RECOMPUTE_BATCH_SIZE, CocoonStatsService
+
+
+class Command(BaseCommand):
+    help = 'Recalcule CocoonStats pour tous les cocons (une requête groupée, upsert par lots)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=RECOMPUTE_BATCH_SIZE,
+            help=f'Taille des lots d\'écriture (défaut: {RECOMPUTE_BATCH_SIZE})'
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write("🔄 Recalcul des statistiques de cocons...")
+        recomputed = CocoonStatsService.recompute_all(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f"✅ {recomputed} cocons recalculés"))
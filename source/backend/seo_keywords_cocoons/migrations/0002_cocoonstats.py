@@ -0,0 +1,55 @@
+# backend/seo_keywords_cocoons/migrations/0002_cocoonstats.py
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def populate_cocoon_stats(apps, schema_editor):
+    from seo_keywords_cocoons.services.cocoon_stats_service import CocoonStatsService
+
+    CocoonStatsService.recompute_all(
+        models=(
+            apps.get_model('seo_keywords_cocoons', 'SemanticCocoon'),
+            apps.get_model('seo_keywords_cocoons', 'CocoonKeyword'),
+            apps.get_model('seo_keywords_cocoons', 'CocoonStats'),
+        ),
+        using=schema_editor.connection.alias,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('seo_keywords_cocoons', '0001_initial'),
+        # avg_kdifficulty lit KeywordMetrics.kdifficulty_value
+        ('seo_keywords_metrics', '0003_backfill_kdifficulty_value'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CocoonStats',
+            fields=[
+                ('cocoon', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='stats', serialize=False, to='seo_keywords_cocoons.semanticcocoon')),
+                ('keywords_count', models.IntegerField(db_index=True, default=0)),
+                ('keywords_with_volume', models.IntegerField(default=0)),
+                ('total_volume', models.BigIntegerField(blank=True, null=True)),
+                ('avg_volume', models.FloatField(blank=True, null=True)),
+                ('max_volume', models.IntegerField(blank=True, null=True)),
+                ('min_volume', models.IntegerField(blank=True, null=True)),
+                ('intent_tofu', models.IntegerField(default=0)),
+                ('intent_mofu', models.IntegerField(default=0)),
+                ('intent_bofu', models.IntegerField(default=0)),
+                ('intent_none', models.IntegerField(default=0)),
+                ('volume_low', models.IntegerField(default=0)),
+                ('volume_medium', models.IntegerField(default=0)),
+                ('volume_high', models.IntegerField(default=0)),
+                ('volume_none', models.IntegerField(default=0)),
+                ('avg_kdifficulty', models.FloatField(blank=True, null=True)),
+                ('computed_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'seo_keywords_cocoons_cocoonstats',
+            },
+        ),
+        migrations.RunPython(populate_cocoon_stats, migrations.RunPython.noop),
+    ]
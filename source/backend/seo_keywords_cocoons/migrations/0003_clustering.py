@@ -0,0 +1,62 @@
+# backend/seo_keywords_cocoons/migrations/0003_clustering.py
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('seo_keywords_cocoons', '0002_cocoonstats'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ClusteringRun',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('mode', models.CharField(choices=[('full', 'Full'), ('incremental', 'Incremental')], default='incremental', max_length=20)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('processing', 'Processing'), ('completed', 'Completed'), ('failed', 'Failed')], default='pending', max_length=20)),
+                ('parameters', models.JSONField(blank=True, default=dict)),
+                ('total_keywords', models.IntegerField(default=0)),
+                ('processed_keywords', models.IntegerField(default=0)),
+                ('proposals_count', models.IntegerField(default=0)),
+                ('assigned_keywords', models.IntegerField(default=0)),
+                ('unclustered_keywords', models.IntegerField(default=0)),
+                ('error_message', models.TextField(blank=True)),
+                ('task_id', models.CharField(blank=True, max_length=255)),
+                ('started_at', models.DateTimeField(blank=True, null=True)),
+                ('completed_at', models.DateTimeField(blank=True, null=True)),
+                ('launched_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='keyword_clustering_runs', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'db_table': 'seo_keywords_cocoons_clusteringrun',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='CocoonProposal',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('kind', models.CharField(choices=[('new', 'New cocoon'), ('extend', 'Extend cocoon')], default='new', max_length=10)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('accepted', 'Accepted'), ('rejected', 'Rejected'), ('superseded', 'Superseded')], db_index=True, default='pending', max_length=20)),
+                ('name', models.CharField(max_length=255)),
+                ('keyword_ids', models.JSONField(default=list)),
+                ('keywords_count', models.IntegerField(default=0)),
+                ('total_volume', models.BigIntegerField(default=0)),
+                ('cohesion', models.FloatField(default=0)),
+                ('run', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='proposals', to='seo_keywords_cocoons.clusteringrun')),
+                ('target_cocoon', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='proposals', to='seo_keywords_cocoons.semanticcocoon')),
+            ],
+            options={
+                'db_table': 'seo_keywords_cocoons_cocoonproposal',
+                'ordering': ['-total_volume'],
+            },
+        ),
+    ]
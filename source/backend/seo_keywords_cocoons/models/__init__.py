@@ -2,5 +2,7 @@
 
 from .cocoon_models import SemanticCocoon, CocoonCategory
 from .association_models import CocoonKeyword
+from .stats_models import CocoonStats
+from .clustering_models import ClusteringRun, CocoonProposal
 
-__all__ = ['SemanticCocoon', 'CocoonCategory', 'CocoonKeyword']
\ No newline at end of file
+__all__ = ['SemanticCocoon', 'CocoonCategory', 'CocoonKeyword', 'CocoonStats', 'ClusteringRun', 'CocoonProposal']
@@ -0,0 +1,104 @@
+# backend/seo_keywords_cocoons/models/clustering_models.py
+
+from django.db import models
+from common.models.mixins import TimestampedMixin
+
+class ClusteringRun(TimestampedMixin):
+    """Exécution du clustering de mots-clés (KeywordClusteringService) - suivi de progression"""
+
+    MODES = [
+        ('full', 'Full'),
+        ('incremental', 'Incremental'),
+    ]
+
+    STATUS_CHOICES = [
+        ('pending', 'Pending'),
+        ('processing', 'Processing'),
+        ('completed', 'Completed'),
+        ('failed', 'Failed'),
+    ]
+
+    mode = models.CharField(max_length=20, choices=MODES, default='incremental')
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
+
+    # Seuils et tailles de blocs (voir DEFAULT_PARAMETERS du service)
+    parameters = models.JSONField(default=dict, blank=True)
+
+    # Progression : mots-clés candidats traités par blocs
+    total_keywords = models.IntegerField(default=0)
+    processed_keywords = models.IntegerField(default=0)
+    proposals_count = models.IntegerField(default=0)
+    assigned_keywords = models.IntegerField(default=0)
+    unclustered_keywords = models.IntegerField(default=0)
+
+    error_message = models.TextField(blank=True)
+    task_id = models.CharField(max_length=255, blank=True)
+    launched_by = models.ForeignKey(
+        'users_core.CustomUser',
+        on_delete=models.SET_NULL,
+        null=True, blank=True,
+        related_name='keyword_clustering_runs'
+    )
+    started_at = models.DateTimeField(null=True, blank=True)
+    completed_at = models.DateTimeField(null=True, blank=True)
+
+    @property
+    def progress_percentage(self):
+        if self.status == 'completed':
+            return 100
+        if not self.total_keywords:
+            return 0
+        return min(99, int(self.processed_keywords * 100 / self.total_keywords))
+
+    def __str__(self):
+        return f"Clustering {self.mode} #{self.pk}"
+
+    class Meta:
+        db_table = 'seo_keywords_cocoons_clusteringrun'
+        ordering = ['-created_at']
+
+
+class CocoonProposal(TimestampedMixin):
+    """
+    Proposition issue d'un clustering : nouveau cocon, ou mots-clés à
+    ajouter à un cocon existant (target_cocoon)
+    """
+
+    KINDS = [
+        ('new', 'New cocoon'),
+        ('extend', 'Extend cocoon'),
+    ]
+
+    STATUS_CHOICES = [
+        ('pending', 'Pending'),
+        ('accepted', 'Accepted'),
+        ('rejected', 'Rejected'),
+        ('superseded', 'Superseded'),
+    ]
+
+    run = models.ForeignKey(ClusteringRun, on_delete=models.CASCADE, related_name='proposals')
+    kind = models.CharField(max_length=10, choices=KINDS, default='new')
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending', db_index=True)
+
+    name = models.CharField(max_length=255)
+    # Cocon étendu ('extend') ou créé à l'acceptation ('new')
+    target_cocoon = models.ForeignKey(
+        'SemanticCocoon',
+        on_delete=models.SET_NULL,
+        null=True, blank=True,
+        related_name='proposals'
+    )
+
+    # Ids Keyword, du plus fort volume au plus faible
+    keyword_ids = models.JSONField(default=list)
+    keywords_count = models.IntegerField(default=0)
+    total_volume = models.BigIntegerField(default=0)
+    # Similarité moyenne au centroïde (0-1)
+    cohesion = models.FloatField(default=0)
+
+    def __str__(self):
+        return f"{self.name} ({self.keywords_count} mots-clés)"
+
+    class Meta:
+        db_table = 'seo_keywords_cocoons_cocoonproposal'
+        ordering = ['-total_volume']
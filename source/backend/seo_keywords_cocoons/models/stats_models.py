@@ -0,0 +1,51 @@
+# backend/seo_keywords_cocoons/models/stats_models.py
+
+from django.db import models
+
+class CocoonStats(models.Model):
+    """
+    Statistiques matérialisées d'un cocon (une ligne par cocon)
+
+    Maintenues par CocoonStatsService : recalcul ciblé après chaque
+    modification de CocoonKeyword / Keyword / KeywordMetrics (signals),
+    recalcul complet en une requête groupée (recompute_all).
+    """
+
+    cocoon = models.OneToOneField(
+        'SemanticCocoon',
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='stats'
+    )
+
+    keywords_count = models.IntegerField(default=0, db_index=True)
+    keywords_with_volume = models.IntegerField(default=0)
+
+    # Volumes
+    total_volume = models.BigIntegerField(null=True, blank=True)
+    avg_volume = models.FloatField(null=True, blank=True)
+    max_volume = models.IntegerField(null=True, blank=True)
+    min_volume = models.IntegerField(null=True, blank=True)
+
+    # Distribution par intention
+    intent_tofu = models.IntegerField(default=0)
+    intent_mofu = models.IntegerField(default=0)
+    intent_bofu = models.IntegerField(default=0)
+    intent_none = models.IntegerField(default=0)
+
+    # Tranches de volume (< 1000, 1000-9999, >= 10000, sans volume)
+    volume_low = models.IntegerField(default=0)
+    volume_medium = models.IntegerField(default=0)
+    volume_high = models.IntegerField(default=0)
+    volume_none = models.IntegerField(default=0)
+
+    # Difficulté moyenne (KeywordMetrics.kdifficulty_value)
+    avg_kdifficulty = models.FloatField(null=True, blank=True)
+
+    computed_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Stats for cocoon {self.cocoon_id}"
+
+    class Meta:
+        db_table = 'seo_keywords_cocoons_cocoonstats'
@@ -10,6 +10,11 @@ from .association_serializers import (
     CocoonKeywordSerializer,
     CocoonKeywordListSerializer
 )
+from .clustering_serializers import (
+    ClusteringRunSerializer,
+    CocoonProposalListSerializer,
+    CocoonProposalSerializer
+)
 
 __all__ = [
     # Cocoon serializers
@@ -20,5 +25,10 @@ __all__ = [
     
     # Association serializers
     'CocoonKeywordSerializer',
-    'CocoonKeywordListSerializer'
+    'CocoonKeywordListSerializer',
+    
+    # Clustering serializers
+    'ClusteringRunSerializer',
+    'CocoonProposalListSerializer',
+    'CocoonProposalSerializer'
 ]
\ No newline at end of file
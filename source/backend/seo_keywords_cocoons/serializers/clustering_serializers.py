@@ -0,0 +1,77 @@
+# backend/seo_keywords_cocoons/serializers/clustering_serializers.py
+
+from rest_framework import serializers
+from common.serializers.mixins import TimestampedSerializer
+from seo_keywords_base.models import Keyword
+from ..models import ClusteringRun, CocoonProposal
+from ..services.keyword_clustering_service import DEFAULT_PARAMETERS
+
+
+class ClusteringRunSerializer(TimestampedSerializer):
+    """Lancement d'un clustering + suivi de progression"""
+    
+    progress_percentage = serializers.IntegerField(read_only=True)
+    launched_by_username = serializers.CharField(source='launched_by.username', read_only=True, default=None)
+    
+    class Meta:
+        model = ClusteringRun
+        fields = [
+            'id', 'mode', 'status', 'parameters',
+            'total_keywords', 'processed_keywords', 'progress_percentage',
+            'proposals_count', 'assigned_keywords', 'unclustered_keywords',
+            'error_message', 'task_id', 'launched_by', 'launched_by_username',
+            'started_at', 'completed_at', 'created_at', 'updated_at'
+        ]
+        read_only_fields = [
+            'status', 'total_keywords', 'processed_keywords',
+            'proposals_count', 'assigned_keywords', 'unclustered_keywords',
+            'error_message', 'task_id', 'launched_by',
+            'started_at', 'completed_at', 'created_at', 'updated_at'
+        ]
+    
+    def validate_parameters(self, value):
+        if not isinstance(value, dict):
+            raise serializers.ValidationError("Objet attendu : {\"paramètre\": valeur}")
+        unknown = set(value) - set(DEFAULT_PARAMETERS)
+        if unknown:
+            raise serializers.ValidationError(
+                f"Paramètres inconnus : {', '.join(sorted(unknown))} "
+                f"(autorisés : {', '.join(DEFAULT_PARAMETERS)})"
+            )
+        for name, parameter in value.items():
+            if not isinstance(parameter, (int, float)) or isinstance(parameter, bool) or parameter <= 0:
+                raise serializers.ValidationError(f"{name} : nombre positif attendu")
+            if isinstance(DEFAULT_PARAMETERS[name], int) and not isinstance(parameter, int):
+                raise serializers.ValidationError(f"{name} : entier attendu")
+            if isinstance(DEFAULT_PARAMETERS[name], float) and parameter > 1:
+                raise serializers.ValidationError(f"{name} : valeur entre 0 et 1 attendue")
+        return value
+
+
+class CocoonProposalListSerializer(serializers.ModelSerializer):
+    """Serializer optimisé pour liste (sans les ids de mots-clés)"""
+    
+    target_cocoon_name = serializers.CharField(source='target_cocoon.name', read_only=True, default=None)
+    
+    class Meta:
+        model = CocoonProposal
+        fields = [
+            'id', 'run', 'kind', 'status', 'name', 'target_cocoon', 'target_cocoon_name',
+            'keywords_count', 'total_volume', 'cohesion', 'created_at'
+        ]
+
+
+class CocoonProposalSerializer(CocoonProposalListSerializer):
+    """Détail : mots-clés proposés (id, texte, volume)"""
+    
+    keywords = serializers.SerializerMethodField()
+    
+    class Meta(CocoonProposalListSerializer.Meta):
+        fields = CocoonProposalListSerializer.Meta.fields + ['keyword_ids', 'keywords', 'updated_at']
+    
+    def get_keywords(self, obj):
+        keywords = {
+            row['id']: row
+            for row in Keyword.objects.filter(id__in=obj.keyword_ids).values('id', 'keyword', 'volume')
+        }
+        return [keywords[keyword_id] for keyword_id in obj.keyword_ids if keyword_id in keywords]
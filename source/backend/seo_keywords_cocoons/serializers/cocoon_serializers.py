@@ -56,6 +56,9 @@ class SemanticCocoonListSerializer(serializers.ModelSerializer):
     categories_names = serializers.StringRelatedField(source='categories', many=True, read_only=True)
     categories_colors = serializers.SerializerMethodField()
     keywords_count = serializers.IntegerField(read_only=True)
+    # Stats matérialisées (CocoonStats, chargées par select_related)
+    total_volume = serializers.IntegerField(source='stats.total_volume', read_only=True, default=None)
+    avg_volume = serializers.FloatField(source='stats.avg_volume', read_only=True, default=None)
     needs_sync = serializers.SerializerMethodField()
     sync_status = serializers.SerializerMethodField()
     
@@ -64,6 +67,7 @@ class SemanticCocoonListSerializer(serializers.ModelSerializer):
         fields = [
             'id', 'name', 'slug', 'description', 
             'categories_names', 'categories_colors', 'keywords_count', 
+            'total_volume', 'avg_volume',
             'needs_sync', 'sync_status', 'openai_storage_type',
             'created_at', 'updated_at'
         ]
@@ -1,5 +1,6 @@
 # backend/seo_keywords_cocoons/services/__init__.py
 
 from .cocoon_stats_service import CocoonStatsService
+from .keyword_clustering_service import KeywordClusteringService
 
-__all__ = ['CocoonStatsService']
\ No newline at end of file
+__all__ = ['CocoonStatsService', 'KeywordClusteringService']
@@ -1,138 +1,277 @@
 # backend/seo_keywords_cocoons/services/cocoon_stats_service.py
 
-from django.db.models import Avg, Sum, Max, Min, Count, Q
-from django.core.exceptions import ObjectDoesNotExist
-from ..models import SemanticCocoon
+from django.db import connections, router, transaction
+from django.db.models import Count, Max, Min, Q, Sum, Avg
+from ..models import SemanticCocoon, CocoonKeyword, CocoonStats
 
 import logging
 logger = logging.getLogger(__name__)
 
+INTENT_LABELS = {
+    'TOFU': 'Top of Funnel',
+    'MOFU': 'Middle of Funnel',
+    'BOFU': 'Bottom of Funnel'
+}
+
+# Champ CocoonStats -> intention (None : non définie)
+INTENT_FIELDS = {
+    'intent_tofu': 'TOFU',
+    'intent_mofu': 'MOFU',
+    'intent_bofu': 'BOFU',
+    'intent_none': None,
+}
+
+STATS_FIELDS = [
+    'keywords_count', 'keywords_with_volume',
+    'total_volume', 'avg_volume', 'max_volume', 'min_volume',
+    *INTENT_FIELDS,
+    'volume_low', 'volume_medium', 'volume_high', 'volume_none',
+    'avg_kdifficulty',
+]
+
+RECOMPUTE_BATCH_SIZE = 1000
+
+
 class CocoonStatsService:
-    """Service pour calculs statistiques avancés des cocons"""
-    
+    """Service pour calculs statistiques avancés des cocons (table CocoonStats)"""
+
     @staticmethod
     def get_cocoon_stats(cocoon_id: int) -> dict:
         """
-        Calcule toutes les statistiques d'un cocon
-        
+        Statistiques d'un cocon, lues dans CocoonStats (calculées si absentes)
+
         Returns:
             dict: Stats complètes avec métriques mots-clés et distribution
         """
         try:
-            cocoon = SemanticCocoon.objects.select_related().prefetch_related(
-                'categories', 
-                'cocoon_keywords__keyword'
-            ).get(id=cocoon_id)
-            
-            # Stats de base
-            base_stats = {
-                'id': cocoon.id,
-                'name': cocoon.name,
-                'keywords_count': cocoon.cocoon_keywords.count(),
-                'categories_count': cocoon.categories.count(),
-                'needs_sync': cocoon.needs_sync(),
-                'last_sync': cocoon.last_pushed_at,
-            }
-            
-            # Stats avancées si mots-clés présents
-            if base_stats['keywords_count'] > 0:
-                keyword_metrics = CocoonStatsService._calculate_keyword_metrics(cocoon)
-                intent_distribution = CocoonStatsService._calculate_intent_distribution(cocoon)
-                volume_ranges = CocoonStatsService._calculate_volume_ranges(cocoon)
-                
-                base_stats.update({
-                    **keyword_metrics,
-                    'intent_distribution': intent_distribution,
-                    'volume_ranges': volume_ranges
-                })
-            
-            logger.info(f"Stats calculated for cocoon {cocoon_id} - {base_stats['keywords_count']} keywords")
-            return base_stats
-            
+            cocoon = SemanticCocoon.objects.select_related('stats').get(id=cocoon_id)
         except SemanticCocoon.DoesNotExist:
             logger.warning(f"Cocoon {cocoon_id} not found")
             raise ValueError(f"Cocon {cocoon_id} introuvable")
-        except Exception as e:
-            logger.error(f"Error calculating stats for cocoon {cocoon_id}: {e}", exc_info=True)
-            raise
-    
+
+        try:
+            stats = cocoon.stats
+        except CocoonStats.DoesNotExist:
+            CocoonStatsService.refresh_stats([cocoon.id])
+            stats = CocoonStats.objects.get(cocoon_id=cocoon.id)
+
+        base_stats = {
+            'id': cocoon.id,
+            'name': cocoon.name,
+            'keywords_count': stats.keywords_count,
+            'categories_count': cocoon.categories.count(),
+            'needs_sync': cocoon.needs_sync(),
+            'last_sync': cocoon.last_pushed_at,
+            'computed_at': stats.computed_at,
+        }
+
+        # Stats avancées si mots-clés présents
+        if stats.keywords_count > 0:
+            base_stats.update({
+                'avg_volume': round(stats.avg_volume, 0) if stats.avg_volume is not None else None,
+                'total_volume': stats.total_volume,
+                'max_volume': stats.max_volume,
+                'min_volume': stats.min_volume,
+                'keywords_with_volume': stats.keywords_with_volume,
+                'avg_kdifficulty': stats.avg_kdifficulty,
+                'intent_distribution': CocoonStatsService.intent_distribution(stats),
+                'volume_ranges': {
+                    'low': stats.volume_low,
+                    'medium': stats.volume_medium,
+                    'high': stats.volume_high,
+                    'no_volume': stats.volume_none,
+                }
+            })
+
+        return base_stats
+
     @staticmethod
-    def _calculate_keyword_metrics(cocoon):
-        """Métriques numériques des mots-clés"""
-        metrics = cocoon.cocoon_keywords.aggregate(
-            avg_volume=Avg('keyword__volume'),
-            total_volume=Sum('keyword__volume'),
-            max_volume=Max('keyword__volume'),
-            min_volume=Min('keyword__volume'),
-            keywords_with_volume=Count('keyword', filter=Q(keyword__volume__isnull=False))
-        )
-        
-        # Arrondir les moyennes
-        if metrics['avg_volume']:
-            metrics['avg_volume'] = round(metrics['avg_volume'], 0)
-        
-        return metrics
-    
-    @staticmethod  
-    def _calculate_intent_distribution(cocoon):
-        """Distribution par intention de recherche"""
-        distribution = list(
-            cocoon.cocoon_keywords
-            .values('keyword__search_intent')
-            .annotate(count=Count('id'))
-            .order_by('-count')
-        )
-        
-        # Nettoyer les noms d'intentions
-        for item in distribution:
-            intent = item['keyword__search_intent']
-            item['intent_label'] = {
-                'TOFU': 'Top of Funnel',
-                'MOFU': 'Middle of Funnel', 
-                'BOFU': 'Bottom of Funnel'
-            }.get(intent, intent or 'Non défini')
-        
+    def intent_distribution(stats):
+        """Distribution par intention (format historique, tri par effectif décroissant)"""
+        distribution = [
+            {
+                'keyword__search_intent': intent,
+                'count': getattr(stats, field),
+                'intent_label': INTENT_LABELS.get(intent, intent or 'Non défini')
+            }
+            for field, intent in INTENT_FIELDS.items()
+            if getattr(stats, field)
+        ]
+        distribution.sort(key=lambda item: -item['count'])
         return distribution
-    
+
+    # ===== CALCUL =====
+
     @staticmethod
-    def _calculate_volume_ranges(cocoon):
-        """Répartition par tranches de volume"""
-        ranges = {
-            'low': cocoon.cocoon_keywords.filter(keyword__volume__lt=1000).count(),
-            'medium': cocoon.cocoon_keywords.filter(
-                keyword__volume__gte=1000, 
-                keyword__volume__lt=10000
-            ).count(),
-            'high': cocoon.cocoon_keywords.filter(keyword__volume__gte=10000).count(),
-            'no_volume': cocoon.cocoon_keywords.filter(keyword__volume__isnull=True).count()
+    def _aggregate(cocoon_keyword_model, cocoon_ids=None):
+        """Une seule requête groupée par cocon : {cocoon_id: {champ: valeur}}"""
+        queryset = cocoon_keyword_model.objects.all()
+        if cocoon_ids is not None:
+            queryset = queryset.filter(cocoon_id__in=cocoon_ids)
+
+        volume = 'keyword__volume'
+        intents = {
+            field: Count('id', filter=Q(keyword__search_intent=intent) if intent
+                         else Q(keyword__search_intent__isnull=True) | Q(keyword__search_intent=''))
+            for field, intent in INTENT_FIELDS.items()
         }
-        
-        return ranges
-    
+        rows = queryset.values('cocoon_id').annotate(
+            keywords_count=Count('id'),
+            keywords_with_volume=Count('id', filter=Q(keyword__volume__isnull=False)),
+            total_volume=Sum(volume),
+            max_volume=Max(volume),
+            min_volume=Min(volume),
+            volume_low=Count('id', filter=Q(keyword__volume__lt=1000)),
+            volume_medium=Count('id', filter=Q(keyword__volume__gte=1000, keyword__volume__lt=10000)),
+            volume_high=Count('id', filter=Q(keyword__volume__gte=10000)),
+            volume_none=Count('id', filter=Q(keyword__volume__isnull=True)),
+            avg_kdifficulty=Avg('keyword__metrics__kdifficulty_value'),
+            **intents
+        ).order_by()
+
+        results = {}
+        for row in rows:
+            cocoon_id = row.pop('cocoon_id')
+            with_volume = row['keywords_with_volume']
+            row['avg_volume'] = row['total_volume'] / with_volume if with_volume else None
+            results[cocoon_id] = row
+        return results
+
+    @classmethod
+    def _write(cls, stats_model, cocoon_ids, aggregated, using):
+        """Upsert des lignes CocoonStats (cocon sans mot-clé : compteurs à zéro)"""
+        empty = {field: stats_model._meta.get_field(field).get_default() for field in STATS_FIELDS}
+        objects = [
+            stats_model(cocoon_id=cocoon_id, **aggregated.get(cocoon_id, empty))
+            for cocoon_id in cocoon_ids
+        ]
+        stats_model.objects.using(using).bulk_create(
+            objects,
+            batch_size=RECOMPUTE_BATCH_SIZE,
+            update_conflicts=True,
+            unique_fields=['cocoon'],
+            update_fields=STATS_FIELDS + ['computed_at'],
+        )
+        return len(objects)
+
+    @classmethod
+    def refresh_stats(cls, cocoon_ids):
+        """Recalcule les stats des cocons donnés (une requête groupée + un upsert)"""
+        cocoon_ids = set(cocoon_ids)
+        if not cocoon_ids:
+            return 0
+        using = router.db_for_write(CocoonStats)
+        # Cocons supprimés entre-temps : ignorés
+        existing = list(
+            SemanticCocoon.objects.using(using).filter(id__in=cocoon_ids).values_list('id', flat=True)
+        )
+        return cls._write(CocoonStats, existing, cls._aggregate(CocoonKeyword, existing), using)
+
+    @classmethod
+    def refresh_for_keywords(cls, keyword_ids):
+        """Recalcule les cocons contenant ces mots-clés (volume, intention, métriques modifiés)"""
+        cocoon_ids = set(
+            CocoonKeyword.objects.filter(keyword_id__in=list(keyword_ids)).values_list('cocoon_id', flat=True)
+        )
+        return cls.refresh_stats(cocoon_ids)
+
+    @classmethod
+    def recompute_all(cls, models=None, using=None, batch_size=RECOMPUTE_BATCH_SIZE):
+        """
+        Recalcul complet : une requête groupée pour tous les cocons puis upsert par lots.
+        `models` : (SemanticCocoon, CocoonKeyword, CocoonStats), modèles historiques en migration.
+        """
+        cocoon_model, cocoon_keyword_model, stats_model = models or (SemanticCocoon, CocoonKeyword, CocoonStats)
+        using = using or router.db_for_write(stats_model)
+
+        aggregated = cls._aggregate(cocoon_keyword_model)
+        cocoon_ids = list(cocoon_model.objects.using(using).order_by('id').values_list('id', flat=True))
+
+        written = 0
+        for start in range(0, len(cocoon_ids), batch_size):
+            with transaction.atomic(using=using):
+                written += cls._write(stats_model, cocoon_ids[start:start + batch_size], aggregated, using)
+
+        logger.info(f"Cocoon stats recomputed for {written} cocoons")
+        return written
+
+    # ===== MAINTENANCE INCRÉMENTALE =====
+
+    @classmethod
+    def schedule_refresh(cls, cocoon_ids):
+        """
+        Recalcul après commit de la transaction courante, regroupé : une
+        transaction qui touche 500 associations d'un cocon déclenche un seul
+        recalcul. Hors transaction, recalcul immédiat.
+        """
+        cocoon_ids = {cocoon_id for cocoon_id in cocoon_ids if cocoon_id}
+        if not cocoon_ids:
+            return
+
+        using = router.db_for_write(CocoonStats)
+        connection = connections[using]
+        if not connection.in_atomic_block:
+            cls._safe_refresh(cocoon_ids)
+            return
+
+        # Callback déjà enregistré pour cette transaction ? (retiré en cas de rollback)
+        pending = getattr(connection, '_cocoon_stats_pending', None)
+        if pending is None or pending.done or not any(entry[1] is pending for entry in connection.run_on_commit):
+            pending = _PendingRefresh(cls)
+            connection._cocoon_stats_pending = pending
+            transaction.on_commit(pending, using=using)
+        pending.cocoon_ids |= cocoon_ids
+
+    @classmethod
+    def schedule_refresh_for_keywords(cls, keyword_ids):
+        cocoon_ids = CocoonKeyword.objects.filter(
+            keyword_id__in=list(keyword_ids)
+        ).values_list('cocoon_id', flat=True)
+        cls.schedule_refresh(set(cocoon_ids))
+
+    @classmethod
+    def _safe_refresh(cls, cocoon_ids):
+        # Données dérivées : un échec ne doit pas casser l'écriture d'origine
+        try:
+            cls.refresh_stats(cocoon_ids)
+        except Exception as e:
+            logger.error(f"Error refreshing stats for cocoons {sorted(cocoon_ids)}: {e}", exc_info=True)
+
     @staticmethod
     def get_cocoons_overview() -> dict:
         """Vue d'ensemble de tous les cocons"""
         try:
             total_cocoons = SemanticCocoon.objects.count()
-            cocoons_with_keywords = SemanticCocoon.objects.filter(
-                cocoon_keywords__isnull=False
-            ).distinct().count()
-            
+            cocoons_with_keywords = CocoonStats.objects.filter(keywords_count__gt=0).count()
+
             # Top 5 des cocons les plus fournis
-            top_cocoons = list(
-                SemanticCocoon.objects.annotate(
-                    kw_count=Count('cocoon_keywords')
-                ).filter(kw_count__gt=0).order_by('-kw_count')[:5]
-                .values('id', 'name', 'kw_count')
-            )
-            
+            top_cocoons = [
+                {'id': row['cocoon_id'], 'name': row['cocoon__name'], 'kw_count': row['keywords_count']}
+                for row in CocoonStats.objects.filter(keywords_count__gt=0)
+                .order_by('-keywords_count')[:5]
+                .values('cocoon_id', 'cocoon__name', 'keywords_count')
+            ]
+
             return {
                 'total_cocoons': total_cocoons,
                 'cocoons_with_keywords': cocoons_with_keywords,
                 'cocoons_empty': total_cocoons - cocoons_with_keywords,
                 'top_cocoons': top_cocoons
             }
-            
+
         except Exception as e:
             logger.error(f"Error calculating cocoons overview: {e}", exc_info=True)
-            raise
\ No newline at end of file
+            raise
+
+
+class _PendingRefresh:
+    """Callback on_commit accumulant les cocons à recalculer"""
+
+    def __init__(self, service):
+        self.service = service
+        self.cocoon_ids = set()
+        self.done = False
+
+    def __call__(self):
+        self.done = True
+        self.service._safe_refresh(self.cocoon_ids)
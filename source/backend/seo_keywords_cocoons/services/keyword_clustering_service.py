@@ -0,0 +1,531 @@
+# backend/seo_keywords_cocoons/services/keyword_clustering_service.py
+"""
+Clustering de mots-clés pour proposer des cocons sémantiques
+
+- Chaque mot-clé devient un vecteur creux (scipy.sparse) : TF-IDF sur les
+  n-grammes de caractères (3 à 5, hachés sur N_FEATURES colonnes) concaténé
+  aux URLs du SERP (search_results), pondéré par serp_weight
+- Voisins : produit matriciel creux par blocs de block_size lignes, seuil
+  de similarité cosinus puis top_k voisins par ligne (jamais de matrice N x N)
+- Clusters : composantes connexes du graphe des voisins ; une composante
+  trop grande (effet de chaîne) est redécoupée avec un seuil plus élevé
+- Incrémental : les mots-clés candidats proches du centroïde d'un cocon
+  existant lui sont proposés ('extend'), les autres sont regroupés entre eux
+
+Le calcul (cluster) est pur NumPy/SciPy ; run() charge les mots-clés par
+tranches, écrit les CocoonProposal et rapporte la progression au ClusteringRun.
+"""
+
+import math
+import unicodedata
+import zlib
+from dataclasses import dataclass, field
+from datetime import timedelta
+from urllib.parse import urlsplit
+
+import numpy as np
+from django.db import transaction
+from django.utils import timezone
+from scipy import sparse
+from scipy.sparse.csgraph import connected_components
+
+from seo_keywords_base.models import Keyword
+from ..models import CocoonKeyword, CocoonProposal, ClusteringRun, SemanticCocoon
+
+import logging
+logger = logging.getLogger(__name__)
+
+NGRAM_RANGE = (3, 5)
+N_FEATURES = 2 ** 20
+SERP_TOP_N = 10
+FETCH_CHUNK_SIZE = 5000
+# Run actif sans progression (updated_at) depuis ce délai : worker tué, run marqué en échec
+STALE_RUN_MINUTES = 60
+ACTIVE_RUN_STATUSES = ['pending', 'processing']
+
+DEFAULT_PARAMETERS = {
+    'similarity_threshold': 0.55,
+    # Rattachement à un cocon existant (similarité au centroïde)
+    'assign_threshold': 0.4,
+    'serp_weight': 0.4,
+    'top_k': 10,
+    'block_size': 2000,
+    'min_cluster_size': 3,
+    'max_cluster_size': 500,
+    # N-grammes présents dans plus de max_df des documents ignorés (bruit, densité du produit)
+    'max_df': 0.05,
+}
+
+
+@dataclass
+class ClusteringResult:
+    """Sortie de KeywordClusteringService.cluster (positions dans la liste d'entrée)"""
+    clusters: list = field(default_factory=list)       # [(positions, cohésion)]
+    assignments: dict = field(default_factory=dict)    # {cocoon_id: [(position, similarité)]}
+    unclustered: list = field(default_factory=list)
+
+
+def normalize_text(text):
+    """Minuscules, accents retirés, espaces normalisés : 'Vélo  Électrique' -> 'velo electrique'"""
+    text = unicodedata.normalize('NFKD', str(text).lower())
+    text = ''.join(char for char in text if not unicodedata.combining(char))
+    return ' '.join(text.split())
+
+
+def char_ngrams(text, ngram_range=NGRAM_RANGE):
+    padded = f' {normalize_text(text)} '
+    low, high = ngram_range
+    for n in range(low, high + 1):
+        for start in range(len(padded) - n + 1):
+            yield padded[start:start + n]
+
+
+def extract_serp_urls(search_results, limit=SERP_TOP_N):
+    """
+    URLs du SERP dans l'ordre de classement, normalisées (domaine + chemin).
+    Format de search_results variable selon la source : on parcourt le JSON
+    et on retient les clés url/link/href et les chaînes http(s).
+    """
+    urls = []
+
+    def walk(node):
+        if len(urls) >= limit:
+            return
+        if isinstance(node, dict):
+            for key in ('url', 'link', 'href'):
+                if isinstance(node.get(key), str):
+                    urls.append(node[key])
+                    return
+            for value in node.values():
+                walk(value)
+        elif isinstance(node, list):
+            for item in node:
+                walk(item)
+        elif isinstance(node, str) and node.startswith(('http://', 'https://')):
+            urls.append(node)
+
+    walk(search_results or {})
+
+    normalized = []
+    for url in urls[:limit]:
+        parts = urlsplit(url if '//' in url else f'//{url}')
+        host = (parts.hostname or '').removeprefix('www.')
+        if host:
+            normalized.append(f"{host}{parts.path.rstrip('/')}")
+    return normalized
+
+
+def _hash(token):
+    return zlib.crc32(token.encode('utf-8')) & (N_FEATURES - 1)
+
+
+def _l2_normalize(matrix):
+    norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+    norms[norms == 0] = 1
+    return sparse.diags(1 / norms) @ matrix
+
+
+class KeywordClusteringService:
+    """Propositions de cocons pour des centaines de milliers de mots-clés"""
+
+    # ===== VECTORISATION =====
+
+    @staticmethod
+    def text_matrix(texts, max_df=DEFAULT_PARAMETERS['max_df']):
+        """TF-IDF (tf sous-linéaire) sur n-grammes de caractères hachés, lignes normalisées L2"""
+        indptr = [0]
+        indices = []
+        for text in texts:
+            indices.extend(_hash(ngram) for ngram in char_ngrams(text))
+            indptr.append(len(indices))
+
+        n_docs = len(texts)
+        matrix = sparse.csr_matrix(
+            (np.ones(len(indices), dtype=np.float32), np.asarray(indices, dtype=np.int32), np.asarray(indptr)),
+            shape=(n_docs, N_FEATURES)
+        )
+        matrix.sum_duplicates()
+        matrix.data = 1 + np.log(matrix.data)
+
+        document_frequency = np.bincount(matrix.indices, minlength=N_FEATURES)
+        idf = (np.log((1 + n_docs) / (1 + document_frequency)) + 1).astype(np.float32)
+        # Petits corpus : pas d'élagage (chaque n-gramme y est « fréquent »)
+        if n_docs >= 1000:
+            idf[document_frequency > max_df * n_docs] = 0
+        matrix.data *= idf[matrix.indices]
+        matrix.eliminate_zeros()
+        return _l2_normalize(matrix).tocsr()
+
+    @staticmethod
+    def serp_matrix(url_lists):
+        """Présence des URLs du SERP (binaire), lignes normalisées L2 ; ligne vide sans SERP"""
+        rows, cols = [], []
+        for row, urls in enumerate(url_lists):
+            for url in set(urls):
+                rows.append(row)
+                cols.append(_hash(url))
+        matrix = sparse.csr_matrix(
+            (np.ones(len(rows), dtype=np.float32), (rows, cols)),
+            shape=(len(url_lists), N_FEATURES)
+        )
+        matrix.data[:] = 1
+        return _l2_normalize(matrix).tocsr()
+
+    @classmethod
+    def feature_matrix(cls, texts, url_lists, serp_weight, max_df=DEFAULT_PARAMETERS['max_df']):
+        """
+        [√(1-w)·texte | √w·SERP] : le produit scalaire de deux lignes vaut
+        (1-w)·cos(texte) + w·cos(SERP). Lignes sans SERP : texte seul (norme 1).
+        """
+        text = cls.text_matrix(texts, max_df)
+        serp = cls.serp_matrix(url_lists)
+        has_serp = np.diff(serp.indptr) > 0
+        text_scale = np.where(has_serp, math.sqrt(1 - serp_weight), 1.0).astype(np.float32)
+        return sparse.hstack(
+            [sparse.diags(text_scale) @ text, serp * np.float32(math.sqrt(serp_weight))],
+            format='csr'
+        )
+
+    # ===== VOISINS ET CLUSTERS =====
+
+    @staticmethod
+    def nearest_neighbours(matrix, threshold, top_k, block_size, progress=None):
+        """
+        Graphe des top_k voisins (similarité >= threshold), calculé par blocs
+        de lignes : la mémoire dépend de block_size, pas de N².
+        Retourne (lignes, colonnes, similarités).
+        """
+        n_rows = matrix.shape[0]
+        transposed = matrix.T.tocsr()
+        rows, cols, sims = [], [], []
+
+        for start in range(0, n_rows, block_size):
+            stop = min(start + block_size, n_rows)
+            block = (matrix[start:stop] @ transposed).tocoo()
+
+            keep = (block.data >= threshold) & (block.col != block.row + start)
+            row, col, sim = block.row[keep], block.col[keep], block.data[keep]
+
+            # Top-k par ligne : tri (ligne, -similarité) puis rang dans la ligne
+            order = np.lexsort((-sim, row))
+            row, col, sim = row[order], col[order], sim[order]
+            counts = np.bincount(row, minlength=stop - start)
+            rank = np.arange(len(row)) - np.repeat(np.cumsum(counts) - counts, counts)
+            top = rank < top_k
+
+            rows.append(row[top] + start)
+            cols.append(col[top])
+            sims.append(sim[top])
+
+            if progress:
+                progress(stop, n_rows)
+
+        if not rows:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+        return np.concatenate(rows), np.concatenate(cols), np.concatenate(sims)
+
+    @staticmethod
+    def connected_clusters(n_nodes, rows, cols, sims, threshold, max_cluster_size, step=0.05):
+        """
+        Composantes connexes du graphe ; une composante de plus de
+        max_cluster_size noeuds est redécoupée sur ses propres arêtes avec
+        un seuil relevé de `step` (jusqu'à 0.95).
+        """
+        graph = sparse.coo_matrix((sims, (rows, cols)), shape=(n_nodes, n_nodes)).tocsr()
+        _, labels = connected_components(graph, directed=True, connection='weak')
+
+        clusters = []
+        for nodes in np.split(np.argsort(labels, kind='stable'), np.cumsum(np.bincount(labels))[:-1]):
+            if len(nodes) <= max_cluster_size or threshold + step > 0.95:
+                clusters.append(nodes)
+                continue
+            sub_graph = graph[nodes][:, nodes].tocoo()
+            keep = sub_graph.data >= threshold + step
+            for sub_nodes in KeywordClusteringService.connected_clusters(
+                len(nodes), sub_graph.row[keep], sub_graph.col[keep], sub_graph.data[keep],
+                threshold + step, max_cluster_size, step
+            ):
+                clusters.append(nodes[sub_nodes])
+        return clusters
+
+    @staticmethod
+    def _cohesion(matrix, nodes):
+        """Similarité moyenne des membres au centroïde"""
+        members = matrix[nodes]
+        centroid = np.asarray(members.mean(axis=0)).ravel()
+        norm = np.linalg.norm(centroid)
+        if not norm:
+            return 0.0
+        return float(np.mean(members @ (centroid / norm)))
+
+    @classmethod
+    def cluster(cls, texts, url_lists, cocoon_members=None, parameters=None, progress=None):
+        """
+        Regroupe les mots-clés `texts` (URLs du SERP en `url_lists`).
+
+        cocoon_members : {cocoon_id: [(texte, urls)]} pour le mode incrémental ;
+        l'IDF est appris sur candidats + membres, les candidats assez proches
+        d'un centroïde de cocon lui sont rattachés au lieu d'être regroupés.
+        """
+        params = {**DEFAULT_PARAMETERS, **(parameters or {})}
+        result = ClusteringResult()
+        n_candidates = len(texts)
+        if not n_candidates:
+            return result
+
+        cocoon_members = cocoon_members or {}
+        member_texts, member_urls, member_cocoons = [], [], []
+        for cocoon_id, members in cocoon_members.items():
+            for text, urls in members:
+                member_texts.append(text)
+                member_urls.append(urls)
+                member_cocoons.append(cocoon_id)
+
+        matrix = cls.feature_matrix(
+            list(texts) + member_texts, list(url_lists) + member_urls, params['serp_weight'], params['max_df']
+        )
+        candidates = matrix[:n_candidates]
+        remaining = np.arange(n_candidates)
+
+        if member_texts:
+            remaining = cls._assign_to_cocoons(candidates, matrix[n_candidates:], member_cocoons, params, result)
+            if not len(remaining):
+                return result
+
+        sub_matrix = candidates[remaining]
+        rows, cols, sims = cls.nearest_neighbours(
+            sub_matrix, params['similarity_threshold'], params['top_k'], params['block_size'], progress
+        )
+        for nodes in cls.connected_clusters(
+            len(remaining), rows, cols, sims, params['similarity_threshold'], params['max_cluster_size']
+        ):
+            positions = remaining[nodes]
+            if len(nodes) >= params['min_cluster_size']:
+                result.clusters.append((positions.tolist(), cls._cohesion(sub_matrix, nodes)))
+            else:
+                result.unclustered.extend(positions.tolist())
+
+        return result
+
+    @staticmethod
+    def _assign_to_cocoons(candidates, members, member_cocoons, params, result):
+        """Rattache les candidats au cocon le plus proche ; retourne les positions non rattachées"""
+        cocoon_ids, member_index = np.unique(np.asarray(member_cocoons), return_inverse=True)
+        membership = sparse.csr_matrix(
+            (np.ones(len(member_index), dtype=np.float32), (member_index, np.arange(len(member_index)))),
+            shape=(len(cocoon_ids), members.shape[0])
+        )
+        centroids = _l2_normalize(membership @ members).T.tocsr()
+
+        best_cocoon = np.full(candidates.shape[0], -1)
+        best_sim = np.zeros(candidates.shape[0], dtype=np.float32)
+        block_size = params['block_size']
+        for start in range(0, candidates.shape[0], block_size):
+            sims = (candidates[start:start + block_size] @ centroids).toarray()
+            best_cocoon[start:start + block_size] = sims.argmax(axis=1)
+            best_sim[start:start + block_size] = sims.max(axis=1)
+
+        assigned = best_sim >= params['assign_threshold']
+        for position in np.flatnonzero(assigned):
+            result.assignments.setdefault(int(cocoon_ids[best_cocoon[position]]), []).append(
+                (int(position), float(best_sim[position]))
+            )
+        return np.flatnonzero(~assigned)
+
+    # ===== EXÉCUTION (BASE DE DONNÉES) =====
+
+    @staticmethod
+    def candidate_keywords(mode, since=None):
+        """
+        Mots-clés à regrouper : sans cocon, et hors propositions en attente
+        en mode incrémental (créés après le dernier clustering terminé)
+        """
+        queryset = Keyword.objects.filter(cocoon_associations__isnull=True)
+        if mode == 'incremental':
+            if since:
+                queryset = queryset.filter(created_at__gt=since)
+            pending = set()
+            for keyword_ids in CocoonProposal.objects.filter(status='pending').values_list('keyword_ids', flat=True):
+                pending.update(keyword_ids)
+            queryset = queryset.exclude(id__in=pending) if pending else queryset
+        return queryset
+
+    @staticmethod
+    def _load(queryset):
+        """(ids, textes, urls SERP, volumes) lus par tranches"""
+        ids, texts, url_lists, volumes = [], [], [], []
+        rows = queryset.order_by().values_list('id', 'keyword', 'search_results', 'volume')
+        for keyword_id, text, search_results, volume in rows.iterator(chunk_size=FETCH_CHUNK_SIZE):
+            ids.append(keyword_id)
+            texts.append(text)
+            url_lists.append(extract_serp_urls(search_results))
+            volumes.append(volume or 0)
+        return ids, texts, url_lists, volumes
+
+    @classmethod
+    def _load_cocoon_members(cls):
+        members = {}
+        rows = CocoonKeyword.objects.order_by().values_list('cocoon_id', 'keyword__keyword', 'keyword__search_results')
+        for cocoon_id, text, search_results in rows.iterator(chunk_size=FETCH_CHUNK_SIZE):
+            members.setdefault(cocoon_id, []).append((text, extract_serp_urls(search_results)))
+        return members
+
+    @staticmethod
+    def fail_stale_runs():
+        """
+        Marque en échec les runs actifs sans progression depuis STALE_RUN_MINUTES.
+        Un worker tué (OOM, SIGKILL) n'atteint jamais le bloc except de la tâche.
+        """
+        now = timezone.now()
+        failed = ClusteringRun.objects.filter(
+            status__in=ACTIVE_RUN_STATUSES,
+            updated_at__lt=now - timedelta(minutes=STALE_RUN_MINUTES)
+        ).update(
+            status='failed',
+            error_message=f"Interrompu : aucune progression depuis {STALE_RUN_MINUTES} min",
+            completed_at=now,
+            updated_at=now
+        )
+        if failed:
+            logger.warning(f"{failed} clustering(s) bloqué(s) marqué(s) en échec")
+        return failed
+
+    @classmethod
+    def has_active_run(cls):
+        """Un clustering tourne réellement (runs bloqués écartés au passage)"""
+        cls.fail_stale_runs()
+        return ClusteringRun.objects.filter(status__in=ACTIVE_RUN_STATUSES).exists()
+
+    @classmethod
+    def run(cls, clustering_run):
+        """Exécute un ClusteringRun : calcul, écriture des propositions, compteurs"""
+        params = {**DEFAULT_PARAMETERS, **(clustering_run.parameters or {})}
+        clustering_run.parameters = params
+        clustering_run.status = 'processing'
+        clustering_run.started_at = timezone.now()
+        clustering_run.save(update_fields=['parameters', 'status', 'started_at', 'updated_at'])
+
+        since = None
+        if clustering_run.mode == 'incremental':
+            previous = ClusteringRun.objects.filter(status='completed').exclude(pk=clustering_run.pk).first()
+            since = previous.started_at if previous else None
+
+        ids, texts, url_lists, volumes = cls._load(cls.candidate_keywords(clustering_run.mode, since))
+        clustering_run.total_keywords = len(ids)
+        clustering_run.save(update_fields=['total_keywords', 'updated_at'])
+        logger.info(f"Clustering {clustering_run.pk}: {len(ids)} mots-clés candidats")
+
+        def progress(processed, total):
+            clustering_run.processed_keywords = clustering_run.total_keywords - total + processed
+            clustering_run.save(update_fields=['processed_keywords', 'updated_at'])
+
+        # Mode complet : on regroupe tout, sans rattachement aux cocons existants
+        cocoon_members = cls._load_cocoon_members() if clustering_run.mode == 'incremental' else None
+        result = cls.cluster(texts, url_lists, cocoon_members, params, progress)
+
+        proposals = [
+            cls._proposal(clustering_run, 'new', [(position, 0) for position in positions], ids, texts, volumes, cohesion)
+            for positions, cohesion in result.clusters
+        ]
+        names = dict(SemanticCocoon.objects.filter(id__in=result.assignments).values_list('id', 'name'))
+        for cocoon_id, members in result.assignments.items():
+            proposal = cls._proposal(
+                clustering_run, 'extend', members, ids, texts, volumes,
+                float(np.mean([similarity for _, similarity in members]))
+            )
+            proposal.name = names.get(cocoon_id, proposal.name)
+            proposal.target_cocoon_id = cocoon_id
+            proposals.append(proposal)
+
+        with transaction.atomic():
+            if clustering_run.mode == 'full':
+                CocoonProposal.objects.filter(status='pending').exclude(run=clustering_run).update(
+                    status='superseded', updated_at=timezone.now()
+                )
+            CocoonProposal.objects.bulk_create(proposals, batch_size=1000)
+
+            clustering_run.status = 'completed'
+            clustering_run.processed_keywords = len(ids)
+            clustering_run.proposals_count = len(proposals)
+            clustering_run.assigned_keywords = sum(len(members) for members in result.assignments.values())
+            clustering_run.unclustered_keywords = len(result.unclustered)
+            clustering_run.completed_at = timezone.now()
+            clustering_run.save()
+
+        logger.info(
+            f"Clustering {clustering_run.pk}: {len(proposals)} propositions, "
+            f"{clustering_run.unclustered_keywords} mots-clés isolés"
+        )
+        return {
+            'total_keywords': clustering_run.total_keywords,
+            'proposals': clustering_run.proposals_count,
+            'assigned_keywords': clustering_run.assigned_keywords,
+            'unclustered_keywords': clustering_run.unclustered_keywords,
+        }
+
+    @staticmethod
+    def _proposal(clustering_run, kind, members, ids, texts, volumes, cohesion):
+        # Du plus fort volume au plus faible : le premier donne son nom au cocon proposé
+        positions = sorted((position for position, _ in members), key=lambda position: -volumes[position])
+        return CocoonProposal(
+            run=clustering_run,
+            kind=kind,
+            name=texts[positions[0]][:255],
+            keyword_ids=[ids[position] for position in positions],
+            keywords_count=len(positions),
+            total_volume=sum(volumes[position] for position in positions),
+            cohesion=round(cohesion, 4),
+        )
+
+    # ===== VALIDATION DES PROPOSITIONS =====
+
+    @staticmethod
+    def accept_proposal(proposal, name=None):
+        """Crée le cocon (ou étend target_cocoon) et ses CocoonKeyword ; retourne le cocon"""
+        from .cocoon_stats_service import CocoonStatsService
+
+        with transaction.atomic():
+            # Verrou de ligne : deux acceptations concurrentes ne créent pas deux cocons
+            locked = CocoonProposal.objects.select_for_update().get(pk=proposal.pk)
+            if locked.status != 'pending':
+                raise ValueError(f"Proposition déjà traitée ({locked.status})")
+            proposal.status = locked.status
+            proposal.target_cocoon_id = locked.target_cocoon_id
+
+            cocoon = proposal.target_cocoon
+            if proposal.kind == 'extend' and cocoon is None:
+                raise ValueError("Cocon cible supprimé")
+            if cocoon is None:
+                base_name = (name or proposal.name)[:240]
+                cocoon_name, counter = base_name, 1
+                while SemanticCocoon.objects.filter(name=cocoon_name).exists():
+                    counter += 1
+                    cocoon_name = f"{base_name} ({counter})"
+                cocoon = SemanticCocoon.objects.create(name=cocoon_name)
+
+            # Mots-clés supprimés depuis le clustering ignorés
+            keyword_ids = Keyword.objects.filter(id__in=proposal.keyword_ids).values_list('id', flat=True)
+            CocoonKeyword.objects.bulk_create(
+                [CocoonKeyword(cocoon=cocoon, keyword_id=keyword_id) for keyword_id in keyword_ids],
+                batch_size=1000,
+                ignore_conflicts=True
+            )
+
+            proposal.status = 'accepted'
+            proposal.target_cocoon = cocoon
+            proposal.save(update_fields=['status', 'target_cocoon', 'updated_at'])
+
+            # bulk_create ne déclenche pas les signaux CocoonKeyword
+            CocoonStatsService.schedule_refresh([cocoon.id])
+
+        logger.info(f"Proposition {proposal.pk} acceptée -> cocon {cocoon.id}")
+        return cocoon
+
+    @staticmethod
+    def reject_proposal(proposal):
+        with transaction.atomic():
+            locked = CocoonProposal.objects.select_for_update().get(pk=proposal.pk)
+            if locked.status != 'pending':
+                raise ValueError(f"Proposition déjà traitée ({locked.status})")
+            proposal.status = 'rejected'
+            proposal.save(update_fields=['status', 'updated_at'])
@@ -0,0 +1,38 @@
+# backend/seo_keywords_cocoons/signals.py
+
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from seo_keywords_base.models import Keyword
+from seo_keywords_metrics.models import KeywordMetrics
+from .models import SemanticCocoon, CocoonKeyword, CocoonStats
+from .services import CocoonStatsService
+
+# Champs de Keyword entrant dans CocoonStats
+KEYWORD_STATS_FIELDS = {'volume', 'search_intent'}
+
+@receiver(post_save, sender=SemanticCocoon)
+def create_cocoon_stats(sender, instance, created, raw=False, **kwargs):
+    """Ligne de stats vide dès la création du cocon"""
+    if created and not raw:
+        CocoonStats.objects.get_or_create(cocoon=instance)
+
+@receiver(post_save, sender=CocoonKeyword)
+@receiver(post_delete, sender=CocoonKeyword)
+def refresh_stats_on_association_change(sender, instance, raw=False, **kwargs):
+    if not raw:
+        CocoonStatsService.schedule_refresh({instance.cocoon_id})
+
+@receiver(post_save, sender=Keyword)
+def refresh_stats_on_keyword_change(sender, instance, created, raw=False, update_fields=None, **kwargs):
+    # Nouveau mot-clé : encore dans aucun cocon
+    if created or raw:
+        return
+    if update_fields is not None and not KEYWORD_STATS_FIELDS & set(update_fields):
+        return
+    CocoonStatsService.schedule_refresh_for_keywords([instance.id])
+
+@receiver(post_save, sender=KeywordMetrics)
+@receiver(post_delete, sender=KeywordMetrics)
+def refresh_stats_on_metrics_change(sender, instance, raw=False, **kwargs):
+    if not raw:
+        CocoonStatsService.schedule_refresh_for_keywords([instance.keyword_id])
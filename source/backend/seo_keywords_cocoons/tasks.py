@@ -0,0 +1,52 @@
+# backend/seo_keywords_cocoons/tasks.py
+import logging
+from celery import shared_task
+from django.utils import timezone
+
+from .models import ClusteringRun
+from .services import CocoonStatsService, KeywordClusteringService
+
+logger = logging.getLogger(__name__)
+
+@shared_task(bind=True)
+def cluster_keywords_task(self, run_id: int):
+    """Clustering de mots-clés (progression par blocs sur ClusteringRun)"""
+    try:
+        clustering_run = ClusteringRun.objects.get(id=run_id)
+    except ClusteringRun.DoesNotExist:
+        logger.error(f"ClusteringRun {run_id} introuvable")
+        return {"status": "failed", "run_id": run_id}
+
+    try:
+        stats = KeywordClusteringService.run(clustering_run)
+    except Exception as exc:
+        logger.error(f"Erreur clustering mots-clés {run_id}: {str(exc)}", exc_info=True)
+        clustering_run.status = 'failed'
+        clustering_run.error_message = str(exc)
+        clustering_run.completed_at = timezone.now()
+        clustering_run.save(update_fields=['status', 'error_message', 'completed_at', 'updated_at'])
+        return {"status": "failed", "run_id": run_id, "error": str(exc)}
+
+    return {"status": "success", "run_id": run_id, **stats}
+
+
+@shared_task
+def cluster_new_keywords_task():
+    """Clustering incrémental périodique (beat) : mots-clés ajoutés depuis le dernier clustering"""
+    if KeywordClusteringService.has_active_run():
+        logger.info("Clustering déjà en cours, passage ignoré")
+        return {"status": "skipped"}
+
+    clustering_run = ClusteringRun.objects.create(mode='incremental')
+    return cluster_keywords_task(clustering_run.id)
+
+
+@shared_task
+def recompute_cocoon_stats_task():
+    """Recalcul complet de CocoonStats (une requête groupée pour tous les cocons)"""
+    try:
+        recomputed = CocoonStatsService.recompute_all()
+    except Exception as exc:
+        logger.error(f"Erreur recalcul stats cocons: {str(exc)}", exc_info=True)
+        return {"status": "failed", "error": str(exc)}
+    return {"status": "success", "recomputed": recomputed}
@@ -0,0 +1,106 @@
+# backend/seo_keywords_cocoons/tests/test_cocoon_stats.py
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from seo_keywords_base.models import Keyword
+from seo_keywords_metrics.models import KeywordMetrics
+from seo_keywords_cocoons.models import SemanticCocoon, CocoonKeyword, CocoonStats
+from seo_keywords_cocoons.services import CocoonStatsService
+from seo_keywords_cocoons.tasks import recompute_cocoon_stats_task
+
+
+@pytest.mark.django_db
+class TestCocoonStats:
+
+    @pytest.fixture
+    def cocoon(self):
+        return SemanticCocoon.objects.create(name='Assurance', slug='assurance')
+
+    @pytest.fixture
+    def keywords(self):
+        return [
+            Keyword.objects.create(keyword='assurance auto', volume=12000, search_intent='TOFU'),
+            Keyword.objects.create(keyword='assurance moto', volume=500, search_intent='BOFU'),
+            Keyword.objects.create(keyword='assurance velo', search_intent='TOFU'),
+        ]
+
+    def test_stats_row_created_with_cocoon(self, cocoon):
+        assert CocoonStats.objects.get(cocoon=cocoon).keywords_count == 0
+
+    def test_association_changes_refresh_after_commit(self, cocoon, keywords, django_capture_on_commit_callbacks):
+        with django_capture_on_commit_callbacks(execute=True) as callbacks:
+            for keyword in keywords:
+                CocoonKeyword.objects.create(cocoon=cocoon, keyword=keyword)
+
+        # Un seul recalcul pour toute la transaction
+        assert len(callbacks) == 1
+        stats = CocoonStats.objects.get(cocoon=cocoon)
+        assert (stats.keywords_count, stats.keywords_with_volume) == (3, 2)
+        assert (stats.total_volume, stats.min_volume, stats.max_volume, stats.avg_volume) == (12500, 500, 12000, 6250)
+        assert (stats.intent_tofu, stats.intent_bofu, stats.intent_mofu) == (2, 1, 0)
+        assert (stats.volume_low, stats.volume_high, stats.volume_none) == (1, 1, 1)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            CocoonKeyword.objects.filter(keyword=keywords[0]).delete()
+        assert CocoonStats.objects.get(cocoon=cocoon).keywords_count == 2
+
+    def test_keyword_and_metrics_changes_refresh(self, cocoon, keywords, django_capture_on_commit_callbacks):
+        with django_capture_on_commit_callbacks(execute=True):
+            CocoonKeyword.objects.create(cocoon=cocoon, keyword=keywords[1])
+        with django_capture_on_commit_callbacks(execute=True):
+            keywords[1].volume = 2000
+            keywords[1].save()
+            KeywordMetrics.objects.create(keyword=keywords[1], kdifficulty='40')
+
+        stats = CocoonStats.objects.get(cocoon=cocoon)
+        assert stats.total_volume == 2000
+        assert stats.volume_medium == 1
+        assert stats.avg_kdifficulty == 40.0
+
+    def test_rolled_back_savepoint_does_not_lose_refresh(self, cocoon, keywords, django_capture_on_commit_callbacks):
+        with django_capture_on_commit_callbacks(execute=True):
+            try:
+                with transaction.atomic():
+                    CocoonKeyword.objects.create(cocoon=cocoon, keyword=keywords[0])
+                    raise RuntimeError
+            except RuntimeError:
+                pass
+            CocoonKeyword.objects.create(cocoon=cocoon, keyword=keywords[1])
+
+        assert CocoonStats.objects.get(cocoon=cocoon).keywords_count == 1
+
+    def test_recompute_all_and_service_output(self, cocoon, keywords):
+        empty = SemanticCocoon.objects.create(name='Vide', slug='vide')
+        CocoonKeyword.objects.bulk_create([CocoonKeyword(cocoon=cocoon, keyword=k) for k in keywords])
+        CocoonStats.objects.all().delete()
+
+        assert CocoonStatsService.recompute_all() == 2
+        assert CocoonStats.objects.get(cocoon=empty).keywords_count == 0
+
+        stats = CocoonStatsService.get_cocoon_stats(cocoon.id)
+        assert stats['keywords_count'] == 3
+        assert stats['volume_ranges'] == {'low': 1, 'medium': 0, 'high': 1, 'no_volume': 1}
+        assert [(item['keyword__search_intent'], item['count']) for item in stats['intent_distribution']] == [
+            ('TOFU', 2), ('BOFU', 1)
+        ]
+
+        overview = CocoonStatsService.get_cocoons_overview()
+        assert overview['cocoons_with_keywords'] == 1
+        assert overview['top_cocoons'] == [{'id': cocoon.id, 'name': 'Assurance', 'kw_count': 3}]
+
+    def test_recompute_endpoint_is_async(self, cocoon, mocker):
+        delay = mocker.patch('seo_keywords_cocoons.views.cocoon_views.recompute_cocoon_stats_task.delay')
+        delay.return_value.id = 'task-1'
+        client = APIClient()
+        client.force_authenticate(get_user_model().objects.create_user(username='seo', password='x'))
+
+        response = client.post(reverse('seo_cocoons:semantic-cocoons-recompute-stats'))
+
+        assert response.status_code == 202
+        assert response.data == {'task_id': 'task-1'}
+        CocoonStats.objects.all().delete()
+        assert recompute_cocoon_stats_task() == {'status': 'success', 'recomputed': 1}
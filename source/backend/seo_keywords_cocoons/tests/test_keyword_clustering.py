@@ -0,0 +1,177 @@
+# backend/seo_keywords_cocoons/tests/test_keyword_clustering.py
+
+from datetime import timedelta
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from seo_keywords_base.models import Keyword
+from seo_keywords_cocoons.models import ClusteringRun, CocoonKeyword, CocoonProposal, CocoonStats, SemanticCocoon
+from seo_keywords_cocoons.services import KeywordClusteringService
+from seo_keywords_cocoons.services.keyword_clustering_service import extract_serp_urls
+
+TEXTS = [
+    'assurance auto', 'assurance auto pas cher', 'assurance auto jeune conducteur',
+    'credit immobilier', 'credit immobilier taux', 'simulation credit immobilier',
+    'velo electrique', 'vélo électrique pliant', 'velo electrique femme',
+    'recette tarte',
+]
+PARAMETERS = {'similarity_threshold': 0.3}
+
+
+def test_extract_serp_urls():
+    search_results = {
+        'organic': [{'position': 1, 'url': 'https://www.site.fr/page/'}, {'link': 'autre.com/a?x=1'}],
+        'related': ['https://third.org'],
+    }
+    assert extract_serp_urls(search_results) == ['site.fr/page', 'autre.com/a', 'third.org']
+    assert extract_serp_urls(search_results, limit=1) == ['site.fr/page']
+
+
+def test_cluster_groups_by_text_and_isolates_outliers():
+    result = KeywordClusteringService.cluster(TEXTS, [[]] * len(TEXTS), parameters=PARAMETERS)
+
+    assert sorted(sorted(positions) for positions, _ in result.clusters) == [[0, 1, 2], [3, 4, 5], [6, 7, 8]]
+    assert result.unclustered == [9]
+    assert all(0 < cohesion <= 1.0001 for _, cohesion in result.clusters)
+
+
+def test_serp_overlap_links_unrelated_texts():
+    serp = ['https://a.fr/1', 'https://b.fr/2', 'https://c.fr/3']
+    texts = ['mutuelle sante', 'complementaire maladie', 'couverture soins']
+
+    without_serp = KeywordClusteringService.cluster(texts, [[]] * 3, parameters={'min_cluster_size': 2})
+    with_serp = KeywordClusteringService.cluster(
+        texts, [extract_serp_urls(serp)] * 3, parameters={'min_cluster_size': 2, 'serp_weight': 0.6}
+    )
+
+    assert without_serp.clusters == []
+    assert [sorted(positions) for positions, _ in with_serp.clusters] == [[0, 1, 2]]
+
+
+def test_oversized_component_is_split():
+    rows, cols = [0, 1, 2, 3], [1, 2, 3, 4]
+    sims = [0.9, 0.6, 0.9, 0.9]
+
+    clusters = KeywordClusteringService.connected_clusters(5, rows, cols, sims, 0.55, max_cluster_size=3)
+
+    assert sorted(sorted(nodes.tolist()) for nodes in clusters) == [[0, 1], [2, 3, 4]]
+
+
+@pytest.mark.django_db
+class TestClusteringRun:
+
+    @pytest.fixture
+    def keywords(self):
+        return [Keyword.objects.create(keyword=text, volume=100 * (i + 1)) for i, text in enumerate(TEXTS)]
+
+    def test_full_run_and_accept(self, keywords, django_capture_on_commit_callbacks):
+        clustering_run = ClusteringRun.objects.create(mode='full', parameters=PARAMETERS)
+
+        stats = KeywordClusteringService.run(clustering_run)
+
+        clustering_run.refresh_from_db()
+        assert stats == {'total_keywords': 10, 'proposals': 3, 'assigned_keywords': 0, 'unclustered_keywords': 1}
+        assert (clustering_run.status, clustering_run.progress_percentage) == ('completed', 100)
+
+        proposal = CocoonProposal.objects.get(name='assurance auto jeune conducteur')
+        assert proposal.keyword_ids == [keywords[2].id, keywords[1].id, keywords[0].id]
+        assert proposal.total_volume == 600
+
+        with django_capture_on_commit_callbacks(execute=True):
+            cocoon = KeywordClusteringService.accept_proposal(proposal, name='Assurance auto')
+
+        assert cocoon.name == 'Assurance auto'
+        assert set(CocoonKeyword.objects.filter(cocoon=cocoon).values_list('keyword_id', flat=True)) == set(proposal.keyword_ids)
+        assert CocoonStats.objects.get(cocoon=cocoon).keywords_count == 3
+        with pytest.raises(ValueError):
+            KeywordClusteringService.accept_proposal(proposal)
+
+    def test_accept_rechecks_status_under_lock(self, keywords):
+        KeywordClusteringService.run(ClusteringRun.objects.create(mode='full', parameters=PARAMETERS))
+        proposal = CocoonProposal.objects.get(name='assurance auto jeune conducteur')
+        # Deux requêtes concurrentes : chacune a chargé la proposition encore 'pending'
+        concurrent = CocoonProposal.objects.get(pk=proposal.pk)
+
+        KeywordClusteringService.accept_proposal(proposal)
+
+        with pytest.raises(ValueError):
+            KeywordClusteringService.accept_proposal(concurrent)
+        with pytest.raises(ValueError):
+            KeywordClusteringService.reject_proposal(CocoonProposal.objects.get(pk=proposal.pk))
+        assert SemanticCocoon.objects.count() == 1
+
+    def test_stale_active_run_is_failed(self):
+        stale = ClusteringRun.objects.create(mode='full', status='processing')
+        ClusteringRun.objects.filter(pk=stale.pk).update(updated_at=timezone.now() - timedelta(hours=2))
+        assert KeywordClusteringService.has_active_run() is False
+
+        stale.refresh_from_db()
+        assert stale.status == 'failed'
+        assert stale.completed_at is not None
+
+        ClusteringRun.objects.create(mode='full', status='processing')
+        assert KeywordClusteringService.has_active_run() is True
+
+    def test_incremental_run_extends_existing_cocoons(self, keywords):
+        cocoon = SemanticCocoon.objects.create(name='Assurance', slug='assurance')
+        CocoonKeyword.objects.bulk_create([CocoonKeyword(cocoon=cocoon, keyword=k) for k in keywords[:3]])
+        Keyword.objects.create(keyword='assurance auto en ligne', volume=50)
+
+        clustering_run = ClusteringRun.objects.create(mode='incremental', parameters=PARAMETERS)
+        KeywordClusteringService.run(clustering_run)
+
+        extend = CocoonProposal.objects.get(kind='extend')
+        assert extend.target_cocoon == cocoon
+        assert extend.keyword_ids == [Keyword.objects.get(keyword='assurance auto en ligne').id]
+        # Les mots-clés déjà rattachés au cocon ne sont pas candidats
+        assert clustering_run.total_keywords == 8
+        assert CocoonProposal.objects.filter(kind='new').count() == 2
+
+        # Un nouveau passage ne repropose pas les mots-clés en attente
+        second_run = ClusteringRun.objects.create(mode='incremental', parameters=PARAMETERS)
+        KeywordClusteringService.run(second_run)
+        assert second_run.total_keywords == 0
+
+    def test_api(self, keywords, mocker):
+        client = APIClient()
+        client.force_authenticate(get_user_model().objects.create_user(username='seo', password='x'))
+        delay = mocker.patch('seo_keywords_cocoons.views.clustering_views.cluster_keywords_task.delay')
+        delay.return_value.id = 'task-1'
+
+        response = client.post(
+            reverse('seo_cocoons:cocoon-clustering-runs-list'),
+            {'mode': 'full', 'parameters': {'similarity_threshold': 0.3}}, format='json'
+        )
+        assert response.status_code == 201
+        assert response.data['task_id'] == 'task-1'
+        response = client.post(reverse('seo_cocoons:cocoon-clustering-runs-list'), {'mode': 'full'}, format='json')
+        assert response.status_code == 409
+
+        clustering_run = ClusteringRun.objects.get()
+        KeywordClusteringService.run(clustering_run)
+        proposal = CocoonProposal.objects.order_by('-total_volume').first()
+
+        response = client.get(reverse('seo_cocoons:cocoon-proposals-detail', args=[proposal.id]))
+        assert [row['keyword'] for row in response.data['keywords']] == [
+            'velo electrique femme', 'vélo électrique pliant', 'velo electrique'
+        ]
+
+        response = client.post(reverse('seo_cocoons:cocoon-proposals-accept', args=[proposal.id]), format='json')
+        assert response.status_code == 200
+        assert response.data['cocoon_name'] == 'velo electrique femme'
+        response = client.post(reverse('seo_cocoons:cocoon-proposals-reject', args=[proposal.id]), format='json')
+        assert response.status_code == 400
+
+    def test_invalid_parameters_rejected(self):
+        client = APIClient()
+        client.force_authenticate(get_user_model().objects.create_user(username='seo', password='x'))
+
+        response = client.post(
+            reverse('seo_cocoons:cocoon-clustering-runs-list'),
+            {'mode': 'full', 'parameters': {'similarity_threshold': 2, 'unknown': 1}}, format='json'
+        )
+        assert response.status_code == 400
@@ -1,12 +1,14 @@
 # backend/seo_keywords_cocoons/urls.py
 
 from rest_framework import routers
-from .views import SemanticCocoonViewSet, CocoonCategoryViewSet
+from .views import SemanticCocoonViewSet, CocoonCategoryViewSet, ClusteringRunViewSet, CocoonProposalViewSet
 
 router = routers.DefaultRouter()
 
 # 🔥 ORDRE CRUCIAL : Spécifique d'abord, générique ensuite
 router.register(r'categories', CocoonCategoryViewSet, basename='cocoon-categories')
+router.register(r'clustering/runs', ClusteringRunViewSet, basename='cocoon-clustering-runs')
+router.register(r'clustering/proposals', CocoonProposalViewSet, basename='cocoon-proposals')
 router.register(r'', SemanticCocoonViewSet, basename='semantic-cocoons')
 
-urlpatterns = router.urls
\ No newline at end of file
+urlpatterns = router.urls
@@ -2,5 +2,9 @@
 
 from .cocoon_views import SemanticCocoonViewSet, CocoonCategoryViewSet
 from .association_views import CocoonKeywordViewSet
+from .clustering_views import ClusteringRunViewSet, CocoonProposalViewSet
 
-__all__ = ['SemanticCocoonViewSet', 'CocoonCategoryViewSet', 'CocoonKeywordViewSet']
\ No newline at end of file
+__all__ = [
+    'SemanticCocoonViewSet', 'CocoonCategoryViewSet', 'CocoonKeywordViewSet',
+    'ClusteringRunViewSet', 'CocoonProposalViewSet'
+]
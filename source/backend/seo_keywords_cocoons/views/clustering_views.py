@@ -0,0 +1,105 @@
+# backend/seo_keywords_cocoons/views/clustering_views.py
+
+from rest_framework import mixins, viewsets, status
+from rest_framework.decorators import action
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from django_filters.rest_framework import DjangoFilterBackend
+
+from ..models import ClusteringRun, CocoonProposal
+from ..serializers import (
+    ClusteringRunSerializer,
+    CocoonProposalListSerializer,
+    CocoonProposalSerializer
+)
+from ..services import KeywordClusteringService
+from ..tasks import cluster_keywords_task
+
+import logging
+logger = logging.getLogger(__name__)
+
+class ClusteringRunViewSet(
+    mixins.CreateModelMixin,
+    mixins.ListModelMixin,
+    mixins.RetrieveModelMixin,
+    viewsets.GenericViewSet
+):
+    """
+    🧮 CLUSTERING DE MOTS-CLÉS (propositions de cocons)
+    
+    Endpoints:
+    - POST /seo/cocoons/clustering/runs/ : Lancement (mode full|incremental, parameters optionnels)
+    - GET /seo/cocoons/clustering/runs/ : Historique
+    - GET /seo/cocoons/clustering/runs/{id}/ : Progression et compteurs
+    """
+    
+    queryset = ClusteringRun.objects.select_related('launched_by')
+    serializer_class = ClusteringRunSerializer
+    permission_classes = [IsAuthenticated]
+    
+    def create(self, request, *args, **kwargs):
+        if KeywordClusteringService.has_active_run():
+            return Response(
+                {'error': 'Un clustering est déjà en cours'},
+                status=status.HTTP_409_CONFLICT
+            )
+        return super().create(request, *args, **kwargs)
+    
+    def perform_create(self, serializer):
+        clustering_run = serializer.save(launched_by=self.request.user)
+        
+        # Traitement asynchrone : la progression se lit sur le run
+        task = cluster_keywords_task.delay(clustering_run.id)
+        clustering_run.task_id = task.id
+        clustering_run.save(update_fields=['task_id', 'updated_at'])
+        logger.info(f"Clustering {clustering_run.id} lancé (task {task.id})")
+
+
+class CocoonProposalViewSet(
+    mixins.ListModelMixin,
+    mixins.RetrieveModelMixin,
+    viewsets.GenericViewSet
+):
+    """
+    📋 PROPOSITIONS DE COCONS
+    
+    Endpoints:
+    - GET /seo/cocoons/clustering/proposals/ : Liste (filtres run, status, kind)
+    - GET /seo/cocoons/clustering/proposals/{id}/ : Détail avec mots-clés
+    - POST /seo/cocoons/clustering/proposals/{id}/accept/ : Crée/étend le cocon (name optionnel)
+    - POST /seo/cocoons/clustering/proposals/{id}/reject/ : Écarte la proposition
+    """
+    
+    queryset = CocoonProposal.objects.select_related('target_cocoon')
+    permission_classes = [IsAuthenticated]
+    filter_backends = [DjangoFilterBackend]
+    filterset_fields = ['run', 'status', 'kind']
+    
+    def get_serializer_class(self):
+        """Serializer par action"""
+        if self.action == 'list':
+            return CocoonProposalListSerializer
+        return CocoonProposalSerializer
+    
+    @action(detail=True, methods=['post'])
+    def accept(self, request, pk=None):
+        proposal = self.get_object()
+        try:
+            cocoon = KeywordClusteringService.accept_proposal(proposal, name=request.data.get('name'))
+        except ValueError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        
+        return Response({
+            'proposal': CocoonProposalListSerializer(proposal).data,
+            'cocoon_id': cocoon.id,
+            'cocoon_name': cocoon.name
+        })
+    
+    @action(detail=True, methods=['post'])
+    def reject(self, request, pk=None):
+        proposal = self.get_object()
+        try:
+            KeywordClusteringService.reject_proposal(proposal)
+        except ValueError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(CocoonProposalListSerializer(proposal).data)
@@ -5,7 +5,8 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
-from django.db.models import Count, Q
+from django.db.models import F, Q
+from django.db.models.functions import Coalesce
 from django.core.exceptions import ValidationError
 
 # Local imports - 🔥 IMPORT CORRIGÉ
@@ -18,6 +19,7 @@ from ..serializers import (
 )
 from ..filters import CocoonFilter
 from ..services import CocoonStatsService
+from ..tasks import recompute_cocoon_stats_task
 
 import logging
 logger = logging.getLogger(__name__)
@@ -76,7 +78,7 @@ class CocoonCategoryViewSet(viewsets.ModelViewSet):
         try:
             category = self.get_object()
             cocoons = category.cocoons.annotate(
-                keywords_count=Count('cocoon_keywords')
+                keywords_count=Coalesce(F('stats__keywords_count'), 0)
             ).order_by('name')
             
             # Pagination simple
@@ -110,6 +112,7 @@ class SemanticCocoonViewSet(viewsets.ModelViewSet):
     - DELETE /seo/cocoons/cocoons/{id}/       # Delete
     - GET /seo/cocoons/cocoons/{id}/stats/    # Statistiques détaillées
     - GET /seo/cocoons/cocoons/overview/      # Vue d'ensemble globale
+    - POST /seo/cocoons/cocoons/recompute_stats/ # Recalcul complet de CocoonStats (asynchrone, 202 + task_id)
     """
     
     queryset = SemanticCocoon.objects.all()
@@ -131,10 +134,11 @@ class SemanticCocoonViewSet(viewsets.ModelViewSet):
     
     def get_queryset(self):
         """Optimisation requêtes avec annotations"""
-        return super().get_queryset().prefetch_related(
+        # Compteur lu dans CocoonStats (pas de COUNT sur les associations)
+        return super().get_queryset().select_related('stats').prefetch_related(
             'categories'
         ).annotate(
-            keywords_count=Count('cocoon_keywords', distinct=True)
+            keywords_count=Coalesce(F('stats__keywords_count'), 0)
         ).distinct()
     
     def destroy(self, request, *args, **kwargs):
@@ -183,6 +187,13 @@ class SemanticCocoonViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
     
+    @action(detail=False, methods=['post'])
+    def recompute_stats(self, request):
+        """Recalcul complet des stats, hors requête HTTP (Celery) : 202 + task_id"""
+        task = recompute_cocoon_stats_task.delay()
+        logger.info(f"Cocoon stats recompute queued (task {task.id}) by user {request.user.id}")
+        return Response({'task_id': task.id}, status=status.HTTP_202_ACCEPTED)
+    
     @action(detail=False, methods=['get'])
     def overview(self, request):
         """Vue d'ensemble de tous les cocons"""
@@ -5,3 +5,6 @@ from django.apps import AppConfig
 class SeoKeywordsMetricsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'seo_keywords_metrics'
+
+    def ready(self):
+        import seo_keywords_metrics.signals
@@ -0,0 +1,48 @@
+# backend/seo_keywords_metrics/management/commands/extract_serp_results.py
+
+from django.core.management.base import BaseCommand, CommandError
+
+from seo_keywords_metrics.services.serp_extraction_service import EXTRACTION_CHUNK_SIZE, SerpExtractionService
+
+
+class Command(BaseCommand):
+    help = 'Extrait Keyword.search_results vers SerpResult et recalcule les quartiles DA/backlinks'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--full',
+            action='store_true',
+            help='Réextraire tous les mots-clés (défaut : uniquement ceux dont le JSON a changé)'
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=EXTRACTION_CHUNK_SIZE,
+            help=f'Mots-clés par tranche (défaut: {EXTRACTION_CHUNK_SIZE})'
+        )
+        parser.add_argument(
+            '--parquet',
+            metavar='PATH',
+            help='Écrire ensuite un instantané Parquet de la table (pandas + pyarrow requis)'
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write("🔄 Extraction des résultats SERP...")
+
+        def progress(stats):
+            self.stdout.write(f"  {stats['keywords']} mots-clés, {stats['results']} résultats")
+
+        stats = SerpExtractionService.refresh(
+            full=options['full'], chunk_size=options['chunk_size'], progress=progress
+        )
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ {stats['keywords']} mots-clés extraits, {stats['results']} résultats, "
+            f"{stats['metrics_updated']} métriques recalculées"
+        ))
+
+        if options['parquet']:
+            try:
+                exported = SerpExtractionService.export_parquet(options['parquet'])
+            except ImportError as e:
+                raise CommandError(f"Export Parquet indisponible : {e}")
+            self.stdout.write(self.style.SUCCESS(f"✅ {exported} lignes écrites dans {options['parquet']}"))
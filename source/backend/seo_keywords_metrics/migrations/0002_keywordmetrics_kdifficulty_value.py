@@ -0,0 +1,18 @@
+# backend/seo_keywords_metrics/migrations/0002_keywordmetrics_kdifficulty_value.py
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('seo_keywords_metrics', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='keywordmetrics',
+            name='kdifficulty_value',
+            field=models.FloatField(blank=True, db_index=True, editable=False, null=True),
+        ),
+    ]
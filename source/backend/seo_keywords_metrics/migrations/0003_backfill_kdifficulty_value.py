@@ -0,0 +1,25 @@
+# backend/seo_keywords_metrics/migrations/0003_backfill_kdifficulty_value.py
+
+from django.db import migrations
+
+
+def backfill_kdifficulty_value(apps, schema_editor):
+    from seo_keywords_base.services.numeric_backfill import backfill_numeric_column
+    from seo_keywords_base.utils.normalization import parse_kdifficulty
+
+    KeywordMetrics = apps.get_model('seo_keywords_metrics', 'KeywordMetrics')
+    backfill_numeric_column(KeywordMetrics, 'kdifficulty', 'kdifficulty_value', parse_kdifficulty)
+
+
+class Migration(migrations.Migration):
+
+    # Un commit par lot : pas de transaction géante sur la table des métriques
+    atomic = False
+
+    dependencies = [
+        ('seo_keywords_metrics', '0002_keywordmetrics_kdifficulty_value'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_kdifficulty_value, migrations.RunPython.noop),
+    ]
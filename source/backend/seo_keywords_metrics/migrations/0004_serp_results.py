@@ -0,0 +1,48 @@
+# backend/seo_keywords_metrics/migrations/0004_serp_results.py
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('seo_keywords_base', '0006_keyword_lower_index'),
+        ('seo_keywords_metrics', '0003_backfill_kdifficulty_value'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SerpExtraction',
+            fields=[
+                ('keyword', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='serp_extraction', serialize=False, to='seo_keywords_base.keyword')),
+                ('source_hash', models.CharField(max_length=32)),
+                ('results_count', models.PositiveSmallIntegerField(default=0)),
+                ('extracted_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'seo_keywords_metrics_serpextraction',
+            },
+        ),
+        migrations.CreateModel(
+            name='SerpResult',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('position', models.PositiveSmallIntegerField()),
+                ('url', models.TextField()),
+                ('domain', models.CharField(max_length=255)),
+                ('domain_authority', models.IntegerField(blank=True, null=True)),
+                ('backlinks', models.IntegerField(blank=True, null=True)),
+                ('keyword', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='serp_results', to='seo_keywords_base.keyword')),
+            ],
+            options={
+                'db_table': 'seo_keywords_metrics_serpresult',
+                'ordering': ['keyword_id', 'position'],
+                'indexes': [models.Index(fields=['domain', 'position'], name='seo_serp_domain_position_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='serpresult',
+            constraint=models.UniqueConstraint(fields=('keyword', 'position'), name='seo_serp_keyword_position_uniq'),
+        ),
+    ]
@@ -1,5 +1,6 @@
 # backend/seo_keywords_metrics/models/__init__.py
 
 from .metrics_models import KeywordMetrics
+from .serp_models import SerpResult, SerpExtraction
 
-__all__ = ['KeywordMetrics']
\ No newline at end of file
+__all__ = ['KeywordMetrics', 'SerpResult', 'SerpExtraction']
\ No newline at end of file
@@ -2,6 +2,7 @@
 
 from django.db import models
 from common.models.mixins import TimestampedMixin
+from seo_keywords_base.utils.normalization import parse_kdifficulty
 
 class KeywordMetrics(TimestampedMixin):
     """Métriques SEO des mots-clés"""
@@ -28,17 +29,24 @@ class KeywordMetrics(TimestampedMixin):
     
     # Difficulté
     kdifficulty = models.CharField(max_length=200, null=True, blank=True)
+    # Valeur numérique de kdifficulty (filtres/tris), calculée à l'écriture
+    kdifficulty_value = models.FloatField(null=True, blank=True, editable=False, db_index=True)
+    
+    def save(self, *args, **kwargs):
+        self.kdifficulty_value = parse_kdifficulty(self.kdifficulty)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'kdifficulty' in update_fields:
+            kwargs['update_fields'] = set(update_fields) | {'kdifficulty_value'}
+        super().save(*args, **kwargs)
     
     def get_normalized_difficulty(self):
         """Normalise la difficulté en float 0-1"""
-        if not self.kdifficulty:
-            return None
-        try:
-            kd_str = str(self.kdifficulty).strip().replace('%', '').replace(',', '.')
-            kd_value = float(kd_str)
-            return kd_value / 100 if kd_value > 1 else kd_value
-        except (ValueError, TypeError):
+        kd_value = self.kdifficulty_value
+        if kd_value is None:
+            kd_value = parse_kdifficulty(self.kdifficulty)
+        if kd_value is None:
             return None
+        return kd_value / 100 if kd_value > 1 else kd_value
     
     def __str__(self):
         return f"Metrics for {self.keyword.keyword}"
@@ -0,0 +1,55 @@
+# backend/seo_keywords_metrics/models/serp_models.py
+
+from django.db import models
+
+class SerpResult(models.Model):
+    """
+    Une ligne par résultat du SERP d'un mot-clé, extraite de
+    Keyword.search_results (SerpExtractionService) : analyses par domaine
+    et quartiles DA/backlinks sans relire les blobs JSON
+    """
+
+    keyword = models.ForeignKey(
+        'seo_keywords_base.Keyword',
+        on_delete=models.CASCADE,
+        related_name='serp_results'
+    )
+    position = models.PositiveSmallIntegerField()
+    url = models.TextField()
+    domain = models.CharField(max_length=255)
+    domain_authority = models.IntegerField(null=True, blank=True)
+    backlinks = models.IntegerField(null=True, blank=True)
+
+    def __str__(self):
+        return f"#{self.position} {self.domain}"
+
+    class Meta:
+        db_table = 'seo_keywords_metrics_serpresult'
+        ordering = ['keyword_id', 'position']
+        constraints = [
+            models.UniqueConstraint(fields=['keyword', 'position'], name='seo_serp_keyword_position_uniq'),
+        ]
+        indexes = [
+            models.Index(fields=['domain', 'position'], name='seo_serp_domain_position_idx'),
+        ]
+
+
+class SerpExtraction(models.Model):
+    """État d'extraction par mot-clé : empreinte du JSON extrait (rafraîchissement incrémental)"""
+
+    keyword = models.OneToOneField(
+        'seo_keywords_base.Keyword',
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='serp_extraction'
+    )
+    # MD5 de search_results (texte), calculé par la base
+    source_hash = models.CharField(max_length=32)
+    results_count = models.PositiveSmallIntegerField(default=0)
+    extracted_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"SERP extraction for keyword {self.keyword_id}"
+
+    class Meta:
+        db_table = 'seo_keywords_metrics_serpextraction'
@@ -1,5 +1,6 @@
 # backend/seo_keywords_metrics/serializers/__init__.py
 
 from .metrics_serializers import KeywordMetricsSerializer
+from .serp_serializers import SerpResultSerializer
 
-__all__ = ['KeywordMetricsSerializer']
\ No newline at end of file
+__all__ = ['KeywordMetricsSerializer', 'SerpResultSerializer']
\ No newline at end of file
@@ -13,7 +13,7 @@ class KeywordMetricsSerializer(TimestampedSerializer):
     class Meta:
         model = KeywordMetrics
         fields = '__all__'
-        read_only_fields = ['created_at', 'updated_at']
+        read_only_fields = ['created_at', 'updated_at', 'kdifficulty_value']
     
     def get_kdifficulty_normalized(self, obj):
         return obj.get_normalized_difficulty()
\ No newline at end of file
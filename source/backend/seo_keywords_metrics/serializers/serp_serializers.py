@@ -0,0 +1,14 @@
+# backend/seo_keywords_metrics/serializers/serp_serializers.py
+
+from rest_framework import serializers
+from ..models import SerpResult
+
+class SerpResultSerializer(serializers.ModelSerializer):
+    """Résultat SERP extrait (lecture seule)"""
+    
+    keyword_text = serializers.CharField(source='keyword.keyword', read_only=True)
+    
+    class Meta:
+        model = SerpResult
+        fields = ['id', 'keyword', 'keyword_text', 'position', 'url', 'domain', 'domain_authority', 'backlinks']
+        read_only_fields = fields
@@ -1 +1,5 @@
 # backend/seo_keywords_metrics/services/__init__.py
+
+from .serp_extraction_service import SerpExtractionService
+
+__all__ = ['SerpExtractionService']
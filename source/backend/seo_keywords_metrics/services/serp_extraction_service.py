@@ -0,0 +1,285 @@
+# backend/seo_keywords_metrics/services/serp_extraction_service.py
+"""
+Extraction de Keyword.search_results vers SerpResult (une ligne par résultat)
+
+- Incrémental : l'empreinte MD5 du JSON est calculée par la base et comparée
+  à SerpExtraction.source_hash ; seuls les mots-clés modifiés sont relus
+- Traitement par tranches de clés (id croissant) : suppression des anciennes
+  lignes, bulk_create des nouvelles, upsert de l'état d'extraction
+- Quartiles DA / backlinks de KeywordMetrics recalculés depuis les lignes
+  SERP, en NumPy pour toute une tranche (pas de boucle par mot-clé)
+"""
+
+from urllib.parse import urlsplit
+
+import numpy as np
+from django.db import router, transaction
+from django.db.models import Avg, Count, Exists, Min, OuterRef, Q, TextField
+from django.db.models.functions import Cast, MD5
+
+from seo_keywords_base.models import Keyword
+from seo_keywords_base.utils.normalization import parse_int
+from ..models import KeywordMetrics, SerpExtraction, SerpResult
+
+import logging
+logger = logging.getLogger(__name__)
+
+EXTRACTION_CHUNK_SIZE = 2000
+MAX_SERP_POSITION = 100
+
+# Formats rencontrés selon les outils d'export
+SERP_LIST_KEYS = ('organic', 'organic_results', 'results', 'serp', 'items')
+URL_KEYS = ('url', 'link', 'href')
+POSITION_KEYS = ('position', 'rank', 'pos')
+DA_KEYS = ('da', 'domain_authority', 'authority', 'dr', 'domain_rating')
+BACKLINKS_KEYS = ('backlinks', 'bl', 'links')
+
+QUARTILES = {'min': 0, 'q1': 0.25, 'median': 0.5, 'q3': 0.75, 'max': 1}
+
+
+def _first(entry, keys):
+    for key in keys:
+        if entry.get(key) not in (None, ''):
+            return entry[key]
+    return None
+
+
+def _serp_entries(search_results):
+    if isinstance(search_results, list):
+        return search_results
+    if not isinstance(search_results, dict) or not search_results:
+        return []
+    for key in SERP_LIST_KEYS:
+        if isinstance(search_results.get(key), list):
+            return search_results[key]
+    # {"1": {...}, "2": {...}} : position en clé
+    if all(str(key).isdigit() and isinstance(value, dict) for key, value in search_results.items()):
+        return [
+            {'position': int(key), **value}
+            for key, value in sorted(search_results.items(), key=lambda item: int(item[0]))
+        ]
+    return []
+
+
+def parse_serp_entries(search_results):
+    """
+    search_results -> [{'position', 'url', 'domain', 'domain_authority', 'backlinks'}]
+    Entrées sans URL exploitable ignorées ; première entrée retenue par position.
+    """
+    entries = []
+    seen_positions = set()
+    for index, entry in enumerate(_serp_entries(search_results), start=1):
+        if isinstance(entry, str):
+            entry = {'url': entry}
+        if not isinstance(entry, dict):
+            continue
+
+        url = _first(entry, URL_KEYS)
+        if not isinstance(url, str):
+            continue
+        url = url.strip()
+        host = urlsplit(url if '//' in url else f'//{url}').hostname or ''
+        domain = host.removeprefix('www.')[:255]
+
+        position = parse_int(_first(entry, POSITION_KEYS)) or index
+        if not domain or position in seen_positions or not 0 < position <= MAX_SERP_POSITION:
+            continue
+        seen_positions.add(position)
+
+        entries.append({
+            'position': position,
+            'url': url,
+            'domain': domain,
+            'domain_authority': parse_int(_first(entry, DA_KEYS)),
+            'backlinks': parse_int(_first(entry, BACKLINKS_KEYS)),
+        })
+    return entries
+
+
+def group_percentiles(groups, values):
+    """
+    Min, quartiles, médiane, max de `values` par valeur de `groups`
+    (interpolation linéaire, comme numpy.percentile), sans boucle par groupe.
+    Retourne (groupes uniques, {'min': array, 'q1': array, ...}).
+    """
+    groups = np.asarray(groups)
+    values = np.asarray(values, dtype=float)
+    valid = ~np.isnan(values)
+    groups, values = groups[valid], values[valid]
+    if not len(groups):
+        return groups, {name: np.empty(0) for name in QUARTILES}
+
+    order = np.lexsort((values, groups))
+    groups, values = groups[order], values[order]
+    unique, starts, counts = np.unique(groups, return_index=True, return_counts=True)
+
+    results = {}
+    for name, quantile in QUARTILES.items():
+        position = starts + quantile * (counts - 1)
+        low = np.floor(position).astype(int)
+        high = np.ceil(position).astype(int)
+        results[name] = values[low] + (values[high] - values[low]) * (position - low)
+    return unique, results
+
+
+class SerpExtractionService:
+    """SERP JSON -> table SerpResult + quartiles KeywordMetrics"""
+
+    @staticmethod
+    def changed_keywords(queryset=None):
+        """Mots-clés jamais extraits ou dont search_results a changé depuis l'extraction"""
+        queryset = Keyword.objects.all() if queryset is None else queryset
+        return queryset.annotate(
+            serp_hash=MD5(Cast('search_results', output_field=TextField()))
+        ).exclude(
+            Exists(SerpExtraction.objects.filter(keyword_id=OuterRef('pk'), source_hash=OuterRef('serp_hash')))
+        )
+
+    @classmethod
+    def refresh(cls, queryset=None, full=False, chunk_size=EXTRACTION_CHUNK_SIZE, progress=None):
+        """
+        Extrait les mots-clés modifiés de `queryset` (tous avec full=True).
+        Retourne {'keywords', 'results', 'metrics_updated'}.
+        """
+        if full:
+            queryset = (Keyword.objects.all() if queryset is None else queryset).annotate(
+                serp_hash=MD5(Cast('search_results', output_field=TextField()))
+            )
+        else:
+            queryset = cls.changed_keywords(queryset)
+        rows = queryset.order_by('id').values_list('id', 'search_results', 'serp_hash')
+
+        stats = {'keywords': 0, 'results': 0, 'metrics_updated': 0}
+        last_id = None
+        while True:
+            chunk = list((rows.filter(id__gt=last_id) if last_id is not None else rows)[:chunk_size])
+            if not chunk:
+                break
+            last_id = chunk[-1][0]
+
+            written, metrics_updated = cls._extract_chunk(chunk)
+            stats['keywords'] += len(chunk)
+            stats['results'] += written
+            stats['metrics_updated'] += metrics_updated
+            if progress:
+                progress(stats)
+
+        if stats['keywords']:
+            logger.info(
+                f"SERP extraction: {stats['keywords']} mots-clés, {stats['results']} résultats, "
+                f"{stats['metrics_updated']} métriques recalculées"
+            )
+        return stats
+
+    @classmethod
+    def _extract_chunk(cls, chunk):
+        keyword_ids = [keyword_id for keyword_id, _, _ in chunk]
+        results = []
+        extractions = []
+        for keyword_id, search_results, serp_hash in chunk:
+            entries = parse_serp_entries(search_results)
+            results.extend(SerpResult(keyword_id=keyword_id, **entry) for entry in entries)
+            extractions.append(SerpExtraction(
+                keyword_id=keyword_id, source_hash=serp_hash or '', results_count=len(entries)
+            ))
+
+        using = router.db_for_write(SerpResult)
+        with transaction.atomic(using=using):
+            SerpResult.objects.using(using).filter(keyword_id__in=keyword_ids).delete()
+            SerpResult.objects.using(using).bulk_create(results, batch_size=5000)
+            SerpExtraction.objects.using(using).bulk_create(
+                extractions,
+                batch_size=5000,
+                update_conflicts=True,
+                unique_fields=['keyword'],
+                update_fields=['source_hash', 'results_count', 'extracted_at'],
+            )
+            metrics_updated = cls._write_quartiles(
+                [result.keyword_id for result in results],
+                [result.domain_authority for result in results],
+                [result.backlinks for result in results],
+                using,
+            )
+        return len(results), metrics_updated
+
+    @classmethod
+    def recompute_quartiles(cls, keyword_ids=None):
+        """Quartiles DA / backlinks depuis SerpResult (mots-clés donnés, ou tous)"""
+        queryset = SerpResult.objects.all()
+        if keyword_ids is not None:
+            queryset = queryset.filter(keyword_id__in=list(keyword_ids))
+        rows = np.array(
+            list(queryset.order_by().values_list('keyword_id', 'domain_authority', 'backlinks')),
+            dtype=float
+        ).reshape(-1, 3)
+        return cls._write_quartiles(rows[:, 0].astype(np.int64), rows[:, 1], rows[:, 2])
+
+    @staticmethod
+    def _write_quartiles(keyword_ids, domain_authorities, backlinks, using=None):
+        """
+        Upsert des quartiles, DA et backlinks séparément : une série absente
+        du SERP laisse les valeurs existantes (import) inchangées
+        """
+        manager = KeywordMetrics.objects.using(using or router.db_for_write(KeywordMetrics))
+        updated = set()
+        for prefix, column in (('da', domain_authorities), ('bl', backlinks)):
+            column = np.array([np.nan if value is None else value for value in column], dtype=float)
+            groups, percentiles = group_percentiles(keyword_ids, column)
+            if not len(groups):
+                continue
+
+            fields = [f'{prefix}_{name}' for name in QUARTILES]
+            rounded = {name: np.rint(array).astype(int).tolist() for name, array in percentiles.items()}
+            manager.bulk_create(
+                [
+                    KeywordMetrics(
+                        keyword_id=keyword_id,
+                        **{f'{prefix}_{name}': rounded[name][index] for name in QUARTILES}
+                    )
+                    for index, keyword_id in enumerate(groups.tolist())
+                ],
+                batch_size=1000,
+                update_conflicts=True,
+                unique_fields=['keyword'],
+                update_fields=fields + ['updated_at'],
+            )
+            updated.update(groups.tolist())
+        return len(updated)
+
+    @staticmethod
+    def domain_overview(keyword_ids=None, limit=50):
+        """Domaines les plus présents dans les SERP (mots-clés couverts, positions)"""
+        queryset = SerpResult.objects.all()
+        if keyword_ids is not None:
+            queryset = queryset.filter(keyword_id__in=list(keyword_ids))
+        return list(
+            queryset.values('domain').annotate(
+                keywords_count=Count('keyword_id', distinct=True),
+                top3_count=Count('id', filter=Q(position__lte=3)),
+                avg_position=Avg('position'),
+                best_position=Min('position'),
+                avg_domain_authority=Avg('domain_authority'),
+            ).order_by('-keywords_count', 'avg_position')[:limit]
+        )
+
+    @staticmethod
+    def export_parquet(path, chunk_size=EXTRACTION_CHUNK_SIZE * 10):
+        """Instantané Parquet de SerpResult (pandas + pyarrow, optionnel)"""
+        import pandas as pd
+
+        columns = ['keyword_id', 'keyword', 'position', 'url', 'domain', 'domain_authority', 'backlinks']
+        rows = SerpResult.objects.order_by('keyword_id', 'position').values_list(
+            'keyword_id', 'keyword__keyword', 'position', 'url', 'domain', 'domain_authority', 'backlinks'
+        )
+        frame = pd.DataFrame.from_records(rows.iterator(chunk_size=chunk_size), columns=columns)
+        frame = frame.astype({'domain_authority': 'Int64', 'backlinks': 'Int64'})
+        frame.to_parquet(path, index=False)
+        return len(frame)
+
+    @classmethod
+    def _safe_refresh(cls, keyword_ids):
+        # Données dérivées : un échec ne doit pas casser l'écriture d'origine
+        try:
+            cls.refresh(Keyword.objects.filter(id__in=list(keyword_ids)))
+        except Exception as e:
+            logger.error(f"Error extracting SERP for keywords {sorted(keyword_ids)}: {e}", exc_info=True)
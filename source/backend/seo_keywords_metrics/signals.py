@@ -0,0 +1,17 @@
+# backend/seo_keywords_metrics/signals.py
+
+from django.db import transaction
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+from seo_keywords_base.models import Keyword
+from .services import SerpExtractionService
+
+@receiver(post_save, sender=Keyword)
+def extract_serp_on_keyword_change(sender, instance, raw=False, update_fields=None, **kwargs):
+    """Réextraction après commit ; sans effet si search_results n'a pas changé (empreinte identique)"""
+    if raw:
+        return
+    if update_fields is not None and 'search_results' not in update_fields:
+        return
+    keyword_id = instance.id
+    transaction.on_commit(lambda: SerpExtractionService._safe_refresh([keyword_id]))
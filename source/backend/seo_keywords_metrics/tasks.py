@@ -0,0 +1,17 @@
+# backend/seo_keywords_metrics/tasks.py
+import logging
+from celery import shared_task
+
+from .services import SerpExtractionService
+
+logger = logging.getLogger(__name__)
+
+@shared_task
+def refresh_serp_results_task():
+    """Extraction SERP des mots-clés dont search_results a changé (écritures en masse sans signal)"""
+    try:
+        stats = SerpExtractionService.refresh()
+    except Exception as exc:
+        logger.error(f"Erreur extraction SERP: {str(exc)}", exc_info=True)
+        return {"status": "failed", "error": str(exc)}
+    return {"status": "success", **stats}
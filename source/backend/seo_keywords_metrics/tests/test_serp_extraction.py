@@ -0,0 +1,118 @@
+# backend/seo_keywords_metrics/tests/test_serp_extraction.py
+
+import numpy as np
+import pytest
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from seo_keywords_base.models import Keyword
+from seo_keywords_metrics.models import KeywordMetrics, SerpExtraction, SerpResult
+from seo_keywords_metrics.services import SerpExtractionService
+from seo_keywords_metrics.services.serp_extraction_service import group_percentiles, parse_serp_entries
+
+SERP = {
+    'organic': [
+        {'position': 1, 'url': 'https://www.leader.fr/page', 'da': 80, 'backlinks': '1 200'},
+        {'position': 2, 'link': 'https://second.com/a', 'domain_authority': 40, 'bl': 300},
+        {'position': 3, 'url': 'https://third.org/', 'da': 20},
+        {'position': 3, 'url': 'https://doublon.org/'},
+        {'title': 'sans url'},
+    ]
+}
+
+
+def test_parse_serp_entries_formats():
+    entries = parse_serp_entries(SERP)
+    assert [(e['position'], e['domain'], e['domain_authority'], e['backlinks']) for e in entries] == [
+        (1, 'leader.fr', 80, 1200), (2, 'second.com', 40, 300), (3, 'third.org', 20, None)
+    ]
+    # Liste simple d'URLs, dict indexé par position
+    assert [e['domain'] for e in parse_serp_entries(['https://a.fr', 'b.fr/x'])] == ['a.fr', 'b.fr']
+    assert [e['position'] for e in parse_serp_entries({'2': {'url': 'https://b.fr'}, '1': {'url': 'https://a.fr'}})] == [1, 2]
+    assert parse_serp_entries({}) == []
+
+
+def test_group_percentiles_matches_numpy():
+    rng = np.random.default_rng(0)
+    groups = rng.integers(0, 50, 2000)
+    values = rng.integers(0, 100, 2000).astype(float)
+    values[::7] = np.nan
+
+    unique, results = group_percentiles(groups, values)
+
+    for index, group in enumerate(unique):
+        expected = np.nanpercentile(values[groups == group], [0, 25, 50, 75, 100])
+        actual = [results[name][index] for name in ('min', 'q1', 'median', 'q3', 'max')]
+        assert np.allclose(actual, expected)
+
+
+@pytest.mark.django_db
+class TestSerpExtraction:
+
+    def test_incremental_extraction_and_quartiles(self):
+        keyword = Keyword.objects.create(keyword='assurance auto')
+        Keyword.objects.filter(pk=keyword.pk).update(search_results=SERP)
+        KeywordMetrics.objects.create(keyword=keyword, bl_q1=999, kdifficulty='35')
+
+        stats = SerpExtractionService.refresh()
+
+        assert stats['results'] == 3
+        assert list(SerpResult.objects.filter(keyword=keyword).values_list('domain', flat=True)) == [
+            'leader.fr', 'second.com', 'third.org'
+        ]
+        metrics = KeywordMetrics.objects.get(keyword=keyword)
+        assert (metrics.da_min, metrics.da_q1, metrics.da_median, metrics.da_q3, metrics.da_max) == (20, 30, 40, 60, 80)
+        assert (metrics.bl_min, metrics.bl_median, metrics.bl_max) == (300, 750, 1200)
+        assert metrics.kdifficulty == '35'
+
+        # Rien n'a changé : rien à réextraire
+        assert SerpExtractionService.refresh()['keywords'] == 0
+
+        Keyword.objects.filter(pk=keyword.pk).update(search_results={'organic': [{'url': 'https://new.fr', 'da': 10}]})
+        assert SerpExtractionService.refresh()['keywords'] == 1
+        assert list(SerpResult.objects.values_list('domain', flat=True)) == ['new.fr']
+        metrics.refresh_from_db()
+        # Pas de backlinks dans le nouveau SERP : valeurs précédentes conservées
+        assert (metrics.da_median, metrics.bl_median) == (10, 750)
+
+    def test_keyword_save_triggers_extraction(self, django_capture_on_commit_callbacks):
+        with django_capture_on_commit_callbacks(execute=True):
+            keyword = Keyword.objects.create(keyword='credit', search_results=SERP)
+
+        assert SerpExtraction.objects.get(keyword=keyword).results_count == 3
+
+        with django_capture_on_commit_callbacks(execute=True):
+            keyword.volume = 10
+            keyword.save(update_fields=['volume'])
+        assert SerpExtraction.objects.get(keyword=keyword).results_count == 3
+
+    def test_domains_endpoint(self):
+        first = Keyword.objects.create(keyword='a')
+        second = Keyword.objects.create(keyword='b')
+        Keyword.objects.filter(pk__in=[first.pk, second.pk]).update(search_results=SERP)
+        Keyword.objects.filter(pk=second.pk).update(search_results={'organic': [{'url': 'https://second.com/b'}]})
+        SerpExtractionService.refresh()
+
+        client = APIClient()
+        client.force_authenticate(get_user_model().objects.create_user(username='seo', password='x'))
+        response = client.get(reverse('seo_keywords_metrics:serp-results-domains'))
+
+        assert response.status_code == 200
+        top = response.data['results'][0]
+        assert (top['domain'], top['keywords_count'], top['best_position']) == ('second.com', 2, 1)
+
+        response = client.get(reverse('seo_keywords_metrics:serp-results-list'), {'domain': 'leader.fr'})
+        assert [row['keyword'] for row in response.data['results']] == [first.id]
+
+    def test_refresh_endpoint_is_async(self, mocker):
+        delay = mocker.patch('seo_keywords_metrics.views.serp_views.refresh_serp_results_task.delay')
+        delay.return_value.id = 'task-1'
+
+        client = APIClient()
+        client.force_authenticate(get_user_model().objects.create_user(username='seo', password='x'))
+        response = client.post(reverse('seo_keywords_metrics:serp-results-refresh'))
+
+        assert response.status_code == 202
+        assert response.data == {'task_id': 'task-1'}
+        delay.assert_called_once_with()
@@ -1,9 +1,10 @@
 # backend/seo_keywords_metrics/urls.py
 
 from rest_framework import routers
-from .views import KeywordMetricsViewSet
+from .views import SerpResultViewSet
 
+# Seules les routes SERP sont exposées ; KeywordMetricsViewSet n'est pas routé
 router = routers.DefaultRouter()
-router.register(r'metrics', KeywordMetricsViewSet, basename='keyword-metrics')
+router.register(r'serp', SerpResultViewSet, basename='serp-results')
 
 urlpatterns = router.urls
\ No newline at end of file
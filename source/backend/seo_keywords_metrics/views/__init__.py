@@ -1,5 +1,6 @@
 # backend/seo_keywords_metrics/views/__init__.py
 
 from .metrics_views import KeywordMetricsViewSet
+from .serp_views import SerpResultViewSet
 
-__all__ = ['KeywordMetricsViewSet']
\ No newline at end of file
+__all__ = ['KeywordMetricsViewSet', 'SerpResultViewSet']
\ No newline at end of file
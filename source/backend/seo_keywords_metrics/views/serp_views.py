@@ -0,0 +1,55 @@
+# backend/seo_keywords_metrics/views/serp_views.py
+
+from rest_framework import viewsets, status
+from rest_framework.decorators import action
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from django_filters.rest_framework import DjangoFilterBackend
+
+# Local imports
+from ..models import SerpResult
+from ..serializers import SerpResultSerializer
+from ..services import SerpExtractionService
+from ..tasks import refresh_serp_results_task
+
+
+class SerpResultViewSet(viewsets.ReadOnlyModelViewSet):
+    """
+    RÉSULTATS SERP EXTRAITS - LECTURE SEULE
+    
+    Endpoints :
+    - GET /seo/keywords-metrics/serp/?keyword=12      # SERP d'un mot-clé
+    - GET /seo/keywords-metrics/serp/?domain=site.fr  # Positions d'un domaine
+    - GET /seo/keywords-metrics/serp/domains/         # Domaines les plus présents (?keyword=1,2,3&limit=50)
+    - POST /seo/keywords-metrics/serp/refresh/        # Extraction des mots-clés modifiés (asynchrone, 202 + task_id)
+    """
+    
+    queryset = SerpResult.objects.all()
+    serializer_class = SerpResultSerializer
+    permission_classes = [IsAuthenticated]
+    filter_backends = [DjangoFilterBackend]
+    filterset_fields = {
+        'keyword': ['exact'],
+        'domain': ['exact'],
+        'position': ['exact', 'lte'],
+    }
+    
+    def get_queryset(self):
+        return super().get_queryset().select_related('keyword')
+    
+    @action(detail=False, methods=['get'])
+    def domains(self, request):
+        keyword_param = request.query_params.get('keyword')
+        try:
+            keyword_ids = [int(value) for value in keyword_param.split(',') if value] if keyword_param else None
+            limit = min(int(request.query_params.get('limit', 50)), 500)
+        except ValueError:
+            return Response({'error': 'keyword et limit doivent être des entiers'}, status=status.HTTP_400_BAD_REQUEST)
+        
+        return Response({'results': SerpExtractionService.domain_overview(keyword_ids, limit)})
+    
+    @action(detail=False, methods=['post'])
+    def refresh(self, request):
+        # Extraction potentiellement longue : hors requête HTTP, via Celery
+        task = refresh_serp_results_task.delay()
+        return Response({'task_id': task.id}, status=status.HTTP_202_ACCEPTED)
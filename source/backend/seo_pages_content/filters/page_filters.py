@@ -155,20 +155,11 @@ class PageFilter(django_filters.FilterSet):
     # === HIERARCHY METHODS ===
     
     def filter_hierarchy_level(self, queryset, name, value):
-        """Niveau hiérarchique (1-3) - VRAIS relations"""
+        """Niveau hiérarchique - colonne depth du chemin matérialisé"""
         if value == 1:
-            return queryset.filter(hierarchy__parent__isnull=True)
-        elif value == 2:
-            return queryset.filter(
-                hierarchy__parent__isnull=False,
-                hierarchy__parent__hierarchy__parent__isnull=True
-            )
-        elif value == 3:
-            return queryset.filter(
-                hierarchy__parent__isnull=False,
-                hierarchy__parent__hierarchy__parent__isnull=False
-            )
-        return queryset
+            # Page sans hiérarchie = racine
+            return queryset.filter(Q(hierarchy__isnull=True) | Q(hierarchy__depth=1))
+        return queryset.filter(hierarchy__depth=value)
     
     def filter_has_parent(self, queryset, name, value):
         """Pages avec/sans parent - VRAI related_name"""
@@ -6,3 +6,6 @@ class SeoPagesHierarchyConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'seo_pages_hierarchy'
     verbose_name = 'SEO Pages Hierarchy'
+
+    def ready(self):
+        import seo_pages_hierarchy.signals
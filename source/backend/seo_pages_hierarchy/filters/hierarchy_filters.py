@@ -4,6 +4,7 @@ import django_filters
 from django.db import models
 
 from ..models import PageHierarchy, PageBreadcrumb
+from ..models.hierarchy_models import build_path
 
 class PageHierarchyFilter(django_filters.FilterSet):
     """Filtres pour hiérarchie des pages"""
@@ -17,6 +18,10 @@ class PageHierarchyFilter(django_filters.FilterSet):
     is_root = django_filters.BooleanFilter(method='filter_is_root')
     has_children = django_filters.BooleanFilter(method='filter_has_children')
     
+    # Filtres par sous-arbre (chemin matérialisé)
+    root_page = django_filters.NumberFilter(method='filter_root_page')
+    descendant_of = django_filters.NumberFilter(method='filter_descendant_of')
+    
     # Recherche dans titres de page
     search = django_filters.CharFilter(method='filter_search')
     
@@ -25,17 +30,8 @@ class PageHierarchyFilter(django_filters.FilterSet):
         fields = ['page', 'parent']
     
     def filter_by_level(self, queryset, name, value):
-        """Filtre par niveau hiérarchique"""
-        # Forcer un ordering simple pour éviter la boucle
-        queryset = queryset.order_by('id')
-        
-        if value == 1:
-            return queryset.filter(parent__isnull=True)
-        elif value == 2:
-            return queryset.filter(parent__isnull=False, parent__hierarchy__parent__isnull=True)
-        elif value == 3:
-            return queryset.filter(parent__isnull=False, parent__hierarchy__parent__isnull=False)
-        return queryset
+        """Filtre par niveau hiérarchique (colonne depth, tous niveaux)"""
+        return queryset.filter(depth=value)
     
     def filter_is_root(self, queryset, name, value):
         """Filtre pages racines (sans parent)"""
@@ -51,6 +47,18 @@ class PageHierarchyFilter(django_filters.FilterSet):
         else:
             return queryset.filter(page__children_hierarchy__isnull=True)
     
+    def filter_root_page(self, queryset, name, value):
+        """Arbre complet d'une page racine (racine incluse)"""
+        return queryset.filter(path__startswith=build_path(int(value)))
+    
+    def filter_descendant_of(self, queryset, name, value):
+        """Descendants d'une page, tous niveaux (page exclue)"""
+        page_id = int(value)
+        path = PageHierarchy.objects.filter(
+            page_id=page_id
+        ).values_list('path', flat=True).first() or build_path(page_id)
+        return queryset.filter(path__startswith=path).exclude(page_id=page_id)
+    
     def filter_search(self, queryset, name, value):
         """Recherche dans titre et URL des pages"""
         return queryset.filter(
@@ -0,0 +1,22 @@
+# backend/seo_pages_hierarchy/management/commands/rebuild_hierarchy_paths.py
+
+from django.core.management.base import BaseCommand
+
+from seo_pages_hierarchy.services.hierarchy_path_service import REBUILD_BATCH_SIZE, HierarchyPathService
+
+
+class Command(BaseCommand):
+    help = 'Recalcule les chemins matérialisés (path / depth) de PageHierarchy'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=REBUILD_BATCH_SIZE,
+            help=f'Taille des lots d\'écriture (défaut: {REBUILD_BATCH_SIZE})'
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write("🔄 Reconstruction des chemins de hiérarchie...")
+        updated = HierarchyPathService.rebuild_paths(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f"✅ {updated} hiérarchies mises à jour"))
@@ -0,0 +1,29 @@
+# backend/seo_pages_hierarchy/migrations/0002_hierarchy_materialized_path.py
+
+from django.db import migrations, models
+
+
+def populate_hierarchy_paths(apps, schema_editor):
+    from seo_pages_hierarchy.services.hierarchy_path_service import HierarchyPathService
+    HierarchyPathService.rebuild_paths(get_model=apps.get_model, using=schema_editor.connection.alias)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('seo_pages_hierarchy', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='pagehierarchy',
+            name='depth',
+            field=models.PositiveSmallIntegerField(db_index=True, default=1, editable=False, help_text='Niveau hiérarchique (1 = racine)'),
+        ),
+        migrations.AddField(
+            model_name='pagehierarchy',
+            name='path',
+            field=models.CharField(blank=True, db_index=True, editable=False, help_text='Ids des pages de la racine à la page : /12/34/56/', max_length=255),
+        ),
+        migrations.RunPython(populate_hierarchy_paths, migrations.RunPython.noop),
+    ]
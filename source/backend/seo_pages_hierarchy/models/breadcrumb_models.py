@@ -1,5 +1,6 @@
 # backend/seo_pages_hierarchy/models/breadcrumb_models.py
 
+from django.core.exceptions import ObjectDoesNotExist
 from django.db import models
 
 from .base_models import PageHierarchyBaseModel
@@ -20,22 +21,20 @@ class PageBreadcrumb(PageHierarchyBaseModel):
     
     def regenerate_breadcrumb(self):
         """Régénère le fil d'Ariane"""
-        breadcrumb = []
-        current = self.page
+        # Ancêtres lus depuis le chemin matérialisé (une requête)
+        try:
+            pages = self.page.hierarchy.get_ancestors() + [self.page]
+        except ObjectDoesNotExist:
+            pages = [self.page]
         
-        # Construire le breadcrumb en remontant
-        while current:
-            breadcrumb.insert(0, {
-                'title': current.title,
-                'url': current.url_path,
-                'page_id': current.id
-            })
-            
-            # Remonter au parent
-            if hasattr(current, 'hierarchy') and current.hierarchy.parent:
-                current = current.hierarchy.parent
-            else:
-                break
+        breadcrumb = [
+            {
+                'title': page.title,
+                'url': page.url_path,
+                'page_id': page.id
+            }
+            for page in pages
+        ]
         
         self.breadcrumb_json = breadcrumb
         self.save(update_fields=['breadcrumb_json', 'updated_at'])
@@ -1,12 +1,35 @@
 # backend/seo_pages_hierarchy/models/hierarchy_models.py
 
-from django.db import models
+from django.db import models, transaction
+from django.db.models import F, Max, Value
+from django.db.models.functions import Concat, Substr
 from django.core.exceptions import ValidationError
 
 from .base_models import PageHierarchyBaseModel
 
+# Profondeur max (niveau 1 = racine)
+MAX_HIERARCHY_DEPTH = 3
+
+
+def build_path(page_id, parent_path=None):
+    """Chemin matérialisé '/racine/.../page/' (ids de pages)"""
+    return f"{parent_path or '/'}{page_id}/"
+
+
+def path_ids(path):
+    """Ids des pages du chemin, de la racine à la page"""
+    return [int(page_id) for page_id in path.strip('/').split('/') if page_id]
+
+
 class PageHierarchy(PageHierarchyBaseModel):
-    """Hiérarchie parent-enfant des pages (3 niveaux max)"""
+    """
+    Hiérarchie parent-enfant des pages (3 niveaux max)
+
+    Chemin matérialisé (`path` + `depth`) maintenu à chaque changement de
+    parent : niveau, racine, ancêtres et sous-arbre sans remonter les parents
+    requête par requête. Une page parente sans PageHierarchy est une racine
+    implicite (chemin '/<page_id>/').
+    """
     
     page = models.OneToOneField(
         'seo_pages_content.Page',
@@ -21,38 +44,122 @@ class PageHierarchy(PageHierarchyBaseModel):
         related_name='children_hierarchy'
     )
     
+    # Chemin matérialisé (calculé dans save)
+    path = models.CharField(
+        max_length=255,
+        blank=True,
+        db_index=True,
+        editable=False,
+        help_text="Ids des pages de la racine à la page : /12/34/56/"
+    )
+    depth = models.PositiveSmallIntegerField(
+        default=1,
+        db_index=True,
+        editable=False,
+        help_text="Niveau hiérarchique (1 = racine)"
+    )
+    
     def clean(self):
-        """Validation hiérarchie 3 niveaux max"""
+        """Validation hiérarchie 3 niveaux max, sans cycle"""
         super().clean()
         
-        if self.parent and self.page == self.parent:
+        if self.parent_id and self.page_id == self.parent_id:
             raise ValidationError("Une page ne peut pas être son propre parent")
         
-        if self.parent:
-            # Vérifier niveau max
-            if hasattr(self.parent, 'hierarchy') and self.parent.hierarchy.parent:
-                if hasattr(self.parent.hierarchy.parent, 'hierarchy') and self.parent.hierarchy.parent.hierarchy.parent:
-                    raise ValidationError("Hiérarchie limitée à 3 niveaux maximum")
+        path = self._compute_path()
+        if self.page_id in path_ids(path)[:-1]:
+            raise ValidationError("Relation circulaire détectée")
+        
+        depth = len(path_ids(path))
+        # Sous-arbre déplacé avec la page : sa hauteur compte aussi
+        if depth + self._subtree_height() > MAX_HIERARCHY_DEPTH:
+            raise ValidationError(f"Hiérarchie limitée à {MAX_HIERARCHY_DEPTH} niveaux maximum")
+        
+        self.path = path
+        self.depth = depth
+    
+    def _compute_path(self):
+        """Chemin calculé depuis celui du parent (une requête)"""
+        if not self.parent_id:
+            return build_path(self.page_id)
+        parent_path = PageHierarchy.objects.filter(
+            page_id=self.parent_id
+        ).values_list('path', flat=True).first()
+        return build_path(self.page_id, parent_path or build_path(self.parent_id))
+    
+    def _stored_path(self):
+        """Chemin actuel en base (racine implicite si pas encore enregistré)"""
+        if self.pk:
+            stored = PageHierarchy.objects.filter(pk=self.pk).values_list('path', flat=True).first()
+            if stored:
+                return stored
+        return build_path(self.page_id)
+    
+    def _subtree_height(self):
+        """Nombre de niveaux sous la page (0 si feuille)"""
+        old_path = self._stored_path()
+        max_depth = PageHierarchy.objects.filter(
+            path__startswith=old_path
+        ).exclude(page_id=self.page_id).aggregate(max_depth=Max('depth'))['max_depth']
+        return max_depth - len(path_ids(old_path)) if max_depth else 0
+    
+    @classmethod
+    def rebase_subtree(cls, old_path, new_path, using=None):
+        """Réécrit en un UPDATE le chemin et la profondeur des descendants"""
+        if old_path == new_path:
+            return 0
+        return cls.objects.using(using).filter(
+            path__startswith=old_path
+        ).exclude(path=old_path).update(
+            path=Concat(Value(new_path), Substr('path', len(old_path) + 1)),
+            depth=F('depth') + (len(path_ids(new_path)) - len(path_ids(old_path))),
+        )
+    
+    # ===== LECTURE =====
     
     def get_level(self):
         """Retourne le niveau hiérarchique (1-3)"""
-        if not self.parent:
-            return 1
-        elif not hasattr(self.parent, 'hierarchy') or not self.parent.hierarchy.parent:
-            return 2
-        else:
-            return 3
+        return self.depth
+    
+    @property
+    def root_page_id(self):
+        return path_ids(self.path)[0] if self.path else self.page_id
     
     def get_root_page(self):
         """Retourne la page racine"""
-        current = self.page
-        while hasattr(current, 'hierarchy') and current.hierarchy.parent:
-            current = current.hierarchy.parent
-        return current
+        if self.root_page_id == self.page_id:
+            return self.page
+        return self.page.__class__.objects.get(pk=self.root_page_id)
+    
+    def get_ancestor_ids(self):
+        """Ids des pages ancêtres, de la racine au parent"""
+        return path_ids(self.path)[:-1]
+    
+    def get_ancestors(self):
+        """Pages ancêtres, de la racine au parent (une requête)"""
+        ancestor_ids = self.get_ancestor_ids()
+        pages = self.page.__class__.objects.in_bulk(ancestor_ids)
+        return [pages[page_id] for page_id in ancestor_ids if page_id in pages]
+    
+    def get_descendants(self, include_self=False):
+        """Sous-arbre (PageHierarchy) par préfixe de chemin, tous niveaux"""
+        queryset = PageHierarchy.objects.filter(path__startswith=self.path)
+        if not include_self:
+            queryset = queryset.exclude(pk=self.pk)
+        return queryset
     
     def save(self, *args, **kwargs):
         self.full_clean()
-        super().save(*args, **kwargs)
+        
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            kwargs['update_fields'] = {*update_fields, 'path', 'depth'}
+        
+        with transaction.atomic(using=kwargs.get('using')):
+            old_path = self._stored_path()
+            super().save(*args, **kwargs)
+            # Déplacement (ou première insertion d'une racine implicite) : sous-arbre réécrit
+            PageHierarchy.rebase_subtree(old_path, self.path, using=kwargs.get('using'))
     
     def __str__(self):
         return f"Hierarchy: {self.page.title} (Level {self.get_level()})"
@@ -64,4 +171,4 @@ class PageHierarchy(PageHierarchyBaseModel):
         verbose_name_plural = "Hiérarchies de Page"
         indexes = [
             models.Index(fields=['page', 'parent']),
-        ]
\ No newline at end of file
+        ]
@@ -63,14 +63,11 @@ class PageHierarchySerializer(PageHierarchyBaseSerializer):
                     'parent': 'Une page ne peut pas être son propre parent'
                 })
             
-            # Vérifier que parent n'est pas déjà enfant de page
-            current = parent
-            while hasattr(current, 'hierarchy') and current.hierarchy.parent:
-                current = current.hierarchy.parent
-                if current == page:
-                    raise serializers.ValidationError({
-                        'parent': 'Relation circulaire détectée'
-                    })
+            # Vérifier que parent n'est pas déjà descendant de page (chemin du parent)
+            if PageHierarchy.objects.filter(page=parent, path__contains=f'/{page.id}/').exists():
+                raise serializers.ValidationError({
+                    'parent': 'Relation circulaire détectée'
+                })
         
         return data
 
@@ -112,10 +109,13 @@ class PageHierarchyTreeSerializer(PageHierarchyBaseSerializer):
         fields = ['page', 'page_title', 'page_url', 'children']
     
     def get_children(self, obj):
-        # Récupérer les enfants directs
-        children_pages = obj.page.children_hierarchy.all()
-        children_hierarchies = [child.hierarchy for child in children_pages if hasattr(child, 'hierarchy')]
-        return PageHierarchyTreeSerializer(children_hierarchies, many=True).data
+        # Enfants directs : pré-chargés par la vue (context) ou requête par nœud
+        children_by_parent = self.context.get('children_by_parent')
+        if children_by_parent is not None:
+            children = children_by_parent.get(obj.page_id, [])
+        else:
+            children = PageHierarchy.objects.select_related('page').filter(parent_id=obj.page_id)
+        return PageHierarchyTreeSerializer(children, many=True, context=self.context).data
 
 class PageBreadcrumbSerializer(PageHierarchyBaseSerializer):
     """Serializer fil d'Ariane"""
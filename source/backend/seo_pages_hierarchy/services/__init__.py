@@ -1 +1,5 @@
 # backend/seo_pages_hierarchy/services/__init__.py
+
+from .hierarchy_path_service import HierarchyPathService
+
+__all__ = ['HierarchyPathService']
@@ -0,0 +1,81 @@
+# backend/seo_pages_hierarchy/services/hierarchy_path_service.py
+"""
+Reconstruction des chemins matérialisés de PageHierarchy
+
+Une seule lecture (page, parent) de toute la table, chemins calculés en
+mémoire, écriture par lots des lignes modifiées uniquement. Utilisée par la
+migration (backfill) et par la commande rebuild_hierarchy_paths après des
+écritures qui contournent save() (QuerySet.update, imports SQL).
+"""
+
+from django.apps import apps as django_apps
+from django.db import router, transaction
+
+from ..models.hierarchy_models import build_path, path_ids
+
+import logging
+logger = logging.getLogger(__name__)
+
+REBUILD_BATCH_SIZE = 1000
+
+
+class HierarchyPathService:
+    """Calcul en masse de path / depth"""
+
+    @staticmethod
+    def compute_paths(parents):
+        """
+        {page_id: parent_id} -> {page_id: path}.
+        Parent sans ligne : racine implicite. Cycle : la page est traitée en racine.
+        """
+        paths = {}
+
+        def resolve(page_id):
+            chain = []
+            current = page_id
+            while current in parents and current not in paths:
+                if current in chain:
+                    logger.warning(f"Hierarchy cycle detected at page {current}, treated as root")
+                    paths[current] = build_path(current)
+                    break
+                chain.append(current)
+                current = parents[current]
+
+            for chain_page_id in reversed(chain):
+                if chain_page_id in paths:
+                    continue
+                parent_id = parents[chain_page_id]
+                if parent_id is None:
+                    paths[chain_page_id] = build_path(chain_page_id)
+                else:
+                    parent_path = paths.get(parent_id) or build_path(parent_id)
+                    paths[chain_page_id] = build_path(chain_page_id, parent_path)
+
+        for page_id in parents:
+            resolve(page_id)
+        return paths
+
+    @classmethod
+    def rebuild_paths(cls, get_model=None, using=None, batch_size=REBUILD_BATCH_SIZE):
+        """
+        Recalcule path / depth de toutes les lignes.
+        `get_model` : apps.get_model historique en migration.
+        """
+        hierarchy_model = (get_model or django_apps.get_model)('seo_pages_hierarchy', 'PageHierarchy')
+        using = using or router.db_for_write(hierarchy_model)
+
+        rows = list(hierarchy_model.objects.using(using).order_by().values_list('id', 'page_id', 'parent_id', 'path', 'depth'))
+        paths = cls.compute_paths({page_id: parent_id for _, page_id, parent_id, _, _ in rows})
+
+        changed = []
+        for hierarchy_id, page_id, _, path, depth in rows:
+            new_path = paths[page_id]
+            new_depth = len(path_ids(new_path))
+            if path != new_path or depth != new_depth:
+                changed.append(hierarchy_model(id=hierarchy_id, path=new_path, depth=new_depth))
+
+        with transaction.atomic(using=using):
+            hierarchy_model.objects.using(using).bulk_update(changed, ['path', 'depth'], batch_size=batch_size)
+
+        logger.info(f"Hierarchy paths rebuilt: {len(changed)}/{len(rows)} rows updated")
+        return len(changed)
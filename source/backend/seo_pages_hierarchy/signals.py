@@ -0,0 +1,14 @@
+# backend/seo_pages_hierarchy/signals.py
+
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+
+from .models import PageHierarchy
+from .models.hierarchy_models import build_path
+
+
+@receiver(post_delete, sender=PageHierarchy)
+def rebase_orphaned_subtree(sender, instance, using, **kwargs):
+    """La page sans hiérarchie devient racine implicite de son sous-arbre"""
+    if instance.path:
+        PageHierarchy.rebase_subtree(instance.path, build_path(instance.page_id), using=using)
@@ -0,0 +1,124 @@
+# backend/seo_pages_hierarchy/tests/test_hierarchy_paths.py
+
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ValidationError
+from django.test import TestCase
+
+from brands_core.models import Brand
+from company_core.models import Company
+from seo_pages_content.filters import PageFilter
+from seo_pages_content.models import Page
+from seo_pages_hierarchy.filters import PageHierarchyFilter
+from seo_pages_hierarchy.models import PageBreadcrumb, PageHierarchy
+from seo_pages_hierarchy.services import HierarchyPathService
+from seo_websites_core.models import Website
+
+User = get_user_model()
+
+
+class HierarchyPathTestCase(TestCase):
+    """Chemin matérialisé : maintenance à l'écriture, lectures sans remontée des parents"""
+
+    def setUp(self):
+        user = User.objects.create_user(username='hierarchy_admin', email='h@example.com', password='x')
+        company = Company.objects.create(name='Hierarchy Company', admin=user, billing_email='b@example.com')
+        brand = Brand.objects.create(name='Hierarchy Brand', company=company, brand_admin=user)
+        self.website = Website.objects.create(name='Site', url='https://example.com', brand=brand)
+
+        self.home, self.services, self.seo, self.blog, self.orphan = [
+            Page.objects.create(website=self.website, title=title, url_path=f'/{title}')
+            for title in ['home', 'services', 'seo', 'blog', 'orphan']
+        ]
+        self.home_h = PageHierarchy.objects.create(page=self.home)
+        self.services_h = PageHierarchy.objects.create(page=self.services, parent=self.home)
+        self.seo_h = PageHierarchy.objects.create(page=self.seo, parent=self.services)
+        self.blog_h = PageHierarchy.objects.create(page=self.blog)
+
+    def path(self, page):
+        return PageHierarchy.objects.get(page=page).path
+
+    def test_paths_and_reads(self):
+        self.assertEqual(self.seo_h.path, f'/{self.home.id}/{self.services.id}/{self.seo.id}/')
+        self.assertEqual(
+            [self.home_h.get_level(), self.services_h.get_level(), self.seo_h.get_level()], [1, 2, 3]
+        )
+        self.assertEqual(self.seo_h.get_root_page(), self.home)
+        self.assertEqual(self.seo_h.get_ancestors(), [self.home, self.services])
+        self.assertEqual(
+            set(self.home_h.get_descendants().values_list('page_id', flat=True)), {self.services.id, self.seo.id}
+        )
+
+        breadcrumb = PageBreadcrumb.objects.create(page=self.seo).regenerate_breadcrumb()
+        self.assertEqual([item['page_id'] for item in breadcrumb], [self.home.id, self.services.id, self.seo.id])
+
+    def test_move_rewrites_subtree(self):
+        self.services_h.parent = self.blog
+        self.services_h.save(update_fields=['parent'])
+
+        self.assertEqual(self.path(self.seo), f'/{self.blog.id}/{self.services.id}/{self.seo.id}/')
+        self.assertEqual(PageHierarchy.objects.get(page=self.seo).get_root_page(), self.blog)
+
+        # Détachée : le sous-arbre remonte d'un niveau
+        self.services_h.parent = None
+        self.services_h.save()
+        self.assertEqual(PageHierarchy.objects.get(page=self.seo).depth, 2)
+
+    def test_validation(self):
+        # Cycle : services sous son propre descendant
+        self.services_h.parent = self.seo
+        with self.assertRaises(ValidationError):
+            self.services_h.save()
+
+        # Niveau 4 refusé, y compris via le déplacement d'un sous-arbre
+        with self.assertRaises(ValidationError):
+            PageHierarchy.objects.create(page=self.orphan, parent=self.seo)
+        PageHierarchy.objects.create(page=self.orphan)
+        self.home_h.parent = self.orphan
+        with self.assertRaises(ValidationError):
+            self.home_h.save()
+
+    def test_implicit_root_and_delete(self):
+        # Parent sans hiérarchie : racine implicite, rattachée ensuite
+        child = Page.objects.create(website=self.website, title='child', url_path='/child')
+        PageHierarchy.objects.create(page=child, parent=self.orphan)
+        self.assertEqual(self.path(child), f'/{self.orphan.id}/{child.id}/')
+        PageHierarchy.objects.create(page=self.orphan, parent=self.blog)
+        self.assertEqual(self.path(child), f'/{self.blog.id}/{self.orphan.id}/{child.id}/')
+
+        # Suppression de la ligne de services : seo sous une racine implicite
+        self.services_h.delete()
+        self.assertEqual(self.path(self.seo), f'/{self.services.id}/{self.seo.id}/')
+
+        # Suppression d'une page racine : lignes enfants supprimées, petits-enfants rebasés
+        self.blog.delete()
+        self.assertEqual(self.path(child), f'/{self.orphan.id}/{child.id}/')
+
+    def test_rebuild_paths(self):
+        PageHierarchy.objects.update(path='', depth=1)
+
+        self.assertEqual(HierarchyPathService.rebuild_paths(batch_size=2), 4)
+
+        self.assertEqual(self.path(self.seo), f'/{self.home.id}/{self.services.id}/{self.seo.id}/')
+        self.assertEqual(PageHierarchy.objects.get(page=self.seo).depth, 3)
+
+    def test_filters(self):
+        def pages(filterset, params, queryset):
+            return set(filterset(params, queryset=queryset).qs.values_list(
+                'page_id' if filterset is PageHierarchyFilter else 'id', flat=True
+            ))
+
+        hierarchies = PageHierarchy.objects.all()
+        self.assertEqual(pages(PageHierarchyFilter, {'level': 3}, hierarchies), {self.seo.id})
+        self.assertEqual(
+            pages(PageHierarchyFilter, {'root_page': self.home.id}, hierarchies),
+            {self.home.id, self.services.id, self.seo.id}
+        )
+        self.assertEqual(
+            pages(PageHierarchyFilter, {'descendant_of': self.services.id}, hierarchies), {self.seo.id}
+        )
+
+        website_pages = Page.objects.filter(website=self.website)
+        self.assertEqual(
+            pages(PageFilter, {'hierarchy_level': 1}, website_pages), {self.home.id, self.blog.id, self.orphan.id}
+        )
+        self.assertEqual(pages(PageFilter, {'hierarchy_level': 2}, website_pages), {self.services.id})
@@ -1,5 +1,7 @@
 # backend/seo_pages_hierarchy/views/hierarchy_views.py
 
+from collections import defaultdict
+
 from rest_framework import status
 from rest_framework.decorators import action
 from rest_framework.response import Response
@@ -29,6 +31,7 @@ class PageHierarchyViewSet(PageHierarchyBaseViewSet):
     - PUT /hierarchy/{id}/         # Update
     - DELETE /hierarchy/{id}/      # Delete
     - GET /hierarchy/tree/         # Arbre complet
+    - GET /hierarchy/{id}/subtree/ # Sous-arbre (tous niveaux)
     - POST /hierarchy/rebuild/     # Reconstruction
     """
     
@@ -115,13 +118,22 @@ class PageHierarchyViewSet(PageHierarchyBaseViewSet):
             )
         
         try:
-            # Récupérer pages racines (sans parent)
-            root_hierarchies = self.get_queryset().filter(
-                page__website_id=website_id,
-                parent__isnull=True
-            )
+            # Tout l'arbre du site en une requête, regroupé par parent
+            hierarchies = self.get_queryset().filter(
+                page__website_id=website_id
+            ).order_by('depth', 'path')
             
-            serializer = PageHierarchyTreeSerializer(root_hierarchies, many=True)
+            children_by_parent = defaultdict(list)
+            root_hierarchies = []
+            for hierarchy in hierarchies:
+                if hierarchy.parent_id is None:
+                    root_hierarchies.append(hierarchy)
+                else:
+                    children_by_parent[hierarchy.parent_id].append(hierarchy)
+            
+            serializer = PageHierarchyTreeSerializer(
+                root_hierarchies, many=True, context={'children_by_parent': children_by_parent}
+            )
             
             return Response({
                 'website_id': int(website_id),
@@ -185,17 +197,12 @@ class PageHierarchyViewSet(PageHierarchyBaseViewSet):
                     try:
                         new_parent = PageHierarchy.objects.get(id=new_parent_id)
                         
-                        # Vérifier relation circulaire
-                        current = new_parent
-                        depth = 0
-                        while current.parent and depth < 10:
-                            if current.parent.page == hierarchy.page:
-                                return Response(
-                                    {'error': 'Relation circulaire détectée'},
-                                    status=status.HTTP_400_BAD_REQUEST
-                                )
-                            current = current.parent
-                            depth += 1
+                        # Vérifier relation circulaire (page dans le chemin du nouveau parent)
+                        if hierarchy.page_id in new_parent.get_ancestor_ids() + [new_parent.page_id]:
+                            return Response(
+                                {'error': 'Relation circulaire détectée'},
+                                status=status.HTTP_400_BAD_REQUEST
+                            )
                         
                         hierarchy.parent = new_parent.page
                         
@@ -225,6 +232,26 @@ class PageHierarchyViewSet(PageHierarchyBaseViewSet):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
+    @action(detail=True, methods=['get'])
+    def subtree(self, request, pk=None):
+        """Sous-arbre complet d'une page (tous niveaux, une requête)"""
+        hierarchy = self.get_object()
+        include_self = request.query_params.get('include_self', 'false').lower() == 'true'
+        
+        descendants = self.get_queryset().filter(
+            path__startswith=hierarchy.path
+        ).order_by('path')
+        if not include_self:
+            descendants = descendants.exclude(pk=hierarchy.pk)
+        
+        serializer = PageHierarchySerializer(descendants, many=True)
+        return Response({
+            'page_id': hierarchy.page_id,
+            'level': hierarchy.depth,
+            'count': len(serializer.data),
+            'descendants': serializer.data
+        })
+
 class PageBreadcrumbViewSet(PageHierarchyBaseViewSet):
     """
     ViewSet pour breadcrumbs
@@ -6,3 +6,6 @@ class SeoWebsitesCoreConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'seo_websites_core'
     verbose_name = 'SEO Websites Core'
+
+    def ready(self):
+        import seo_websites_core.signals
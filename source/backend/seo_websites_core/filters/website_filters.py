@@ -2,7 +2,7 @@
 
 import django_filters
 from django.db import models
-from django.db.models import Count, Q, F, Avg, Max, Min
+from django.db.models import Count, Q, F, Max, Min
 
 from ..models import Website
 
@@ -69,6 +69,10 @@ class WebsiteFilter(django_filters.FilterSet):
     GET /websites/?has_published_pages=true&categorization_source=manual&da_above_category=true
     GET /websites/?pages_count_min=50&keywords_coverage_gte=0.8&needs_openai_sync=true
     GET /websites/?primary_category=5&has_page_builder=true&avg_sitemap_priority_gte=0.6
+    
+    Compteurs et ratios pages / workflow / mots-clés / SEO lus dans
+    WebsiteStats (related 'stats') : les filtres se combinent sans
+    multiplier les jointures.
     """
     
     # ===== FILTRES DE BASE (seo_websites_core) =====
@@ -200,6 +204,23 @@ class WebsiteFilter(django_filters.FilterSet):
             except ImportError:
                 pass
 
+    # ===== WEBSITESTATS HELPERS =====
+    
+    def _filter_stats_range(self, queryset, field, value):
+        """Plage sur une colonne WebsiteStats (une jointure 1:1, aucune sur les pages)"""
+        if value.start is not None:
+            queryset = queryset.filter(**{f'stats__{field}__gte': value.start})
+        if value.stop is not None:
+            queryset = queryset.filter(**{f'stats__{field}__lte': value.stop})
+        return queryset
+    
+    def _filter_stats_positive(self, queryset, field, value):
+        """Compteur WebsiteStats non nul (True) ou nul/absent (False)"""
+        if value:
+            return queryset.filter(**{f'stats__{field}__gt': 0})
+        # Site sans ligne WebsiteStats (pas encore calculée) : compteur nul
+        return queryset.filter(Q(stats__isnull=True) | Q(**{f'stats__{field}': 0}))
+    
     # ===== BRAND METHODS =====
     
     def filter_has_chatgpt_key(self, queryset, name, value):
@@ -229,25 +250,14 @@ class WebsiteFilter(django_filters.FilterSet):
         if not HAS_PAGES_CONTENT:
             return queryset
         
-        queryset = queryset.annotate(
-            total_pages=Count('pages', distinct=True)
-        )
-        
-        if value.start is not None:
-            queryset = queryset.filter(total_pages__gte=value.start)
-        if value.stop is not None:
-            queryset = queryset.filter(total_pages__lte=value.stop)
-        
-        return queryset
+        return self._filter_stats_range(queryset, 'pages_count', value)
     
     def filter_has_pages(self, queryset, name, value):
         """Sites avec/sans pages"""
         if not HAS_PAGES_CONTENT:
             return queryset
         
-        if value:
-            return queryset.filter(pages__isnull=False).distinct()
-        return queryset.filter(pages__isnull=True)
+        return self._filter_stats_positive(queryset, 'pages_count', value)
     
     def filter_page_types(self, queryset, name, value):
         """Sites ayant certains types de pages (comma-separated)"""
@@ -299,86 +309,35 @@ class WebsiteFilter(django_filters.FilterSet):
         if not HAS_WORKFLOW:
             return queryset
         
-        if value:
-            return queryset.filter(
-                pages__workflow_status__status='published'
-            ).distinct()
-        return queryset.exclude(
-            pages__workflow_status__status='published'
-        )
+        return self._filter_stats_positive(queryset, 'published_pages_count', value)
     
     def filter_has_draft_pages(self, queryset, name, value):
         """Sites avec/sans brouillons"""
         if not HAS_WORKFLOW:
             return queryset
         
-        if value:
-            return queryset.filter(
-                pages__workflow_status__status='draft'
-            ).distinct()
-        return queryset.exclude(
-            pages__workflow_status__status='draft'
-        )
+        return self._filter_stats_positive(queryset, 'draft_pages_count', value)
     
     def filter_has_scheduled_pages(self, queryset, name, value):
         """Sites avec/sans pages programmées"""
         if not HAS_WORKFLOW:
             return queryset
         
-        if value:
-            return queryset.filter(
-                pages__workflow_status__status='scheduled'
-            ).distinct()
-        return queryset.exclude(
-            pages__workflow_status__status='scheduled'
-        )
+        return self._filter_stats_positive(queryset, 'scheduled_pages_count', value)
     
     def filter_published_pages_count(self, queryset, name, value):
         """Nombre de pages publiées"""
         if not HAS_WORKFLOW:
             return queryset
         
-        queryset = queryset.annotate(
-            published_count=Count(
-                'pages',
-                filter=Q(pages__workflow_status__status='published'),
-                distinct=True
-            )
-        )
-        
-        if value.start is not None:
-            queryset = queryset.filter(published_count__gte=value.start)
-        if value.stop is not None:
-            queryset = queryset.filter(published_count__lte=value.stop)
-        
-        return queryset
+        return self._filter_stats_range(queryset, 'published_pages_count', value)
     
     def filter_publication_ratio(self, queryset, name, value):
         """Ratio pages publiées / total pages"""
         if not (HAS_WORKFLOW and HAS_PAGES_CONTENT):
             return queryset
         
-        queryset = queryset.annotate(
-            total_pages=Count('pages', distinct=True),
-            published_pages=Count(
-                'pages',
-                filter=Q(pages__workflow_status__status='published'),
-                distinct=True
-            )
-        ).annotate(
-            pub_ratio=models.Case(
-                models.When(total_pages=0, then=0),
-                default=models.F('published_pages') * 1.0 / models.F('total_pages'),
-                output_field=models.FloatField()
-            )
-        )
-        
-        if value.start is not None:
-            queryset = queryset.filter(pub_ratio__gte=value.start)
-        if value.stop is not None:
-            queryset = queryset.filter(pub_ratio__lte=value.stop)
-        
-        return queryset
+        return self._filter_stats_range(queryset, 'publication_ratio', value)
     
     # ===== KEYWORDS METHODS =====
     
@@ -387,131 +346,49 @@ class WebsiteFilter(django_filters.FilterSet):
         if not HAS_KEYWORDS:
             return queryset
         
-        if value:
-            return queryset.filter(
-                pages__page_keywords__isnull=False
-            ).distinct()
-        return queryset.filter(
-            pages__page_keywords__isnull=True
-        )
+        return self._filter_stats_positive(queryset, 'total_keywords_count', value)
     
     def filter_total_keywords_count(self, queryset, name, value):
         """Nombre total de mots-clés (avec duplicates)"""
         if not HAS_KEYWORDS:
             return queryset
         
-        queryset = queryset.annotate(
-            total_keywords=Count('pages__page_keywords', distinct=True)
-        )
-        
-        if value.start is not None:
-            queryset = queryset.filter(total_keywords__gte=value.start)
-        if value.stop is not None:
-            queryset = queryset.filter(total_keywords__lte=value.stop)
-        
-        return queryset
+        return self._filter_stats_range(queryset, 'total_keywords_count', value)
     
     def filter_unique_keywords_count(self, queryset, name, value):
         """Nombre de mots-clés uniques"""
         if not HAS_KEYWORDS:
             return queryset
         
-        queryset = queryset.annotate(
-            unique_keywords=Count(
-                'pages__page_keywords__keyword',
-                distinct=True
-            )
-        )
-        
-        if value.start is not None:
-            queryset = queryset.filter(unique_keywords__gte=value.start)
-        if value.stop is not None:
-            queryset = queryset.filter(unique_keywords__lte=value.stop)
-        
-        return queryset
+        return self._filter_stats_range(queryset, 'unique_keywords_count', value)
     
     def filter_keywords_coverage(self, queryset, name, value):
         """Ratio pages avec mots-clés / total pages"""
         if not (HAS_KEYWORDS and HAS_PAGES_CONTENT):
             return queryset
         
-        queryset = queryset.annotate(
-            total_pages=Count('pages', distinct=True),
-            pages_with_keywords=Count(
-                'pages',
-                filter=Q(pages__page_keywords__isnull=False),
-                distinct=True
-            )
-        ).annotate(
-            coverage=models.Case(
-                models.When(total_pages=0, then=0),
-                default=models.F('pages_with_keywords') * 1.0 / models.F('total_pages'),
-                output_field=models.FloatField()
-            )
-        )
-        
-        if value.start is not None:
-            queryset = queryset.filter(coverage__gte=value.start)
-        if value.stop is not None:
-            queryset = queryset.filter(coverage__lte=value.stop)
-        
-        return queryset
+        return self._filter_stats_range(queryset, 'keywords_coverage', value)
     
     def filter_has_primary_keywords(self, queryset, name, value):
         """Sites avec/sans mots-clés primaires"""
         if not HAS_KEYWORDS:
             return queryset
         
-        if value:
-            return queryset.filter(
-                pages__page_keywords__keyword_type='primary'
-            ).distinct()
-        return queryset.exclude(
-            pages__page_keywords__keyword_type='primary'
-        )
+        return self._filter_stats_positive(queryset, 'primary_keywords_count', value)
     
     def filter_ai_keywords_ratio(self, queryset, name, value):
         """Ratio mots-clés sélectionnés par IA"""
         if not HAS_KEYWORDS:
             return queryset
         
-        queryset = queryset.annotate(
-            total_kw=Count('pages__page_keywords', distinct=True),
-            ai_kw=Count(
-                'pages__page_keywords',
-                filter=Q(pages__page_keywords__is_ai_selected=True),
-                distinct=True
-            )
-        ).annotate(
-            ai_ratio=models.Case(
-                models.When(total_kw=0, then=0),
-                default=models.F('ai_kw') * 1.0 / models.F('total_kw'),
-                output_field=models.FloatField()
-            )
-        )
-        
-        if value.start is not None:
-            queryset = queryset.filter(ai_ratio__gte=value.start)
-        if value.stop is not None:
-            queryset = queryset.filter(ai_ratio__lte=value.stop)
-        
-        return queryset
+        return self._filter_stats_range(queryset, 'ai_keywords_ratio', value)
     
     def filter_avg_keyword_volume(self, queryset, name, value):
         """Volume moyen des mots-clés"""
         if not HAS_KEYWORDS:
             return queryset
         
-        queryset = queryset.annotate(
-            avg_volume=Avg('pages__page_keywords__keyword__volume')
-        )
-        
-        if value.start is not None:
-            queryset = queryset.filter(avg_volume__gte=value.start)
-        if value.stop is not None:
-            queryset = queryset.filter(avg_volume__lte=value.stop)
-        
-        return queryset
+        return self._filter_stats_range(queryset, 'avg_keyword_volume', value)
     
     # ===== SEO METHODS =====
     
@@ -520,87 +397,35 @@ class WebsiteFilter(django_filters.FilterSet):
         if not HAS_SEO:
             return queryset
         
-        if value:
-            return queryset.filter(pages__seo_config__isnull=False).distinct()
-        return queryset.filter(pages__seo_config__isnull=True)
+        return self._filter_stats_positive(queryset, 'pages_with_seo_count', value)
     
     def filter_has_featured_images(self, queryset, name, value):
         """Sites avec/sans images featured"""
         if not HAS_SEO:
             return queryset
         
-        if value:
-            return queryset.exclude(
-                Q(pages__seo_config__featured_image__isnull=True) |
-                Q(pages__seo_config__featured_image='')
-            ).distinct()
-        return queryset.filter(
-            Q(pages__seo_config__featured_image__isnull=True) |
-            Q(pages__seo_config__featured_image='')
-        ).distinct()
+        return self._filter_stats_positive(queryset, 'featured_images_count', value)
     
     def filter_avg_sitemap_priority(self, queryset, name, value):
         """Priorité sitemap moyenne"""
         if not HAS_SEO:
             return queryset
         
-        queryset = queryset.annotate(
-            avg_priority=Avg('pages__seo_config__sitemap_priority')
-        )
-        
-        if value.start is not None:
-            queryset = queryset.filter(avg_priority__gte=value.start)
-        if value.stop is not None:
-            queryset = queryset.filter(avg_priority__lte=value.stop)
-        
-        return queryset
+        return self._filter_stats_range(queryset, 'avg_sitemap_priority', value)
     
     def filter_excluded_from_sitemap_count(self, queryset, name, value):
         """Nombre de pages exclues du sitemap"""
         if not HAS_SEO:
             return queryset
         
-        queryset = queryset.annotate(
-            excluded_count=Count(
-                'pages',
-                filter=Q(pages__seo_config__exclude_from_sitemap=True),
-                distinct=True
-            )
-        )
-        
-        if value.start is not None:
-            queryset = queryset.filter(excluded_count__gte=value.start)
-        if value.stop is not None:
-            queryset = queryset.filter(excluded_count__lte=value.stop)
-        
-        return queryset
+        return self._filter_stats_range(queryset, 'excluded_from_sitemap_count', value)
     
     def filter_meta_description_coverage(self, queryset, name, value):
         """Ratio pages avec meta description"""
         if not HAS_PAGES_CONTENT:
             return queryset
         
-        queryset = queryset.annotate(
-            total_pages=Count('pages', distinct=True),
-            pages_with_meta=Count(
-                'pages',
-                filter=~Q(pages__meta_description__isnull=True) & ~Q(pages__meta_description=''),
-                distinct=True
-            )
-        ).annotate(
-            meta_coverage=models.Case(
-                models.When(total_pages=0, then=0),
-                default=models.F('pages_with_meta') * 1.0 / models.F('total_pages'),
-                output_field=models.FloatField()
-            )
-        )
-        
-        if value.start is not None:
-            queryset = queryset.filter(meta_coverage__gte=value.start)
-        if value.stop is not None:
-            queryset = queryset.filter(meta_coverage__lte=value.stop)
-        
-        return queryset
+        return self._filter_stats_range(queryset, 'meta_description_coverage', value)
     
     # ===== LAYOUT METHODS =====
     
@@ -756,10 +581,8 @@ class WebsiteFilter(django_filters.FilterSet):
         if not (value and HAS_CATEGORIZATION and HAS_PAGES_CONTENT):
             return queryset
         
-        return queryset.annotate(
-            pages_count=Count('pages', distinct=True)
-        ).filter(
-            pages_count__gt=F(
+        return queryset.filter(
+            stats__pages_count__gt=F(
                 'categorizations__category__typical_pages_count'
             ),
             categorizations__is_primary=True
@@ -770,10 +593,8 @@ class WebsiteFilter(django_filters.FilterSet):
         if not (value and HAS_CATEGORIZATION and HAS_PAGES_CONTENT):
             return queryset
         
-        return queryset.annotate(
-            pages_count=Count('pages', distinct=True)
-        ).filter(
-            pages_count__lt=F(
+        return queryset.filter(
+            stats__pages_count__lt=F(
                 'categorizations__category__typical_pages_count'
             ),
             categorizations__is_primary=True
@@ -788,25 +609,19 @@ class WebsiteFilter(django_filters.FilterSet):
         if value == 'above':
             return queryset.filter(
                 Q(domain_authority__gt=F('categorizations__category__typical_da_range_max')) |
-                Q(pages_count__gt=F('categorizations__category__typical_pages_count')),
+                Q(stats__pages_count__gt=F('categorizations__category__typical_pages_count')),
                 categorizations__is_primary=True
-            ).annotate(
-                pages_count=Count('pages', distinct=True)
             ).distinct()
         elif value == 'below':
             return queryset.filter(
                 domain_authority__lt=F('categorizations__category__typical_da_range_min'),
                 categorizations__is_primary=True
-            ).annotate(
-                pages_count=Count('pages', distinct=True)
             ).distinct()
         elif value == 'typical':
             return queryset.filter(
                 domain_authority__gte=F('categorizations__category__typical_da_range_min'),
                 domain_authority__lte=F('categorizations__category__typical_da_range_max'),
                 categorizations__is_primary=True
-            ).annotate(
-                pages_count=Count('pages', distinct=True)
             ).distinct()
         
         return queryset
@@ -0,0 +1,22 @@
+# backend/seo_websites_core/management/commands/recompute_website_stats.py
+
+from django.core.management.base import BaseCommand
+
+from seo_websites_core.services.website_stats_service import RECOMPUTE_BATCH_SIZE, WebsiteStatsService
+
+
+class Command(BaseCommand):
+    help = 'Recalcule WebsiteStats pour tous les sites (requêtes groupées, upsert par lots)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=RECOMPUTE_BATCH_SIZE,
+            help=f'Taille des lots d\'écriture (défaut: {RECOMPUTE_BATCH_SIZE})'
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write("🔄 Recalcul des statistiques de sites...")
+        recomputed = WebsiteStatsService.recompute_all(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f"✅ {recomputed} sites recalculés"))
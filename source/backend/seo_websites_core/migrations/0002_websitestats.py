@@ -0,0 +1,57 @@
+# backend/seo_websites_core/migrations/0002_websitestats.py
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def populate_website_stats(apps, schema_editor):
+    from seo_websites_core.services.website_stats_service import WebsiteStatsService
+
+    WebsiteStatsService.recompute_all(get_model=apps.get_model, using=schema_editor.connection.alias)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('seo_websites_core', '0001_initial'),
+        # Sources agrégées par populate_website_stats
+        ('seo_pages_content', '0001_initial'),
+        ('seo_pages_workflow', '0002_initial'),
+        ('seo_pages_keywords', '0001_initial'),
+        ('seo_pages_seo', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WebsiteStats',
+            fields=[
+                ('website', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='stats', serialize=False, to='seo_websites_core.website')),
+                ('pages_count', models.IntegerField(db_index=True, default=0)),
+                ('pages_with_meta_count', models.IntegerField(default=0)),
+                ('pages_by_type', models.JSONField(blank=True, default=dict)),
+                ('published_pages_count', models.IntegerField(default=0)),
+                ('draft_pages_count', models.IntegerField(default=0)),
+                ('scheduled_pages_count', models.IntegerField(default=0)),
+                ('pages_by_status', models.JSONField(blank=True, default=dict)),
+                ('total_keywords_count', models.IntegerField(default=0)),
+                ('unique_keywords_count', models.IntegerField(default=0)),
+                ('primary_keywords_count', models.IntegerField(default=0)),
+                ('ai_keywords_count', models.IntegerField(default=0)),
+                ('pages_with_keywords_count', models.IntegerField(default=0)),
+                ('avg_keyword_volume', models.FloatField(blank=True, null=True)),
+                ('pages_with_seo_count', models.IntegerField(default=0)),
+                ('featured_images_count', models.IntegerField(default=0)),
+                ('excluded_from_sitemap_count', models.IntegerField(default=0)),
+                ('avg_sitemap_priority', models.FloatField(blank=True, null=True)),
+                ('publication_ratio', models.FloatField(db_index=True, default=0)),
+                ('keywords_coverage', models.FloatField(db_index=True, default=0)),
+                ('ai_keywords_ratio', models.FloatField(default=0)),
+                ('meta_description_coverage', models.FloatField(default=0)),
+                ('computed_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'seo_websites_core_websitestats',
+            },
+        ),
+        migrations.RunPython(populate_website_stats, migrations.RunPython.noop),
+    ]
@@ -1,5 +1,6 @@
 # backend/seo_websites_core/models/__init__.py
 
 from .website_models import Website
+from .stats_models import WebsiteStats
 
-__all__ = ['Website']
\ No newline at end of file
+__all__ = ['Website', 'WebsiteStats']
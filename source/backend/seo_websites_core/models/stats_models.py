@@ -0,0 +1,60 @@
+# backend/seo_websites_core/models/stats_models.py
+
+from django.db import models
+
+class WebsiteStats(models.Model):
+    """
+    Statistiques matérialisées d'un site (une ligne par site)
+
+    Maintenues par WebsiteStatsService : recalcul ciblé après chaque
+    modification de Page / PageStatus / PageKeyword / PageSEO (signals),
+    recalcul complet en quelques requêtes groupées (recompute_all).
+    Lues par WebsiteFilter et WebsiteViewSet au lieu des annotate(Count)
+    cross-app.
+    """
+
+    website = models.OneToOneField(
+        'Website',
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='stats'
+    )
+
+    # Pages (seo_pages_content)
+    pages_count = models.IntegerField(default=0, db_index=True)
+    pages_with_meta_count = models.IntegerField(default=0)
+    pages_by_type = models.JSONField(default=dict, blank=True)
+
+    # Workflow (seo_pages_workflow)
+    published_pages_count = models.IntegerField(default=0)
+    draft_pages_count = models.IntegerField(default=0)
+    scheduled_pages_count = models.IntegerField(default=0)
+    pages_by_status = models.JSONField(default=dict, blank=True)
+
+    # Mots-clés (seo_pages_keywords)
+    total_keywords_count = models.IntegerField(default=0)
+    unique_keywords_count = models.IntegerField(default=0)
+    primary_keywords_count = models.IntegerField(default=0)
+    ai_keywords_count = models.IntegerField(default=0)
+    pages_with_keywords_count = models.IntegerField(default=0)
+    avg_keyword_volume = models.FloatField(null=True, blank=True)
+
+    # SEO (seo_pages_seo)
+    pages_with_seo_count = models.IntegerField(default=0)
+    featured_images_count = models.IntegerField(default=0)
+    excluded_from_sitemap_count = models.IntegerField(default=0)
+    avg_sitemap_priority = models.FloatField(null=True, blank=True)
+
+    # Ratios (0 si dénominateur nul)
+    publication_ratio = models.FloatField(default=0, db_index=True)
+    keywords_coverage = models.FloatField(default=0, db_index=True)
+    ai_keywords_ratio = models.FloatField(default=0)
+    meta_description_coverage = models.FloatField(default=0)
+
+    computed_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Stats for website {self.website_id}"
+
+    class Meta:
+        db_table = 'seo_websites_core_websitestats'
@@ -1 +1,5 @@
 # backend/seo_websites_core/services/__init__.py
+
+from .website_stats_service import WebsiteStatsService
+
+__all__ = ['WebsiteStatsService']
@@ -0,0 +1,283 @@
+# backend/seo_websites_core/services/website_stats_service.py
+"""
+Statistiques matérialisées des sites (table WebsiteStats)
+
+- Une requête groupée par source (pages, statuts, mots-clés, SEO) : aucune
+  jointure croisée entre tables, donc pas de multiplication des lignes
+- Recalcul ciblé par site, regroupé en fin de transaction (signals)
+- Recalcul complet par lots (commande recompute_website_stats, migration)
+"""
+
+from collections import defaultdict
+
+from django.apps import apps as django_apps
+from django.db import connections, router, transaction
+from django.db.models import Avg, Count, Q
+
+from ..models import Website, WebsiteStats
+
+import logging
+logger = logging.getLogger(__name__)
+
+RECOMPUTE_BATCH_SIZE = 1000
+
+# Apps optionnelles : statistiques à zéro si l'app n'est pas installée
+SOURCE_MODELS = {
+    'page': ('seo_pages_content', 'Page'),
+    'status': ('seo_pages_workflow', 'PageStatus'),
+    'keyword': ('seo_pages_keywords', 'PageKeyword'),
+    'seo': ('seo_pages_seo', 'PageSEO'),
+}
+
+# Statuts workflow dénormalisés en colonnes filtrables
+STATUS_FIELDS = {
+    'published_pages_count': 'published',
+    'draft_pages_count': 'draft',
+    'scheduled_pages_count': 'scheduled',
+}
+
+# Ratio -> (numérateur, dénominateur)
+RATIO_FIELDS = {
+    'publication_ratio': ('published_pages_count', 'pages_count'),
+    'keywords_coverage': ('pages_with_keywords_count', 'pages_count'),
+    'ai_keywords_ratio': ('ai_keywords_count', 'total_keywords_count'),
+    'meta_description_coverage': ('pages_with_meta_count', 'pages_count'),
+}
+
+STATS_FIELDS = [
+    'pages_count', 'pages_with_meta_count', 'pages_by_type',
+    *STATUS_FIELDS, 'pages_by_status',
+    'total_keywords_count', 'unique_keywords_count', 'primary_keywords_count',
+    'ai_keywords_count', 'pages_with_keywords_count', 'avg_keyword_volume',
+    'pages_with_seo_count', 'featured_images_count', 'excluded_from_sitemap_count',
+    'avg_sitemap_priority',
+    *RATIO_FIELDS,
+]
+
+
+def _source_models(get_model=None):
+    """Modèles sources installés ({clé: modèle ou None}), historiques en migration"""
+    get_model = get_model or django_apps.get_model
+    models = {}
+    for key, (app_label, model_name) in SOURCE_MODELS.items():
+        try:
+            models[key] = get_model(app_label, model_name)
+        except LookupError:
+            models[key] = None
+    return models
+
+
+class WebsiteStatsService:
+    """Calcul et maintenance de WebsiteStats"""
+
+    # ===== CALCUL =====
+
+    @staticmethod
+    def _aggregate(models, website_ids=None, using=None):
+        """Requêtes groupées par site : {website_id: {champ: valeur}}"""
+        results = defaultdict(dict)
+
+        def scoped(model, website_field):
+            queryset = model.objects.using(using).order_by()
+            if website_ids is not None:
+                queryset = queryset.filter(**{f'{website_field}__in': website_ids})
+            return queryset
+
+        def collect(rows, website_field):
+            for row in rows:
+                results[row.pop(website_field)].update(row)
+
+        page_model = models['page']
+        if page_model:
+            collect(
+                scoped(page_model, 'website_id').values('website_id').annotate(
+                    pages_count=Count('id'),
+                    pages_with_meta_count=Count(
+                        'id', filter=Q(meta_description__isnull=False) & ~Q(meta_description='')
+                    ),
+                ),
+                'website_id'
+            )
+            for website_id, page_type, count in scoped(page_model, 'website_id').values(
+                'website_id', 'page_type'
+            ).annotate(count=Count('id')).values_list('website_id', 'page_type', 'count'):
+                results[website_id].setdefault('pages_by_type', {})[page_type] = count
+
+        status_model = models['status']
+        if status_model:
+            for website_id, status, count in scoped(status_model, 'page__website_id').values(
+                'page__website_id', 'status'
+            ).annotate(count=Count('id')).values_list('page__website_id', 'status', 'count'):
+                results[website_id].setdefault('pages_by_status', {})[status] = count
+
+        keyword_model = models['keyword']
+        if keyword_model:
+            collect(
+                scoped(keyword_model, 'page__website_id').values('page__website_id').annotate(
+                    total_keywords_count=Count('id'),
+                    unique_keywords_count=Count('keyword_id', distinct=True),
+                    primary_keywords_count=Count('id', filter=Q(keyword_type='primary')),
+                    ai_keywords_count=Count('id', filter=Q(is_ai_selected=True)),
+                    pages_with_keywords_count=Count('page_id', distinct=True),
+                    avg_keyword_volume=Avg('keyword__volume'),
+                ),
+                'page__website_id'
+            )
+
+        seo_model = models['seo']
+        if seo_model:
+            collect(
+                scoped(seo_model, 'page__website_id').values('page__website_id').annotate(
+                    pages_with_seo_count=Count('id'),
+                    featured_images_count=Count(
+                        'id', filter=Q(featured_image__isnull=False) & ~Q(featured_image='')
+                    ),
+                    excluded_from_sitemap_count=Count('id', filter=Q(exclude_from_sitemap=True)),
+                    avg_sitemap_priority=Avg('sitemap_priority'),
+                ),
+                'page__website_id'
+            )
+
+        return results
+
+    @staticmethod
+    def _row(stats_model, aggregated):
+        """Valeurs complètes d'une ligne : défauts, statuts en colonnes, ratios"""
+        row = {field: stats_model._meta.get_field(field).get_default() for field in STATS_FIELDS}
+        row.update(aggregated)
+
+        for field, status in STATUS_FIELDS.items():
+            row[field] = row['pages_by_status'].get(status, 0)
+        for field, (numerator, denominator) in RATIO_FIELDS.items():
+            row[field] = row[numerator] / row[denominator] if row[denominator] else 0
+        # Avg(DecimalField) -> Decimal
+        if row['avg_sitemap_priority'] is not None:
+            row['avg_sitemap_priority'] = float(row['avg_sitemap_priority'])
+        return row
+
+    @classmethod
+    def _write(cls, stats_model, website_ids, aggregated, using):
+        """Upsert des lignes WebsiteStats (site sans page : compteurs à zéro)"""
+        objects = [
+            stats_model(website_id=website_id, **cls._row(stats_model, aggregated.get(website_id, {})))
+            for website_id in website_ids
+        ]
+        stats_model.objects.using(using).bulk_create(
+            objects,
+            batch_size=RECOMPUTE_BATCH_SIZE,
+            update_conflicts=True,
+            unique_fields=['website'],
+            update_fields=STATS_FIELDS + ['computed_at'],
+        )
+        return len(objects)
+
+    @classmethod
+    def refresh_stats(cls, website_ids):
+        """Recalcule les stats des sites donnés (requêtes groupées filtrées + un upsert)"""
+        website_ids = set(website_ids)
+        if not website_ids:
+            return 0
+        using = router.db_for_write(WebsiteStats)
+        # Sites supprimés entre-temps : ignorés
+        existing = list(Website.objects.using(using).filter(id__in=website_ids).values_list('id', flat=True))
+        if not existing:
+            return 0
+        return cls._write(WebsiteStats, existing, cls._aggregate(_source_models(), existing, using), using)
+
+    @classmethod
+    def recompute_all(cls, get_model=None, using=None, batch_size=RECOMPUTE_BATCH_SIZE):
+        """
+        Recalcul complet : requêtes groupées sur toutes les tables puis upsert par lots.
+        `get_model` : apps.get_model historique en migration.
+        """
+        models = _source_models(get_model)
+        website_model = get_model('seo_websites_core', 'Website') if get_model else Website
+        stats_model = get_model('seo_websites_core', 'WebsiteStats') if get_model else WebsiteStats
+        using = using or router.db_for_write(stats_model)
+
+        aggregated = cls._aggregate(models, using=using)
+        website_ids = list(website_model.objects.using(using).order_by('id').values_list('id', flat=True))
+
+        written = 0
+        for start in range(0, len(website_ids), batch_size):
+            with transaction.atomic(using=using):
+                written += cls._write(stats_model, website_ids[start:start + batch_size], aggregated, using)
+
+        logger.info(f"Website stats recomputed for {written} websites")
+        return written
+
+    @classmethod
+    def get_stats(cls, website):
+        """Ligne WebsiteStats du site (calculée si absente)"""
+        try:
+            return website.stats
+        except WebsiteStats.DoesNotExist:
+            cls.refresh_stats([website.id])
+            return WebsiteStats.objects.get(website_id=website.id)
+
+    # ===== MAINTENANCE INCRÉMENTALE =====
+
+    @classmethod
+    def schedule_refresh(cls, website_ids):
+        """
+        Recalcul après commit de la transaction courante, regroupé : une
+        transaction qui crée 500 pages d'un site déclenche un seul recalcul.
+        Hors transaction, recalcul immédiat.
+        """
+        website_ids = {website_id for website_id in website_ids if website_id}
+        if not website_ids:
+            return
+
+        using = router.db_for_write(WebsiteStats)
+        connection = connections[using]
+        if not connection.in_atomic_block:
+            cls._safe_refresh(website_ids)
+            return
+
+        # Callback déjà enregistré pour cette transaction ? (retiré en cas de rollback)
+        pending = getattr(connection, '_website_stats_pending', None)
+        if pending is None or pending.done or not any(entry[1] is pending for entry in connection.run_on_commit):
+            pending = _PendingRefresh(cls)
+            connection._website_stats_pending = pending
+            transaction.on_commit(pending, using=using)
+        pending.website_ids |= website_ids
+
+    @classmethod
+    def schedule_refresh_for_pages(cls, page_ids):
+        page_model = _source_models()['page']
+        if page_model is None:
+            return
+        website_ids = page_model.objects.filter(id__in=list(page_ids)).values_list('website_id', flat=True)
+        cls.schedule_refresh(set(website_ids))
+
+    @classmethod
+    def schedule_refresh_for_keywords(cls, keyword_ids):
+        """Volume d'un mot-clé modifié : sites dont une page l'utilise"""
+        keyword_model = _source_models()['keyword']
+        if keyword_model is None:
+            return
+        website_ids = keyword_model.objects.filter(
+            keyword_id__in=list(keyword_ids)
+        ).values_list('page__website_id', flat=True).distinct()
+        cls.schedule_refresh(set(website_ids))
+
+    @classmethod
+    def _safe_refresh(cls, website_ids):
+        # Données dérivées : un échec ne doit pas casser l'écriture d'origine
+        try:
+            cls.refresh_stats(website_ids)
+        except Exception as e:
+            logger.error(f"Error refreshing stats for websites {sorted(website_ids)}: {e}", exc_info=True)
+
+
+class _PendingRefresh:
+    """Callback on_commit accumulant les sites à recalculer"""
+
+    def __init__(self, service):
+        self.service = service
+        self.website_ids = set()
+        self.done = False
+
+    def __call__(self):
+        self.done = True
+        self.service._safe_refresh(self.website_ids)
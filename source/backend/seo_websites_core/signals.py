@@ -0,0 +1,87 @@
+# backend/seo_websites_core/signals.py
+
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import receiver
+from seo_keywords_base.models import Keyword
+from .models import Website, WebsiteStats
+from .services import WebsiteStatsService
+
+# Champs entrant dans WebsiteStats
+PAGE_STATS_FIELDS = {'website', 'website_id', 'meta_description', 'page_type'}
+KEYWORD_STATS_FIELDS = {'volume'}
+
+@receiver(post_save, sender=Website)
+def create_website_stats(sender, instance, created, raw=False, **kwargs):
+    """Ligne de stats vide dès la création du site"""
+    if created and not raw:
+        WebsiteStats.objects.get_or_create(website=instance)
+
+@receiver(post_save, sender=Keyword)
+def refresh_stats_on_keyword_change(sender, instance, created, raw=False, update_fields=None, **kwargs):
+    # Nouveau mot-clé : encore sur aucune page
+    if created or raw:
+        return
+    if update_fields is not None and not KEYWORD_STATS_FIELDS & set(update_fields):
+        return
+    WebsiteStatsService.schedule_refresh_for_keywords([instance.id])
+
+# ===== SOURCES CROSS-APP (apps optionnelles) =====
+
+try:
+    from seo_pages_content.models import Page
+
+    @receiver(pre_save, sender=Page)
+    def remember_page_website(sender, instance, raw=False, update_fields=None, **kwargs):
+        """Site d'origine d'une page existante : un déplacement rafraîchit les deux sites"""
+        if raw or instance.pk is None:
+            return
+        if update_fields is not None and not {'website', 'website_id'} & set(update_fields):
+            return
+        instance._stats_previous_website_id = (
+            Page.objects.filter(pk=instance.pk).values_list('website_id', flat=True).first()
+        )
+
+    @receiver(post_save, sender=Page)
+    @receiver(post_delete, sender=Page)
+    def refresh_stats_on_page_change(sender, instance, raw=False, update_fields=None, **kwargs):
+        previous_website_id = instance.__dict__.pop('_stats_previous_website_id', None)
+        if raw:
+            return
+        if update_fields is not None and not PAGE_STATS_FIELDS & set(update_fields):
+            return
+        WebsiteStatsService.schedule_refresh({instance.website_id, previous_website_id})
+except ImportError:
+    pass
+
+try:
+    from seo_pages_workflow.models import PageStatus
+
+    @receiver(post_save, sender=PageStatus)
+    @receiver(post_delete, sender=PageStatus)
+    def refresh_stats_on_status_change(sender, instance, raw=False, **kwargs):
+        if not raw:
+            WebsiteStatsService.schedule_refresh_for_pages([instance.page_id])
+except ImportError:
+    pass
+
+try:
+    from seo_pages_keywords.models import PageKeyword
+
+    @receiver(post_save, sender=PageKeyword)
+    @receiver(post_delete, sender=PageKeyword)
+    def refresh_stats_on_page_keyword_change(sender, instance, raw=False, **kwargs):
+        if not raw:
+            WebsiteStatsService.schedule_refresh_for_pages([instance.page_id])
+except ImportError:
+    pass
+
+try:
+    from seo_pages_seo.models import PageSEO
+
+    @receiver(post_save, sender=PageSEO)
+    @receiver(post_delete, sender=PageSEO)
+    def refresh_stats_on_seo_change(sender, instance, raw=False, **kwargs):
+        if not raw:
+            WebsiteStatsService.schedule_refresh_for_pages([instance.page_id])
+except ImportError:
+    pass
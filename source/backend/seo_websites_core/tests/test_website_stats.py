@@ -0,0 +1,142 @@
+# backend/seo_websites_core/tests/test_website_stats.py
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from brands_core.models import Brand
+from company_core.models import Company
+from seo_keywords_base.models import Keyword
+from seo_pages_content.models import Page
+from seo_pages_keywords.models import PageKeyword
+from seo_pages_seo.models import PageSEO
+from seo_pages_workflow.models import PageStatus
+from seo_websites_core.filters import WebsiteFilter
+from seo_websites_core.models import Website, WebsiteStats
+from seo_websites_core.services import WebsiteStatsService
+
+User = get_user_model()
+
+
+class WebsiteStatsTestCase(TestCase):
+    """WebsiteStats : maintenance incrémentale, recalcul complet, lecture par les filtres"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='stats_admin', email='stats@example.com', password='x')
+        self.company = Company.objects.create(name='Stats Company', admin=self.user, billing_email='b@example.com')
+        self.user.company = self.company
+        self.user.save()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.website = self._website('Site A')
+            self.other = self._website('Site B')
+
+            self.keywords = [Keyword.objects.create(keyword=f'mot {index}', volume=100 * (index + 1)) for index in range(3)]
+            self.pages = [
+                Page.objects.create(website=self.website, title=f'Page {index}', page_type=page_type,
+                                    meta_description='Meta' if index < 2 else '')
+                for index, page_type in enumerate(['vitrine', 'blog', 'blog', 'produit'])
+            ]
+            for page, status in zip(self.pages, ['published', 'published', 'draft', 'scheduled']):
+                PageStatus.objects.create(page=page, status=status)
+
+            PageKeyword.objects.create(page=self.pages[0], keyword=self.keywords[0], keyword_type='primary', is_ai_selected=True)
+            PageKeyword.objects.create(page=self.pages[0], keyword=self.keywords[1])
+            PageKeyword.objects.create(page=self.pages[1], keyword=self.keywords[0], is_ai_selected=True)
+
+            PageSEO.objects.create(page=self.pages[0], sitemap_priority='0.8', featured_image='https://img.fr/a.png')
+            PageSEO.objects.create(page=self.pages[1], sitemap_priority='0.6', exclude_from_sitemap=True)
+
+    def _website(self, name):
+        brand = Brand.objects.create(name=name, company=self.company, brand_admin=self.user)
+        return Website.objects.create(name=name, url='https://example.com', brand=brand)
+
+    def assert_stats(self, stats):
+        self.assertEqual(stats.pages_count, 4)
+        self.assertEqual(stats.pages_by_type, {'vitrine': 1, 'blog': 2, 'produit': 1})
+        self.assertEqual(stats.pages_by_status, {'published': 2, 'draft': 1, 'scheduled': 1})
+        self.assertEqual(
+            (stats.published_pages_count, stats.draft_pages_count, stats.scheduled_pages_count), (2, 1, 1)
+        )
+        self.assertEqual(stats.publication_ratio, 0.5)
+        self.assertEqual(stats.meta_description_coverage, 0.5)
+        self.assertEqual(
+            (stats.total_keywords_count, stats.unique_keywords_count, stats.primary_keywords_count,
+             stats.ai_keywords_count, stats.pages_with_keywords_count),
+            (3, 2, 1, 2, 2)
+        )
+        self.assertEqual(stats.keywords_coverage, 0.5)
+        self.assertAlmostEqual(stats.ai_keywords_ratio, 2 / 3)
+        self.assertAlmostEqual(stats.avg_keyword_volume, 400 / 3)
+        self.assertEqual((stats.pages_with_seo_count, stats.featured_images_count, stats.excluded_from_sitemap_count), (2, 1, 1))
+        self.assertAlmostEqual(stats.avg_sitemap_priority, 0.7)
+
+    def test_incremental_maintenance(self):
+        self.assert_stats(WebsiteStats.objects.get(website=self.website))
+        self.assertEqual(WebsiteStats.objects.get(website=self.other).pages_count, 0)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            status = self.pages[2].workflow_status
+            status.status = 'published'
+            status.save()
+            Keyword.objects.filter(pk=self.keywords[0].pk).update(volume=700)
+            self.keywords[0].refresh_from_db()
+            self.keywords[0].save(update_fields=['volume'])
+
+        stats = WebsiteStats.objects.get(website=self.website)
+        self.assertEqual((stats.published_pages_count, stats.draft_pages_count), (3, 0))
+        self.assertEqual(stats.publication_ratio, 0.75)
+        self.assertAlmostEqual(stats.avg_keyword_volume, 1600 / 3)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.pages[0].delete()
+        stats.refresh_from_db()
+        self.assertEqual((stats.pages_count, stats.total_keywords_count, stats.pages_with_seo_count), (3, 1, 1))
+
+    def test_page_move_refreshes_both_websites(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            page = Page.objects.get(pk=self.pages[3].pk)
+            page.website = self.other
+            page.save()
+
+        self.assertEqual(WebsiteStats.objects.get(website=self.website).pages_count, 3)
+        self.assertEqual(WebsiteStats.objects.get(website=self.other).pages_count, 1)
+
+    def test_recompute_all_matches_incremental(self):
+        WebsiteStats.objects.all().delete()
+
+        self.assertEqual(WebsiteStatsService.recompute_all(batch_size=1), 2)
+
+        self.assert_stats(WebsiteStats.objects.get(website=self.website))
+
+    def test_filters_read_stats(self):
+        def names(params):
+            return sorted(WebsiteFilter(params, queryset=Website.objects.all()).qs.values_list('name', flat=True))
+
+        self.assertEqual(names({'pages_count_min': 1}), ['Site A'])
+        self.assertEqual(names({'has_pages': False}), ['Site B'])
+        # Filtres combinés : une seule jointure 1:1 sur WebsiteStats
+        self.assertEqual(names({
+            'publication_ratio_min': 0.5, 'keywords_coverage_min': 0.5,
+            'ai_keywords_ratio_min': 0.6, 'avg_sitemap_priority_min': 0.65,
+            'has_featured_images': True, 'has_primary_keywords': True,
+        }), ['Site A'])
+        self.assertEqual(names({'publication_ratio_min': 0.6}), [])
+        self.assertEqual(names({'has_keywords': False}), ['Site B'])
+
+        # Site sans ligne WebsiteStats : compté comme sans pages
+        WebsiteStats.objects.filter(website=self.other).delete()
+        self.assertEqual(names({'has_pages': False}), ['Site B'])
+        self.assertEqual(names({'has_pages': True}), ['Site A'])
+
+    def test_stats_endpoint(self):
+        client = APIClient()
+        client.force_authenticate(self.user)
+
+        response = client.get(reverse('sites:websites-stats', args=[self.website.id]))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['total_pages'], 4)
+        self.assertEqual(response.data['pages_by_status'], {'published': 2, 'draft': 1, 'scheduled': 1})
+        self.assertEqual(response.data['performance_ratios'], {'publication_rate': 0.5, 'completion_rate': 0.75})
@@ -4,7 +4,8 @@ from rest_framework import viewsets, permissions
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
-from django.db.models import Count
+from django.db.models import F
+from django.db.models.functions import Coalesce
 
 from common.views.mixins import BrandScopedViewSetMixin
 
@@ -14,7 +15,7 @@ class WebsiteCoreBaseViewSet(BrandScopedViewSetMixin, viewsets.ModelViewSet):
     
     Fournit :
     - Filtrage automatique par brand (via BrandScopedViewSetMixin)
-    - Optimisations queryset de base (brand + pages_count)
+    - Optimisations queryset de base (brand + pages_count via WebsiteStats)
     - Configuration DRF standard
     """
     
@@ -27,15 +28,15 @@ class WebsiteCoreBaseViewSet(BrandScopedViewSetMixin, viewsets.ModelViewSet):
         Optimisations de base communes à tous les ViewSets Website
         
         Performance Strategy:
-        - select_related('brand') : Évite N+1 queries sur brand
-        - annotate(pages_count) : Calcul pages en une seule query
+        - select_related('brand', 'stats') : Évite N+1 queries sur brand/stats
+        - annotate(pages_count) : Lu dans WebsiteStats, sans jointure sur les pages
         - Base pour optimisations conditionnelles dans enfants
         """
         queryset = super().get_queryset()
         
         # Optimisations systématiques pour tous les websites
-        return queryset.select_related('brand').annotate(
-            pages_count=Count('pages', distinct=True)
+        return queryset.select_related('brand', 'stats').annotate(
+            pages_count=Coalesce(F('stats__pages_count'), 0)
         )
     
     class Meta:
@@ -9,6 +9,7 @@ from django.db import models
 
 from .base_views import WebsiteCoreBaseViewSet
 from ..models import Website
+from ..services import WebsiteStatsService
 from ..serializers import (
     WebsiteListSerializer,
     WebsiteDetailSerializer,
@@ -45,10 +46,9 @@ class WebsiteViewSet(WebsiteCoreBaseViewSet):
         🔥 QUERYSET INTELLIGENT : Optimisations conditionnelles selon filtres
         
         Performance Strategy:
-        - Base: select_related('brand') + pages_count (TOUJOURS via parent)
-        - Keywords: + prefetch keywords SI filtres keywords actifs  
-        - SEO: + prefetch seo_config SI filtres SEO actifs
-        - Workflow: + prefetch workflow_status SI filtres workflow actifs
+        - Base: select_related('brand', 'stats') + pages_count (TOUJOURS via parent)
+        - Keywords / SEO / Workflow: compteurs lus dans WebsiteStats SI filtres actifs
+          (aucune jointure sur pages / mots-clés / statuts)
         - Layout: + prefetch layout/sections SI filtres layout actifs
         - Categorization: + prefetch categories SI filtres catégorie actifs
         
@@ -66,11 +66,9 @@ class WebsiteViewSet(WebsiteCoreBaseViewSet):
             'avg_keyword_volume'
         ]
         if any(param in request_params for param in keywords_filters):
-            queryset = queryset.prefetch_related(
-                'pages__page_keywords__keyword'
-            ).annotate(
-                total_keywords=Count('pages__page_keywords', distinct=True),
-                unique_keywords=Count('pages__page_keywords__keyword', distinct=True)
+            queryset = queryset.annotate(
+                total_keywords=F('stats__total_keywords_count'),
+                unique_keywords=F('stats__unique_keywords_count')
             )
         
         # 🔥 SEO OPTIMIZATION  
@@ -79,15 +77,9 @@ class WebsiteViewSet(WebsiteCoreBaseViewSet):
             'excluded_from_sitemap_count', 'meta_description_coverage'
         ]
         if any(param in request_params for param in seo_filters):
-            queryset = queryset.prefetch_related(
-                'pages__seo_config'
-            ).annotate(
-                avg_sitemap_priority=Avg('pages__seo_config__sitemap_priority'),
-                excluded_pages=Count(
-                    'pages',
-                    filter=Q(pages__seo_config__exclude_from_sitemap=True),
-                    distinct=True
-                )
+            queryset = queryset.annotate(
+                avg_sitemap_priority=F('stats__avg_sitemap_priority'),
+                excluded_pages=F('stats__excluded_from_sitemap_count')
             )
         
         # 🔥 WORKFLOW OPTIMIZATION
@@ -96,19 +88,9 @@ class WebsiteViewSet(WebsiteCoreBaseViewSet):
             'published_pages_count', 'publication_ratio'
         ]
         if any(param in request_params for param in workflow_filters):
-            queryset = queryset.prefetch_related(
-                'pages__workflow_status'
-            ).annotate(
-                published_pages=Count(
-                    'pages',
-                    filter=Q(pages__workflow_status__status='published'),
-                    distinct=True
-                ),
-                draft_pages=Count(
-                    'pages',
-                    filter=Q(pages__workflow_status__status='draft'),
-                    distinct=True
-                )
+            queryset = queryset.annotate(
+                published_pages=F('stats__published_pages_count'),
+                draft_pages=F('stats__draft_pages_count')
             )
         
         # 🔥 LAYOUT OPTIMIZATION
@@ -292,6 +274,8 @@ class WebsiteViewSet(WebsiteCoreBaseViewSet):
         
         GET /websites/{id}/stats/
         
+        Lu dans WebsiteStats (calculé si absent), sans requête sur les pages.
+        
         Retourne :
         - Métriques de base du site
         - Répartition des pages par type/statut
@@ -299,64 +283,30 @@ class WebsiteViewSet(WebsiteCoreBaseViewSet):
         - Ratios de performance si données disponibles
         """
         website = self.get_object()
+        website_stats = WebsiteStatsService.get_stats(website)
+        total_pages = website_stats.pages_count
         
-        # Import local pour éviter circular import
-        try:
-            from seo_pages_content.models import Page
-            from seo_pages_workflow.models import PageStatus
-            
-            pages = Page.objects.filter(website=website)
-            
-            stats = {
-                'website_id': website.id,
-                'website_name': website.name,
-                'website_url': website.url,
-                'brand_name': website.brand.name,
-                'total_pages': pages.count(),
-                'pages_by_type': dict(
-                    pages.values('page_type').annotate(count=Count('id')).values_list('page_type', 'count')
-                ),
-                'pages_by_status': {},
-                'domain_authority': website.domain_authority,
-                'competitor_metrics': {
-                    'max_backlinks': website.max_competitor_backlinks,
-                    'max_kd': website.max_competitor_kd
-                }
-            }
-            
-            # Stats statuts si disponibles
-            try:
-                status_stats = PageStatus.objects.filter(page__website=website).values(
-                    'status'
-                ).annotate(count=Count('id'))
-                stats['pages_by_status'] = {
-                    item['status']: item['count'] for item in status_stats
-                }
-                
-                # Ratios de performance
-                total_pages = stats['total_pages']
-                if total_pages > 0:
-                    published_count = stats['pages_by_status'].get('published', 0)
-                    stats['performance_ratios'] = {
-                        'publication_rate': round(published_count / total_pages, 2),
-                        'completion_rate': round((total_pages - stats['pages_by_status'].get('draft', 0)) / total_pages, 2)
-                    }
-            except:
-                pass
-                
-        except ImportError:
-            # Apps pas disponibles
-            stats = {
-                'website_id': website.id,
-                'website_name': website.name,
-                'website_url': website.url,
-                'brand_name': website.brand.name,
-                'domain_authority': website.domain_authority,
-                'competitor_metrics': {
-                    'max_backlinks': website.max_competitor_backlinks,
-                    'max_kd': website.max_competitor_kd
-                },
-                'message': 'Stats détaillées nécessitent les apps pages_content et workflow'
+        stats = {
+            'website_id': website.id,
+            'website_name': website.name,
+            'website_url': website.url,
+            'brand_name': website.brand.name,
+            'total_pages': total_pages,
+            'pages_by_type': website_stats.pages_by_type,
+            'pages_by_status': website_stats.pages_by_status,
+            'domain_authority': website.domain_authority,
+            'competitor_metrics': {
+                'max_backlinks': website.max_competitor_backlinks,
+                'max_kd': website.max_competitor_kd
+            },
+            'computed_at': website_stats.computed_at,
+        }
+        
+        # Ratios de performance
+        if total_pages > 0:
+            stats['performance_ratios'] = {
+                'publication_rate': round(website_stats.publication_ratio, 2),
+                'completion_rate': round((total_pages - website_stats.draft_pages_count) / total_pages, 2)
             }
         
-        return Response(stats)
\ No newline at end of file
+        return Response(stats)
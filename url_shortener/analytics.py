@@ -0,0 +1,511 @@
+# url_shortener/analytics.py
+"""
+Click log partitionné + agrégats journaliers incrémentaux
+
+Partitionnement :
+- url_shortener_click_log devient une table partitionnée par jour
+  (RANGE sur clicked_at, UTC). Conversion unique : `python analytics.py migrate`
+  (l'ancienne table devient la partition "legacy", sans copie de données)
+- Partitions créées à l'avance (SHORTENER_PARTITION_DAYS_AHEAD) ; une
+  partition DEFAULT recueille les lignes hors plage, redistribuées à la
+  création de la partition concernée
+- Rétention : les partitions plus vieilles que SHORTENER_CLICK_RETENTION_DAYS
+  sont supprimées, uniquement une fois agrégées
+
+Agrégats (url_shortener_click_daily) :
+- Une ligne par (jour, short_id, public/privé, domaine referer, classe d'UA)
+- Le job ne lit que les lignes d'id > dernier id agrégé (watermark en base),
+  agrégat + watermark dans la même transaction : chaque clic compte une fois
+- Les lignes plus récentes que ROLLUP_LAG sont laissées au passage suivant
+  (transactions d'insertion pas encore visibles)
+- clicked_at est l'heure de mise en file (writer batché), pas l'heure de
+  commit : une ligne d'id inférieur au watermark peut devenir visible après
+  son passage (file en retard, flush lent). Réconciliation idempotente :
+  les agrégats des RECONCILE_DAYS derniers jours sont recalculés en entier
+  depuis le log brut pour id <= watermark (DELETE + INSERT sous le même
+  verrou que l'agrégation incrémentale), toutes les
+  SHORTENER_ROLLUP_RECONCILE_INTERVAL secondes. Un clic commité en retard
+  apparaît au plus tard à la réconciliation suivante, jamais en double
+
+Les dashboards lisent url_shortener_click_daily (voir get_click_summary).
+
+Les jobs tournent dans un thread par worker ; un advisory lock Postgres
+garantit qu'un seul worker travaille à la fois.
+"""
+import logging
+import os
+import re
+import sys
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+logger = logging.getLogger(__name__)
+
+CLICK_LOG = 'url_shortener_click_log'
+LEGACY_PARTITION = f'{CLICK_LOG}_legacy'
+DEFAULT_PARTITION = f'{CLICK_LOG}_default'
+DAILY_ROLLUP = 'url_shortener_click_daily'
+ROLLUP_STATE = 'url_shortener_rollup_state'
+
+# Clés d'advisory lock (arbitraires, propres au raccourcisseur)
+ROLLUP_LOCK_KEY = 7310001
+PARTITION_LOCK_KEY = 7310002
+
+ROLLUP_LAG = '60 seconds'
+
+# Jours recalculés par la réconciliation (aujourd'hui et hier, UTC)
+RECONCILE_DAYS = 2
+
+BOUND_PATTERN = re.compile(r"FROM \((.+?)\) TO \((.+?)\)")
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS {DAILY_ROLLUP} (
+    day date NOT NULL,
+    short_id varchar(10) NOT NULL,
+    is_public boolean NOT NULL,
+    referer_host varchar(255) NOT NULL,
+    ua_class varchar(16) NOT NULL,
+    clicks bigint NOT NULL,
+    PRIMARY KEY (day, short_id, is_public, referer_host, ua_class)
+);
+CREATE INDEX IF NOT EXISTS {DAILY_ROLLUP}_short_id_day_idx ON {DAILY_ROLLUP} (short_id, day);
+CREATE TABLE IF NOT EXISTS {ROLLUP_STATE} (
+    name varchar(50) PRIMARY KEY,
+    last_id bigint NOT NULL DEFAULT 0,
+    updated_at timestamptz NOT NULL DEFAULT now()
+);
+INSERT INTO {ROLLUP_STATE} (name, last_id) VALUES ('click_daily', 0) ON CONFLICT DO NOTHING;
+"""
+
+# Classe d'UA et domaine du referer calculés en SQL : pas de transit des lignes brutes
+ROLLUP_SQL = f"""
+INSERT INTO {DAILY_ROLLUP} AS r (day, short_id, is_public, referer_host, ua_class, clicks)
+SELECT (clicked_at AT TIME ZONE 'UTC')::date,
+       short_id,
+       is_public,
+       COALESCE(NULLIF(regexp_replace(
+           lower(substring(referer from '^[a-zA-Z][a-zA-Z0-9+.-]*://([^/:?#]+)')),
+           '^www\\.', ''), ''), '(direct)'),
+       CASE
+           WHEN COALESCE(user_agent, '') = '' THEN 'unknown'
+           WHEN user_agent ~* '(bot|crawl|spider|slurp|curl|wget|python|http-client|preview)' THEN 'bot'
+           WHEN user_agent ~* '(ipad|tablet)' THEN 'tablet'
+           WHEN user_agent ~* '(mobile|iphone|android)' THEN 'mobile'
+           ELSE 'desktop'
+       END,
+       count(*)
+FROM {CLICK_LOG}
+WHERE {{where}}
+GROUP BY 1, 2, 3, 4, 5
+ON CONFLICT (day, short_id, is_public, referer_host, ua_class)
+DO UPDATE SET clicks = r.clicks + EXCLUDED.clicks
+"""
+
+
+def _utc_today():
+    return datetime.now(timezone.utc).date()
+
+
+def _day_start(day):
+    return datetime(day.year, day.month, day.day, tzinfo=timezone.utc)
+
+
+def _parse_bound(value):
+    """Borne de pg_get_expr : 'MINVALUE' / 'MAXVALUE' / timestamp entre quotes"""
+    value = value.strip()
+    if value in ('MINVALUE', 'MAXVALUE'):
+        return None
+    return datetime.fromisoformat(value.strip("'"))
+
+
+# ===== PARTITIONNEMENT =====
+
+def is_partitioned(cursor):
+    cursor.execute(
+        "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(%s))",
+        (CLICK_LOG,)
+    )
+    return cursor.fetchone()[0]
+
+
+def list_partitions(cursor):
+    """[(nom, borne basse, borne haute)] ; None = MINVALUE/MAXVALUE, DEFAULT exclue"""
+    cursor.execute("""
+        SELECT c.relname, pg_get_expr(c.relpartbound, c.oid)
+        FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid
+        WHERE i.inhparent = to_regclass(%s)
+    """, (CLICK_LOG,))
+    partitions = []
+    for name, bound in cursor.fetchall():
+        match = BOUND_PATTERN.search(bound or '')
+        if match:
+            partitions.append((name, _parse_bound(match.group(1)), _parse_bound(match.group(2))))
+    return sorted(partitions, key=lambda p: p[2] or datetime.max.replace(tzinfo=timezone.utc))
+
+
+def convert_to_partitioned(db):
+    """
+    Conversion unique de la table existante en table partitionnée.
+
+    L'ancienne table est rattachée telle quelle comme partition
+    [MINVALUE, demain) : pas de copie, mais un scan de validation de la
+    contrainte de plage et la construction de la nouvelle clé primaire,
+    sous verrou exclusif (à lancer en heure creuse).
+    """
+    boundary = _day_start(_utc_today() + timedelta(days=1))
+    with db.connection() as conn:
+        with conn.cursor() as cursor:
+            if is_partitioned(cursor):
+                logger.info(f"{CLICK_LOG} is already partitioned")
+                return False
+
+            cursor.execute("SELECT pg_get_serial_sequence(%s, 'id')", (CLICK_LOG,))
+            sequence = cursor.fetchone()[0]
+
+            cursor.execute(f"LOCK TABLE {CLICK_LOG} IN ACCESS EXCLUSIVE MODE")
+            cursor.execute(f"ALTER TABLE {CLICK_LOG} RENAME TO {LEGACY_PARTITION}")
+            cursor.execute(f"""
+                CREATE TABLE {CLICK_LOG} (LIKE {LEGACY_PARTITION} INCLUDING DEFAULTS)
+                PARTITION BY RANGE (clicked_at)
+            """)
+            # La clé de partition doit faire partie de la clé primaire
+            cursor.execute(f"""
+                ALTER TABLE {CLICK_LOG}
+                ADD CONSTRAINT {CLICK_LOG}_part_pkey PRIMARY KEY (id, clicked_at)
+            """)
+            cursor.execute(f"""
+                CREATE INDEX {CLICK_LOG}_part_short_id_idx
+                ON {CLICK_LOG} (short_id, clicked_at)
+            """)
+            if sequence:
+                cursor.execute(f"ALTER SEQUENCE {sequence} OWNED BY {CLICK_LOG}.id")
+
+            # CHECK validé d'abord : SET NOT NULL et ATTACH le réutilisent sans rescanner
+            cursor.execute(f"""
+                ALTER TABLE {LEGACY_PARTITION}
+                ADD CONSTRAINT {LEGACY_PARTITION}_bound
+                CHECK (clicked_at IS NOT NULL AND clicked_at < %s)
+            """, (boundary,))
+            cursor.execute(f"ALTER TABLE {LEGACY_PARTITION} ALTER COLUMN clicked_at SET NOT NULL")
+            # L'ancienne clé primaire (id) est remplacée par celle du parent (id, clicked_at),
+            # construite par ATTACH
+            cursor.execute("""
+                SELECT conname FROM pg_constraint
+                WHERE conrelid = to_regclass(%s) AND contype = 'p'
+            """, (LEGACY_PARTITION,))
+            for (constraint,) in cursor.fetchall():
+                cursor.execute(f"ALTER TABLE {LEGACY_PARTITION} DROP CONSTRAINT {constraint}")
+            cursor.execute(f"""
+                ALTER TABLE {CLICK_LOG} ATTACH PARTITION {LEGACY_PARTITION}
+                FOR VALUES FROM (MINVALUE) TO (%s)
+            """, (boundary,))
+            cursor.execute(f"CREATE TABLE {DEFAULT_PARTITION} PARTITION OF {CLICK_LOG} DEFAULT")
+
+    logger.info(f"{CLICK_LOG} converted to a partitioned table (legacy < {boundary.date()})")
+    return True
+
+
+def ensure_partitions(db, days_ahead=7):
+    """Crée les partitions journalières d'aujourd'hui à aujourd'hui + days_ahead"""
+    created = 0
+    today = _utc_today()
+    with db.connection() as conn:
+        with conn.cursor() as cursor:
+            if not is_partitioned(cursor):
+                return 0
+            existing = list_partitions(cursor)
+
+    for offset in range(days_ahead + 1):
+        start = _day_start(today + timedelta(days=offset))
+        end = start + timedelta(days=1)
+        if any((low is None or low < end) and (high is None or high > start)
+               for _, low, high in existing):
+            continue
+        _create_day_partition(db, start, end)
+        created += 1
+    return created
+
+
+def _create_day_partition(db, start, end):
+    """Table autonome + rapatriement des lignes de DEFAULT + ATTACH, en une transaction"""
+    name = f"{CLICK_LOG}_p{start:%Y%m%d}"
+    with db.connection() as conn:
+        with conn.cursor() as cursor:
+            # Ne pas bloquer le writer de clics plus de quelques secondes
+            cursor.execute("SET LOCAL lock_timeout = '5s'")
+            cursor.execute(f"CREATE TABLE {name} (LIKE {CLICK_LOG} INCLUDING DEFAULTS)")
+            cursor.execute(f"""
+                WITH moved AS (
+                    DELETE FROM {DEFAULT_PARTITION}
+                    WHERE clicked_at >= %(start)s AND clicked_at < %(end)s
+                    RETURNING *
+                )
+                INSERT INTO {name} SELECT * FROM moved
+            """, {'start': start, 'end': end})
+            moved = cursor.rowcount
+            cursor.execute(f"""
+                ALTER TABLE {CLICK_LOG} ATTACH PARTITION {name}
+                FOR VALUES FROM (%s) TO (%s)
+            """, (start, end))
+    logger.info(f"Click log partition {name} created ({moved} rows moved from default)")
+
+
+def drop_expired_partitions(db, retention_days):
+    """Supprime les partitions entièrement hors rétention et déjà agrégées"""
+    cutoff = _day_start(_utc_today() - timedelta(days=retention_days))
+    dropped = []
+    with db.connection() as conn:
+        with conn.cursor() as cursor:
+            if not is_partitioned(cursor):
+                return dropped
+            cursor.execute(f"SELECT last_id FROM {ROLLUP_STATE} WHERE name = 'click_daily'")
+            row = cursor.fetchone()
+            last_id = row[0] if row else 0
+
+            for name, _, high in list_partitions(cursor):
+                if high is None or high > cutoff:
+                    continue
+                # Jamais de perte de clics non agrégés
+                cursor.execute(f"SELECT EXISTS (SELECT 1 FROM {name} WHERE id > %s)", (last_id,))
+                if cursor.fetchone()[0]:
+                    logger.warning(f"Partition {name} expired but not fully rolled up, kept")
+                    continue
+                cursor.execute("SET LOCAL lock_timeout = '5s'")
+                cursor.execute(f"DROP TABLE {name}")
+                dropped.append(name)
+
+    if dropped:
+        logger.info(f"Click log partitions dropped (retention {retention_days}d): {dropped}")
+    return dropped
+
+
+# ===== AGRÉGATS =====
+
+def ensure_schema(db):
+    with db.connection() as conn:
+        with conn.cursor() as cursor:
+            cursor.execute(SCHEMA)
+
+
+def rollup_new_clicks(db, chunk_size=100000):
+    """
+    Agrège les clics d'id > watermark, par tranches d'ids.
+    Retourne le nombre de tranches traitées (0 = rien à faire ou autre worker actif).
+    """
+    chunks = 0
+    while True:
+        with db.connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT pg_try_advisory_xact_lock(%s)", (ROLLUP_LOCK_KEY,))
+                if not cursor.fetchone()[0]:
+                    return chunks
+
+                cursor.execute(
+                    f"SELECT last_id FROM {ROLLUP_STATE} WHERE name = 'click_daily' FOR UPDATE"
+                )
+                last_id = cursor.fetchone()[0]
+
+                # Borne haute : dernier id assez ancien pour que les lignes d'id
+                # inférieur soient toutes visibles
+                cursor.execute(f"""
+                    SELECT max(id) FROM (
+                        SELECT id FROM {CLICK_LOG}
+                        WHERE id > %s AND clicked_at < now() - interval '{ROLLUP_LAG}'
+                        ORDER BY id LIMIT %s
+                    ) AS candidates
+                """, (last_id, chunk_size))
+                until_id = cursor.fetchone()[0]
+                if until_id is None:
+                    return chunks
+
+                cursor.execute(
+                    ROLLUP_SQL.format(where='id > %(after_id)s AND id <= %(until_id)s'),
+                    {'after_id': last_id, 'until_id': until_id}
+                )
+                cursor.execute(
+                    f"UPDATE {ROLLUP_STATE} SET last_id = %s, updated_at = now() "
+                    f"WHERE name = 'click_daily'",
+                    (until_id,)
+                )
+        chunks += 1
+
+
+def reconcile_recent_days(db, days=RECONCILE_DAYS):
+    """
+    Recalcule entièrement les agrégats des `days` derniers jours pour id <= watermark.
+    Rattrape les clics commités après le passage du watermark ; idempotent.
+    Retourne False si un autre worker agrège en ce moment.
+    """
+    since = _utc_today() - timedelta(days=days - 1)
+    with db.connection() as conn:
+        with conn.cursor() as cursor:
+            cursor.execute("SELECT pg_try_advisory_xact_lock(%s)", (ROLLUP_LOCK_KEY,))
+            if not cursor.fetchone()[0]:
+                return False
+
+            cursor.execute(
+                f"SELECT last_id FROM {ROLLUP_STATE} WHERE name = 'click_daily' FOR UPDATE"
+            )
+            last_id = cursor.fetchone()[0]
+
+            # Les lignes d'id > watermark restent à l'agrégation incrémentale
+            cursor.execute(f"DELETE FROM {DAILY_ROLLUP} WHERE day >= %s", (since,))
+            cursor.execute(
+                ROLLUP_SQL.format(where='clicked_at >= %(since)s AND id <= %(until_id)s'),
+                {'since': _day_start(since), 'until_id': last_id}
+            )
+    return True
+
+
+def get_click_summary(db, short_id, days=30):
+    """Stats d'un lien pour les dashboards (agrégats uniquement, jamais le log brut)"""
+    since = _utc_today() - timedelta(days=days - 1)
+    with db.connection() as conn:
+        with conn.cursor() as cursor:
+            cursor.execute(f"""
+                SELECT day, sum(clicks) FROM {DAILY_ROLLUP}
+                WHERE short_id = %s AND day >= %s
+                GROUP BY day ORDER BY day
+            """, (short_id, since))
+            per_day = [(day.isoformat(), int(clicks)) for day, clicks in cursor.fetchall()]
+
+            cursor.execute(f"""
+                SELECT referer_host, sum(clicks) AS total FROM {DAILY_ROLLUP}
+                WHERE short_id = %s AND day >= %s
+                GROUP BY referer_host ORDER BY total DESC LIMIT 10
+            """, (short_id, since))
+            referers = [(host, int(clicks)) for host, clicks in cursor.fetchall()]
+
+            cursor.execute(f"""
+                SELECT ua_class, sum(clicks) FROM {DAILY_ROLLUP}
+                WHERE short_id = %s AND day >= %s
+                GROUP BY ua_class
+            """, (short_id, since))
+            ua_classes = {ua_class: int(clicks) for ua_class, clicks in cursor.fetchall()}
+
+    return {
+        'short_id': short_id,
+        'days': days,
+        'total_clicks': sum(clicks for _, clicks in per_day),
+        'per_day': per_day,
+        'top_referers': referers,
+        'ua_classes': ua_classes,
+    }
+
+
+# ===== JOB D'ARRIÈRE-PLAN =====
+
+class AnalyticsJobs:
+    """Agrégation fréquente + maintenance des partitions, un thread par worker"""
+
+    def __init__(self, db, rollup_interval=60, maintenance_interval=3600,
+                 retention_days=90, days_ahead=7, reconcile_interval=900):
+        self.db = db
+        self.rollup_interval = rollup_interval
+        self.reconcile_interval = reconcile_interval
+        self.maintenance_interval = maintenance_interval
+        self.retention_days = retention_days
+        self.days_ahead = days_ahead
+        self._thread = None
+        self._pid = None
+        self._lock = threading.Lock()
+        self._last_maintenance = 0
+        self._last_reconcile = time.time()
+        self.stats = {
+            'rollup_chunks': 0,
+            'reconciliations': 0,
+            'partitions_created': 0,
+            'partitions_dropped': 0,
+            'errors': 0,
+            'last_rollup_ms': 0.0,
+        }
+
+    def ensure_started(self):
+        if self._thread is not None and self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._thread is not None and self._pid == os.getpid():
+                return
+            self._pid = os.getpid()
+            self._thread = threading.Thread(
+                target=self._run, name='click-analytics', daemon=True
+            )
+            self._thread.start()
+
+    def _run(self):
+        try:
+            ensure_schema(self.db)
+        except Exception as e:
+            logger.error(f"Click analytics schema init failed: {str(e)}")
+        while True:
+            try:
+                if time.time() - self._last_maintenance >= self.maintenance_interval:
+                    self._last_maintenance = time.time()
+                    self.maintain()
+                start = time.time()
+                self.stats['rollup_chunks'] += rollup_new_clicks(self.db)
+                self.stats['last_rollup_ms'] = round((time.time() - start) * 1000, 2)
+                if time.time() - self._last_reconcile >= self.reconcile_interval:
+                    self._last_reconcile = time.time()
+                    self.stats['reconciliations'] += int(reconcile_recent_days(self.db))
+            except Exception as e:
+                self.stats['errors'] += 1
+                logger.error(f"Click analytics job failed: {str(e)}")
+            time.sleep(self.rollup_interval)
+
+    def maintain(self):
+        """Partitions à venir + rétention (un seul worker grâce à l'advisory lock)"""
+        with self.db.connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT pg_try_advisory_lock(%s)", (PARTITION_LOCK_KEY,))
+                if not cursor.fetchone()[0]:
+                    return
+            try:
+                self.stats['partitions_created'] += ensure_partitions(self.db, self.days_ahead)
+                self.stats['partitions_dropped'] += len(
+                    drop_expired_partitions(self.db, self.retention_days)
+                )
+            finally:
+                with conn.cursor() as cursor:
+                    cursor.execute("SELECT pg_advisory_unlock(%s)", (PARTITION_LOCK_KEY,))
+
+    def get_stats(self):
+        return dict(self.stats)
+
+
+def build_analytics_jobs(db):
+    """Construit les jobs depuis les variables d'environnement (None si désactivés)"""
+    if os.environ.get('SHORTENER_ANALYTICS_JOBS', 'true').lower() != 'true':
+        return None
+    return AnalyticsJobs(
+        db,
+        rollup_interval=int(os.environ.get('SHORTENER_ROLLUP_INTERVAL', '60')),
+        maintenance_interval=int(os.environ.get('SHORTENER_PARTITION_MAINTENANCE_INTERVAL', '3600')),
+        retention_days=int(os.environ.get('SHORTENER_CLICK_RETENTION_DAYS', '90')),
+        days_ahead=int(os.environ.get('SHORTENER_PARTITION_DAYS_AHEAD', '7')),
+        reconcile_interval=int(os.environ.get('SHORTENER_ROLLUP_RECONCILE_INTERVAL', '900')),
+    )
+
+
+if __name__ == '__main__':
+    # python analytics.py migrate | maintain | rollup | reconcile
+    from db import DatabaseManager
+
+    logging.basicConfig(level=logging.INFO, format='[FLASK-SHORTENER] %(asctime)s %(levelname)s: %(message)s')
+    command = sys.argv[1] if len(sys.argv) > 1 else 'maintain'
+    database = DatabaseManager(prewarm=False)
+    ensure_schema(database)
+
+    if command == 'migrate':
+        convert_to_partitioned(database)
+        ensure_partitions(database, int(os.environ.get('SHORTENER_PARTITION_DAYS_AHEAD', '7')))
+    elif command == 'maintain':
+        jobs = build_analytics_jobs(database) or AnalyticsJobs(database)
+        jobs.maintain()
+    elif command == 'rollup':
+        print(f"{rollup_new_clicks(database)} chunk(s) rolled up")
+    elif command == 'reconcile':
+        print(f"Recent days reconciled: {reconcile_recent_days(database)}")
+    else:
+        sys.exit(f"Unknown command: {command}")
@@ -1,14 +1,18 @@
 from flask import Flask, redirect, abort, request, jsonify
 import re
-import psycopg2
-import psycopg2.pool
 import os
 import logging
 import time
-from collections import defaultdict, deque
 from datetime import datetime
 from urllib.parse import urlparse
 
+from analytics import build_analytics_jobs
+from bloom import build_prefilter
+from cache import CachedUrl, build_redirect_cache
+from click_tracker import build_click_tracker
+from db import DatabaseManager
+from rate_limit import build_rate_limiter
+
 # Configuration Flask
 app = Flask(__name__)
 app.config.update(
@@ -28,57 +32,37 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Configuration DB
-DB_CONFIG = {
-    'host': os.environ.get('DB_HOST', 'postgres'),           # <-- Nouveau défaut
-    'database': os.environ.get('DB_NAME', 'mhdb24'),         # <-- Nouveau défaut  
-    'user': os.environ.get('DB_USER', 'SuperAdminduTurfu'),  # <-- Nouveau défaut
-    'password': os.environ.get('DB_PASSWORD', 'MHub2401!'),  # <-- Nouveau défaut
-    'port': 5432,
-    'sslmode': 'prefer',
-    'connect_timeout': 5,
-    'application_name': 'flask_shortener'
-}
-
 # Pattern ultra-strict
 SHORT_ID_PATTERN = re.compile(r'^[a-zA-Z0-9]{6,10}$')
 
-# Rate limiting en mémoire
-class RateLimiter:
-    def __init__(self, max_requests=60, window=60):
-        self.max_requests = max_requests
-        self.window = window
-        self.requests = defaultdict(deque)
-        self.blocked_ips = set()
-    
-    def is_allowed(self, ip):
-        if ip in self.blocked_ips:
-            return False
-            
-        now = time.time()
-        # Nettoyer les anciennes requêtes
-        while self.requests[ip] and self.requests[ip][0] < now - self.window:
-            self.requests[ip].popleft()
-        
-        if len(self.requests[ip]) >= self.max_requests:
-            # Bloquer temporairement les IPs abusives
-            if len(self.requests[ip]) > self.max_requests * 2:
-                self.blocked_ips.add(ip)
-                logger.warning(f"IP blocked for abuse: {ip}")
-            return False
-        
-        self.requests[ip].append(now)
-        return True
+# Rate limiting sliding window (mémoire fixe, blocages qui expirent, Redis optionnel)
+rate_limiter = build_rate_limiter(
+    'redirect',
+    max_requests=int(os.environ.get('SHORTENER_RATE_LIMIT', '60')),
+    window=60
+)
+
+# Connection pool thread-safe + requêtes préparées (config via DB_* / SHORTENER_DB_POOL_*)
+db = DatabaseManager()
 
-rate_limiter = RateLimiter()
+# Cache read-through des redirections (LRU local + Redis optionnel)
+redirect_cache = build_redirect_cache()
 
-# Connection pool
-try:
-    db_pool = psycopg2.pool.SimpleConnectionPool(1, 10, **DB_CONFIG)
-    logger.info("Database connection pool initialized")
-except Exception as e:
-    logger.error(f"Failed to initialize DB pool: {str(e)}")
-    db_pool = None
+# Préfiltre Bloom des short_id connus (absents à coup sûr -> pas de DB)
+prefilter = build_prefilter(db)
+
+# Tracking des clics asynchrone (file bornée + writer batché)
+click_tracker = build_click_tracker(db)
+
+# Agrégats journaliers des clics + maintenance des partitions (thread par worker)
+analytics_jobs = build_analytics_jobs(db)
+
+@app.before_request
+def start_background_jobs():
+    """Démarrage paresseux des jobs après le fork gunicorn"""
+    if analytics_jobs and db:
+        analytics_jobs.ensure_started()
+    redirect_cache.ensure_listener()
 
 def get_client_ip():
     """IP réelle avec protection proxy"""
@@ -113,79 +97,68 @@ def is_safe_destination(url):
     except:
         return False
 
-def lookup_and_track(short_id, client_ip, user_agent):
-    """Lookup + tracking atomique"""
-    if not db_pool:
+def load_short_url(short_id):
+    """Lookup dans les deux tables (READ ONLY) -> CachedUrl ou None"""
+    if not db:
+        # Pas de negative caching quand la DB est indisponible
+        raise RuntimeError("database_pool_unavailable")
+    
+    # Filtre consulté seulement s'il est prêt (sinon pas de faux positif à compter)
+    filtered = prefilter is not None and prefilter.is_ready()
+    if filtered and not prefilter.might_contain(short_id):
         return None
     
-    conn = None
     try:
-        conn = db_pool.getconn()
-        cursor = conn.cursor()
-        
-        # 1. Lookup dans les deux tables
-        cursor.execute("""
-            (SELECT original_url, false as is_public FROM url_shortener_shorturl 
-             WHERE short_id = %s AND is_active = true 
-             AND (expires_at IS NULL OR expires_at > NOW()))
-            UNION ALL
-            (SELECT original_url, true as is_public FROM url_shortener_public_shorturl 
-             WHERE short_id = %s AND is_active = true 
-             AND expires_at > NOW())
-            LIMIT 1
-        """, (short_id, short_id))
-        
-        result = cursor.fetchone()
-        if not result:
-            return None
-        
-        original_url, is_public = result
-        
-        # 2. Validation URL destination
-        if not is_safe_destination(original_url):
-            logger.error(f"Unsafe destination blocked: {original_url}")
-            return None
-        
-        # 3. Tracking atomique
-        if is_public:
-            cursor.execute("""
-                UPDATE url_shortener_public_shorturl 
-                SET click_count = click_count + 1, last_clicked = NOW()
-                WHERE short_id = %s
-            """, (short_id,))
-        else:
-            cursor.execute("""
-                UPDATE url_shortener_shorturl 
-                SET click_count = click_count + 1, last_clicked = NOW()
-                WHERE short_id = %s
-            """, (short_id,))
-        
-        # 4. Log détaillé pour analytics
-        cursor.execute("""
-            INSERT INTO url_shortener_click_log 
-            (short_id, is_public, ip_address, user_agent, clicked_at, referer, country, city) 
-            VALUES (%s, %s, %s, %s, NOW(), %s, %s, %s)
-        """, (
-            short_id, 
-            is_public, 
-            client_ip[:45], 
-            user_agent[:500],
-            request.headers.get('Referer', '')[:500],
-            '',  # country vide au lieu de NULL
-            ''   # city vide au lieu de NULL
-        ))
-        
-        conn.commit()
-        return original_url
-        
+        with db.connection() as conn:
+            with conn.cursor() as cursor:
+                db.execute_prepared(cursor, 'lookup_short_url', (short_id,))
+                result = cursor.fetchone()
     except Exception as e:
-        logger.error(f"DB error for {short_id}: {str(e)}")
-        if conn:
-            conn.rollback()
+        logger.error(f"DB lookup error for {short_id}: {str(e)}")
+        raise
+    
+    if not result:
+        # Id absent des deux tables alors que le filtre prêt disait "peut-être"
+        if filtered:
+            prefilter.record_false_positive()
+        return None
+    
+    original_url, is_public, expires_at, servable = result
+    if not servable:
+        # Lien inactif ou expiré : présent dans le filtre à raison
+        return None
+    
+    # Validation destination une fois par chargement (pas à chaque clic) :
+    # une destination refusée est mise en cache comme absente
+    if not is_safe_destination(original_url):
+        logger.error(f"Unsafe destination blocked: {original_url}")
         return None
-    finally:
-        if conn:
-            db_pool.putconn(conn)
+    
+    return CachedUrl(
+        original_url,
+        is_public,
+        expires_at.timestamp() if expires_at else None
+    )
+
+def lookup_and_track(short_id, client_ip, user_agent):
+    """Lookup (via cache) + tracking asynchrone"""
+    try:
+        record = redirect_cache.get_or_load(short_id, load_short_url)
+    except Exception:
+        # Erreur DB : pas de mise en cache, fallback redirection
+        return None
+    
+    if record is None:
+        return None
+    
+    click_tracker.track(
+        short_id,
+        record.is_public,
+        client_ip,
+        user_agent,
+        request.headers.get('Referer', '')
+    )
+    return record.original_url
 
 @app.route('/<short_id>')
 def redirect_url(short_id):
@@ -210,7 +183,7 @@ def redirect_url(short_id):
         logger.warning(f"Suspicious pattern in {short_id} from {client_ip}")
         return redirect('https://humari.fr', code=301)
     
-    # 4. Lookup + tracking atomique
+    # 4. Lookup (cache) + tracking asynchrone
     original_url = lookup_and_track(short_id, client_ip, user_agent)
     
     if not original_url:
@@ -228,18 +201,18 @@ def redirect_url(short_id):
 def health_check():
     """Health check pour Docker"""
     try:
-        if db_pool:
-            conn = db_pool.getconn()
-            cursor = conn.cursor()
-            cursor.execute("SELECT 1")
-            cursor.close()
-            db_pool.putconn(conn)
-            
+        if db and db.test_connection():
             return jsonify({
                 'status': 'healthy',
                 'timestamp': time.time(),
                 'service': 'url-shortener-flask',
-                'version': '1.0.0'
+                'version': '1.0.0',
+                'cache': redirect_cache.get_stats(),
+                'click_tracking': click_tracker.get_stats(),
+                'db_pool': db.get_stats(),
+                'rate_limiter': rate_limiter.get_stats(),
+                'bloom_prefilter': prefilter.get_stats() if prefilter else None,
+                'click_analytics': analytics_jobs.get_stats() if analytics_jobs else None
             }), 200
         else:
             return jsonify({
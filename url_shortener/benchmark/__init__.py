@@ -0,0 +1,7 @@
+# url_shortener/benchmark/__init__.py
+"""
+Banc de charge du chemin de redirection
+
+- seed.py     : remplit un Postgres local (ou embarqué) avec des millions de liens et de clics
+- loadtest.py : pilote l'app Flask avec un mix réaliste et écrit un rapport comparable
+"""
@@ -0,0 +1,483 @@
+# url_shortener/benchmark/loadtest.py
+"""
+Test de charge du chemin de redirection
+
+Pilote l'app avec un mix de trafic réaliste :
+- hot   : petit ensemble de liens très demandés (distribution de Zipf)
+- cold  : liens tirés uniformément dans tout le jeu de données
+- miss  : short_id valides mais inexistants (scanners)
+- abuse : quelques IPs qui martèlent le service (rate limiting / blocage)
+
+Deux modes :
+- in-process (défaut) : importe app.py et passe par le client de test Flask,
+  DB_* pointant sur la base seedée
+- --target http://host:port : requêtes HTTP réelles (gunicorn, container)
+
+Mesures : latence p50/p90/p99/max par catégorie, redirections/s, issue
+(redirection vers la cible / repli humari.fr / erreur), connexions
+Postgres de l'app échantillonnées dans pg_stat_activity, stats /health.
+
+Le rapport (JSON + Markdown) est écrit dans benchmark/results/ ; --compare
+affiche les écarts avec un rapport précédent.
+
+Usage (depuis url_shortener/):
+    python -m benchmark.loadtest --embedded /tmp/pgdata --duration 30 --concurrency 16
+    python -m benchmark.loadtest --target http://localhost:5000 --compare benchmark/results/baseline.json
+"""
+import argparse
+import bisect
+import http.client
+import itertools
+import json
+import logging
+import os
+import random
+import subprocess
+import sys
+import threading
+import time
+from urllib.parse import urlparse
+
+import psycopg2
+
+from benchmark.seed import (
+    MISS_PREFIX, PRIVATE_PREFIX, PUBLIC_PREFIX, connect_params, read_meta,
+)
+
+logger = logging.getLogger('benchmark.loadtest')
+
+FALLBACK_URL = 'https://humari.fr'
+CATEGORIES = ('hot', 'cold', 'miss', 'abuse')
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), 'results')
+
+
+def short_id(prefix, index):
+    """Même format que les liens générés par seed.py"""
+    return f"{prefix}{index:07x}"
+
+
+def parse_mix(value):
+    """'hot=70,cold=20,miss=8,abuse=2' -> {'hot': 0.7, ...}"""
+    mix = {}
+    for part in value.split(','):
+        name, _, weight = part.partition('=')
+        name = name.strip()
+        if name not in CATEGORIES:
+            raise argparse.ArgumentTypeError(f"catégorie inconnue: {name}")
+        mix[name] = float(weight)
+    total = sum(mix.values())
+    if total <= 0:
+        raise argparse.ArgumentTypeError("mix vide")
+    return {name: weight / total for name, weight in mix.items()}
+
+
+def percentile(sorted_values, pct):
+    """Percentile au rang le plus proche"""
+    if not sorted_values:
+        return None
+    rank = max(0, min(len(sorted_values) - 1, int(round(pct / 100 * len(sorted_values))) - 1))
+    return sorted_values[rank]
+
+
+class TrafficMix:
+    """Tire (catégorie, short_id, ip) selon le mix demandé"""
+
+    def __init__(self, meta, mix, hot_set=1000, abusive_ips=3, seed=None):
+        self.private = int(meta['private_links'])
+        self.public = int(meta['public_links'])
+        self.total = self.private + self.public
+        self.categories = list(mix)
+        self.cum_mix = list(itertools.accumulate(mix[c] for c in self.categories))
+        self.rng = random.Random(seed)
+
+        # Liens chauds tirés une fois, popularité en 1/rang
+        self.hot_ids = [self._random_link(self.rng) for _ in range(min(hot_set, self.total))]
+        self.hot_cum = list(itertools.accumulate(1 / rank for rank in range(1, len(self.hot_ids) + 1)))
+        self.abusive_ips = [f"203.0.113.{i + 1}" for i in range(abusive_ips)]
+
+    def _random_link(self, rng):
+        index = rng.randrange(self.total)
+        if index < self.private:
+            return short_id(PRIVATE_PREFIX, index + 1)
+        return short_id(PUBLIC_PREFIX, index - self.private + 1)
+
+    def worker_rng(self):
+        return random.Random(self.rng.random())
+
+    def next(self, rng):
+        category = self.categories[bisect.bisect(self.cum_mix, rng.random() * self.cum_mix[-1])]
+        # IPs "normales" sur un /16 : jamais rate limitées individuellement
+        ip = f"198.51.{rng.randrange(256)}.{rng.randrange(256)}"
+
+        if category == 'hot':
+            position = bisect.bisect(self.hot_cum, rng.random() * self.hot_cum[-1])
+            return category, self.hot_ids[min(position, len(self.hot_ids) - 1)], ip
+        if category == 'cold':
+            return category, self._random_link(rng), ip
+        if category == 'miss':
+            return category, short_id(MISS_PREFIX, rng.randrange(1 << 28)), ip
+        # abuse : liens chauds depuis une poignée d'IPs
+        return category, self.hot_ids[rng.randrange(len(self.hot_ids))], rng.choice(self.abusive_ips)
+
+
+# ===== CLIENTS =====
+
+class InProcessClient:
+    """Client de test Flask (un par thread)"""
+
+    def __init__(self, flask_app):
+        self.client = flask_app.test_client()
+
+    def get(self, path, ip):
+        response = self.client.get(path, headers={
+            'X-Forwarded-For': ip,
+            'User-Agent': 'shortener-benchmark',
+        })
+        return response.status_code, response.headers.get('Location', '')
+
+
+class HttpClient:
+    """Connexion HTTP keep-alive (une par thread)"""
+
+    def __init__(self, target):
+        parsed = urlparse(target)
+        self.host = parsed.hostname
+        self.port = parsed.port or (443 if parsed.scheme == 'https' else 80)
+        self.https = parsed.scheme == 'https'
+        self.conn = None
+
+    def _connect(self):
+        cls = http.client.HTTPSConnection if self.https else http.client.HTTPConnection
+        self.conn = cls(self.host, self.port, timeout=10)
+
+    def get(self, path, ip):
+        if self.conn is None:
+            self._connect()
+        try:
+            self.conn.request('GET', path, headers={
+                'X-Forwarded-For': ip,
+                'User-Agent': 'shortener-benchmark',
+            })
+            response = self.conn.getresponse()
+            response.read()
+            return response.status, response.getheader('Location', '')
+        except (http.client.HTTPException, OSError):
+            self.conn.close()
+            self.conn = None
+            raise
+
+    def get_json(self, path):
+        if self.conn is None:
+            self._connect()
+        self.conn.request('GET', path)
+        return json.loads(self.conn.getresponse().read())
+
+
+# ===== ÉCHANTILLONNAGE DB =====
+
+class ConnectionSampler(threading.Thread):
+    """Échantillonne les connexions de l'app dans pg_stat_activity"""
+
+    def __init__(self, params, interval=0.5):
+        super().__init__(name='bench-pg-sampler', daemon=True)
+        self.params = params
+        self.interval = interval
+        self.samples = []
+        self._stop_event = threading.Event()
+
+    def run(self):
+        try:
+            conn = psycopg2.connect(**self.params)
+            conn.autocommit = True
+        except Exception as e:
+            logger.warning(f"pg_stat_activity sampling disabled: {str(e)}")
+            return
+        try:
+            while not self._stop_event.is_set():
+                with conn.cursor() as cursor:
+                    cursor.execute("""
+                        SELECT count(*), count(*) FILTER (WHERE state = 'active')
+                        FROM pg_stat_activity WHERE application_name = 'flask_shortener'
+                    """)
+                    self.samples.append(cursor.fetchone())
+                self._stop_event.wait(self.interval)
+        finally:
+            conn.close()
+
+    def stop(self):
+        self._stop_event.set()
+        self.join(5)
+
+    def summary(self):
+        if not self.samples:
+            return None
+        opened = [s[0] for s in self.samples]
+        active = [s[1] for s in self.samples]
+        return {
+            'samples': len(self.samples),
+            'open_max': max(opened),
+            'open_avg': round(sum(opened) / len(opened), 2),
+            'active_max': max(active),
+            'active_avg': round(sum(active) / len(active), 2),
+        }
+
+
+# ===== EXÉCUTION =====
+
+def run_load(make_client, traffic, duration, concurrency, warmup):
+    """Boucle fermée : chaque thread enchaîne les requêtes jusqu'à la fin"""
+    results = {category: [] for category in CATEGORIES}
+    outcomes = {category: {'redirect': 0, 'fallback': 0, 'error': 0} for category in CATEGORIES}
+    lock = threading.Lock()
+    measure_from = time.perf_counter() + warmup
+    stop_at = measure_from + duration
+
+    def worker():
+        client = make_client()
+        rng = traffic.worker_rng()
+        latencies = {category: [] for category in CATEGORIES}
+        counts = {category: {'redirect': 0, 'fallback': 0, 'error': 0} for category in CATEGORIES}
+        while True:
+            category, sid, ip = traffic.next(rng)
+            start = time.perf_counter()
+            if start >= stop_at:
+                break
+            try:
+                status, location = client.get(f"/{sid}", ip)
+                if status >= 500:
+                    outcome = 'error'
+                elif location.rstrip('/') == FALLBACK_URL:
+                    outcome = 'fallback'
+                else:
+                    outcome = 'redirect'
+            except Exception:
+                outcome = 'error'
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            if start >= measure_from:
+                latencies[category].append(elapsed_ms)
+                counts[category][outcome] += 1
+        with lock:
+            for category in CATEGORIES:
+                results[category].extend(latencies[category])
+                for outcome, count in counts[category].items():
+                    outcomes[category][outcome] += count
+
+    threads = [threading.Thread(target=worker, name=f'bench-{i}') for i in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results, outcomes
+
+
+def summarize(latencies, outcomes, duration):
+    values = sorted(latencies)
+    return {
+        'requests': len(values),
+        'rps': round(len(values) / duration, 1),
+        'mean_ms': round(sum(values) / len(values), 3) if values else None,
+        'p50_ms': round(percentile(values, 50), 3) if values else None,
+        'p90_ms': round(percentile(values, 90), 3) if values else None,
+        'p99_ms': round(percentile(values, 99), 3) if values else None,
+        'max_ms': round(values[-1], 3) if values else None,
+        'outcomes': outcomes,
+    }
+
+
+def build_report(args, meta, results, outcomes, db_connections, app_stats):
+    categories = {
+        category: summarize(results[category], outcomes[category], args.duration)
+        for category in CATEGORIES if results[category]
+    }
+    all_outcomes = {'redirect': 0, 'fallback': 0, 'error': 0}
+    for category in outcomes.values():
+        for outcome, count in category.items():
+            all_outcomes[outcome] += count
+    overall = summarize(list(itertools.chain.from_iterable(results.values())), all_outcomes, args.duration)
+    overall['redirects_per_sec'] = round(all_outcomes['redirect'] / args.duration, 1)
+
+    return {
+        'label': args.label,
+        'created_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'git_revision': _git_revision(),
+        'config': {
+            'mode': 'http' if args.target else 'in-process',
+            'target': args.target,
+            'duration_s': args.duration,
+            'warmup_s': args.warmup,
+            'concurrency': args.concurrency,
+            'mix': args.mix,
+            'hot_set': args.hot_set,
+            'abusive_ips': args.abusive_ips,
+        },
+        'dataset': meta,
+        'overall': overall,
+        'categories': categories,
+        'db_connections': db_connections,
+        'app_stats': app_stats,
+    }
+
+
+def _git_revision():
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            cwd=os.path.dirname(__file__), stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except Exception:
+        return None
+
+
+def render_markdown(report, previous=None):
+    """Tableau lisible ; avec `previous`, ajoute les écarts p50/p99/rps"""
+    config = report['config']
+    lines = [
+        f"# Shortener load test - {report['label']}",
+        '',
+        f"- Date : {report['created_at']} (rev {report['git_revision'] or '?'})",
+        f"- Mode : {config['mode']}, {config['concurrency']} threads, "
+        f"{config['duration_s']}s (+{config['warmup_s']}s warmup)",
+        f"- Dataset : {report['dataset'].get('private_links')} private / "
+        f"{report['dataset'].get('public_links')} public links, "
+        f"{report['dataset'].get('click_logs')} click logs",
+        f"- Redirects/s : {report['overall']['redirects_per_sec']}",
+        '',
+        '| category | requests | rps | p50 ms | p90 ms | p99 ms | max ms | redirect | fallback | error |',
+        '|---|---|---|---|---|---|---|---|---|---|',
+    ]
+    rows = [('overall', report['overall'])] + list(report['categories'].items())
+    for name, stats in rows:
+        o = stats['outcomes']
+        lines.append(
+            f"| {name} | {stats['requests']} | {stats['rps']} | {stats['p50_ms']} | "
+            f"{stats['p90_ms']} | {stats['p99_ms']} | {stats['max_ms']} | "
+            f"{o['redirect']} | {o['fallback']} | {o['error']} |"
+        )
+
+    if report['db_connections']:
+        db_conn = report['db_connections']
+        lines += [
+            '',
+            f"DB connections (pg_stat_activity) : open max {db_conn['open_max']} "
+            f"avg {db_conn['open_avg']}, active max {db_conn['active_max']} "
+            f"avg {db_conn['active_avg']}",
+        ]
+
+    if previous:
+        lines += [
+            '',
+            f"## Comparaison avec {previous['label']} ({previous['created_at']})",
+            '',
+            '| category | p50 ms | p99 ms | rps |',
+            '|---|---|---|---|',
+        ]
+        previous_rows = {'overall': previous['overall'], **previous['categories']}
+        for name, stats in rows:
+            before = previous_rows.get(name)
+            if not before:
+                continue
+            lines.append(
+                f"| {name} | {_delta(before['p50_ms'], stats['p50_ms'])} | "
+                f"{_delta(before['p99_ms'], stats['p99_ms'])} | "
+                f"{_delta(before['rps'], stats['rps'])} |"
+            )
+    return '\n'.join(lines) + '\n'
+
+
+def _delta(before, after):
+    if before is None or after is None:
+        return f"{before} -> {after}"
+    change = (after - before) / before * 100 if before else 0
+    return f"{before} -> {after} ({change:+.1f}%)"
+
+
+def fetch_app_stats(make_client, args):
+    """Snapshot /health (cache, pool, click tracking, rate limiter, Bloom)"""
+    try:
+        if args.target:
+            return make_client().get_json('/health')
+        return make_client().client.get('/health').get_json()
+    except Exception as e:
+        logger.warning(f"Could not fetch /health: {str(e)}")
+        return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Test de charge du raccourcisseur")
+    parser.add_argument('--target', help="URL de l'app (mode HTTP) ; défaut : in-process")
+    parser.add_argument('--embedded', metavar='DATA_DIR',
+                        help="Postgres embarqué (pgserver) utilisé par seed.py")
+    parser.add_argument('--duration', type=float, default=30)
+    parser.add_argument('--warmup', type=float, default=5)
+    parser.add_argument('--concurrency', type=int, default=16)
+    parser.add_argument('--mix', type=parse_mix, default=parse_mix('hot=70,cold=20,miss=8,abuse=2'))
+    parser.add_argument('--hot-set', type=int, default=1000)
+    parser.add_argument('--abusive-ips', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=42, help="graine du générateur de trafic")
+    parser.add_argument('--label', default=None, help="nom du rapport (défaut : horodatage)")
+    parser.add_argument('--output-dir', default=RESULTS_DIR)
+    parser.add_argument('--compare', metavar='REPORT_JSON', help="rapport précédent à comparer")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='[BENCH] %(asctime)s %(message)s')
+    args.label = args.label or time.strftime('run-%Y%m%d-%H%M%S')
+
+    params = connect_params(args.embedded)
+    conn = psycopg2.connect(**params)
+    try:
+        meta = read_meta(conn)
+    finally:
+        conn.close()
+    if not meta:
+        sys.exit("Aucun jeu de données : lancer d'abord python -m benchmark.seed")
+
+    if args.target:
+        def make_client():
+            return HttpClient(args.target)
+    else:
+        # L'app lit sa config DB à l'import
+        os.environ.update({
+            'DB_HOST': params['host'],
+            'DB_NAME': params['dbname'],
+            'DB_USER': params['user'],
+            'DB_PASSWORD': params.get('password', ''),
+            'DB_PORT': str(params.get('port', 5432)),
+        })
+        import app as shortener
+        # Un log INFO par redirection noierait la console
+        logging.getLogger(shortener.logger.name).setLevel(logging.WARNING)
+
+        def make_client():
+            return InProcessClient(shortener.app)
+
+    traffic = TrafficMix(meta, args.mix, args.hot_set, args.abusive_ips, seed=args.seed)
+    sampler = ConnectionSampler(params)
+    sampler.start()
+
+    logger.info(f"Running {args.label}: {args.concurrency} threads, "
+                f"{args.warmup}s warmup + {args.duration}s")
+    results, outcomes = run_load(make_client, traffic, args.duration, args.concurrency, args.warmup)
+    sampler.stop()
+
+    report = build_report(args, meta, results, outcomes, sampler.summary(),
+                          fetch_app_stats(make_client, args))
+
+    previous = None
+    if args.compare:
+        with open(args.compare) as f:
+            previous = json.load(f)
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    base = os.path.join(args.output_dir, args.label)
+    markdown = render_markdown(report, previous)
+    with open(base + '.json', 'w') as f:
+        json.dump(report, f, indent=2, default=str)
+    with open(base + '.md', 'w') as f:
+        f.write(markdown)
+
+    print(markdown)
+    logger.info(f"Report written to {base}.json / .md")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,260 @@
+# url_shortener/benchmark/seed.py
+"""
+Jeu de données du banc de charge
+
+Remplit les tables du raccourcisseur avec des liens et des clics générés
+côté serveur (generate_series) : des millions de lignes en quelques
+dizaines de secondes, sans transit par Python.
+
+Les short_id générés sont préfixés (bk = privé, bp = public) et ne
+peuvent pas entrer en collision avec de vrais liens ; --reset ne supprime
+que ces lignes-là.
+
+Usage (depuis url_shortener/):
+    DB_HOST=localhost DB_NAME=shortener_bench python -m benchmark.seed --urls 2000000 --clicks 5000000
+    python -m benchmark.seed --embedded /tmp/pgdata --urls 200000   # Postgres embarqué (pgserver)
+"""
+import argparse
+import logging
+import os
+import sys
+import time
+
+import psycopg2
+
+logger = logging.getLogger('benchmark.seed')
+
+PRIVATE_PREFIX = 'bk'
+PUBLIC_PREFIX = 'bp'
+# Préfixe jamais inséré : garantit des absences
+MISS_PREFIX = 'bm'
+
+CHUNK_SIZE = 500000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS url_shortener_shorturl (
+    id serial PRIMARY KEY,
+    short_id varchar(10) UNIQUE NOT NULL,
+    original_url text NOT NULL,
+    is_active boolean NOT NULL DEFAULT true,
+    expires_at timestamptz,
+    click_count integer NOT NULL DEFAULT 0,
+    last_clicked timestamptz,
+    created_at timestamptz NOT NULL DEFAULT now()
+);
+CREATE TABLE IF NOT EXISTS url_shortener_public_shorturl (
+    id serial PRIMARY KEY,
+    short_id varchar(10) UNIQUE NOT NULL,
+    original_url text NOT NULL,
+    is_active boolean NOT NULL DEFAULT true,
+    expires_at timestamptz,
+    click_count integer NOT NULL DEFAULT 0,
+    last_clicked timestamptz,
+    created_at timestamptz NOT NULL DEFAULT now()
+);
+CREATE TABLE IF NOT EXISTS url_shortener_click_log (
+    id bigserial PRIMARY KEY,
+    short_id varchar(10) NOT NULL,
+    is_public boolean NOT NULL DEFAULT false,
+    ip_address varchar(45),
+    user_agent text,
+    clicked_at timestamptz NOT NULL DEFAULT now(),
+    referer text,
+    country varchar(100),
+    city varchar(100)
+);
+CREATE INDEX IF NOT EXISTS url_shortener_click_log_short_id_idx
+    ON url_shortener_click_log (short_id, clicked_at);
+CREATE TABLE IF NOT EXISTS url_shortener_benchmark_meta (
+    key text PRIMARY KEY,
+    value text NOT NULL
+);
+"""
+
+INSERT_LINKS = """
+INSERT INTO {table} (short_id, original_url, is_active, expires_at, created_at)
+SELECT %(prefix)s || lpad(to_hex(i), 7, '0'),
+       'https://bench.example.com/' || %(prefix)s || '/' || i,
+       true,
+       {expires_at},
+       now() - random() * interval '180 days'
+FROM generate_series(%(start)s, %(stop)s) AS i
+ON CONFLICT (short_id) DO NOTHING
+"""
+
+INSERT_CLICKS = """
+INSERT INTO url_shortener_click_log
+    (short_id, is_public, ip_address, user_agent, clicked_at, referer, country, city)
+SELECT CASE WHEN pub THEN %(public_prefix)s ELSE %(private_prefix)s END
+           || lpad(to_hex(1 + floor(random() * CASE WHEN pub THEN %(public_urls)s
+                                                    ELSE %(private_urls)s END)::int), 7, '0'),
+       pub,
+       '10.' || (i %% 250) || '.' || ((i / 250) %% 250) || '.' || (i %% 7),
+       (ARRAY['Mozilla/5.0 (Windows NT 10.0)', 'Mozilla/5.0 (iPhone)',
+              'Mozilla/5.0 (Macintosh)', 'Googlebot/2.1'])[1 + i %% 4],
+       now() - random() * interval '90 days',
+       (ARRAY['', 'https://www.google.com/', 'https://www.linkedin.com/',
+              'https://t.co/'])[1 + i %% 4],
+       '', ''
+FROM (SELECT i, random() < %(public_ratio)s AS pub
+      FROM generate_series(%(start)s, %(stop)s) AS i) AS s
+"""
+
+
+def connect_params(embedded=None):
+    """Paramètres psycopg2 : Postgres embarqué ou variables DB_* (comme db.DatabaseManager)"""
+    if embedded:
+        try:
+            import pgserver
+        except ImportError:
+            sys.exit("--embedded requiert le paquet pgserver (pip install pgserver)")
+        pgserver.get_server(embedded, cleanup_mode=None)
+        return {'host': embedded, 'dbname': 'postgres', 'user': 'postgres'}
+
+    return {
+        'host': os.environ.get('DB_HOST', 'localhost'),
+        'dbname': os.environ.get('DB_NAME', 'shortener_bench'),
+        'user': os.environ.get('DB_USER', 'postgres'),
+        'password': os.environ.get('DB_PASSWORD', ''),
+        'port': int(os.environ.get('DB_PORT', '5432')),
+    }
+
+
+def is_local(params):
+    host = params.get('host') or ''
+    return host.startswith('/') or host in ('localhost', '127.0.0.1', '::1')
+
+
+def read_meta(conn):
+    """Métadonnées du dernier seed ({} si absent)"""
+    with conn.cursor() as cursor:
+        cursor.execute("SELECT to_regclass('url_shortener_benchmark_meta')")
+        if cursor.fetchone()[0] is None:
+            return {}
+        cursor.execute("SELECT key, value FROM url_shortener_benchmark_meta")
+        return dict(cursor.fetchall())
+
+
+def _write_meta(cursor, meta):
+    for key, value in meta.items():
+        cursor.execute(
+            "INSERT INTO url_shortener_benchmark_meta (key, value) VALUES (%s, %s) "
+            "ON CONFLICT (key) DO UPDATE SET value = EXCLUDED.value",
+            (key, str(value))
+        )
+
+
+def reset(conn):
+    """Supprime uniquement les lignes générées par le banc"""
+    with conn.cursor() as cursor:
+        for table in ('url_shortener_shorturl', 'url_shortener_public_shorturl',
+                      'url_shortener_click_log'):
+            cursor.execute(
+                f"DELETE FROM {table} WHERE short_id LIKE %s OR short_id LIKE %s",
+                (PRIVATE_PREFIX + '%', PUBLIC_PREFIX + '%')
+            )
+            logger.info(f"{table}: {cursor.rowcount} benchmark rows deleted")
+        cursor.execute("DELETE FROM url_shortener_benchmark_meta")
+    conn.commit()
+
+
+def seed_links(conn, urls, public_ratio):
+    """Insère `urls` liens répartis entre les deux tables, par tranches"""
+    public_count = int(urls * public_ratio)
+    plan = (
+        ('url_shortener_shorturl', PRIVATE_PREFIX, urls - public_count, 'NULL'),
+        ('url_shortener_public_shorturl', PUBLIC_PREFIX, public_count,
+         "now() + interval '30 days'"),
+    )
+    for table, prefix, count, expires_at in plan:
+        sql = INSERT_LINKS.format(table=table, expires_at=expires_at)
+        for start in range(1, count + 1, CHUNK_SIZE):
+            stop = min(count, start + CHUNK_SIZE - 1)
+            t0 = time.time()
+            with conn.cursor() as cursor:
+                cursor.execute(sql, {'prefix': prefix, 'start': start, 'stop': stop})
+            conn.commit()
+            logger.info(f"{table}: {stop}/{count} ({time.time() - t0:.1f}s)")
+    return urls - public_count, public_count
+
+
+def seed_clicks(conn, clicks, private_count, public_count):
+    """Historique de clics réparti uniformément sur les liens existants"""
+    if not clicks:
+        return
+    public_ratio = public_count / max(1, private_count + public_count)
+    for start in range(1, clicks + 1, CHUNK_SIZE):
+        stop = min(clicks, start + CHUNK_SIZE - 1)
+        t0 = time.time()
+        with conn.cursor() as cursor:
+            cursor.execute(INSERT_CLICKS, {
+                'public_prefix': PUBLIC_PREFIX,
+                'private_prefix': PRIVATE_PREFIX,
+                'public_urls': public_count,
+                'private_urls': private_count,
+                'public_ratio': public_ratio,
+                'start': start,
+                'stop': stop,
+            })
+        conn.commit()
+        logger.info(f"url_shortener_click_log: {stop}/{clicks} ({time.time() - t0:.1f}s)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Seed du banc de charge du raccourcisseur")
+    parser.add_argument('--urls', type=int, default=1000000, help="nombre total de liens")
+    parser.add_argument('--clicks', type=int, default=2000000, help="lignes de click log")
+    parser.add_argument('--public-ratio', type=float, default=0.3,
+                        help="part des liens dans la table publique")
+    parser.add_argument('--embedded', metavar='DATA_DIR',
+                        help="utilise un Postgres embarqué (pgserver) dans DATA_DIR")
+    parser.add_argument('--reset', action='store_true',
+                        help="supprime d'abord les lignes d'un précédent seed")
+    parser.add_argument('--force', action='store_true',
+                        help="autorise un serveur non local")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='[BENCH-SEED] %(asctime)s %(message)s')
+
+    params = connect_params(args.embedded)
+    if not is_local(params) and not args.force:
+        sys.exit(f"Refus de seeder {params['host']} (non local) sans --force")
+
+    start = time.time()
+    conn = psycopg2.connect(**params)
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute(SCHEMA)
+        conn.commit()
+
+        if args.reset:
+            reset(conn)
+        elif read_meta(conn):
+            sys.exit("Un seed existe déjà : relancer avec --reset")
+
+        private_count, public_count = seed_links(conn, args.urls, args.public_ratio)
+        seed_clicks(conn, args.clicks, private_count, public_count)
+
+        with conn.cursor() as cursor:
+            _write_meta(cursor, {
+                'private_links': private_count,
+                'public_links': public_count,
+                'click_logs': args.clicks,
+                'seeded_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            })
+        conn.commit()
+
+        # Statistiques à jour pour que le planner voie la vraie volumétrie
+        conn.autocommit = True
+        with conn.cursor() as cursor:
+            cursor.execute("ANALYZE url_shortener_shorturl, url_shortener_public_shorturl, "
+                           "url_shortener_click_log")
+    finally:
+        conn.close()
+
+    logger.info(f"Seed done in {time.time() - start:.1f}s "
+                f"({private_count} private, {public_count} public, {args.clicks} clicks)")
+
+
+if __name__ == '__main__':
+    main()
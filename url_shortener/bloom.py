@@ -0,0 +1,245 @@
+# url_shortener/bloom.py
+"""
+Préfiltre Bloom des short_id connus
+
+Un ID qui respecte SHORT_ID_PATTERN mais n'existe pas coûte sinon un
+aller-retour DB. Le filtre répond "absent à coup sûr" sans toucher la DB.
+
+- Reconstruit périodiquement depuis les deux tables (curseur serveur)
+- Contient aussi les liens inactifs : une réactivation ne doit jamais
+  produire de faux négatif (un inactif ne coûte qu'un faux positif)
+- Nouveaux liens ajoutés incrémentalement (id > dernier id vu - recouvrement,
+  par table) : les ids de séquence ne deviennent pas visibles dans l'ordre
+  (une transaction qui tient un id plus bas peut committer après lecture
+  d'un id plus haut, cas typique des bulk_create par lots de 1000). La
+  fenêtre SHORTENER_BLOOM_SYNC_OVERLAP est relue à chaque synchro ; un id
+  ajouté deux fois est sans effet sur un filtre de Bloom
+- Reconstruction en arrière-plan puis swap atomique de la référence
+- Taux de faux positifs théorique et observé exposés dans les stats
+
+Un lien créé entre deux synchronisations est invisible au plus
+SHORTENER_BLOOM_SYNC_INTERVAL secondes.
+"""
+import hashlib
+import logging
+import math
+import os
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+TABLES = ('url_shortener_shorturl', 'url_shortener_public_shorturl')
+
+
+class BloomFilter:
+    """Filtre de Bloom sur bytearray (double hashing blake2b)"""
+
+    def __init__(self, capacity, error_rate=0.01):
+        capacity = max(1, int(capacity))
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item):
+        digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hash_count))
+
+    def add(self, item):
+        """Ajoute item ; count n'augmente que si un bit change (re-scan de recouvrement)"""
+        changed = False
+        for pos in self._positions(item):
+            mask = 1 << (pos & 7)
+            if not self.bits[pos >> 3] & mask:
+                self.bits[pos >> 3] |= mask
+                changed = True
+        if changed:
+            self.count += 1
+        return changed
+
+    def __contains__(self, item):
+        bits = self.bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+    def estimated_false_positive_rate(self):
+        """(1 - e^(-kn/m))^k pour le nombre d'éléments insérés"""
+        k, n, m = self.hash_count, self.count, self.size
+        return (1 - math.exp(-k * n / m)) ** k
+
+
+class ShortIdPrefilter:
+    """Filtre Bloom maintenu en arrière-plan pour un worker"""
+
+    def __init__(self, db, error_rate=0.01, headroom=1.5,
+                 rebuild_interval=3600, sync_interval=10, sync_overlap=10000):
+        self.db = db
+        self.error_rate = error_rate
+        self.headroom = headroom
+        self.rebuild_interval = rebuild_interval
+        self.sync_interval = sync_interval
+        self.sync_overlap = sync_overlap
+        self._filter = None
+        self._last_ids = {table: 0 for table in TABLES}
+        self._lock = threading.Lock()
+        self._thread = None
+        self._pid = None
+        self._last_rebuild = 0
+        self._last_sync = 0
+        self.stats = {
+            'definite_misses': 0,
+            'maybe_present': 0,
+            'observed_false_positives': 0,
+            'rebuilds': 0,
+            'rebuild_ms': 0.0,
+            'sync_errors': 0,
+        }
+
+    # ===== REQUÊTE =====
+
+    def is_ready(self):
+        """Filtre construit et synchronisé récemment"""
+        self._ensure_started()
+        return self._filter is not None and not self._is_stale()
+
+    def might_contain(self, short_id):
+        """False = absent à coup sûr ; True si présent possible ou filtre pas prêt"""
+        if not self.is_ready():
+            return True
+        bloom = self._filter
+        if short_id in bloom:
+            self.stats['maybe_present'] += 1
+            return True
+        self.stats['definite_misses'] += 1
+        return False
+
+    def record_false_positive(self):
+        """
+        Le filtre (prêt) a dit 'peut-être' et l'id n'existe dans aucune table.
+        lookup_short_url renvoie aussi les liens inactifs ou expirés (présents
+        dans le filtre à raison) : l'appelant le sait sans requête de plus.
+        """
+        self.stats['observed_false_positives'] += 1
+
+    def _is_stale(self):
+        # Sans synchro récente, le filtre pourrait ignorer des liens neufs
+        return time.time() - self._last_sync > self.sync_interval * 6
+
+    # ===== MAINTENANCE =====
+
+    def _ensure_started(self):
+        if self._thread is not None and self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._thread is not None and self._pid == os.getpid():
+                return
+            self._pid = os.getpid()
+            self._filter = None
+            self._thread = threading.Thread(
+                target=self._run, name='bloom-prefilter', daemon=True
+            )
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            try:
+                if time.time() - self._last_rebuild >= self.rebuild_interval:
+                    self.rebuild()
+                else:
+                    self.sync_new_ids()
+            except Exception as e:
+                self.stats['sync_errors'] += 1
+                logger.error(f"Bloom prefilter maintenance failed: {str(e)}")
+            time.sleep(self.sync_interval)
+
+    def rebuild(self):
+        """Reconstruit un filtre complet hors ligne puis le publie"""
+        if not self.db:
+            return
+        start = time.time()
+        with self.db.connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(
+                    f"SELECT (SELECT COUNT(*) FROM {TABLES[0]}) + (SELECT COUNT(*) FROM {TABLES[1]})"
+                )
+                expected = cursor.fetchone()[0] or 0
+
+            bloom = BloomFilter(max(1000, expected * self.headroom), self.error_rate)
+            last_ids = {}
+            for table in TABLES:
+                last_ids[table] = self._load_ids(conn, table, 0, bloom, stream=True)
+
+        with self._lock:
+            self._filter = bloom
+            self._last_ids = last_ids
+            self._last_rebuild = self._last_sync = time.time()
+        self.stats['rebuilds'] += 1
+        self.stats['rebuild_ms'] = round((time.time() - start) * 1000, 2)
+        logger.info(f"Bloom prefilter rebuilt: {bloom.count} ids in {self.stats['rebuild_ms']}ms")
+
+    def sync_new_ids(self):
+        """Ajoute les liens créés depuis la dernière synchro (avec recouvrement)"""
+        bloom = self._filter
+        if not self.db or bloom is None:
+            return
+        with self.db.connection() as conn:
+            for table in TABLES:
+                last_id = self._last_ids[table]
+                seen = self._load_ids(conn, table, max(0, last_id - self.sync_overlap), bloom)
+                self._last_ids[table] = max(last_id, seen)
+        self._last_sync = time.time()
+        # Trop plein : le taux de faux positifs dérive, on reconstruit
+        if bloom.count > bloom.capacity:
+            self._last_rebuild = 0
+
+    @staticmethod
+    def _load_ids(conn, table, after_id, bloom, stream=False):
+        """Ajoute les short_id d'id > after_id, retourne le dernier id vu"""
+        # Curseur nommé (côté serveur) pour ne pas matérialiser des millions de lignes
+        cursor = conn.cursor(name=f'bloom_{table}') if stream else conn.cursor()
+        cursor.itersize = 20000
+        try:
+            cursor.execute(
+                f"SELECT id, short_id FROM {table} WHERE id > %s ORDER BY id",
+                (after_id,)
+            )
+            last_id = after_id
+            for row_id, short_id in cursor:
+                bloom.add(short_id)
+                last_id = row_id
+            return last_id
+        finally:
+            cursor.close()
+
+    def get_stats(self):
+        bloom = self._filter
+        # IDs absents ayant passé le filtre / IDs absents vérifiés
+        absent_checks = self.stats['observed_false_positives'] + self.stats['definite_misses']
+        return {
+            **self.stats,
+            'ready': bloom is not None and not self._is_stale(),
+            'ids': bloom.count if bloom else 0,
+            'size_bytes': len(bloom.bits) if bloom else 0,
+            'hash_count': bloom.hash_count if bloom else 0,
+            'false_positive_rate_estimated': round(bloom.estimated_false_positive_rate(), 6) if bloom else None,
+            'false_positive_rate_observed': round(
+                self.stats['observed_false_positives'] / absent_checks, 6
+            ) if absent_checks else None,
+        }
+
+
+def build_prefilter(db):
+    """Construit le préfiltre depuis les variables d'environnement (None si désactivé)"""
+    if os.environ.get('SHORTENER_BLOOM_ENABLED', 'true').lower() != 'true':
+        return None
+    return ShortIdPrefilter(
+        db,
+        error_rate=float(os.environ.get('SHORTENER_BLOOM_ERROR_RATE', '0.01')),
+        rebuild_interval=int(os.environ.get('SHORTENER_BLOOM_REBUILD_INTERVAL', '3600')),
+        sync_interval=int(os.environ.get('SHORTENER_BLOOM_SYNC_INTERVAL', '10')),
+        sync_overlap=int(os.environ.get('SHORTENER_BLOOM_SYNC_OVERLAP', '10000')),
+    )
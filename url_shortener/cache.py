@@ -0,0 +1,298 @@
+# url_shortener/cache.py
+"""
+Cache read-through des redirections
+
+Deux niveaux devant la requête UNION ALL :
+- LRU en mémoire (par worker gunicorn)
+- Redis partagé (optionnel, activé si SHORTENER_REDIS_URL/REDIS_URL est défini)
+
+Les absences (IDs inconnus) sont mises en cache avec un TTL court
+(negative caching) pour que les scanners ne martèlent pas Postgres.
+
+Invalidation (désactivation / modification côté Django) : la clé Redis est
+supprimée et le short_id publié sur INVALIDATION_CHANNEL ; chaque worker
+écoute le canal et purge son LRU (vidé entièrement à chaque
+réabonnement, les messages manqués pendant une coupure étant inconnus).
+Fenêtre de staleness résiduelle :
+- avec Redis : le temps de propagation du message (quelques ms)
+- sans Redis : le TTL local des entrées positives
+  (SHORTENER_CACHE_TTL, 30 s par défaut)
+"""
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+
+try:
+    import redis
+except ImportError:  # Redis optionnel
+    redis = None
+
+logger = logging.getLogger(__name__)
+
+REDIS_KEY_PREFIX = 'shortener:url:'
+INVALIDATION_CHANNEL = 'shortener:invalidate'
+
+# Marqueur pour distinguer "absent du cache" de "absence mise en cache"
+MISS = object()
+
+
+class CachedUrl:
+    """Résultat résolu d'un short_id (URL, public/privé, expiration)"""
+
+    __slots__ = ('original_url', 'is_public', 'expires_at')
+
+    def __init__(self, original_url, is_public, expires_at=None):
+        self.original_url = original_url
+        self.is_public = is_public
+        self.expires_at = expires_at  # timestamp epoch ou None
+
+    def is_expired(self, now=None):
+        if self.expires_at is None:
+            return False
+        return (now or time.time()) >= self.expires_at
+
+    def to_json(self):
+        return json.dumps({
+            'u': self.original_url,
+            'p': self.is_public,
+            'e': self.expires_at,
+        })
+
+    @classmethod
+    def from_json(cls, raw):
+        data = json.loads(raw)
+        if data.get('miss'):
+            return MISS
+        return cls(data['u'], data['p'], data.get('e'))
+
+
+class LRUCache:
+    """LRU thread-safe avec TTL par entrée"""
+
+    def __init__(self, max_size=10000):
+        self.max_size = max_size
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, now=None):
+        now = now or time.time()
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            value, deadline = item
+            if deadline <= now:
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl):
+        deadline = time.time() + ttl
+        with self._lock:
+            self._data[key] = (value, deadline)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
+class RedirectCache:
+    """
+    Cache read-through pour la résolution des short_id
+
+    Usage:
+        record = redirect_cache.get_or_load(short_id, loader)
+        # loader(short_id) -> CachedUrl | None
+    """
+
+    def __init__(self, max_size=10000, ttl=30, negative_ttl=15,
+                 redis_url=None, redis_ttl=300):
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.redis_ttl = redis_ttl
+        self.local = LRUCache(max_size)
+        self.redis = None
+        self.redis_url = redis_url
+        self._listener = None
+        self._listener_pid = None
+        self._listener_lock = threading.Lock()
+        self.stats = {
+            'local_hits': 0,
+            'redis_hits': 0,
+            'negative_hits': 0,
+            'misses': 0,
+            'redis_errors': 0,
+            'invalidations': 0,
+        }
+
+        if redis_url and redis is not None:
+            try:
+                self.redis = redis.Redis.from_url(
+                    redis_url,
+                    socket_timeout=0.05,
+                    socket_connect_timeout=0.2,
+                )
+                logger.info("Redirect cache: Redis tier enabled")
+            except Exception as e:
+                logger.error(f"Redirect cache: Redis init failed: {str(e)}")
+                self.redis = None
+        elif redis_url:
+            logger.warning("Redirect cache: REDIS_URL set but redis package missing")
+
+    def _ttl_for(self, record, ttl):
+        """TTL borné par l'expiration du lien"""
+        if record is MISS or record.expires_at is None:
+            return ttl
+        remaining = record.expires_at - time.time()
+        return max(0, min(ttl, remaining))
+
+    def _store(self, short_id, record):
+        if record is MISS:
+            self.local.set(short_id, MISS, self.negative_ttl)
+            payload, redis_ttl = json.dumps({'miss': True}), self.negative_ttl
+        else:
+            local_ttl = self._ttl_for(record, self.ttl)
+            if local_ttl <= 0:
+                return
+            self.local.set(short_id, record, local_ttl)
+            payload, redis_ttl = record.to_json(), self._ttl_for(record, self.redis_ttl)
+
+        if self.redis is not None and redis_ttl >= 1:
+            try:
+                self.redis.setex(REDIS_KEY_PREFIX + short_id, int(redis_ttl), payload)
+            except Exception as e:
+                self.stats['redis_errors'] += 1
+                logger.warning(f"Redis set failed for {short_id}: {str(e)}")
+
+    def _from_redis(self, short_id):
+        if self.redis is None:
+            return None
+        try:
+            raw = self.redis.get(REDIS_KEY_PREFIX + short_id)
+        except Exception as e:
+            self.stats['redis_errors'] += 1
+            logger.warning(f"Redis get failed for {short_id}: {str(e)}")
+            return None
+        if raw is None:
+            return None
+        try:
+            return CachedUrl.from_json(raw)
+        except (ValueError, KeyError):
+            return None
+
+    def get_or_load(self, short_id, loader):
+        """Retourne un CachedUrl valide ou None (absent/expiré)"""
+        now = time.time()
+
+        # 1. LRU local
+        record = self.local.get(short_id, now)
+        if record is MISS:
+            self.stats['negative_hits'] += 1
+            return None
+        if record is not None and not record.is_expired(now):
+            self.stats['local_hits'] += 1
+            return record
+
+        # 2. Redis partagé
+        record = self._from_redis(short_id)
+        if record is MISS:
+            self.stats['negative_hits'] += 1
+            self.local.set(short_id, MISS, self.negative_ttl)
+            return None
+        if record is not None and not record.is_expired(now):
+            self.stats['redis_hits'] += 1
+            local_ttl = self._ttl_for(record, self.ttl)
+            if local_ttl > 0:
+                self.local.set(short_id, record, local_ttl)
+            return record
+
+        # 3. Base de données
+        self.stats['misses'] += 1
+        record = loader(short_id)
+        self._store(short_id, record if record is not None else MISS)
+        return record
+
+    def invalidate(self, short_id):
+        """Retire un short_id des deux niveaux et notifie les autres workers"""
+        self.local.delete(short_id)
+        if self.redis is not None:
+            try:
+                self.redis.delete(REDIS_KEY_PREFIX + short_id)
+                self.redis.publish(INVALIDATION_CHANNEL, short_id)
+            except Exception as e:
+                self.stats['redis_errors'] += 1
+                logger.warning(f"Redis delete failed for {short_id}: {str(e)}")
+
+    # ===== ÉCOUTE DES INVALIDATIONS =====
+
+    def ensure_listener(self):
+        """Thread d'écoute du canal d'invalidation (démarré après le fork gunicorn)"""
+        if self.redis is None:
+            return
+        if self._listener is not None and self._listener_pid == os.getpid():
+            return
+        with self._listener_lock:
+            if self._listener is not None and self._listener_pid == os.getpid():
+                return
+            self._listener_pid = os.getpid()
+            self._listener = threading.Thread(
+                target=self._listen, name='redirect-cache-invalidation', daemon=True
+            )
+            self._listener.start()
+
+    def _listen(self):
+        backoff = 1
+        while True:
+            try:
+                # Client dédié : pas de socket_timeout sur une lecture bloquante
+                client = redis.Redis.from_url(self.redis_url, socket_connect_timeout=0.2)
+                pubsub = client.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(INVALIDATION_CHANNEL)
+                # (Ré)abonné : les invalidations manquées entre-temps sont inconnues
+                self.local.clear()
+                backoff = 1
+                for message in pubsub.listen():
+                    short_id = message.get('data')
+                    if isinstance(short_id, bytes):
+                        short_id = short_id.decode('utf-8', 'ignore')
+                    if short_id:
+                        self.local.delete(short_id)
+                        self.stats['invalidations'] += 1
+            except Exception as e:
+                self.stats['redis_errors'] += 1
+                logger.warning(f"Redirect cache invalidation listener error: {str(e)}")
+            time.sleep(backoff)
+            backoff = min(backoff * 2, 30)
+
+    def get_stats(self):
+        return {
+            **self.stats,
+            'local_size': len(self.local),
+            'redis_enabled': self.redis is not None,
+            'invalidation_listener': self._listener is not None and self._listener.is_alive(),
+        }
+
+
+def build_redirect_cache():
+    """Construit le cache depuis les variables d'environnement"""
+    return RedirectCache(
+        max_size=int(os.environ.get('SHORTENER_CACHE_SIZE', '10000')),
+        ttl=int(os.environ.get('SHORTENER_CACHE_TTL', '30')),
+        negative_ttl=int(os.environ.get('SHORTENER_NEGATIVE_CACHE_TTL', '15')),
+        redis_url=os.environ.get('SHORTENER_REDIS_URL') or os.environ.get('REDIS_URL'),
+        redis_ttl=int(os.environ.get('SHORTENER_REDIS_CACHE_TTL', '300')),
+    )
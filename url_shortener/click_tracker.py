@@ -0,0 +1,194 @@
+# url_shortener/click_tracker.py
+"""
+Tracking des clics asynchrone et batché
+
+La redirection pousse un événement dans une file bornée et repart
+immédiatement. Un thread d'écriture vide la file par lots :
+- INSERT multi-lignes dans url_shortener_click_log (unnest de tableaux)
+- UPDATE des compteurs agrégés par short_id (un seul UPDATE par table)
+
+Les requêtes sont des statements préparés de db.DatabaseManager : la
+taille du lot ne change pas le SQL, donc pas de re-parsing.
+
+Si la file est pleine, l'événement est abandonné et compté dans
+`dropped_events` : la latence de redirection passe avant l'analytics.
+"""
+import atexit
+import logging
+import os
+import queue
+import threading
+import time
+from collections import namedtuple
+from datetime import datetime, timezone
+
+logger = logging.getLogger(__name__)
+
+ClickEvent = namedtuple(
+    'ClickEvent',
+    ['short_id', 'is_public', 'ip_address', 'user_agent', 'referer', 'clicked_at']
+)
+
+
+class ClickTracker:
+    """File bornée + writer en arrière-plan"""
+
+    def __init__(self, db, max_queue_size=10000, batch_size=500, flush_interval=1.0):
+        self.db = db
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue = queue.Queue(maxsize=max_queue_size)
+        self._stop = threading.Event()
+        self._flush_lock = threading.Lock()
+        self._thread = None
+        self._pid = None
+        self.stats = {
+            'enqueued_events': 0,
+            'written_events': 0,
+            'dropped_events': 0,
+            'failed_batches': 0,
+            'last_flush_ms': 0.0,
+        }
+
+    # ===== PRODUCTEUR =====
+
+    def track(self, short_id, is_public, ip_address, user_agent, referer):
+        """Enfile un clic sans bloquer (abandon si la file est pleine)"""
+        self._ensure_started()
+        event = ClickEvent(
+            short_id,
+            is_public,
+            (ip_address or '')[:45],
+            (user_agent or '')[:500],
+            (referer or '')[:500],
+            datetime.now(timezone.utc),
+        )
+        try:
+            self._queue.put_nowait(event)
+            self.stats['enqueued_events'] += 1
+            return True
+        except queue.Full:
+            self.stats['dropped_events'] += 1
+            if self.stats['dropped_events'] % 1000 == 1:
+                logger.warning(f"Click queue full - dropped events: {self.stats['dropped_events']}")
+            return False
+
+    # ===== WRITER =====
+
+    def _ensure_started(self):
+        """Démarrage paresseux (un writer par worker, après le fork gunicorn)"""
+        if self._thread is not None and self._pid == os.getpid():
+            return
+        with self._flush_lock:
+            if self._thread is not None and self._pid == os.getpid():
+                return
+            self._pid = os.getpid()
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name='click-tracker', daemon=True
+            )
+            self._thread.start()
+
+    def _run(self):
+        while not self._stop.is_set():
+            batch = self._drain(block=True)
+            if batch:
+                self._write(batch)
+        # Dernier vidage à l'arrêt
+        self.flush()
+
+    def _drain(self, block=False):
+        """Récupère jusqu'à batch_size événements"""
+        batch = []
+        deadline = time.time() + self.flush_interval
+        while len(batch) < self.batch_size:
+            timeout = deadline - time.time()
+            try:
+                if block and timeout > 0:
+                    batch.append(self._queue.get(timeout=timeout))
+                else:
+                    batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def flush(self):
+        """Vide entièrement la file (appelé à l'arrêt du worker)"""
+        while True:
+            batch = self._drain(block=False)
+            if not batch:
+                return
+            self._write(batch)
+
+    def _write(self, batch):
+        if not self.db:
+            self.stats['dropped_events'] += len(batch)
+            return
+
+        start = time.time()
+        try:
+            with self.db.connection() as conn:
+                with conn.cursor() as cursor:
+                    # 1. Log détaillé (INSERT multi-lignes)
+                    self.db.execute_prepared(cursor, 'insert_click_logs', (
+                        [e.short_id for e in batch],
+                        [e.is_public for e in batch],
+                        [e.ip_address for e in batch],
+                        [e.user_agent for e in batch],
+                        [e.clicked_at for e in batch],
+                        [e.referer for e in batch],
+                    ))
+
+                    # 2. Compteurs agrégés par short_id
+                    counters = {}
+                    for e in batch:
+                        key = (e.short_id, e.is_public)
+                        count, last = counters.get(key, (0, e.clicked_at))
+                        counters[key] = (count + 1, max(last, e.clicked_at))
+
+                    for is_public, statement in ((False, 'increment_private_clicks'),
+                                                 (True, 'increment_public_clicks')):
+                        # Ordre stable pour limiter les deadlocks entre workers
+                        rows = sorted(
+                            (short_id, count, last)
+                            for (short_id, public), (count, last) in counters.items()
+                            if public == is_public
+                        )
+                        if not rows:
+                            continue
+                        short_ids, clicks, lasts = zip(*rows)
+                        self.db.execute_prepared(
+                            cursor, statement, (list(short_ids), list(clicks), list(lasts))
+                        )
+
+            self.stats['written_events'] += len(batch)
+
+        except Exception as e:
+            self.stats['failed_batches'] += 1
+            self.stats['dropped_events'] += len(batch)
+            logger.error(f"Click batch write failed ({len(batch)} events): {str(e)}")
+        finally:
+            self.stats['last_flush_ms'] = round((time.time() - start) * 1000, 2)
+
+    def shutdown(self, timeout=5.0):
+        """Arrête le writer et vide la file"""
+        self._stop.set()
+        if self._thread is not None and self._pid == os.getpid():
+            self._thread.join(timeout)
+        else:
+            self.flush()
+
+    def get_stats(self):
+        return {**self.stats, 'queue_size': self._queue.qsize()}
+
+
+def build_click_tracker(db):
+    """Construit le tracker depuis les variables d'environnement et branche le flush d'arrêt"""
+    tracker = ClickTracker(
+        db,
+        max_queue_size=int(os.environ.get('SHORTENER_CLICK_QUEUE_SIZE', '10000')),
+        batch_size=int(os.environ.get('SHORTENER_CLICK_BATCH_SIZE', '500')),
+        flush_interval=float(os.environ.get('SHORTENER_CLICK_FLUSH_INTERVAL', '1.0')),
+    )
+    atexit.register(tracker.shutdown)
+    return tracker
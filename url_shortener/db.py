@@ -1,127 +1,250 @@
 # url_shortener/db.py
+"""
+Couche d'accès DB unique du raccourcisseur
+
+- Pool thread-safe (ThreadedConnectionPool + sémaphore bloquant avec timeout)
+- Requêtes chaudes préparées côté serveur (PREPARE/EXECUTE) une fois par connexion
+- Taille de pool configurable, pré-chauffage au démarrage
+- Mesure du temps d'attente pour obtenir une connexion
+"""
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+
 import psycopg2
+import psycopg2.extensions
 import psycopg2.pool
-import os
-import logging
-from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Requêtes préparées : nom -> (types des paramètres, SQL)
+PREPARED_STATEMENTS = {
+    # Lignes inactives/expirées aussi (servable = false) : distingue un
+    # lien désactivé d'un id inconnu sans second aller-retour
+    'lookup_short_url': ('text', """
+        (SELECT original_url, false AS is_public, expires_at,
+                (is_active AND (expires_at IS NULL OR expires_at > NOW())) IS TRUE AS servable
+         FROM url_shortener_shorturl WHERE short_id = $1)
+        UNION ALL
+        (SELECT original_url, true AS is_public, expires_at,
+                (is_active AND expires_at > NOW()) IS TRUE AS servable
+         FROM url_shortener_public_shorturl WHERE short_id = $1)
+        ORDER BY servable DESC
+        LIMIT 1
+    """),
+    'insert_click_logs': ('text[], boolean[], text[], text[], timestamptz[], text[]', """
+        INSERT INTO url_shortener_click_log
+        (short_id, is_public, ip_address, user_agent, clicked_at, referer, country, city)
+        SELECT short_id, is_public, ip_address, user_agent, clicked_at, referer, '', ''
+        FROM unnest($1, $2, $3, $4, $5, $6)
+            AS v (short_id, is_public, ip_address, user_agent, clicked_at, referer)
+    """),
+    'increment_private_clicks': ('text[], integer[], timestamptz[]', """
+        UPDATE url_shortener_shorturl AS t
+        SET click_count = t.click_count + v.clicks,
+            last_clicked = GREATEST(COALESCE(t.last_clicked, v.last_clicked), v.last_clicked)
+        FROM unnest($1, $2, $3) AS v (short_id, clicks, last_clicked)
+        WHERE t.short_id = v.short_id
+    """),
+    'increment_public_clicks': ('text[], integer[], timestamptz[]', """
+        UPDATE url_shortener_public_shorturl AS t
+        SET click_count = t.click_count + v.clicks,
+            last_clicked = GREATEST(COALESCE(t.last_clicked, v.last_clicked), v.last_clicked)
+        FROM unnest($1, $2, $3) AS v (short_id, clicks, last_clicked)
+        WHERE t.short_id = v.short_id
+    """),
+}
+
+
+class PreparedConnection(psycopg2.extensions.connection):
+    """Connexion qui mémorise les statements déjà préparés sur sa session"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.prepared = set()
+
+
+class PoolTimeout(Exception):
+    """Aucune connexion libre dans le délai imparti"""
+
+
 class DatabaseManager:
-    def __init__(self):
-        self.db_config = {
-            'host': os.environ.get('DB_HOST', 'postgres-shortener'),
-            'database': os.environ.get('DB_NAME', 'shortener_db'),
-            'user': os.environ.get('DB_USER', 'shortener_user'),
-            'password': os.environ.get('DB_PASSWORD', 'ShortUrl2025!'),
-            'port': 5432
+    def __init__(self, db_config=None, minconn=None, maxconn=None,
+                 acquire_timeout=None, prewarm=None):
+        self.db_config = db_config or {
+            'host': os.environ.get('DB_HOST', 'postgres'),
+            'database': os.environ.get('DB_NAME', 'mhdb24'),
+            'user': os.environ.get('DB_USER', 'SuperAdminduTurfu'),
+            'password': os.environ.get('DB_PASSWORD', 'MHub2401!'),
+            'port': int(os.environ.get('DB_PORT', '5432')),
+            'sslmode': 'prefer',
+            'connect_timeout': 5,
+            'application_name': 'flask_shortener'
         }
-        
+        self.minconn = minconn or int(os.environ.get('SHORTENER_DB_POOL_MIN', '2'))
+        self.maxconn = maxconn or int(os.environ.get('SHORTENER_DB_POOL_MAX', '10'))
+        self.acquire_timeout = acquire_timeout or float(
+            os.environ.get('SHORTENER_DB_POOL_TIMEOUT', '2.0')
+        )
+        if prewarm is None:
+            prewarm = os.environ.get('SHORTENER_DB_PREWARM', 'true').lower() == 'true'
+
+        # Le sémaphore transforme "pool épuisé" en attente bornée
+        self._slots = threading.BoundedSemaphore(self.maxconn)
+        self._stats_lock = threading.Lock()
+        self.stats = {
+            'checkouts': 0,
+            'in_use': 0,
+            'timeouts': 0,
+            'wait_ms_total': 0.0,
+            'wait_ms_max': 0.0,
+            'statements_prepared': 0,
+        }
+
         # Connection pool pour performance
         try:
-            self.pool = psycopg2.pool.SimpleConnectionPool(
-                1, 10,  # min/max connections
+            self.pool = psycopg2.pool.ThreadedConnectionPool(
+                self.minconn, self.maxconn,
+                connection_factory=PreparedConnection,
                 **self.db_config
             )
-            logger.info("Database connection pool initialized")
+            logger.info(f"Database connection pool initialized ({self.minconn}-{self.maxconn})")
         except Exception as e:
             logger.error(f"Failed to initialize DB pool: {str(e)}")
             self.pool = None
-    
+
+        if self.pool and prewarm:
+            self.prewarm()
+
+    def __bool__(self):
+        return self.pool is not None
+
+    # ===== POOL =====
+
     def get_connection(self):
-        """Récupère une connexion du pool"""
-        if self.pool:
-            return self.pool.getconn()
-        return None
-    
-    def put_connection(self, conn):
+        """Récupère une connexion du pool (bloque au plus acquire_timeout)"""
+        if not self.pool:
+            return None
+
+        start = time.perf_counter()
+        if not self._slots.acquire(timeout=self.acquire_timeout):
+            with self._stats_lock:
+                self.stats['timeouts'] += 1
+            raise PoolTimeout(f"No DB connection available after {self.acquire_timeout}s")
+
+        try:
+            conn = self.pool.getconn()
+        except Exception:
+            self._slots.release()
+            raise
+
+        wait_ms = (time.perf_counter() - start) * 1000
+        with self._stats_lock:
+            self.stats['checkouts'] += 1
+            self.stats['in_use'] += 1
+            self.stats['wait_ms_total'] += wait_ms
+            self.stats['wait_ms_max'] = max(self.stats['wait_ms_max'], wait_ms)
+
+        try:
+            self._prepare(conn)
+        except Exception:
+            self.put_connection(conn, close=True)
+            raise
+        return conn
+
+    def put_connection(self, conn, close=False):
         """Remet une connexion dans le pool"""
-        if self.pool and conn:
-            self.pool.putconn(conn)
-    
-    def test_connection(self):
-        """Test de connexion pour health check"""
-        conn = None
+        if not self.pool or not conn:
+            return
         try:
-            conn = self.get_connection()
-            if conn:
-                cursor = conn.cursor()
-                cursor.execute("SELECT 1")
-                cursor.close()
-                return True
-            return False
-        except Exception as e:
-            logger.error(f"DB connection test failed: {str(e)}")
-            return False
+            self.pool.putconn(conn, close=close or conn.closed)
         finally:
-            if conn:
-                self.put_connection(conn)
-    
-    def get_original_url(self, short_id):
-        """Récupère l'URL originale (READ ONLY)"""
-        conn = None
+            with self._stats_lock:
+                self.stats['in_use'] -= 1
+            self._slots.release()
+
+    @contextmanager
+    def connection(self):
+        """
+        Connexion transactionnelle : commit en sortie, rollback sur erreur.
+        Une connexion cassée est fermée au lieu d'être remise dans le pool.
+        """
+        conn = self.get_connection()
+        if conn is None:
+            raise RuntimeError("database_pool_unavailable")
+        broken = False
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            broken = conn.closed != 0
+            if not broken:
+                try:
+                    conn.rollback()
+                except psycopg2.Error:
+                    broken = True
+            raise
+        finally:
+            self.put_connection(conn, close=broken)
+
+    def prewarm(self):
+        """Ouvre et prépare minconn connexions avant la première requête"""
+        conns = []
         try:
-            conn = self.get_connection()
-            if not conn:
-                return None
-                
-            cursor = conn.cursor()
-            
-            # Query simple et sécurisée
-            cursor.execute("""
-                SELECT original_url 
-                FROM url_shortener_shorturl 
-                WHERE short_id = %s 
-                AND is_active = true 
-                AND (expires_at IS NULL OR expires_at > NOW())
-            """, (short_id,))
-            
-            result = cursor.fetchone()
-            cursor.close()
-            
-            return result[0] if result else None
-            
+            for _ in range(self.minconn):
+                conns.append(self.get_connection())
         except Exception as e:
-            logger.error(f"Error fetching URL for {short_id}: {str(e)}")
-            return None
+            logger.warning(f"DB pool prewarm incomplete: {str(e)}")
         finally:
-            if conn:
+            for conn in conns:
                 self.put_connection(conn)
-    
-    def track_click(self, short_id, ip_address, user_agent):
-        """Track un clic (WRITE)"""
-        conn = None
+        logger.info(f"DB pool prewarmed with {len(conns)} connections")
+
+    # ===== PREPARED STATEMENTS =====
+
+    def _prepare(self, conn):
+        """Prépare les requêtes chaudes une seule fois par session"""
+        if len(conn.prepared) == len(PREPARED_STATEMENTS):
+            return
+        with conn.cursor() as cursor:
+            for name, (param_types, sql) in PREPARED_STATEMENTS.items():
+                if name in conn.prepared:
+                    continue
+                cursor.execute(f"PREPARE {name} ({param_types}) AS {sql}")
+                conn.prepared.add(name)
+                with self._stats_lock:
+                    self.stats['statements_prepared'] += 1
+        # PREPARE hors transaction applicative
+        conn.commit()
+
+    @staticmethod
+    def execute_prepared(cursor, name, params):
+        """EXECUTE d'un statement préparé"""
+        placeholders = ', '.join(['%s'] * len(params))
+        cursor.execute(f"EXECUTE {name} ({placeholders})", params)
+
+    # ===== HELPERS =====
+
+    def test_connection(self):
+        """Test de connexion pour health check"""
         try:
-            conn = self.get_connection()
-            if not conn:
-                return False
-                
-            cursor = conn.cursor()
-            
-            # Update compteur atomique
-            cursor.execute("""
-                UPDATE url_shortener_shorturl 
-                SET click_count = click_count + 1,
-                    last_clicked = NOW()
-                WHERE short_id = %s
-            """, (short_id,))
-            
-            # Log détaillé (optionnel, pour analytics futures)
-            cursor.execute("""
-                INSERT INTO url_shortener_clicklog 
-                (short_id, ip_address, user_agent, clicked_at) 
-                VALUES (%s, %s, %s, NOW())
-            """, (short_id, ip_address[:45], user_agent[:200]))
-            
-            conn.commit()
-            cursor.close()
+            with self.connection() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute("SELECT 1")
             return True
-            
         except Exception as e:
-            logger.error(f"Error tracking click for {short_id}: {str(e)}")
-            if conn:
-                conn.rollback()
+            logger.error(f"DB connection test failed: {str(e)}")
             return False
-        finally:
-            if conn:
-                self.put_connection(conn)
\ No newline at end of file
+
+    def get_stats(self):
+        with self._stats_lock:
+            stats = dict(self.stats)
+        checkouts = stats['checkouts'] or 1
+        stats['wait_ms_avg'] = round(stats['wait_ms_total'] / checkouts, 3)
+        stats['wait_ms_total'] = round(stats['wait_ms_total'], 3)
+        stats['wait_ms_max'] = round(stats['wait_ms_max'], 3)
+        stats['pool_min'] = self.minconn
+        stats['pool_max'] = self.maxconn
+        return stats
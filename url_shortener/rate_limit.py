@@ -0,0 +1,239 @@
+# url_shortener/rate_limit.py
+"""
+Rate limiting à mémoire fixe (sliding window counter)
+
+Chaque clé (IP) ne coûte que deux compteurs : fenêtre courante et
+fenêtre précédente. Le débit estimé est :
+
+    précédente * (1 - écoulé / fenêtre) + courante
+
+Les clés inactives et les blocages expirés sont évincés (TTL), donc la
+mémoire reste proportionnelle au nombre de clés actives.
+
+Backends :
+- InProcessBackend : dict local au worker
+- RedisBackend     : compteurs partagés entre workers/containers, avec
+                     repli sur un InProcessBackend si Redis ne répond pas
+"""
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+
+try:
+    import redis
+except ImportError:  # Redis optionnel
+    redis = None
+
+logger = logging.getLogger(__name__)
+
+
+class InProcessBackend:
+    """Compteurs en mémoire avec éviction TTL et plafond de clés"""
+
+    def __init__(self, max_keys=100000, sweep_interval=30):
+        self.max_keys = max_keys
+        self.sweep_interval = sweep_interval
+        # key -> [window_index, current_count, previous_count]
+        self._counters = OrderedDict()
+        # key -> blocked_until
+        self._blocks = {}
+        self._lock = threading.Lock()
+        self._last_sweep = time.time()
+
+    def hit(self, key, window, now):
+        """Incrémente et retourne (current_count, previous_count, elapsed_ratio)"""
+        window_index = int(now // window)
+        with self._lock:
+            entry = self._counters.get(key)
+            if entry is None:
+                entry = [window_index, 0, 0]
+                self._counters[key] = entry
+            elif entry[0] != window_index:
+                # Glissement : la courante devient la précédente (ou 0 si trop ancienne)
+                entry[2] = entry[1] if entry[0] == window_index - 1 else 0
+                entry[1] = 0
+                entry[0] = window_index
+            entry[1] += 1
+            self._counters.move_to_end(key)
+
+            while len(self._counters) > self.max_keys:
+                self._counters.popitem(last=False)
+
+            if now - self._last_sweep > self.sweep_interval:
+                self._sweep(window_index, now)
+
+            return entry[1], entry[2], (now % window) / window
+
+    def _sweep(self, window_index, now):
+        """Évince les clés inactives depuis 2 fenêtres et les blocages expirés"""
+        self._last_sweep = now
+        stale = [k for k, entry in self._counters.items() if entry[0] < window_index - 1]
+        for key in stale:
+            del self._counters[key]
+        expired = [k for k, until in self._blocks.items() if until <= now]
+        for key in expired:
+            del self._blocks[key]
+
+    def block(self, key, duration, now):
+        with self._lock:
+            self._blocks[key] = now + duration
+
+    def is_blocked(self, key, now):
+        until = self._blocks.get(key)
+        if until is None:
+            return False
+        if until <= now:
+            with self._lock:
+                self._blocks.pop(key, None)
+            return False
+        return True
+
+    def stats(self):
+        return {
+            'backend': 'memory',
+            'tracked_keys': len(self._counters),
+            'blocked_keys': len(self._blocks),
+        }
+
+
+class RedisBackend:
+    """Compteurs partagés dans Redis ; InProcessBackend en remplacement si Redis échoue"""
+
+    def __init__(self, client, prefix='shortener:rl:', fallback=None):
+        self.client = client
+        self.prefix = prefix
+        self.fallback = fallback or InProcessBackend()
+        self.errors = 0
+
+    def hit(self, key, window, now):
+        window_index = int(now // window)
+        current_key = f"{self.prefix}{key}:{window_index}"
+        previous_key = f"{self.prefix}{key}:{window_index - 1}"
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            pipe.incr(current_key)
+            pipe.expire(current_key, window * 2)
+            pipe.get(previous_key)
+            current, _, previous = pipe.execute()
+            return int(current), int(previous or 0), (now % window) / window
+        except Exception as e:
+            self._on_error(e)
+            return self.fallback.hit(key, window, now)
+
+    def block(self, key, duration, now):
+        self.fallback.block(key, duration, now)
+        try:
+            self.client.set(f"{self.prefix}block:{key}", 1, ex=max(1, int(duration)))
+        except Exception as e:
+            self._on_error(e)
+
+    def is_blocked(self, key, now):
+        if self.fallback.is_blocked(key, now):
+            return True
+        try:
+            return bool(self.client.exists(f"{self.prefix}block:{key}"))
+        except Exception as e:
+            self._on_error(e)
+            return False
+
+    def _on_error(self, error):
+        self.errors += 1
+        if self.errors % 100 == 1:
+            logger.warning(f"Rate limit Redis error, using local counters: {str(error)}")
+
+    def stats(self):
+        return {
+            'backend': 'redis',
+            'redis_errors': self.errors,
+            'fallback': self.fallback.stats(),
+        }
+
+
+class SlidingWindowRateLimiter:
+    """
+    Limiteur par clé : max_requests par window secondes.
+
+    Au-delà de block_threshold requêtes estimées dans la fenêtre, la clé est
+    bloquée pendant block_duration secondes (blocage qui expire).
+    """
+
+    def __init__(self, max_requests=60, window=60, block_threshold=None,
+                 block_duration=900, backend=None, name='default'):
+        self.max_requests = max_requests
+        self.window = window
+        self.block_threshold = block_threshold or max_requests * 2
+        self.block_duration = block_duration
+        self.backend = backend or InProcessBackend()
+        # Préfixe pour partager un même backend entre plusieurs limiteurs
+        self.name = name
+
+    def is_blocked(self, key):
+        return self.backend.is_blocked(f"{self.name}:{key}", time.time())
+
+    def is_allowed(self, key):
+        now = time.time()
+        scoped_key = f"{self.name}:{key}"
+
+        if self.backend.is_blocked(scoped_key, now):
+            return False
+
+        current, previous, elapsed = self.backend.hit(scoped_key, self.window, now)
+        estimated = previous * (1 - elapsed) + current
+
+        if estimated > self.block_threshold:
+            self.backend.block(scoped_key, self.block_duration, now)
+            logger.warning(f"IP blocked for abuse ({self.name}): {key} for {self.block_duration}s")
+            return False
+
+        return estimated <= self.max_requests
+
+    def get_stats(self):
+        return {
+            'name': self.name,
+            'max_requests': self.max_requests,
+            'window': self.window,
+            **self.backend.stats(),
+        }
+
+
+_shared_backend = None
+
+
+def get_backend():
+    """Backend partagé par le process (Redis si configuré, sinon mémoire)"""
+    global _shared_backend
+    if _shared_backend is not None:
+        return _shared_backend
+
+    redis_url = os.environ.get('SHORTENER_REDIS_URL') or os.environ.get('REDIS_URL')
+    max_keys = int(os.environ.get('SHORTENER_RATE_LIMIT_MAX_KEYS', '100000'))
+
+    if redis_url and redis is not None:
+        try:
+            client = redis.Redis.from_url(
+                redis_url,
+                socket_timeout=0.05,
+                socket_connect_timeout=0.2,
+            )
+            _shared_backend = RedisBackend(client, fallback=InProcessBackend(max_keys))
+            logger.info("Rate limiter: Redis backend enabled")
+            return _shared_backend
+        except Exception as e:
+            logger.error(f"Rate limiter: Redis init failed: {str(e)}")
+
+    _shared_backend = InProcessBackend(max_keys)
+    return _shared_backend
+
+
+def build_rate_limiter(name, max_requests, window=60, block_threshold=None, block_duration=None):
+    """Construit un limiteur branché sur le backend partagé"""
+    return SlidingWindowRateLimiter(
+        max_requests=max_requests,
+        window=window,
+        block_threshold=block_threshold,
+        block_duration=block_duration or int(os.environ.get('SHORTENER_BLOCK_DURATION', '900')),
+        backend=get_backend(),
+        name=name,
+    )
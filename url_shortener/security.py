@@ -2,7 +2,8 @@
 import re
 import logging
 from urllib.parse import urlparse
-import time
+
+from rate_limit import build_rate_limiter
 
 logger = logging.getLogger(__name__)
 
@@ -33,9 +34,13 @@ class SecurityValidator:
             'malware', 'phishing', 'spam'
         ]
         
-        # Rate limiting simple en mémoire
-        self.request_counts = {}
-        self.blocked_ips = set()
+        # Rate limiting : 100 req/minute par IP, blocage temporaire au-delà
+        self.rate_limiter = build_rate_limiter(
+            'security',
+            max_requests=100,
+            window=60,
+            block_threshold=100
+        )
     
     def is_safe_request(self, request, short_id):
         """Validation complète de la requête"""
@@ -43,8 +48,8 @@ class SecurityValidator:
             client_ip = request.environ.get('HTTP_X_REAL_IP', request.remote_addr)
             user_agent = request.headers.get('User-Agent', '').lower()
             
-            # 1. IP bloquée
-            if client_ip in self.blocked_ips:
+            # 1. IP bloquée (blocage expirant)
+            if self.rate_limiter.is_blocked(client_ip):
                 return False
             
             # 2. Rate limiting simple
@@ -98,28 +103,10 @@ class SecurityValidator:
             return False
     
     def _check_rate_limit(self, ip):
-        """Rate limiting simple : 100 req/minute par IP"""
-        current_time = int(time.time() / 60)  # Minute actuelle
-        
-        if ip not in self.request_counts:
-            self.request_counts[ip] = {}
-        
-        # Nettoie les anciennes minutes
-        self.request_counts[ip] = {
-            minute: count for minute, count in self.request_counts[ip].items()
-            if minute >= current_time - 5  # Garde 5 minutes
-        }
-        
-        # Compte requêtes cette minute
-        current_count = self.request_counts[ip].get(current_time, 0)
-        
-        if current_count >= 100:  # Limite : 100/minute
+        """Rate limiting : 100 req/minute par IP (sliding window partagé)"""
+        if not self.rate_limiter.is_allowed(ip):
             logger.warning(f"Rate limit exceeded for IP: {ip}")
-            self.blocked_ips.add(ip)  # Blocage temporaire
             return False
-        
-        # Incrémente compteur
-        self.request_counts[ip][current_time] = current_count + 1
         return True
     
     def _has_suspicious_headers(self, request):